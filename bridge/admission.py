@@ -0,0 +1,200 @@
+"""Per-instance admission control with priority lanes.
+
+Every request to an instance goes through one of three lanes. Interactive
+requests (UI selection, single function or memory lookups, job status) are
+admitted at once. Standard requests (listings) and heavy requests (decompiles,
+call graphs, analysis) share a bounded number of slots per instance, heavy ones
+at most ``GHIDRA_MAX_HEAVY_REQUESTS`` of them, so a burst of decompiles queues
+in the bridge instead of occupying every pooled connection and plugin thread
+ahead of cheap calls. When a slot frees, waiting standard requests go before
+heavy ones.
+
+Runs on the transport loop only.
+"""
+
+import asyncio
+import os
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from timeouts import timeout_class
+from transport import POOL_MAXSIZE, call_soon
+
+# Standard plus heavy requests in flight per instance; the rest of the
+# connection pool is left for interactive requests
+MAX_CONCURRENT = int(os.environ.get("GHIDRA_MAX_CONCURRENT_REQUESTS", str(max(1, POOL_MAXSIZE - 2))))
+MAX_HEAVY = int(os.environ.get("GHIDRA_MAX_HEAVY_REQUESTS", str(max(1, MAX_CONCURRENT // 2))))
+
+LANES = ("interactive", "standard", "heavy")
+
+# Endpoint heads answered by a point lookup, cheap whatever their path
+POINT_LOOKUP_HEADS = frozenset({"memory", "jobs"})
+
+
+def lane_for(endpoint: str) -> str:
+    """The admission lane of a plugin endpoint."""
+    cls = timeout_class(endpoint)
+    if cls in ("decompile", "analysis"):
+        return "heavy"
+    if cls == "interactive":
+        return "interactive"
+    parts = endpoint.strip("/").split("/")
+    if parts[0] in POINT_LOOKUP_HEADS:
+        return "interactive"
+    # functions/{address} and functions/by-name/{name}, but not their sub-resources
+    if parts[0] == "functions" and (len(parts) == 2 or (len(parts) == 3 and parts[1] == "by-name")):
+        return "interactive"
+    return "standard"
+
+
+class QueueTimeout(Exception):
+    """A request waited longer than its budget for a slot."""
+
+    def __init__(self, lane: str, waited: float):
+        super().__init__(f"Waited {waited:.1f}s for a free {lane} request slot")
+        self.lane = lane
+        self.waited = waited
+
+
+class _LaneStats:
+    __slots__ = ("requests", "queued", "in_flight", "max_queue_depth", "wait_seconds", "max_wait_seconds")
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.queued = 0
+        self.in_flight = 0
+        self.max_queue_depth = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def as_dict(self, queue_depth: int) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "queued": self.queued,
+            "in_flight": self.in_flight,
+            "queue_depth": queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "avg_wait_ms": round(self.wait_seconds * 1000 / self.queued, 2) if self.queued else 0.0,
+            "max_wait_ms": round(self.max_wait_seconds * 1000, 2),
+        }
+
+
+class _Instance:
+    """Slots and waiters for one instance."""
+
+    def __init__(self) -> None:
+        self.waiters: dict[str, deque[asyncio.Future]] = {"standard": deque(), "heavy": deque()}
+        self.stats = {lane: _LaneStats() for lane in LANES}
+
+    @property
+    def busy(self) -> int:
+        return self.stats["standard"].in_flight + self.stats["heavy"].in_flight
+
+    def can_start(self, lane: str) -> bool:
+        if self.busy >= MAX_CONCURRENT:
+            return False
+        return lane != "heavy" or self.stats["heavy"].in_flight < MAX_HEAVY
+
+    def wake(self) -> None:
+        """Hand free slots to waiters, standard before heavy."""
+        for lane in ("standard", "heavy"):
+            waiters = self.waiters[lane]
+            while waiters and self.can_start(lane):
+                future = waiters.popleft()
+                if not future.done():
+                    self.stats[lane].in_flight += 1
+                    future.set_result(None)
+
+
+class AdmissionController:
+    """Admit requests per instance and lane; see the module docstring."""
+
+    def __init__(self) -> None:
+        self._instances: dict[int, _Instance] = {}
+
+    def _instance(self, port: int) -> _Instance:
+        instance = self._instances.get(port)
+        if instance is None:
+            instance = self._instances[port] = _Instance()
+        return instance
+
+    @asynccontextmanager
+    async def admit(self, port: int, lane: str, timeout: float | None = None) -> AsyncIterator[None]:
+        """Hold a slot in lane on the instance for the duration of the block, queueing for one if needed.
+
+        Raises QueueTimeout if no slot frees up within ``timeout`` seconds.
+        """
+        instance = self._instance(port)
+        stats = instance.stats[lane]
+        stats.requests += 1
+
+        if lane == "interactive" or self._can_start_now(instance, lane):
+            stats.in_flight += 1
+        else:
+            future = asyncio.get_running_loop().create_future()
+            waiters = instance.waiters[lane]
+            waiters.append(future)
+            stats.queued += 1
+            stats.max_queue_depth = max(stats.max_queue_depth, len(waiters))
+            started = time.monotonic()
+            try:
+                await asyncio.wait_for(future, timeout)
+            except BaseException as e:
+                if future.done() and not future.cancelled():
+                    stats.in_flight -= 1  # a slot was handed over just as the caller gave up
+                    instance.wake()
+                else:
+                    future.cancel()
+                    try:
+                        waiters.remove(future)
+                    except ValueError:
+                        pass
+                if isinstance(e, TimeoutError):
+                    raise QueueTimeout(lane, time.monotonic() - started) from None
+                raise
+            finally:
+                waited = time.monotonic() - started
+                stats.wait_seconds += waited
+                stats.max_wait_seconds = max(stats.max_wait_seconds, waited)
+
+        try:
+            yield
+        finally:
+            stats.in_flight -= 1
+            if lane != "interactive":
+                instance.wake()
+
+    def forget(self, port: int) -> None:
+        """Drop an instance's lanes and counters once it has gone away; callable from any thread.
+
+        Requests still holding or waiting for its slots finish on the dropped
+        lanes; a later request to the port starts afresh.
+        """
+        call_soon(self._instances.pop, port, None)
+
+    @staticmethod
+    def _can_start_now(instance: _Instance, lane: str) -> bool:
+        # Queued requests keep their place: a newcomer only starts if nobody is waiting ahead of it
+        if instance.waiters["standard"] or (lane == "heavy" and instance.waiters["heavy"]):
+            return False
+        return instance.can_start(lane)
+
+    def stats(self, port: int | None = None) -> dict[str, Any]:
+        """Queue depth, in-flight and wait-time metrics per instance and lane."""
+        ports = [port] if port is not None else sorted(self._instances)
+        per_port = {}
+        for p in ports:
+            instance = self._instances.get(p)
+            if instance is None:
+                continue
+            per_port[p] = {
+                lane: instance.stats[lane].as_dict(len(instance.waiters.get(lane, ())))
+                for lane in LANES
+            }
+        return {"max_concurrent": MAX_CONCURRENT, "max_heavy": MAX_HEAVY, "instances": per_port}
+
+
+admission = AdmissionController()
@@ -0,0 +1,418 @@
+"""Read-through cache for idempotent GET responses from Ghidra instances."""
+
+import asyncio
+import hashlib
+import os
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+CACHE_MAX_BYTES = int(os.environ.get("GHIDRA_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+CACHE_TTL = float(os.environ.get("GHIDRA_CACHE_TTL", "300"))
+# Cached responses are only served while the program state was confirmed this recently
+CACHE_REVALIDATE_AFTER = float(os.environ.get("GHIDRA_CACHE_REVALIDATE_AFTER", "1"))
+DISK_CACHE_DIR = os.environ.get("GHIDRA_DISK_CACHE_DIR", "")
+DISK_CACHE_MAX_BYTES = int(os.environ.get("GHIDRA_DISK_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+
+# Response headers the plugin uses to report which program state a response reflects.
+# The program ID is a per-session counter; the identity (project path, domain
+# file ID and executable hash) is the same across Ghidra restarts and instances.
+PROGRAM_ID_HEADER = "X-Ghidra-Program-ID"
+PROGRAM_IDENTITY_HEADER = "X-Ghidra-Program-Identity"
+MODIFICATION_NUMBER_HEADER = "X-Ghidra-Modification-Number"
+
+# These reflect UI selection, instance metadata or job progress, which change
+# without the program's modification number moving.
+UNCACHEABLE_ENDPOINTS = frozenset({"address", "function", "info", "instances", "jobs", "plugin-version", "program"})
+
+# Responses expensive enough to keep on disk across bridge restarts
+PERSISTENT_ENDPOINT_SUFFIXES = ("/decompile", "/disassembly")
+PERSISTENT_ENDPOINTS = frozenset({"analysis/callgraph", "analysis/dataflow"})
+
+CacheKey = tuple[int, str, tuple[tuple[str, str], ...]]
+
+
+def make_key(port: int, endpoint: str, params: dict | None = None) -> CacheKey:
+    """Build a cache key from (port, endpoint, normalized params)."""
+    normalized = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items() if v is not None))
+    return (port, endpoint.strip("/"), normalized)
+
+
+class ResponseCache:
+    """LRU/TTL cache of raw response bodies, bounded by total body size in bytes.
+
+    Each port carries a generation number that is bumped whenever its entries
+    are flushed. A GET only stores its response if the generation it started
+    under is still current, so a write racing with a read cannot repopulate
+    the cache with stale data.
+    """
+
+    def __init__(self, max_bytes: int = CACHE_MAX_BYTES, ttl: float = CACHE_TTL):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: OrderedDict[CacheKey, tuple[float, bytes]] = OrderedDict()
+        self._bytes = 0
+        self._generations: dict[int, int] = {}
+        self._program_states: dict[int, tuple[str, str]] = {}
+        self._identities: dict[int, str | None] = {}
+        self._observed_at: dict[int, float] = {}
+        self._oversized: set[CacheKey] = set()  # keys whose last response was over max_bytes
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0 and self.ttl > 0
+
+    def is_cacheable(self, endpoint: str) -> bool:
+        """Whether GET responses from this endpoint may be cached."""
+        return self.enabled and endpoint.strip("/").split("/", 1)[0] not in UNCACHEABLE_ENDPOINTS
+
+    def generation(self, port: int) -> int:
+        """Current generation for a port; pass it back to put()."""
+        return self._generations.get(port, 0)
+
+    def can_hold(self, key: CacheKey) -> bool:
+        """Whether a GET response for key would be kept: its endpoint is cacheable and it was not too large last time."""
+        with self._lock:
+            return self.is_cacheable(key[1]) and key not in self._oversized
+
+    def contains(self, key: CacheKey) -> bool:
+        """Whether an unexpired body is cached for a key, without counting a lookup."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry[0] >= time.monotonic()
+
+    def get(self, key: CacheKey) -> bytes | None:
+        """Return the cached body for a key, or None on a miss or expiry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, body = entry
+            if expires_at < time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def put(self, key: CacheKey, body: bytes, generation: int) -> None:
+        """Store a body, evicting least recently used entries to stay within budget."""
+        size = len(body)
+        if not self.enabled:
+            return
+        if size > self.max_bytes:
+            with self._lock:
+                self._oversized.add(key)
+            return
+        with self._lock:
+            self._oversized.discard(key)
+            if self._generations.get(key[0], 0) != generation:
+                return
+            if key in self._entries:
+                self._remove(key)
+            while self._entries and self._bytes + size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+            self._entries[key] = (time.monotonic() + self.ttl, body)
+            self._bytes += size
+
+    def invalidate_port(self, port: int) -> None:
+        """Drop every entry for a port and bump its generation."""
+        with self._lock:
+            self._generations[port] = self._generations.get(port, 0) + 1
+            stale = [key for key in self._entries if key[0] == port]
+            for key in stale:
+                self._remove(key)
+            self._oversized = {key for key in self._oversized if key[0] != port}
+            if stale:
+                self.invalidations += 1
+
+    def observe_program_state(
+        self,
+        port: int,
+        program_id: str | None,
+        modification_number: str | None,
+        identity: str | None = None,
+    ) -> None:
+        """Flush a port's entries when its program, program identity or modification number changes."""
+        if program_id is None or modification_number is None:
+            return
+        state = (program_id, modification_number)
+        with self._lock:
+            previous = self._program_states.get(port)
+            previous_identity = self._identities.get(port)
+            self._program_states[port] = state
+            self._identities[port] = identity
+            self._observed_at[port] = time.monotonic()
+        if previous is not None and (previous != state or previous_identity != identity):
+            self.invalidate_port(port)
+
+    def observe_headers(self, port: int, headers: Any) -> tuple[str, str] | None:
+        """Record the program state reported in a response's headers.
+
+        Returns the response's persistent state (see persistent_state), or None.
+        """
+        identity = headers.get(PROGRAM_IDENTITY_HEADER)
+        modification_number = headers.get(MODIFICATION_NUMBER_HEADER)
+        self.observe_program_state(port, headers.get(PROGRAM_ID_HEADER), modification_number, identity)
+        return (identity, modification_number) if identity and modification_number is not None else None
+
+    def program_state(self, port: int, max_age: float | None = None) -> tuple[str, str] | None:
+        """Last observed (program ID, modification number) for a port.
+
+        The program ID is only unique within one Ghidra session. With
+        ``max_age``, returns None if it was observed longer ago than that.
+        """
+        with self._lock:
+            if max_age is not None and time.monotonic() - self._observed_at.get(port, float("-inf")) > max_age:
+                return None
+            return self._program_states.get(port)
+
+    def observed_since(self, port: int, since: float) -> bool:
+        """Whether a port's program state was observed at or after a time.monotonic() instant."""
+        with self._lock:
+            return self._observed_at.get(port, float("-inf")) >= since
+
+    def persistent_state(self, port: int, max_age: float | None = None) -> tuple[str, str] | None:
+        """Last observed (program identity, modification number) for a port.
+
+        Unlike program_state this names the same program in every Ghidra
+        session and no other, so it can key data kept across restarts. None if
+        the plugin sent no identity, or, with ``max_age``, if it was observed
+        longer ago than that.
+        """
+        with self._lock:
+            if max_age is not None and time.monotonic() - self._observed_at.get(port, float("-inf")) > max_age:
+                return None
+            identity = self._identities.get(port)
+            state = self._program_states.get(port)
+            return (identity, state[1]) if identity and state is not None else None
+
+    def forget_port(self, port: int) -> None:
+        """Flush a port and drop its recorded program state (instance went away)."""
+        self.invalidate_port(port)
+        with self._lock:
+            self._program_states.pop(port, None)
+            self._identities.pop(port, None)
+            self._observed_at.pop(port, None)
+
+    def clear(self) -> None:
+        """Drop every entry on every port."""
+        with self._lock:
+            for port in {key[0] for key in self._entries}:
+                self._generations[port] = self._generations.get(port, 0) + 1
+            self._entries.clear()
+            self._oversized.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Counters and current occupancy."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl,
+            }
+
+    def _remove(self, key: CacheKey) -> None:
+        _, body = self._entries.pop(key)
+        self._bytes -= len(body)
+
+
+class DiskCache:
+    """Compressed on-disk store of expensive responses that survives bridge restarts.
+
+    Entries are keyed by persistent program state (the plugin's program
+    identity and modification number) plus endpoint and params, not by port,
+    so they are found again after a restart of the bridge or of Ghidra and
+    simply never match once the program has changed. The per-session program
+    ID is not used: another instance, or Ghidra after a restart, can reuse it
+    for a different program. A single SQLite file holds zlib-compressed bodies; the total
+    compressed size is capped with LRU eviction, and the file is trimmed and
+    vacuumed when the bridge starts.
+
+    The request path uses async_get and put_in_background, which run on a
+    single worker thread owned by the cache, so compression and SQLite lock
+    waits never stall the transport loop and writes are applied in order.
+    """
+
+    def __init__(self, directory: str = DISK_CACHE_DIR, max_bytes: int = DISK_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.path = Path(directory).expanduser() / "responses.sqlite" if directory else None
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="GhidraMCP-DiskCache")
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        if self.path is not None and max_bytes > 0:
+            try:
+                self._open()
+            except (OSError, sqlite3.Error) as e:
+                print(f"Disk cache disabled, cannot open {self.path}: {e}", file=sys.stderr)
+                self._conn = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._conn is not None
+
+    @staticmethod
+    def is_persistent(endpoint: str) -> bool:
+        """Whether responses from this endpoint are worth keeping on disk."""
+        endpoint = endpoint.strip("/")
+        return endpoint in PERSISTENT_ENDPOINTS or endpoint.endswith(PERSISTENT_ENDPOINT_SUFFIXES)
+
+    def _open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "key TEXT PRIMARY KEY, program_state TEXT, body BLOB, size INTEGER, last_used REAL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used)")
+        self._conn = conn
+        self.compact()
+
+    @staticmethod
+    def _state_key(state: tuple[str, str]) -> str:
+        return f"{state[0]}@{state[1]}"
+
+    def _entry_key(self, state: tuple[str, str], key: CacheKey) -> str:
+        _, endpoint, params = key
+        return hashlib.sha256(repr((self._state_key(state), endpoint, params)).encode("utf-8")).hexdigest()
+
+    def get(self, state: tuple[str, str], key: CacheKey) -> bytes | None:
+        """Return the decompressed body stored for this program state and request, or None."""
+        if not self.enabled:
+            return None
+        entry_key = self._entry_key(state, key)
+        with self._lock:
+            try:
+                row = self._conn.execute("SELECT body FROM entries WHERE key = ?", (entry_key,)).fetchone()
+                if row is None:
+                    self.misses += 1
+                    return None
+                self._conn.execute("UPDATE entries SET last_used = ? WHERE key = ?", (time.time(), entry_key))
+                self.hits += 1
+            except sqlite3.Error as e:
+                print(f"Disk cache read failed: {e}", file=sys.stderr)
+                return None
+        return zlib.decompress(row[0])
+
+    def put(self, state: tuple[str, str], key: CacheKey, body: bytes) -> None:
+        """Compress and store a body, evicting least recently used entries over the cap."""
+        if not self.enabled:
+            return
+        compressed = zlib.compress(body, 6)
+        size = len(compressed)
+        if size > self.max_bytes:
+            return
+        entry_key = self._entry_key(state, key)
+        with self._lock:
+            try:
+                previous = self._conn.execute("SELECT size FROM entries WHERE key = ?", (entry_key,)).fetchone()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                    (entry_key, self._state_key(state), compressed, size, time.time()),
+                )
+                self._bytes += size - (previous[0] if previous else 0)
+                self.writes += 1
+                if self._bytes > self.max_bytes:
+                    self._evict(self.max_bytes)
+            except sqlite3.Error as e:
+                print(f"Disk cache write failed: {e}", file=sys.stderr)
+
+    async def async_get(self, state: tuple[str, str], key: CacheKey) -> bytes | None:
+        """get() on the cache's worker thread."""
+        return await asyncio.wrap_future(self._executor.submit(self.get, state, key))
+
+    def put_in_background(self, state: tuple[str, str], key: CacheKey, body: bytes) -> None:
+        """Queue a put() on the cache's worker thread without waiting for it."""
+        if self.enabled:
+            self._executor.submit(self.put, state, key, body)
+
+    def flush(self) -> None:
+        """Wait for queued writes to be applied."""
+        self._executor.submit(lambda: None).result()
+
+    def _evict(self, target: int) -> None:
+        """Drop least recently used entries until the total is within target. Caller holds the lock."""
+        rows = self._conn.execute("SELECT key, size FROM entries ORDER BY last_used").fetchall()
+        doomed = []
+        for entry_key, size in rows:
+            if self._bytes <= target:
+                break
+            doomed.append((entry_key,))
+            self._bytes -= size
+        self._conn.executemany("DELETE FROM entries WHERE key = ?", doomed)
+        self.evictions += len(doomed)
+
+    def compact(self) -> None:
+        """Trim to the size cap and reclaim free pages (run at startup)."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if self._bytes > self.max_bytes:
+                self._evict(self.max_bytes)
+            free_pages = self._conn.execute("PRAGMA freelist_count").fetchone()[0]
+            total_pages = self._conn.execute("PRAGMA page_count").fetchone()[0]
+            if total_pages and free_pages / total_pages > 0.25:
+                self._conn.execute("VACUUM")
+
+    def clear(self, state: tuple[str, str] | None = None) -> None:
+        """Drop every entry, or only those for one program state."""
+        if not self.enabled:
+            return
+        with self._lock:
+            if state is None:
+                self._conn.execute("DELETE FROM entries")
+            else:
+                self._conn.execute("DELETE FROM entries WHERE program_state = ?", (self._state_key(state),))
+            self._bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            entries = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0] if self.enabled else 0
+            return {
+                "enabled": self.enabled,
+                "path": str(self.path) if self.path else None,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "writes": self.writes,
+                "evictions": self.evictions,
+                "entries": entries,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+
+response_cache = ResponseCache()
+disk_cache = DiskCache()
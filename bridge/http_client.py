@@ -1,16 +1,48 @@
 """HTTP helpers, response simplification, and shared fetchers."""
 
+import asyncio
+import codecs
+import json
 import os
+import re
 import time
-from typing import Any
-from urllib.parse import quote, urlparse
+import uuid
+from contextlib import aclosing, asynccontextmanager
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any, TypeVar
+from urllib.parse import parse_qsl, quote, urlparse, urlsplit
 
-import requests
+import httpx
 
-from state import get_instance_url, get_instance_port
+try:
+    import orjson
+except ImportError:  # optional; the standard library decoder is used without it
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # optional; responses are requested as JSON without it
+    msgpack = None
+
+from admission import QueueTimeout, admission, lane_for
+from cache import CACHE_REVALIDATE_AFTER, CacheKey, disk_cache, make_key, response_cache
+from state import async_get_instance_port, async_get_instance_url, get_instance_port, get_instance_url
+from timeouts import DEADLINE_HEADER, TIMEOUT_CLASSES, Budget, budget_for
+from transport import get_client, run_async, run_sync, transient_client
+
+T = TypeVar("T")
 
 ALLOWED_ORIGINS = os.environ.get("GHIDRA_ALLOWED_ORIGINS", "http://localhost").split(",")
 
+# Ask the plugin for MessagePack instead of JSON ("auto": when msgpack is installed)
+WIRE_FORMAT = os.environ.get("GHIDRA_WIRE_FORMAT", "auto").lower()
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+ACCEPT = (
+    f"{MSGPACK_CONTENT_TYPE}, application/json;q=0.9"
+    if msgpack is not None and WIRE_FORMAT in ("auto", "msgpack")
+    else "application/json"
+)
+
 
 # ---------------------------------------------------------------------------
 # Origin validation
@@ -35,21 +67,283 @@ def validate_origin(headers: dict) -> bool:
 # Core request helper
 # ---------------------------------------------------------------------------
 
-def _make_request(
+def _loads(data: bytes | str) -> Any:
+    """Decode JSON, with orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. integers wider than 64 bits; let the standard decoder decide
+    return json.loads(data)
+
+
+def _decode(body: bytes) -> Any:
+    """Decode a response body as MessagePack or JSON.
+
+    Responses are maps, so a MessagePack body starts with a map header byte
+    (0x80 or above) and a JSON one with ASCII; cached bodies of either format
+    decode without knowing the Content-Type they came with.
+    """
+    if body[:1] >= b"\x80" and msgpack is not None:
+        return msgpack.unpackb(body)
+    return _loads(body)
+
+
+def _parse_body(status_code: int, body: bytes) -> dict:
+    """Decode a plugin response body and normalize its error shape."""
+    is_success = 200 <= status_code < 300
+    try:
+        parsed_json = _decode(body)
+        if isinstance(parsed_json, dict) and "timestamp" not in parsed_json:
+            parsed_json["timestamp"] = int(time.time() * 1000)
+
+        if (
+            not is_success
+            and isinstance(parsed_json, dict)
+            and "success" in parsed_json
+            and not parsed_json["success"]
+        ):
+            if "error" in parsed_json and not isinstance(parsed_json["error"], dict):
+                error_message = parsed_json["error"]
+                parsed_json["error"] = {
+                    "code": f"HTTP_{status_code}",
+                    "message": error_message,
+                }
+        return parsed_json
+
+    except ValueError:
+        text = body.decode("utf-8", errors="replace")
+        if is_success:
+            return {
+                "success": False,
+                "error": {
+                    "code": "NON_JSON_RESPONSE",
+                    "message": "Received non-JSON success response from Ghidra plugin",
+                },
+                "status_code": status_code,
+                "response_text": text[:500],
+                "timestamp": int(time.time() * 1000),
+            }
+        return {
+            "success": False,
+            "error": {
+                "code": f"HTTP_{status_code}",
+                "message": f"Non-JSON error response: {text[:100]}...",
+            },
+            "status_code": status_code,
+            "response_text": text[:500],
+            "timestamp": int(time.time() * 1000),
+        }
+
+
+class SingleFlight:
+    """Coalesce concurrent identical GETs into one upstream request.
+
+    Runs on the transport loop only. The first caller for a key starts the
+    upstream request as a task; later callers await the same task. The task
+    is cancelled only once every caller waiting on it has gone away.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[CacheKey, list] = {}
+        self.upstream = 0
+        self.coalesced = 0
+
+    async def do(self, key: CacheKey, factory: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """Await the shared result for key; returns (result, whether this caller started it)."""
+        entry = self._inflight.get(key)
+        leader = entry is None
+        if leader:
+            task = asyncio.ensure_future(factory())
+            entry = [task, 0]
+            self._inflight[key] = entry
+            task.add_done_callback(lambda _, e=entry: self._discard(key, e))
+            self.upstream += 1
+        else:
+            self.coalesced += 1
+
+        entry[1] += 1
+        try:
+            return await asyncio.shield(entry[0]), leader
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0 and not entry[0].done():
+                entry[0].cancel()
+
+    def stats(self) -> dict[str, Any]:
+        """Upstream vs coalesced request counters."""
+        return {
+            "upstream": self.upstream,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._inflight),
+        }
+
+    def _discard(self, key: CacheKey, entry: list) -> None:
+        if self._inflight.get(key) is entry:
+            del self._inflight[key]
+
+
+inflight_requests = SingleFlight()
+
+
+def _new_request_id() -> str:
+    return f"mcp-bridge-{uuid.uuid4().hex}"
+
+
+# Cancel requests still being sent, kept referenced until they finish
+_cancel_tasks: set[asyncio.Task] = set()
+
+
+async def _cancel_upstream(port: int, url: str, request_id: str) -> None:
+    """Ask the plugin to stop the work behind request_id; best effort."""
+    parts = urlsplit(url)
+    cancel_url = f"{parts.scheme}://{parts.netloc}/requests/{quote(request_id, safe='')}/cancel"
+    timeout = TIMEOUT_CLASSES["interactive"].httpx_timeout()
+    try:
+        client = get_client(port)
+        if client is not None:
+            await client.post(cancel_url, headers={"Accept": "application/json"}, timeout=timeout)
+        else:
+            async with transient_client(cancel_url) as transient:
+                await transient.post(cancel_url, headers={"Accept": "application/json"}, timeout=timeout)
+    except httpx.HTTPError:
+        pass  # the plugin's own decompiler limits still apply
+
+
+def _cancel_in_background(port: int, url: str, headers: dict) -> None:
+    """On the transport loop: cancel the plugin work of a request the bridge stopped waiting for."""
+    request_id = headers.get("X-Request-ID")
+    if request_id:
+        task = asyncio.get_running_loop().create_task(_cancel_upstream(port, url, request_id))
+        _cancel_tasks.add(task)
+        task.add_done_callback(_cancel_tasks.discard)
+
+
+@asynccontextmanager
+async def _admitted(port: int, lane: str, budget: Budget) -> AsyncIterator[tuple[Budget, asyncio.Timeout]]:
+    """Hold an admission slot and yield what is left of budget once it is taken, with the deadline.
+
+    A single timeout of budget.total covers both the wait for a slot and the
+    request, so queueing eats into the request's budget rather than adding
+    to it. Running out while still queued raises QueueTimeout.
+    """
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    admitted = False
+    try:
+        async with asyncio.timeout(budget.total) as deadline:
+            async with admission.admit(port, lane):
+                admitted = True
+                yield budget.within(deadline.when() - loop.time()), deadline
+    except TimeoutError:
+        if not admitted:
+            raise QueueTimeout(lane, loop.time() - started) from None
+        raise
+
+
+async def _send(
+    method: str,
+    port: int,
+    url: str,
+    params: dict | None,
+    json_data: dict | None,
+    data: str | None,
+    headers: dict,
+    budget: Budget,
+    lane: str,
+) -> tuple[int, bytes, tuple[str, str] | None] | dict:
+    """Send one request within budget; returns (status, body, persistent program state) or an error response dict.
+
+    The request first takes a slot in its admission lane for the instance;
+    the wait for one counts against the budget. The plugin is told the read
+    budget left after admission in DEADLINE_HEADER so it can abandon work the
+    bridge has stopped waiting for. If the request times out or the caller is
+    cancelled, the plugin is asked to cancel it by X-Request-ID.
+    """
+    try:
+        async with _admitted(port, lane, budget) as (remaining, _):
+            headers = {**headers, DEADLINE_HEADER: str(int(remaining.read * 1000))}
+            client = get_client(port)
+            if client is not None:
+                response = await client.request(
+                    method, url, params=params, json=json_data, content=data,
+                    headers=headers, timeout=remaining.httpx_timeout(),
+                )
+            else:
+                async with transient_client(url) as transient:
+                    response = await transient.request(
+                        method, url, params=params, json=json_data, content=data,
+                        headers=headers, timeout=remaining.httpx_timeout(),
+                    )
+    except QueueTimeout as e:
+        return error_response("INSTANCE_BUSY", f"{e}; the instance is saturated with other requests", 503)
+    except asyncio.CancelledError:
+        _cancel_in_background(port, url, headers)
+        raise
+    except (httpx.TimeoutException, TimeoutError):
+        _cancel_in_background(port, url, headers)
+        return error_response(
+            "REQUEST_TIMEOUT",
+            f"Request timed out (connect budget {budget.connect:g}s, read budget {budget.read:g}s)",
+            408,
+        )
+    except httpx.TransportError:
+        return error_response("CONNECTION_ERROR", f"Failed to connect to Ghidra instance at {url}", 503)
+    except Exception as e:
+        return {
+            "success": False,
+            "error": {"code": "UNEXPECTED_ERROR", "message": f"An unexpected error occurred: {str(e)}"},
+            "exception": e.__class__.__name__,
+            "timestamp": int(time.time() * 1000),
+        }
+
+    state = response_cache.observe_headers(port, response.headers)
+    return response.status_code, response.content, state
+
+
+async def _revalidate(port: int, base_url: str) -> bool:
+    """Confirm a port's program state before cached responses for it are served.
+
+    Cached entries are flushed when a response reports a new modification
+    number, but edits made in the Ghidra GUI only show up on the next response
+    that reaches the plugin. If the state was last observed more than
+    CACHE_REVALIDATE_AFTER seconds ago, a /program probe (answered by the
+    plugin without queueing behind heavy work) observes it again, flushing the
+    port if it moved. Returns whether the state is confirmed.
+    """
+    if response_cache.program_state(port, max_age=CACHE_REVALIDATE_AFTER) is not None:
+        return True
+    started = time.monotonic()
+    url = f"{base_url}/program"
+    headers = {"Accept": ACCEPT, "X-Request-ID": _new_request_id()}
+    await inflight_requests.do(
+        make_key(port, "program"),
+        lambda: _send("GET", port, url, None, None, None, headers, budget_for("program"), lane_for("program")),
+    )
+    return response_cache.observed_since(port, started)
+
+
+async def _request(
     method: str,
     port: int,
+    base_url: str,
     endpoint: str,
     params: dict | None = None,
     json_data: dict | None = None,
     data: str | None = None,
     headers: dict | None = None,
+    timeout: float | None = None,
 ) -> dict:
-    """Internal helper to make HTTP requests and handle common errors."""
-    url = f"{get_instance_url(port)}/{endpoint}"
+    """Perform one request on the transport loop and handle common errors.
 
+    ``timeout`` overrides the read budget of the endpoint's timeout class.
+    """
+    url = f"{base_url}/{endpoint}"
+    budget = budget_for(endpoint, timeout)
+    lane = lane_for(endpoint)
     request_headers = {
-        "Accept": "application/json",
-        "X-Request-ID": f"mcp-bridge-{int(time.time() * 1000)}",
+        "Accept": ACCEPT,
+        "X-Request-ID": _new_request_id(),
     }
     if headers:
         request_headers.update(headers)
@@ -66,111 +360,647 @@ def _make_request(
         elif data is not None:
             request_headers["Content-Type"] = "text/plain"
 
-    try:
-        response = requests.request(
-            method,
-            url,
-            params=params,
-            json=json_data,
-            data=data,
-            headers=request_headers,
-            timeout=60,
-        )
-
         try:
-            parsed_json = response.json()
-            if isinstance(parsed_json, dict) and "timestamp" not in parsed_json:
-                parsed_json["timestamp"] = int(time.time() * 1000)
+            outcome = await _send(method, port, url, params, json_data, data, request_headers, budget, lane)
+        finally:
+            response_cache.invalidate_port(port)
+        if isinstance(outcome, dict):
+            return outcome
+        return _parse_body(*outcome[:2])
+
+    key = make_key(port, endpoint, params)
+    cacheable = method.upper() == "GET" and response_cache.is_cacheable(endpoint)
+    # Expensive results may be on disk from an earlier bridge run
+    persistent = method.upper() == "GET" and disk_cache.enabled and disk_cache.is_persistent(endpoint)
+    confirmed = ((cacheable and response_cache.contains(key)) or persistent) and await _revalidate(port, base_url)
+    if cacheable and confirmed:
+        cached = response_cache.get(key)
+        if cached is not None:
+            return _parse_body(200, cached)
+    generation = response_cache.generation(port)
+
+    if persistent and confirmed:
+        state = response_cache.persistent_state(port)
+        stored = await disk_cache.async_get(state, key) if state is not None else None
+        if stored is not None:
+            if cacheable:
+                response_cache.put(key, stored, generation)
+            return _parse_body(200, stored)
+
+    outcome, leader = await inflight_requests.do(
+        key, lambda: _send(method, port, url, params, None, None, request_headers, budget, lane)
+    )
+    if isinstance(outcome, dict):
+        return dict(outcome, error=dict(outcome["error"]))
+
+    status_code, body, state = outcome
+    parsed_json = _parse_body(status_code, body)
+    if (
+        leader
+        and 200 <= status_code < 300
+        and isinstance(parsed_json, dict)
+        and parsed_json.get("success")
+    ):
+        if cacheable:
+            response_cache.put(key, body, generation)
+        if persistent and state is not None:
+            disk_cache.put_in_background(state, key, body)
+    return parsed_json
 
-            if (
-                not response.ok
-                and isinstance(parsed_json, dict)
-                and "success" in parsed_json
-                and not parsed_json["success"]
-            ):
-                if "error" in parsed_json and not isinstance(parsed_json["error"], dict):
-                    error_message = parsed_json["error"]
-                    parsed_json["error"] = {
-                        "code": f"HTTP_{response.status_code}",
-                        "message": error_message,
-                    }
-            return parsed_json
-
-        except ValueError:
-            if response.ok:
-                return {
-                    "success": False,
-                    "error": {
-                        "code": "NON_JSON_RESPONSE",
-                        "message": "Received non-JSON success response from Ghidra plugin",
-                    },
-                    "status_code": response.status_code,
-                    "response_text": response.text[:500],
-                    "timestamp": int(time.time() * 1000),
-                }
-            return {
-                "success": False,
-                "error": {
-                    "code": f"HTTP_{response.status_code}",
-                    "message": f"Non-JSON error response: {response.text[:100]}...",
-                },
-                "status_code": response.status_code,
-                "response_text": response.text[:500],
-                "timestamp": int(time.time() * 1000),
-            }
 
-    except requests.exceptions.Timeout:
-        return error_response("REQUEST_TIMEOUT", "Request timed out", 408)
-    except requests.exceptions.ConnectionError:
-        return error_response("CONNECTION_ERROR", f"Failed to connect to Ghidra instance at {url}", 503)
-    except Exception as e:
-        return {
-            "success": False,
-            "error": {"code": "UNEXPECTED_ERROR", "message": f"An unexpected error occurred: {str(e)}"},
-            "exception": e.__class__.__name__,
-            "timestamp": int(time.time() * 1000),
-        }
+def _make_request(
+    method: str,
+    port: int,
+    endpoint: str,
+    params: dict | None = None,
+    json_data: dict | None = None,
+    data: str | None = None,
+    headers: dict | None = None,
+    timeout: float | None = None,
+) -> dict:
+    """Blocking request helper for scripts and other synchronous callers."""
+    base_url = get_instance_url(port)
+    return run_sync(_request(method, port, base_url, endpoint, params, json_data, data, headers, timeout))
+
+
+async def _async_make_request(
+    method: str,
+    port: int,
+    endpoint: str,
+    params: dict | None = None,
+    json_data: dict | None = None,
+    data: str | None = None,
+    headers: dict | None = None,
+    timeout: float | None = None,
+) -> dict:
+    """Async request helper; awaits the transport loop without blocking the caller's loop."""
+    base_url = await async_get_instance_url(port)
+    return await run_async(_request(method, port, base_url, endpoint, params, json_data, data, headers, timeout))
 
 
 # ---------------------------------------------------------------------------
 # Convenience HTTP verbs
 # ---------------------------------------------------------------------------
 
-def safe_get(port: int, endpoint: str, params: dict | None = None) -> dict:
+def _split_payload(data: dict | str) -> tuple[dict | None, dict | None, str | None]:
+    """Split a POST payload into (headers, json payload, text payload)."""
+    if isinstance(data, dict):
+        return data.pop("headers", None), data, None
+    return None, None, data
+
+
+async def async_safe_get(port: int, endpoint: str, params: dict | None = None, timeout: float | None = None) -> dict:
     """Make GET request to Ghidra instance."""
-    return _make_request("GET", port, endpoint, params=params)
+    return await _async_make_request("GET", port, endpoint, params=params, timeout=timeout)
 
 
-def safe_post(port: int, endpoint: str, data: dict | str) -> dict:
+async def async_safe_post(port: int, endpoint: str, data: dict | str, timeout: float | None = None) -> dict:
     """Make POST request with JSON or text payload."""
-    headers = None
-    json_payload = None
-    text_payload = None
-    if isinstance(data, dict):
-        headers = data.pop("headers", None)
-        json_payload = data
-    else:
-        text_payload = data
-    return _make_request("POST", port, endpoint, json_data=json_payload, data=text_payload, headers=headers)
+    headers, json_payload, text_payload = _split_payload(data)
+    return await _async_make_request(
+        "POST", port, endpoint, json_data=json_payload, data=text_payload, headers=headers, timeout=timeout
+    )
 
 
-def safe_put(port: int, endpoint: str, data: dict) -> dict:
+async def async_safe_put(port: int, endpoint: str, data: dict) -> dict:
     """Make PUT request with JSON payload."""
     headers = data.pop("headers", None) if isinstance(data, dict) else None
+    return await _async_make_request("PUT", port, endpoint, json_data=data, headers=headers)
+
+
+async def async_safe_patch(port: int, endpoint: str, data: dict) -> dict:
+    """Make PATCH request with JSON payload."""
+    headers = data.pop("headers", None) if isinstance(data, dict) else None
+    return await _async_make_request("PATCH", port, endpoint, json_data=data, headers=headers)
+
+
+async def async_safe_delete(port: int, endpoint: str) -> dict:
+    """Make DELETE request."""
+    return await _async_make_request("DELETE", port, endpoint)
+
+
+def safe_get(port: int, endpoint: str, params: dict | None = None, timeout: float | None = None) -> dict:
+    """Make GET request to Ghidra instance (blocking)."""
+    return _make_request("GET", port, endpoint, params=params, timeout=timeout)
+
+
+def safe_post(port: int, endpoint: str, data: dict | str, timeout: float | None = None) -> dict:
+    """Make POST request with JSON or text payload (blocking)."""
+    headers, json_payload, text_payload = _split_payload(data)
+    return _make_request(
+        "POST", port, endpoint, json_data=json_payload, data=text_payload, headers=headers, timeout=timeout
+    )
+
+
+def safe_put(port: int, endpoint: str, data: dict) -> dict:
+    """Make PUT request with JSON payload (blocking)."""
+    headers = data.pop("headers", None) if isinstance(data, dict) else None
     return _make_request("PUT", port, endpoint, json_data=data, headers=headers)
 
 
 def safe_patch(port: int, endpoint: str, data: dict) -> dict:
-    """Make PATCH request with JSON payload."""
+    """Make PATCH request with JSON payload (blocking)."""
     headers = data.pop("headers", None) if isinstance(data, dict) else None
     return _make_request("PATCH", port, endpoint, json_data=data, headers=headers)
 
 
 def safe_delete(port: int, endpoint: str) -> dict:
-    """Make DELETE request."""
+    """Make DELETE request (blocking)."""
     return _make_request("DELETE", port, endpoint)
 
 
+# ---------------------------------------------------------------------------
+# Streaming (newline-delimited JSON)
+# ---------------------------------------------------------------------------
+
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+
+
+async def _stream_lines(
+    port: int,
+    url: str,
+    json_data: dict,
+    headers: dict,
+    emit: Callable[[dict], None],
+    budget: Budget,
+    lane: str,
+) -> None:
+    """POST on the transport loop and emit each JSON line of the response as it arrives.
+
+    The budget bounds the wait for admission and the response headers
+    together, then each wait for the next line, not the whole stream.
+    Cancelling the call, or timing out, also cancels the batch in the plugin.
+
+    A non-streamed reply (an error envelope, or a plugin that ignored the
+    Accept header) is emitted as a single item.
+    """
+    client = get_client(port)
+    transient = transient_client(url) if client is None else None
+    try:
+        async with _admitted(port, lane, budget) as (remaining, deadline), (client or transient).stream(
+            "POST", url, json=json_data, headers=headers, timeout=remaining.httpx_timeout()
+        ) as response:
+            deadline.reschedule(None)
+            response_cache.observe_headers(port, response.headers)
+            if NDJSON_CONTENT_TYPE not in response.headers.get("Content-Type", ""):
+                emit(_parse_body(response.status_code, await response.aread()))
+                return
+            async for line in response.aiter_lines():
+                if line.strip():
+                    emit(_loads(line))
+    except QueueTimeout as e:
+        emit(error_response("INSTANCE_BUSY", f"{e}; the instance is saturated with other requests", 503))
+    except asyncio.CancelledError:
+        _cancel_in_background(port, url, headers)
+        raise
+    except (httpx.TimeoutException, TimeoutError):
+        _cancel_in_background(port, url, headers)
+        emit(error_response("REQUEST_TIMEOUT", "Request timed out", 408))
+    except httpx.TransportError:
+        emit(error_response("CONNECTION_ERROR", f"Failed to connect to Ghidra instance at {url}", 503))
+    except ValueError as e:
+        emit(error_response("INVALID_RESPONSE", f"Malformed streamed line: {e}"))
+    finally:
+        if transient is not None:
+            await transient.aclose()
+
+
+async def async_stream_post(port: int, endpoint: str, data: dict) -> AsyncIterator[dict]:
+    """POST a JSON payload and yield each item of a newline-delimited JSON response as it arrives.
+
+    Used for read-only batch endpoints, so it neither checks origin nor flushes
+    the response cache. Closing the iterator early cancels the request.
+    """
+    caller_loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    finished = object()
+
+    def emit(item: dict) -> None:
+        caller_loop.call_soon_threadsafe(queue.put_nowait, item)
+
+    headers = {
+        "Accept": f"{NDJSON_CONTENT_TYPE}, application/json",
+        "Content-Type": "application/json",
+        "X-Request-ID": _new_request_id(),
+    }
+    url = f"{await async_get_instance_url(port)}/{endpoint}"
+    task = asyncio.ensure_future(run_async(_stream_lines(port, url, data, headers, emit, budget_for(endpoint), lane_for(endpoint))))
+    task.add_done_callback(lambda _: queue.put_nowait(finished))
+    try:
+        while (item := await queue.get()) is not finished:
+            yield item
+        await task
+    finally:
+        if not task.done():
+            task.cancel()
+
+
+# ---------------------------------------------------------------------------
+# Streaming JSON decoding
+# ---------------------------------------------------------------------------
+
+STREAM_MIN_ITEMS = int(os.environ.get("GHIDRA_STREAM_MIN_ITEMS", "10000"))
+STREAM_CHUNK_SIZE = 64 * 1024
+STREAM_BATCH_ITEMS = 256
+STREAM_QUEUE_BATCHES = 4
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_CONTINUATION = frozenset("0123456789.eE+-")
+_json_decoder = json.JSONDecoder()
+
+
+class _JsonArrayReader:
+    """Decode one JSON object from a byte stream, handing out one of its arrays piecewise.
+
+    ``path`` names the array to stream, e.g. ``("result",)`` or
+    ``("result", "references")``. Its elements are passed to ``emit`` in
+    batches as soon as they are decoded and are not kept; it is left as an
+    empty list in ``envelope``, which collects every other member whole. Only
+    the undecoded tail of the body is buffered.
+    """
+
+    def __init__(self, chunks: AsyncIterator[bytes], path: tuple[str, ...]):
+        self._chunks = chunks
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self.path = path
+        self.envelope: dict = {}
+
+    async def read(self, emit: Callable[[list], Awaitable[None]]) -> dict:
+        """Decode the whole body; returns the envelope."""
+        await self._object(self.envelope, 0, emit)
+        return self.envelope
+
+    async def _fill(self) -> bool:
+        """Read until the undecoded text has at least doubled; False once the body is exhausted.
+
+        Doubling keeps re-decoding a value that straddles chunks linear overall.
+        """
+        if self._eof:
+            return False
+        parts = [self._buffer[self._pos:]]
+        target = max(2 * len(parts[0]), 1)
+        size = len(parts[0])
+        while size < target:
+            chunk = await anext(self._chunks, None)
+            if chunk is None:
+                parts.append(self._utf8.decode(b"", final=True))
+                self._eof = True
+                break
+            text = self._utf8.decode(chunk)
+            parts.append(text)
+            size += len(text)
+        self._buffer = "".join(parts)
+        self._pos = 0
+        return True
+
+    async def _peek(self) -> str:
+        """Skip whitespace and return the next character, or "" at the end of the body."""
+        while True:
+            self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not await self._fill():
+                return ""
+
+    async def _expect(self, chars: str) -> str:
+        char = await self._peek()
+        if not char or char not in chars:
+            raise ValueError(f"expected one of {chars!r}, got {char or 'end of body'!r}")
+        self._pos += 1
+        return char
+
+    async def _value(self) -> Any:
+        await self._peek()
+        while True:
+            try:
+                value, end = _json_decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not await self._fill():
+                    raise
+                continue
+            # A number cut off by the end of the buffer still decodes ("1" of
+            # "12", "2.5" of "2.5e3"), so only trust one followed by something else.
+            if (
+                not isinstance(value, (str, list, dict))
+                and (end == len(self._buffer) or self._buffer[end] in _NUMBER_CONTINUATION)
+                and await self._fill()
+            ):
+                continue
+            self._pos = end
+            return value
+
+    async def _object(self, target: dict, depth: int, emit: Callable[[list], Awaitable[None]]) -> None:
+        await self._expect("{")
+        if await self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = await self._value()
+            await self._expect(":")
+            on_path = depth < len(self.path) and key == self.path[depth]
+            last = depth == len(self.path) - 1
+            if on_path and await self._peek() == ("[" if last else "{"):
+                if last:
+                    target[key] = []
+                    await self._array(emit)
+                else:
+                    target[key] = {}
+                    await self._object(target[key], depth + 1, emit)
+            else:
+                target[key] = await self._value()
+            if await self._expect(",}") == "}":
+                return
+
+    async def _array(self, emit: Callable[[list], Awaitable[None]]) -> None:
+        await self._expect("[")
+        batch: list = []
+        if await self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            batch.append(await self._value())
+            if len(batch) >= STREAM_BATCH_ITEMS:
+                await emit(batch)
+                batch = []
+            if await self._expect(",]") == "]":
+                break
+        if batch:
+            await emit(batch)
+
+
+async def _stream_json(
+    port: int,
+    url: str,
+    params: dict | None,
+    headers: dict,
+    path: tuple[str, ...],
+    emit: Callable[[list], Awaitable[None]],
+    budget: Budget,
+    lane: str,
+) -> dict:
+    """GET on the transport loop, emitting the array at ``path`` in batches as it is decoded.
+
+    The budget bounds the wait for admission and the response headers
+    together, then each wait for more data, not the whole stream.
+
+    Returns the rest of the response. Error statuses are read whole and
+    returned as the parsed error response. Cancelling the call, or timing
+    out, also cancels the request in the plugin.
+    """
+    client = get_client(port)
+    transient = transient_client(url) if client is None else None
+    try:
+        async with _admitted(port, lane, budget) as (remaining, deadline), (client or transient).stream(
+            "GET", url, params=params, headers=headers, timeout=remaining.httpx_timeout()
+        ) as response:
+            deadline.reschedule(None)
+            response_cache.observe_headers(port, response.headers)
+            if not 200 <= response.status_code < 300:
+                return _parse_body(response.status_code, await response.aread())
+            reader = _JsonArrayReader(response.aiter_bytes(STREAM_CHUNK_SIZE), path)
+            envelope = await reader.read(emit)
+            envelope.setdefault("timestamp", int(time.time() * 1000))
+            return envelope
+    except QueueTimeout as e:
+        return error_response("INSTANCE_BUSY", f"{e}; the instance is saturated with other requests", 503)
+    except asyncio.CancelledError:
+        _cancel_in_background(port, url, headers)
+        raise
+    except (httpx.TimeoutException, TimeoutError):
+        _cancel_in_background(port, url, headers)
+        return error_response("REQUEST_TIMEOUT", "Request timed out", 408)
+    except httpx.TransportError:
+        return error_response("CONNECTION_ERROR", f"Failed to connect to Ghidra instance at {url}", 503)
+    except ValueError as e:
+        return error_response("NON_JSON_RESPONSE", f"Malformed JSON in streamed response: {e}")
+    finally:
+        if transient is not None:
+            await transient.aclose()
+
+
+async def async_stream_items(
+    port: int,
+    endpoint: str,
+    params: dict | None = None,
+    items_path: tuple[str, ...] = ("result",),
+    envelope: dict | None = None,
+) -> AsyncIterator[Any]:
+    """Yield the items of a listing response, simplified, as they are decoded off the socket.
+
+    For responses too big to hold as raw body, decoded text and objects at
+    once. Once iteration ends, ``envelope`` holds the rest of the response
+    passed through simplify_response, with the streamed list left empty; for a
+    failed request it holds the error. Bypasses the response cache. Closing
+    the iterator early cancels the request.
+    """
+    caller_loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    slots = asyncio.Semaphore(STREAM_QUEUE_BATCHES)
+    finished = object()
+
+    async def enqueue(batch: list) -> None:
+        await slots.acquire()
+        queue.put_nowait(batch)
+
+    async def emit(batch: list) -> None:
+        # Waits for the caller to catch up, so a slow consumer throttles the socket.
+        await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(enqueue(batch), caller_loop))
+
+    headers = {"Accept": "application/json", "X-Request-ID": _new_request_id()}
+    url = f"{await async_get_instance_url(port)}/{endpoint}"
+    task = asyncio.ensure_future(
+        run_async(_stream_json(port, url, params, headers, items_path, emit, budget_for(endpoint), lane_for(endpoint)))
+    )
+    task.add_done_callback(lambda _: queue.put_nowait(finished))
+    try:
+        while (batch := await queue.get()) is not finished:
+            slots.release()
+            for item in batch:
+                yield simplify_item(item)
+        if envelope is not None:
+            envelope.update(simplify_response(await task))
+    finally:
+        if not task.done():
+            task.cancel()
+
+
+async def async_get_streamed(
+    port: int,
+    endpoint: str,
+    params: dict | None = None,
+    items_path: tuple[str, ...] = ("result",),
+) -> dict:
+    """Same result as simplify_response(await async_safe_get(...)), decoded incrementally.
+
+    Peak memory is roughly the simplified items alone, instead of those plus
+    the raw body, its decoded text and the unsimplified objects.
+    """
+    envelope: dict = {}
+    items = [item async for item in async_stream_items(port, endpoint, params, items_path, envelope)]
+    if not envelope.get("success"):
+        return envelope
+    parent = envelope
+    for key in items_path[:-1]:
+        parent = parent.get(key) if isinstance(parent, dict) else None
+    if isinstance(parent, dict) and isinstance(parent.get(items_path[-1]), list):
+        parent[items_path[-1]] = items
+    return envelope
+
+
+async def async_get_listing(
+    port: int,
+    endpoint: str,
+    params: dict,
+    items_path: tuple[str, ...] = ("result",),
+    lean: bool | None = None,
+) -> dict:
+    """Fetch and simplify one listing page for a list tool.
+
+    A lean page (``lean``, or GHIDRA_LEAN when it is None) is requested without
+    links and returned in columnar form. The page is streamed when its limit
+    is GHIDRA_STREAM_MIN_ITEMS or more.
+    """
+    params = lean_params(params, lean)
+    if STREAM_MIN_ITEMS > 0 and int(params.get("limit", 0)) >= STREAM_MIN_ITEMS:
+        response = await async_get_streamed(port, endpoint, params, items_path)
+    else:
+        response = simplify_response(await async_safe_get(port, endpoint, params))
+    return to_columns(response, items_path) if use_lean(lean) else response
+
+
+# ---------------------------------------------------------------------------
+# Auto-pagination
+# ---------------------------------------------------------------------------
+
+PAGE_TARGET_SECONDS = float(os.environ.get("GHIDRA_PAGE_TARGET_SECONDS", "0.5"))
+PAGE_MIN_SIZE = 50
+PAGE_MAX_SIZE = int(os.environ.get("GHIDRA_PAGE_MAX_SIZE", "5000"))
+
+
+def page_items(page: dict) -> list:
+    """The items of a simplified listing page (xrefs nest them under ``references``)."""
+    result = page.get("result") if isinstance(page, dict) else None
+    if isinstance(result, dict):
+        result = result.get("references")
+    return result if isinstance(result, list) else []
+
+
+def _next_page_request(page: dict) -> tuple[str, dict] | None:
+    """Endpoint and params for the page after this one, taken from its ``next`` link."""
+    href = (page.get("api_links") or {}).get("next")
+    if not href:
+        return None
+    parts = urlsplit(href)
+    return parts.path.lstrip("/"), dict(parse_qsl(parts.query, keep_blank_values=True))
+
+
+def _adapt_page_size(size: int, elapsed: float) -> int:
+    """Double the page size while pages come back fast, halve it when they are slow."""
+    if elapsed < PAGE_TARGET_SECONDS / 2:
+        return min(size * 2, PAGE_MAX_SIZE)
+    if elapsed > PAGE_TARGET_SECONDS:
+        return max(size // 2, PAGE_MIN_SIZE)
+    return size
+
+
+async def _timed_get(port: int, endpoint: str, params: dict) -> tuple[dict, float]:
+    start = time.monotonic()
+    response = await async_safe_get(port, endpoint, params)
+    return response, time.monotonic() - start
+
+
+async def async_iter_pages(
+    port: int,
+    endpoint: str,
+    params: dict | None = None,
+    page_size: int = 100,
+    max_items: int | None = None,
+) -> AsyncIterator[dict]:
+    """Yield simplified pages of a listing endpoint by following its ``next`` links.
+
+    Starts in cursor mode, so every page costs the plugin the same. The next
+    page is requested before the current one is yielded, and its size adapts
+    so a page takes about GHIDRA_PAGE_TARGET_SECONDS. With ``max_items`` the
+    last request is shrunk so the final page's ``next_cursor`` resumes exactly
+    where iteration stopped. Iteration ends after an error page.
+    """
+    size = max(1, min(page_size, max_items)) if max_items else page_size
+    fetched = 0
+    pending: asyncio.Future | None = asyncio.ensure_future(
+        _timed_get(port, endpoint, {**(params or {}), "cursor": "", "limit": size})
+    )
+    try:
+        while pending is not None:
+            response, elapsed = await pending
+            pending = None
+            page = simplify_response(response)
+            fetched += len(page_items(page))
+
+            next_request = _next_page_request(page) if page.get("success") else None
+            if next_request is not None and (max_items is None or fetched < max_items):
+                size = _adapt_page_size(size, elapsed)
+                if max_items is not None:
+                    size = min(size, max_items - fetched)
+                next_endpoint, next_params = next_request
+                # Links only carry what the plugin echoes back (not e.g. lean)
+                next_params = {**(params or {}), **next_params, "limit": size}
+                pending = asyncio.ensure_future(_timed_get(port, next_endpoint, next_params))
+            yield page
+    finally:
+        if pending is not None and not pending.done():
+            pending.cancel()
+
+
+async def async_list_all(
+    port: int,
+    endpoint: str,
+    params: dict | None = None,
+    max_results: int = 1000,
+    page_size: int = 100,
+    on_page: Callable[[int], Awaitable[None]] | None = None,
+    lean: bool | None = None,
+) -> dict:
+    """Collect every item of a listing (up to ``max_results``) into one response.
+
+    ``on_page`` is awaited with the running item count after each page. An
+    error part-way through returns the items collected so far alongside it.
+    ``lean`` is as for async_get_listing.
+    """
+    items: list = []
+    pages = 0
+    last: dict = {}
+    params = lean_params(params or {}, lean)
+    async with aclosing(async_iter_pages(port, endpoint, params, page_size, max_results)) as page_iter:
+        async for page in page_iter:
+            last = page
+            if not page.get("success"):
+                if not items:
+                    return page
+                break
+            pages += 1
+            items.extend(page_items(page))
+            if on_page is not None:
+                await on_page(len(items))
+
+    response: dict[str, Any] = {
+        "success": bool(last.get("success")),
+        "result": items,
+        "size": len(items),
+        "pages": pages,
+        "truncated": False,
+    }
+    if not last.get("success"):
+        response["error"] = last.get("error")
+    elif _next_page_request(last) is not None:
+        response["truncated"] = True
+        if last.get("next_cursor"):
+            response["next_cursor"] = last["next_cursor"]
+    return to_columns(response) if use_lean(lean) else response
+
+
 # ---------------------------------------------------------------------------
 # Response helpers
 # ---------------------------------------------------------------------------
@@ -187,76 +1017,124 @@ def error_response(code: str, message: str, status_code: int | None = None) -> d
     return resp
 
 
+def format_disassembly(instructions: list) -> str:
+    """Render plugin instruction dicts as ``address: bytes  mnemonic operands`` lines."""
+    return "".join(
+        f"{instr.get('address', '')}: {instr.get('bytes', '').ljust(10)}  "
+        f"{instr.get('mnemonic', '')} {instr.get('operands', '')}\n"
+        for instr in instructions
+        if isinstance(instr, dict)
+    )
+
+
+# One shared key string per link name, rather than a fresh one per item.
+_url_keys: dict[str, str] = {}
+
+
+def simplify_item(item: Any) -> Any:
+    """Flatten a dict's ``_links`` into ``<name>_url`` fields, in place."""
+    if isinstance(item, dict):
+        links = item.pop("_links", None)
+        if isinstance(links, dict):
+            for link_name, link_data in links.items():
+                if isinstance(link_data, dict) and "href" in link_data:
+                    key = _url_keys.get(link_name) or _url_keys.setdefault(link_name, f"{link_name}_url")
+                    item[key] = link_data["href"]
+    return item
+
+
 def simplify_response(response: dict) -> dict:
-    """Simplify HATEOAS response for AI agent consumption."""
+    """Simplify HATEOAS response for AI agent consumption.
+
+    Works in place, in a single pass, and returns the same dict: every caller
+    gets its own freshly decoded response, so there is nothing to protect by
+    copying.
+    """
     if not isinstance(response, dict):
         return response
 
-    result = response.copy()
-
-    api_metadata: dict[str, Any] = {}
-    for key in ("id", "instance", "timestamp", "size", "offset", "limit"):
-        if key in result:
-            api_metadata[key] = result.get(key)
-
-    if "result" in result:
-        if isinstance(result["result"], list):
-            simplified_items = []
-            for item in result["result"]:
-                if isinstance(item, dict):
-                    item_copy = item.copy()
-                    links = item_copy.pop("_links", None)
-                    if isinstance(links, dict):
-                        for link_name, link_data in links.items():
-                            if isinstance(link_data, dict) and "href" in link_data:
-                                item_copy[f"{link_name}_url"] = link_data["href"]
-                    simplified_items.append(item_copy)
-                else:
-                    simplified_items.append(item)
-            result["result"] = simplified_items
-
-        elif isinstance(result["result"], dict):
-            result_copy = result["result"].copy()
-            links = result_copy.pop("_links", None)
-
-            if isinstance(links, dict):
-                for link_name, link_data in links.items():
-                    if isinstance(link_data, dict) and "href" in link_data:
-                        result_copy[f"{link_name}_url"] = link_data["href"]
-
-            if "instructions" in result_copy and isinstance(result_copy["instructions"], list):
-                disasm_text = ""
-                for instr in result_copy["instructions"]:
-                    if isinstance(instr, dict):
-                        addr = instr.get("address", "")
-                        mnemonic = instr.get("mnemonic", "")
-                        operands = instr.get("operands", "")
-                        bytes_str = instr.get("bytes", "")
-                        disasm_text += f"{addr}: {bytes_str.ljust(10)}  {mnemonic} {operands}\n"
-                result_copy["disassembly_text"] = disasm_text
-                result_copy.pop("instructions", None)
-
-            if "ccode" in result_copy:
-                result_copy["decompiled_text"] = result_copy["ccode"]
-            elif "decompiled" in result_copy:
-                result_copy["decompiled_text"] = result_copy["decompiled"]
-
-            result["result"] = result_copy
-
-    links = result.pop("_links", None)
+    result = response.get("result")
+    if isinstance(result, list):
+        for item in result:
+            if isinstance(item, dict) and "_links" in item:
+                simplify_item(item)
+
+    elif isinstance(result, dict):
+        simplify_item(result)
+
+        instructions = result.get("instructions")
+        if isinstance(instructions, list):
+            result["disassembly_text"] = format_disassembly(instructions)
+            del result["instructions"]
+
+        if "ccode" in result:
+            result["decompiled_text"] = result["ccode"]
+        elif "decompiled" in result:
+            result["decompiled_text"] = result["decompiled"]
+
+    links = response.pop("_links", None)
     if isinstance(links, dict):
-        api_links: dict[str, str] = {}
-        for link_name, link_data in links.items():
-            if isinstance(link_data, dict) and "href" in link_data:
-                api_links[link_name] = link_data["href"]
+        api_links = {
+            link_name: link_data["href"]
+            for link_name, link_data in links.items()
+            if isinstance(link_data, dict) and "href" in link_data
+        }
         if api_links:
-            result["api_links"] = api_links
+            response["api_links"] = api_links
+
+    return response
+
+
+# ---------------------------------------------------------------------------
+# Lean listings
+# ---------------------------------------------------------------------------
+
+LEAN_RESPONSES = os.environ.get("GHIDRA_LEAN", "0").lower() not in ("0", "false", "no", "")
+LEAN_PARAM = "lean"
+
 
-    for key, value in api_metadata.items():
-        if key not in result:
-            result[key] = value
+def use_lean(lean: bool | None) -> bool:
+    """Whether a listing call is lean: its own ``lean`` argument, else GHIDRA_LEAN."""
+    return LEAN_RESPONSES if lean is None else lean
 
-    return result
+
+def lean_params(params: dict, lean: bool | None = None) -> dict:
+    """Add the lean flag to listing params when the call is lean.
+
+    Sent as a query parameter rather than the X-Ghidra-Lean header so lean and
+    full pages get different response cache keys.
+    """
+    return {**params, LEAN_PARAM: "1"} if use_lean(lean) else params
+
+
+def to_columns(response: dict, items_path: tuple[str, ...] = ("result",)) -> dict:
+    """Rewrite a listing's items as rows, with their field names given once in ``columns``.
+
+    ``columns`` is placed just before the rows. Fields missing from an item
+    are null in its row. Anything that is not a list of dicts is left alone.
+    """
+    parents = [response]
+    for key in items_path[:-1]:
+        child = parents[-1].get(key) if isinstance(parents[-1], dict) else None
+        parents.append(child)
+    parent, field = parents[-1], items_path[-1]
+    items = parent.get(field) if isinstance(parent, dict) else None
+    if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+        return response
+
+    columns = list(dict.fromkeys(key for item in items for key in item))
+    rows = [[item.get(column) for column in columns] for item in items]
+    rebuilt: dict[str, Any] = {}
+    for key, value in parent.items():
+        if key == field:
+            rebuilt["columns"] = columns
+            value = rows
+        rebuilt[key] = value
+
+    if len(parents) == 1:
+        return rebuilt
+    parents[-2][items_path[-2]] = rebuilt
+    return response
 
 
 # ---------------------------------------------------------------------------
@@ -273,19 +1151,54 @@ def _extract_error_message(simplified: dict, default: str) -> str:
     return default
 
 
-def fetch_decompiled(port: int, address: str | None = None, name: str | None = None) -> str:
-    """Fetch decompiled C code for a function (shared by resources + tools)."""
-    port = get_instance_port(port)
-    params = {"syntax_tree": "false", "style": "normalize"}
-
+def _function_endpoint(address: str | None, name: str | None, resource: str | None = None) -> str | None:
+    """Build the function endpoint for an address or name, or None if neither is given."""
     if address:
-        endpoint = f"functions/{address}/decompile"
+        endpoint = f"functions/{address}"
     elif name:
-        endpoint = f"functions/by-name/{quote(name)}/decompile"
+        endpoint = f"functions/by-name/{quote(name)}"
     else:
-        return "Error: Either address or name is required"
+        return None
+    return f"{endpoint}/{resource}" if resource else endpoint
+
+
+DECOMPILE_PARAMS = {"syntax_tree": "false", "style": "normalize"}
+
 
-    response = safe_get(port, endpoint, params)
+def slice_decompiled(
+    text: str,
+    start_line: int | None = None,
+    end_line: int | None = None,
+    max_lines: int | None = None,
+) -> tuple[str, dict]:
+    """Cut a line window out of full decompiled text, as the plugin's line filter does.
+
+    Returns (window text, filter metadata). Lines are 1-indexed and end_line is
+    inclusive; max_lines takes precedence over end_line.
+    """
+    lines = text.split("\n")
+    while len(lines) > 1 and lines[-1] == "":
+        lines.pop()  # match Java's String.split, which drops trailing empty lines
+
+    start = start_line - 1 if start_line and start_line > 0 else 0
+    end = min(len(lines), end_line) if end_line and end_line > 0 else len(lines)
+    if max_lines and max_lines > 0:
+        end = min(end, start + max_lines)
+
+    window = "\n".join(lines[start:end]) if start < len(lines) else "// No lines in specified range"
+
+    filter_info: dict[str, int] = {"total_lines": len(lines)}
+    if start_line and start_line > 0:
+        filter_info["start_line"] = start_line
+    if end_line and end_line > 0:
+        filter_info["end_line"] = end_line
+    if max_lines and max_lines > 0:
+        filter_info["max_lines"] = max_lines
+    return window, filter_info
+
+
+def _extract_decompiled(response: dict) -> str:
+    """Pull decompiled C code out of a raw decompile response."""
     simplified = simplify_response(response)
 
     if (
@@ -304,18 +1217,8 @@ def fetch_decompiled(port: int, address: str | None = None, name: str | None = N
     return "Error: Could not extract decompiled code from response"
 
 
-def fetch_function_info(port: int, address: str | None = None, name: str | None = None) -> dict:
-    """Fetch function metadata (shared by resources + tools)."""
-    port = get_instance_port(port)
-
-    if address:
-        endpoint = f"functions/{address}"
-    elif name:
-        endpoint = f"functions/by-name/{quote(name)}"
-    else:
-        return error_response("MISSING_PARAMETER", "Either address or name is required")
-
-    response = safe_get(port, endpoint)
+def _extract_function_info(response: dict) -> dict:
+    """Pull function metadata out of a raw function response."""
     simplified = simplify_response(response)
 
     if (
@@ -336,18 +1239,8 @@ def fetch_function_info(port: int, address: str | None = None, name: str | None
     return simplified["result"]
 
 
-def fetch_disassembly(port: int, address: str | None = None, name: str | None = None) -> str:
-    """Fetch formatted disassembly listing (shared by resources + tools)."""
-    port = get_instance_port(port)
-
-    if address:
-        endpoint = f"functions/{address}/disassembly"
-    elif name:
-        endpoint = f"functions/by-name/{quote(name)}/disassembly"
-    else:
-        return "Error: Either address or name is required"
-
-    response = safe_get(port, endpoint)
+def _extract_disassembly(response: dict) -> str:
+    """Pull a formatted disassembly listing out of a raw disassembly response."""
     simplified = simplify_response(response)
 
     if (
@@ -362,18 +1255,64 @@ def fetch_disassembly(port: int, address: str | None = None, name: str | None =
     if isinstance(result, dict) and "disassembly_text" in result:
         return result["disassembly_text"]
 
-    if isinstance(result, dict) and "instructions" in result and isinstance(result["instructions"], list):
-        disasm_text = ""
-        for instr in result["instructions"]:
-            if isinstance(instr, dict):
-                addr = instr.get("address", "")
-                mnemonic = instr.get("mnemonic", "")
-                operands = instr.get("operands", "")
-                bytes_str = instr.get("bytes", "")
-                disasm_text += f"{addr}: {bytes_str.ljust(10)}  {mnemonic} {operands}\n"
-        return disasm_text
+    if isinstance(result, dict) and isinstance(result.get("instructions"), list):
+        return format_disassembly(result["instructions"])
 
     if isinstance(result, dict) and "disassembly" in result:
         return result["disassembly"]
 
     return "Error: Could not extract disassembly from response"
+
+
+def fetch_decompiled(port: int, address: str | None = None, name: str | None = None) -> str:
+    """Fetch decompiled C code for a function (shared by resources + tools)."""
+    port = get_instance_port(port)
+    endpoint = _function_endpoint(address, name, "decompile")
+    if endpoint is None:
+        return "Error: Either address or name is required"
+    return _extract_decompiled(safe_get(port, endpoint, dict(DECOMPILE_PARAMS)))
+
+
+def fetch_function_info(port: int, address: str | None = None, name: str | None = None) -> dict:
+    """Fetch function metadata (shared by resources + tools)."""
+    port = get_instance_port(port)
+    endpoint = _function_endpoint(address, name)
+    if endpoint is None:
+        return error_response("MISSING_PARAMETER", "Either address or name is required")
+    return _extract_function_info(safe_get(port, endpoint))
+
+
+def fetch_disassembly(port: int, address: str | None = None, name: str | None = None) -> str:
+    """Fetch formatted disassembly listing (shared by resources + tools)."""
+    port = get_instance_port(port)
+    endpoint = _function_endpoint(address, name, "disassembly")
+    if endpoint is None:
+        return "Error: Either address or name is required"
+    return _extract_disassembly(safe_get(port, endpoint))
+
+
+async def async_fetch_decompiled(port: int, address: str | None = None, name: str | None = None) -> str:
+    """Async variant of fetch_decompiled."""
+    port = await async_get_instance_port(port)
+    endpoint = _function_endpoint(address, name, "decompile")
+    if endpoint is None:
+        return "Error: Either address or name is required"
+    return _extract_decompiled(await async_safe_get(port, endpoint, dict(DECOMPILE_PARAMS)))
+
+
+async def async_fetch_function_info(port: int, address: str | None = None, name: str | None = None) -> dict:
+    """Async variant of fetch_function_info."""
+    port = await async_get_instance_port(port)
+    endpoint = _function_endpoint(address, name)
+    if endpoint is None:
+        return error_response("MISSING_PARAMETER", "Either address or name is required")
+    return _extract_function_info(await async_safe_get(port, endpoint))
+
+
+async def async_fetch_disassembly(port: int, address: str | None = None, name: str | None = None) -> str:
+    """Async variant of fetch_disassembly."""
+    port = await async_get_instance_port(port)
+    endpoint = _function_endpoint(address, name, "disassembly")
+    if endpoint is None:
+        return "Error: Either address or name is required"
+    return _extract_disassembly(await async_safe_get(port, endpoint))
@@ -0,0 +1,440 @@
+"""Local SQLite index of a program's functions, symbols, strings, segments and xrefs.
+
+Name and address lookups are answered from an on-disk index instead of making
+the plugin walk the whole program. There is one index file per program,
+named after the program's project path, so a bridge restart reuses it. The
+index records the program state (program identity and modification number)
+it was exported at, and is re-exported when that state moves.
+"""
+
+import asyncio
+import hashlib
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import aclosing, closing
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable
+
+from cache import response_cache
+from http_client import LEAN_PARAM, async_iter_pages, async_safe_get, page_items, simplify_response
+
+INDEX_ENABLED = os.environ.get("GHIDRA_INDEX", "1") != "0"
+INDEX_DIR = Path(os.environ.get("GHIDRA_INDEX_DIR", str(Path.home() / ".cache" / "ghidra-mcp" / "index")))
+INDEX_PAGE_SIZE = 1000
+SCHEMA_VERSION = "1"
+
+SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE functions (name TEXT, address TEXT, offset INTEGER);
+CREATE TABLE symbols (name TEXT, address TEXT, offset INTEGER, namespace TEXT, type TEXT, is_primary INTEGER);
+CREATE TABLE strings (value TEXT, address TEXT, offset INTEGER, length INTEGER, type TEXT, name TEXT);
+CREATE TABLE segments (name TEXT, start TEXT, end TEXT, offset INTEGER, end_offset INTEGER, size INTEGER,
+                       readable INTEGER, writable INTEGER, executable INTEGER, initialized INTEGER);
+CREATE TABLE xrefs (from_addr TEXT, from_offset INTEGER, to_addr TEXT, to_offset INTEGER,
+                    ref_type TEXT, is_primary INTEGER);
+"""
+
+# Built after the bulk insert, which is faster than maintaining them row by row
+INDEXES = """
+CREATE INDEX functions_name ON functions (name);
+CREATE INDEX functions_offset ON functions (offset);
+CREATE INDEX symbols_name ON symbols (name);
+CREATE INDEX symbols_offset ON symbols (offset);
+CREATE INDEX strings_offset ON strings (offset);
+CREATE INDEX xrefs_from ON xrefs (from_offset);
+CREATE INDEX xrefs_to ON xrefs (to_offset);
+"""
+
+# Column searched by name filters for each kind
+NAME_COLUMNS = {"functions": "name", "symbols": "name", "strings": "value", "segments": "name"}
+
+
+def parse_offset(address: Any) -> int | None:
+    """Numeric offset of a plugin address string ("00401000", "ram:00401000", "0x401000")."""
+    if not isinstance(address, str) or not address:
+        return None
+    text = address.rsplit(":", 1)[-1]
+    try:
+        return int(text, 16)
+    except ValueError:
+        return None
+
+
+def require_offset(address: str, parameter: str) -> int:
+    """Offset of an address given as a query parameter; ValueError if it doesn't parse."""
+    offset = parse_offset(address)
+    if offset is None:
+        raise ValueError(f"Invalid {parameter}: {address!r} is not a hex address")
+    return offset
+
+
+def _function_row(item: dict) -> tuple:
+    return item.get("name"), item.get("address"), parse_offset(item.get("address"))
+
+
+def _symbol_row(item: dict) -> tuple:
+    return (
+        item.get("name"),
+        item.get("address"),
+        parse_offset(item.get("address")),
+        item.get("namespace"),
+        item.get("type"),
+        int(bool(item.get("isPrimary"))),
+    )
+
+
+def _string_row(item: dict) -> tuple:
+    return (
+        item.get("value"),
+        item.get("address"),
+        parse_offset(item.get("address")),
+        item.get("length"),
+        item.get("type"),
+        item.get("name"),
+    )
+
+
+def _segment_row(item: dict) -> tuple:
+    return (
+        item.get("name"),
+        item.get("start"),
+        item.get("end"),
+        parse_offset(item.get("start")),
+        parse_offset(item.get("end")),
+        item.get("size"),
+        int(bool(item.get("readable"))),
+        int(bool(item.get("writable"))),
+        int(bool(item.get("executable"))),
+        int(bool(item.get("initialized"))),
+    )
+
+
+def _xref_row(item: dict) -> tuple:
+    return (
+        item.get("from_addr"),
+        parse_offset(item.get("from_addr")),
+        item.get("to_addr"),
+        parse_offset(item.get("to_addr")),
+        item.get("refType"),
+        int(bool(item.get("isPrimary"))),
+    )
+
+
+# (table, plugin endpoint, row builder, placeholder count)
+EXPORTS: list[tuple[str, str, Callable[[dict], tuple], int]] = [
+    ("functions", "functions", _function_row, 3),
+    ("symbols", "symbols", _symbol_row, 6),
+    ("strings", "strings", _string_row, 6),
+    ("segments", "segments", _segment_row, 10),
+    ("xrefs", "xrefs", _xref_row, 6),
+]
+
+
+@lru_cache(maxsize=64)
+def _compile(pattern: str) -> re.Pattern:
+    return re.compile(pattern)
+
+
+def _regexp(pattern: str, value: str | None) -> bool:
+    return value is not None and _compile(pattern).fullmatch(value) is not None
+
+
+def _escape_like(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class ProgramIndex:
+    """Read-only queries against one program's index file."""
+
+    def __init__(self, path: Path):
+        self.path = path
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+        conn.row_factory = sqlite3.Row
+        conn.create_function("REGEXP", 2, _regexp, deterministic=True)
+        return conn
+
+    def meta(self) -> dict[str, str]:
+        with closing(self._connect()) as conn:
+            return {row["key"]: row["value"] for row in conn.execute("SELECT key, value FROM meta")}
+
+    def counts(self) -> dict[str, int]:
+        with closing(self._connect()) as conn:
+            return {
+                table: conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                for table, *_ in EXPORTS
+            }
+
+    def search(
+        self,
+        kind: str,
+        name: str | None = None,
+        name_contains: str | None = None,
+        name_regex: str | None = None,
+        start: int | None = None,
+        end: int | None = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> tuple[list[dict], int]:
+        """Filter one table by name and address range; returns (page, total matches).
+
+        For segments the range selects segments overlapping [start, end].
+        """
+        column = NAME_COLUMNS[kind]
+        clauses: list[str] = []
+        args: list[Any] = []
+        if name is not None:
+            clauses.append(f"{column} = ?")
+            args.append(name)
+        if name_contains:
+            clauses.append(f"{column} LIKE ? ESCAPE '\\'")
+            args.append(f"%{_escape_like(name_contains)}%")
+        if name_regex:
+            _compile(name_regex)  # surface pattern errors before querying
+            clauses.append(f"{column} REGEXP ?")
+            args.append(name_regex)
+        end_column = "end_offset" if kind == "segments" else "offset"
+        if start is not None:
+            clauses.append(f"{end_column} >= ?")
+            args.append(start)
+        if end is not None:
+            clauses.append("offset <= ?")
+            args.append(end)
+
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with closing(self._connect()) as conn:
+            total = conn.execute(f"SELECT COUNT(*) FROM {kind}{where}", args).fetchone()[0]
+            rows = conn.execute(
+                f"SELECT * FROM {kind}{where} ORDER BY offset LIMIT ? OFFSET ?", [*args, limit, offset]
+            ).fetchall()
+        return [dict(row) for row in rows], total
+
+    def xrefs(
+        self,
+        to_addr: str | None = None,
+        from_addr: str | None = None,
+        ref_type: str | None = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> tuple[list[dict], int]:
+        """References to and/or from an address; returns (page, total matches).
+
+        Raises ValueError for an address that doesn't parse.
+        """
+        clauses: list[str] = []
+        args: list[Any] = []
+        if to_addr:
+            clauses.append("to_offset = ?")
+            args.append(require_offset(to_addr, "to_addr"))
+        if from_addr:
+            clauses.append("from_offset = ?")
+            args.append(require_offset(from_addr, "from_addr"))
+        where = " OR ".join(clauses)
+        if ref_type:
+            where = f"({where}) AND ref_type = ? COLLATE NOCASE"
+            args.append(ref_type)
+        with closing(self._connect()) as conn:
+            total = conn.execute(f"SELECT COUNT(*) FROM xrefs WHERE {where}", args).fetchone()[0]
+            rows = conn.execute(
+                f"SELECT * FROM xrefs WHERE {where} ORDER BY from_offset LIMIT ? OFFSET ?",
+                [*args, limit, offset],
+            ).fetchall()
+        return [dict(row) for row in rows], total
+
+
+class IndexManager:
+    """Builds, refreshes and locates per-program index files.
+
+    Exports run on a small worker pool, each on its own event loop; a program
+    is only ever exported by one worker at a time, and callers that need a
+    fresh index while an export is running wait for that export.
+    """
+
+    def __init__(self, directory: Path = INDEX_DIR, workers: int = 2):
+        self.directory = Path(directory)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="GhidraMCP-Index")
+        self._lock = threading.Lock()
+        self._syncing: dict[Path, Future] = {}
+        self.exports = 0
+        self.failed_exports = 0
+
+    def path_for(self, program_id: str) -> Path:
+        """Index file for a program, keyed by its project path."""
+        digest = hashlib.sha1(program_id.encode("utf-8")).hexdigest()[:16]
+        stem = re.sub(r"[^A-Za-z0-9._-]+", "_", program_id.rsplit("/", 1)[-1])[:40]
+        return self.directory / f"{stem}-{digest}.sqlite"
+
+    async def _identity(self, port: int) -> tuple[str, tuple[str, str] | None]:
+        """(program ID, current program state) for the program open on a port.
+
+        The state is the program identity and modification number. A plugin
+        that sends no identity still reports its per-session program ID, which
+        together with the program ID names the program within this Ghidra
+        session. None if the plugin reports no program state at all.
+        """
+        response = simplify_response(await async_safe_get(port, "program"))
+        result = response.get("result") if isinstance(response, dict) else None
+        if not response.get("success") or not isinstance(result, dict):
+            message = (response.get("error") or {}).get("message", "no program loaded")
+            raise RuntimeError(f"Cannot read program on port {port}: {message}")
+        program_id = result.get("programId") or result.get("name") or f"port-{port}"
+        state = response_cache.persistent_state(port)
+        if state is None:
+            session_state = response_cache.program_state(port)
+            if session_state is not None:
+                state = (f"{program_id}#session-{session_state[0]}", session_state[1])
+        return program_id, state
+
+    @staticmethod
+    def _require_state(port: int, state: tuple[str, str] | None) -> tuple[str, str]:
+        """The program state, or RuntimeError if the plugin reports none."""
+        if state is None:
+            raise RuntimeError(
+                f"The plugin on port {port} reports no program state (modification number), "
+                "so an index of its program could never be known to be current"
+            )
+        return state
+
+    @staticmethod
+    def _is_fresh(path: Path, state: tuple[str, str]) -> bool:
+        if not path.exists():
+            return False
+        try:
+            meta = ProgramIndex(path).meta()
+        except sqlite3.Error:
+            return False
+        return (
+            meta.get("schema_version") == SCHEMA_VERSION
+            and meta.get("program_state_id") == state[0]
+            and meta.get("modification_number") == state[1]
+        )
+
+    def _claim(self, path: Path) -> tuple[Future, bool]:
+        """Return the running export for a path, or a new future the caller must complete."""
+        with self._lock:
+            running = self._syncing.get(path)
+            if running is not None and not running.done():
+                return running, False
+            future: Future = Future()
+            self._syncing[path] = future
+            return future, True
+
+    def _run_export(self, future: Future, port: int, program_id: str, path: Path, force: bool = False) -> None:
+        try:
+            future.set_result(asyncio.run(self._export(port, program_id, path, force)))
+        except Exception as e:
+            self.failed_exports += 1
+            print(f"Index export for {program_id} on port {port} failed: {e}", file=sys.stderr)
+            future.set_exception(e)
+
+    async def _export(self, port: int, program_id: str, path: Path, force: bool = False) -> dict[str, Any]:
+        """Export the whole program into a fresh file and swap it into place.
+
+        The current file keeps serving queries until the new one replaces it.
+        Without ``force`` an index that is already fresh is kept as it is.
+        """
+        _, state = await self._identity(port)
+        state = self._require_state(port, state)
+        if not force and self._is_fresh(path, state):
+            return ProgramIndex(path).meta()
+
+        started = time.monotonic()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.unlink(missing_ok=True)
+        try:
+            with closing(sqlite3.connect(tmp)) as conn:
+                conn.execute("PRAGMA journal_mode = OFF")
+                conn.execute("PRAGMA synchronous = OFF")
+                conn.executescript(SCHEMA)
+                for table, endpoint, make_row, columns in EXPORTS:
+                    insert = f"INSERT INTO {table} VALUES ({', '.join('?' * columns)})"
+                    pages = async_iter_pages(port, endpoint, {LEAN_PARAM: "1"}, INDEX_PAGE_SIZE)
+                    async with aclosing(pages) as page_iter:
+                        async for page in page_iter:
+                            if not page.get("success"):
+                                message = (page.get("error") or {}).get("message", "request failed")
+                                raise RuntimeError(f"Exporting {endpoint} failed: {message}")
+                            conn.executemany(insert, [make_row(item) for item in page_items(page)])
+                conn.executescript(INDEXES)
+                # Record the state seen before the export, so changes made while
+                # it ran leave the index stale rather than silently mixed.
+                meta = {
+                    "schema_version": SCHEMA_VERSION,
+                    "program_id": program_id,
+                    "program_state_id": state[0],
+                    "modification_number": state[1],
+                    "built_at": str(int(time.time())),
+                    "build_seconds": f"{time.monotonic() - started:.2f}",
+                }
+                conn.executemany("INSERT INTO meta VALUES (?, ?)", meta.items())
+                conn.commit()
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+        self.exports += 1
+        return meta
+
+    def _background_sync(self, port: int) -> None:
+        try:
+            program_id, state = asyncio.run(self._identity(port))
+            self._require_state(port, state)
+        except Exception as e:
+            print(f"Skipping index sync for port {port}: {e}", file=sys.stderr)
+            return
+        path = self.path_for(program_id)
+        future, owner = self._claim(path)
+        if owner:
+            self._run_export(future, port, program_id, path)
+
+    def schedule_sync(self, port: int) -> None:
+        """Bring a newly registered instance's index up to date in the background."""
+        if INDEX_ENABLED:
+            self._executor.submit(self._background_sync, port)
+
+    async def get(self, port: int, rebuild: bool = False) -> ProgramIndex:
+        """Index for the program open on a port, re-exporting it first if it is stale.
+
+        With ``rebuild`` the program is always exported again; an export that
+        was already running when the rebuild was asked for doesn't count.
+        """
+        program_id, state = await self._identity(port)
+        state = self._require_state(port, state)
+        path = self.path_for(program_id)
+        if not rebuild and self._is_fresh(path, state):
+            return ProgramIndex(path)
+
+        while True:
+            future, owner = self._claim(path)
+            if owner:
+                self._executor.submit(self._run_export, future, port, program_id, path, rebuild)
+                await asyncio.wrap_future(future)
+                return ProgramIndex(path)
+            try:
+                await asyncio.wrap_future(future)
+            except Exception:
+                if not rebuild:
+                    raise
+            if not rebuild:
+                return ProgramIndex(path)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            syncing = sum(1 for future in self._syncing.values() if not future.done())
+        return {
+            "enabled": INDEX_ENABLED,
+            "directory": str(self.directory),
+            "exports": self.exports,
+            "failed_exports": self.failed_exports,
+            "syncing": syncing,
+        }
+
+
+program_index = IndexManager()
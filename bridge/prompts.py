@@ -1,22 +1,24 @@
 """MCP prompts -- reusable LLM analysis templates."""
 
+import asyncio
+
 from fastmcp import FastMCP
 
-from http_client import fetch_decompiled, fetch_disassembly, fetch_function_info
-from state import get_instance_info, get_instance_port
+from http_client import async_fetch_decompiled, async_fetch_disassembly, async_fetch_function_info
+from state import async_get_instance_info, async_get_instance_port
 
 
 def register_prompts(server: FastMCP) -> None:
 
     @server.prompt("analyze_function")
-    def analyze_function_prompt(
+    async def analyze_function_prompt(
         name: str = None, address: str = None, port: int = None
     ) -> dict:
         """Guide the LLM through analyzing a function."""
-        port = get_instance_port(port)
+        port = await async_get_instance_port(port)
 
         if address and not name:
-            fn_info = fetch_function_info(port, address=address)
+            fn_info = await async_fetch_function_info(port, address=address)
             if isinstance(fn_info, dict) and "name" in fn_info:
                 name = fn_info["name"]
 
@@ -25,13 +27,17 @@ def register_prompts(server: FastMCP) -> None:
         fn_info = None
 
         if address:
-            decompiled = fetch_decompiled(port, address=address)
-            disasm = fetch_disassembly(port, address=address)
-            fn_info = fetch_function_info(port, address=address)
+            decompiled, disasm, fn_info = await asyncio.gather(
+                async_fetch_decompiled(port, address=address),
+                async_fetch_disassembly(port, address=address),
+                async_fetch_function_info(port, address=address),
+            )
         elif name:
-            decompiled = fetch_decompiled(port, name=name)
-            disasm = fetch_disassembly(port, name=name)
-            fn_info = fetch_function_info(port, name=name)
+            decompiled, disasm, fn_info = await asyncio.gather(
+                async_fetch_decompiled(port, name=name),
+                async_fetch_disassembly(port, name=name),
+                async_fetch_function_info(port, name=name),
+            )
 
         return {
             "prompt": f"""
@@ -57,14 +63,14 @@ def register_prompts(server: FastMCP) -> None:
         }
 
     @server.prompt("identify_vulnerabilities")
-    def identify_vulnerabilities_prompt(
+    async def identify_vulnerabilities_prompt(
         name: str = None, address: str = None, port: int = None
     ) -> dict:
         """Help identify potential vulnerabilities in a function."""
-        port = get_instance_port(port)
+        port = await async_get_instance_port(port)
 
         if address and not name:
-            fn_info = fetch_function_info(port, address=address)
+            fn_info = await async_fetch_function_info(port, address=address)
             if isinstance(fn_info, dict) and "name" in fn_info:
                 name = fn_info["name"]
 
@@ -73,13 +79,17 @@ def register_prompts(server: FastMCP) -> None:
         fn_info = None
 
         if address:
-            decompiled = fetch_decompiled(port, address=address)
-            disasm = fetch_disassembly(port, address=address)
-            fn_info = fetch_function_info(port, address=address)
+            decompiled, disasm, fn_info = await asyncio.gather(
+                async_fetch_decompiled(port, address=address),
+                async_fetch_disassembly(port, address=address),
+                async_fetch_function_info(port, address=address),
+            )
         elif name:
-            decompiled = fetch_decompiled(port, name=name)
-            disasm = fetch_disassembly(port, name=name)
-            fn_info = fetch_function_info(port, name=name)
+            decompiled, disasm, fn_info = await asyncio.gather(
+                async_fetch_decompiled(port, name=name),
+                async_fetch_disassembly(port, name=name),
+                async_fetch_function_info(port, name=name),
+            )
 
         return {
             "prompt": f"""
@@ -110,10 +120,10 @@ def register_prompts(server: FastMCP) -> None:
         }
 
     @server.prompt("reverse_engineer_binary")
-    def reverse_engineer_binary_prompt(port: int = None) -> dict:
+    async def reverse_engineer_binary_prompt(port: int = None) -> dict:
         """Comprehensive guide to reverse engineering an entire binary."""
-        port = get_instance_port(port)
-        program_info = get_instance_info(port=port)
+        port = await async_get_instance_port(port)
+        program_info = await async_get_instance_info(port=port)
 
         return {
             "prompt": f"""
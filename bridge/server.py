@@ -2,7 +2,7 @@
 # requires-python = ">=3.11"
 # dependencies = [
 #     "fastmcp",
-#     "requests>=2.32",
+#     "httpx>=0.27",
 # ]
 # ///
 """GhidraMCP Bridge -- MCP server for Ghidra reverse engineering."""
@@ -26,6 +26,9 @@ from tools import (
     register_analysis_tools,
     register_ui_tools,
     register_comment_tools,
+    register_cache_tools,
+    register_index_tools,
+    register_job_tools,
 )
 
 instructions = """
@@ -44,6 +47,9 @@ The API is organized into namespaces for different types of operations:
 - memory_* : For memory access
 - xrefs_* : For cross-references
 - analysis_* : For program analysis
+- cache_* : For inspecting and flushing the bridge response cache
+- index_* : For fast name, address and xref lookups from a local index of the program
+- jobs_* : For following, collecting and cancelling long-running jobs such as analysis_run
 """
 
 server = FastMCP("GhidraMCP", version=BRIDGE_VERSION, instructions=instructions)
@@ -58,6 +64,9 @@ register_xref_tools(server)
 register_analysis_tools(server)
 register_ui_tools(server)
 register_comment_tools(server)
+register_cache_tools(server)
+register_index_tools(server)
+register_job_tools(server)
 
 # Wire resources & prompts
 register_resources(server)
@@ -1,12 +1,22 @@
 """Instance registry, discovery, and shared state for the Ghidra MCP bridge."""
 
+import asyncio
+import getpass
 import os
+import socket
+import stat
 import sys
+import tempfile
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any
 
-import requests
+import httpx
+
+from admission import admission
+from cache import response_cache
+from transport import LOOPBACK_HOSTS, close_client, open_client
 
 BRIDGE_VERSION = "v2.1.0"
 REQUIRED_API_VERSION = 2010
@@ -18,33 +28,214 @@ GHIDRA_HOST = os.environ.get("GHIDRA_HYDRA_HOST", DEFAULT_GHIDRA_HOST)
 QUICK_DISCOVERY_RANGE = range(DEFAULT_GHIDRA_PORT, DEFAULT_GHIDRA_PORT + 10)
 FULL_DISCOVERY_RANGE = range(DEFAULT_GHIDRA_PORT, DEFAULT_GHIDRA_PORT + 20)
 
+# Discovery probes ports in parallel; closed or filtered ports fail on the connect timeout
+DISCOVERY_WORKERS = int(os.environ.get("GHIDRA_DISCOVERY_WORKERS", "16"))
+DISCOVERY_CONNECT_TIMEOUT = float(os.environ.get("GHIDRA_DISCOVERY_CONNECT_TIMEOUT", "0.5"))
+
+
+def _default_socket_dir() -> str:
+    """Same default as the plugin: $XDG_RUNTIME_DIR/ghidra-mcp, else a per-user temp directory."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "ghidra-mcp")
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = "unknown"
+    return os.path.join(tempfile.gettempdir(), f"ghidra-mcp-{user}")
+
+
+# Plugins on this host also serve their API on <dir>/<port>.sock ("" turns sockets off)
+SOCKET_DIR = os.environ.get("GHIDRA_SOCKET_DIR", _default_socket_dir())
+# Probe FULL_DISCOVERY_RANGE over TCP: "auto" only when there is no socket directory to list
+PORT_SCAN = os.environ.get("GHIDRA_PORT_SCAN", "auto").lower()
+
+# Health checks back off for stable instances and retry quickly after errors
+DISCOVERY_INTERVAL = float(os.environ.get("GHIDRA_DISCOVERY_INTERVAL", "30"))
+HEALTH_MIN_INTERVAL = float(os.environ.get("GHIDRA_HEALTH_MIN_INTERVAL", "5"))
+HEALTH_MAX_INTERVAL = float(os.environ.get("GHIDRA_HEALTH_MAX_INTERVAL", "120"))
+HEALTH_MAX_FAILURES = int(os.environ.get("GHIDRA_HEALTH_MAX_FAILURES", "2"))
+
+# Seconds a port that failed to register is skipped by the implicit per-request probe
+NEGATIVE_CACHE_TTL = float(os.environ.get("GHIDRA_NEGATIVE_CACHE_TTL", "10"))
+
+# Copy-on-write registry: readers load ``active_instances`` without locking;
+# writers hold instances_lock, build a new mapping and publish it with _publish().
+# Neither the mapping nor the info dicts in it are mutated once published.
 active_instances: dict[int, dict] = {}
 instances_lock = threading.Lock()
 current_instance_port = DEFAULT_GHIDRA_PORT
 
+# Ports that recently failed to register, mapped to when they may be probed again
+_unreachable: dict[int, float] = {}
+
+# Per-port health schedule: interval, next_check, failures, last_ok (guarded by instances_lock)
+_health: dict[int, dict[str, float]] = {}
+
+
+class WaitStats:
+    """Running count/total/max of how long callers were blocked."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.total += seconds
+            self.max = max(self.max, seconds)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "count": self.count,
+                "avg_ms": round(self.total / self.count * 1000, 3) if self.count else 0.0,
+                "max_ms": round(self.max * 1000, 3),
+                "total_ms": round(self.total * 1000, 3),
+            }
+
+
+# Time tool requests spent blocked resolving an unregistered port (lookups of
+# registered ports never block)
+registry_wait = WaitStats()
+
+
+# ---------------------------------------------------------------------------
+# Registry access
+# ---------------------------------------------------------------------------
+
+def _publish(instances: dict[int, dict]) -> None:
+    """Swap in a new registry snapshot. Caller must hold instances_lock."""
+    global active_instances
+    active_instances = instances
+
+
+def get_instances() -> dict[int, dict]:
+    """Current registry snapshot (port -> info). Treat it as read-only."""
+    return active_instances
+
+
+def _recently_unreachable(port: int) -> bool:
+    """Whether a port failed to register within the last NEGATIVE_CACHE_TTL seconds."""
+    retry_at = _unreachable.get(port)
+    return retry_at is not None and retry_at > time.monotonic()
+
+
+def _mark_unreachable(port: int) -> None:
+    if NEGATIVE_CACHE_TTL > 0:
+        _unreachable[port] = time.monotonic() + NEGATIVE_CACHE_TTL
+
+
+def _register_on_demand(port: int) -> dict | None:
+    """Slow path for a port missing from the registry: probe it unless it just failed."""
+    if _recently_unreachable(port):
+        return None
+    started = time.perf_counter()
+    register_instance(port)
+    registry_wait.record(time.perf_counter() - started)
+    return active_instances.get(port)
+
+
+async def _async_register_on_demand(port: int) -> dict | None:
+    """Async variant of _register_on_demand; the blocking probe runs in a worker thread."""
+    if _recently_unreachable(port):
+        return None
+    started = time.perf_counter()
+    await asyncio.to_thread(register_instance, port)
+    registry_wait.record(time.perf_counter() - started)
+    return active_instances.get(port)
+
+
+def sockets_enabled(host: str | None = None) -> bool:
+    """Whether instances on host can be reached over Unix domain sockets."""
+    host = host if host is not None else GHIDRA_HOST
+    local = host in LOOPBACK_HOSTS or host.startswith("127.")
+    return bool(SOCKET_DIR) and local and hasattr(socket, "AF_UNIX")
+
+
+def socket_path(port: int) -> str | None:
+    """The socket a plugin on this host serves port's API on, or None if there is none."""
+    if not sockets_enabled():
+        return None
+    path = os.path.join(SOCKET_DIR, f"{port}.sock")
+    try:
+        return path if stat.S_ISSOCK(os.stat(path).st_mode) else None
+    except OSError:
+        return None
+
+
+_probe_client: httpx.Client | None = None
+_probe_client_lock = threading.Lock()
+
+
+def _probe_get(url: str, uds: str | None, timeout: httpx.Timeout | float, headers: dict | None = None) -> httpx.Response:
+    """One-off GET for registration and health probes, over the instance's socket when it has one.
+
+    TCP probes share one client without keep-alive so its TLS setup is paid
+    once; there is no TLS on a socket, so those skip it entirely.
+    """
+    global _probe_client
+    if uds:
+        with httpx.Client(transport=httpx.HTTPTransport(uds=uds, verify=False), timeout=timeout) as client:
+            return client.get(url, headers=headers)
+    with _probe_client_lock:
+        if _probe_client is None:
+            _probe_client = httpx.Client(limits=httpx.Limits(max_keepalive_connections=0))
+    return _probe_client.get(url, headers=headers, timeout=timeout)
+
 
 def get_instance_port(port: int | None = None) -> int:
     """Get the current instance port or validate a specific port."""
     port = port or current_instance_port
-    if port not in active_instances:
-        register_instance(port)
-        if port not in active_instances:
-            raise ValueError(f"No active Ghidra instance on port {port}")
+    if port not in active_instances and _register_on_demand(port) is None:
+        raise ValueError(f"No active Ghidra instance on port {port}")
     return port
 
 
 def get_instance_url(port: int) -> str:
     """Get URL for a Ghidra instance by port."""
-    with instances_lock:
-        if port in active_instances:
-            return active_instances[port]["url"]
-        if 8192 <= port <= 65535:
-            register_instance(port)
-            if port in active_instances:
-                return active_instances[port]["url"]
+    info = active_instances.get(port)
+    if info is None and 8192 <= port <= 65535:
+        info = _register_on_demand(port)
+    if info is not None:
+        return info["url"]
+    return f"http://{GHIDRA_HOST}:{port}"
+
+
+async def async_get_instance_port(port: int | None = None) -> int:
+    """Async variant of get_instance_port; probing an unknown port does not block the event loop."""
+    port = port or current_instance_port
+    if port not in active_instances and await _async_register_on_demand(port) is None:
+        raise ValueError(f"No active Ghidra instance on port {port}")
+    return port
+
+
+async def async_get_instance_url(port: int) -> str:
+    """Async variant of get_instance_url."""
+    info = active_instances.get(port)
+    if info is None and 8192 <= port <= 65535:
+        info = await _async_register_on_demand(port)
+    if info is not None:
+        return info["url"]
     return f"http://{GHIDRA_HOST}:{port}"
 
 
+def unregister_instance(port: int) -> bool:
+    """Remove an instance from the registry and close its connection pool."""
+    with instances_lock:
+        removed = port in active_instances
+        if removed:
+            _publish({p: info for p, info in active_instances.items() if p != port})
+        _health.pop(port, None)
+    close_client(port)
+    response_cache.forget_port(port)
+    admission.forget(port)
+    return removed
+
+
 def set_current_port(port: int) -> None:
     """Set the current working instance port."""
     global current_instance_port
@@ -56,19 +247,27 @@ def get_current_port() -> int:
     return current_instance_port
 
 
-def register_instance(port: int, url: str | None = None) -> str:
-    """Register a new Ghidra instance by validating its HATEOAS API."""
+def register_instance(port: int, url: str | None = None, uds: str | None = None) -> str:
+    """Register a new Ghidra instance by validating its HATEOAS API.
+
+    Without an explicit url, the instance is reached over its Unix domain
+    socket when the plugin serves one.
+    """
     if url is None:
         url = f"http://{GHIDRA_HOST}:{port}"
+        uds = uds or socket_path(port)
 
     try:
         test_url = f"{url}/plugin-version"
-        response = requests.get(test_url, timeout=10)
+        response = _probe_get(test_url, uds, 10)
 
-        if not response.ok:
+        if not response.is_success:
+            _mark_unreachable(port)
             return f"Error: Instance at {url} is not responding properly to HATEOAS API"
 
         project_info: dict[str, Any] = {"url": url}
+        if uds:
+            project_info["socket"] = uds
 
         try:
             try:
@@ -88,6 +287,7 @@ def register_instance(port: int, url: str | None = None) -> str:
                                 f"but bridge requires version {REQUIRED_API_VERSION}"
                             )
                             print(error_msg, file=sys.stderr)
+                            _mark_unreachable(port)
                             return error_msg
 
                         print(
@@ -99,8 +299,9 @@ def register_instance(port: int, url: str | None = None) -> str:
 
             try:
                 info_url = f"{url}/program"
-                info_response = requests.get(info_url, timeout=10)
-                if info_response.ok:
+                info_response = _probe_get(info_url, uds, 10)
+                response_cache.observe_headers(port, info_response.headers)
+                if info_response.is_success:
                     try:
                         info_data = info_response.json()
                         if "result" in info_data:
@@ -129,137 +330,299 @@ def register_instance(port: int, url: str | None = None) -> str:
             pass
 
         with instances_lock:
-            active_instances[port] = project_info
+            _publish({**active_instances, port: project_info})
+            _unreachable.pop(port, None)
+            _health[port] = {
+                "interval": HEALTH_MIN_INTERVAL,
+                "failures": 0,
+                "next_check": time.monotonic() + HEALTH_MIN_INTERVAL,
+            }
+        open_client(port, url, uds)
+
+        from index import program_index
 
-        return f"Registered instance on port {port} at {url}"
+        program_index.schedule_sync(port)
+
+        via = f" via {uds}" if uds else ""
+        return f"Registered instance on port {port} at {url}{via}"
     except Exception as e:
+        _mark_unreachable(port)
         return f"Error: Could not connect to instance at {url}: {str(e)}"
 
 
-def _discover_instances(port_range: range, host: str | None = None, timeout: int = 5) -> dict:
-    """Discover NEW Ghidra instances by scanning ports."""
-    found_instances: list[dict] = []
-    scan_host = host if host is not None else GHIDRA_HOST
+def _probe_instance(port: int, url: str, timeout: float, uds: str | None = None) -> dict | None:
+    """Probe one port (or its socket) and register it if a HATEOAS plugin answers."""
+    try:
+        response = _probe_get(
+            f"{url}/plugin-version",
+            uds,
+            httpx.Timeout(timeout, connect=DISCOVERY_CONNECT_TIMEOUT),
+            headers={
+                "Accept": "application/json",
+                "X-Request-ID": f"discovery-{port}-{int(time.time() * 1000)}",
+            },
+        )
+    except httpx.HTTPError:
+        return None
+
+    if not response.is_success:
+        return None
 
-    for port in port_range:
-        if port in active_instances:
-            continue
+    try:
+        json_data = response.json()
+        if not ("success" in json_data and json_data["success"] and "result" in json_data):
+            return None
+    except (ValueError, KeyError):
+        print(f"Port {port} returned non-HATEOAS response", file=sys.stderr)
+        return None
+
+    result = register_instance(port, url, uds)
+    instance_info: dict[str, Any] = {"port": port, "url": url}
+    if uds:
+        instance_info["socket"] = uds
+
+    if isinstance(json_data["result"], dict):
+        instance_info["plugin_version"] = json_data["result"].get("plugin_version", "unknown")
+        instance_info["api_version"] = json_data["result"].get("api_version", "unknown")
+    else:
+        instance_info["plugin_version"] = "unknown"
+        instance_info["api_version"] = "unknown"
+
+    registered = active_instances.get(port)
+    if registered is not None:
+        instance_info["project"] = registered.get("project", "")
+        instance_info["file"] = registered.get("file", "")
+
+    instance_info["result"] = result
+    return instance_info
 
-        url = f"http://{scan_host}:{port}"
-        try:
-            test_url = f"{url}/plugin-version"
-            response = requests.get(
-                test_url,
-                headers={
-                    "Accept": "application/json",
-                    "X-Request-ID": f"discovery-{int(time.time() * 1000)}",
-                },
-                timeout=timeout,
-            )
-
-            if response.ok:
-                try:
-                    json_data = response.json()
-                    if "success" in json_data and json_data["success"] and "result" in json_data:
-                        result = register_instance(port, url)
-                        instance_info: dict[str, Any] = {"port": port, "url": url}
-
-                        if isinstance(json_data["result"], dict):
-                            instance_info["plugin_version"] = json_data["result"].get(
-                                "plugin_version", "unknown"
-                            )
-                            instance_info["api_version"] = json_data["result"].get(
-                                "api_version", "unknown"
-                            )
-                        else:
-                            instance_info["plugin_version"] = "unknown"
-                            instance_info["api_version"] = "unknown"
-
-                        if port in active_instances:
-                            instance_info["project"] = active_instances[port].get("project", "")
-                            instance_info["file"] = active_instances[port].get("file", "")
-
-                        instance_info["result"] = result
-                        found_instances.append(instance_info)
-                except (ValueError, KeyError):
-                    print(f"Port {port} returned non-HATEOAS response", file=sys.stderr)
-                    continue
-        except requests.exceptions.RequestException:
-            continue
 
+def _listed_sockets() -> dict[int, str]:
+    """Sockets in SOCKET_DIR by port, or {} when the directory can't be listed."""
+    if not sockets_enabled():
+        return {}
+    try:
+        names = os.listdir(SOCKET_DIR)
+    except OSError:
+        return {}
+    sockets: dict[int, str] = {}
+    for name in names:
+        stem, ext = os.path.splitext(name)
+        if ext == ".sock" and stem.isdigit():
+            sockets[int(stem)] = os.path.join(SOCKET_DIR, name)
+    return sockets
+
+
+def _should_scan_ports(host: str | None) -> bool:
+    """Whether discovery on host has to probe TCP ports, per GHIDRA_PORT_SCAN."""
+    if PORT_SCAN in ("1", "true", "yes"):
+        return True
+    if PORT_SCAN in ("0", "false", "no"):
+        return False
+    return host is not None or not sockets_enabled() or not os.path.isdir(SOCKET_DIR)
+
+
+def _discover_instances(port_range: range, host: str | None = None, timeout: float = 5) -> dict:
+    """Discover NEW Ghidra instances from the socket directory, then by probing ports.
+
+    On the default host every socket in SOCKET_DIR is probed, whatever its
+    port, and port_range is only scanned if _should_scan_ports says so. Probes
+    run concurrently; each port gets DISCOVERY_CONNECT_TIMEOUT to accept the
+    connection and ``timeout`` to answer, so a scan costs roughly one timeout
+    rather than one per closed or filtered port. Instances are registered as
+    soon as they answer.
+    """
+    scan_host = host if host is not None else GHIDRA_HOST
+    targets: dict[int, tuple[str, str | None]] = {}
+    if host is None:
+        for port, path in _listed_sockets().items():
+            targets[port] = (f"http://{scan_host}:{port}", path)
+    if _should_scan_ports(host):
+        for port in port_range:
+            targets.setdefault(port, (f"http://{scan_host}:{port}", None))
+    targets = {port: target for port, target in targets.items() if port not in active_instances}
+    if not targets:
+        return {"found": 0, "instances": []}
+
+    found_instances: list[dict] = []
+    workers = max(1, min(DISCOVERY_WORKERS, len(targets)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="GhidraMCP-Discovery") as pool:
+        futures = [
+            pool.submit(_probe_instance, port, url, timeout, uds) for port, (url, uds) in targets.items()
+        ]
+        for future in as_completed(futures):
+            instance_info = future.result()
+            if instance_info is not None:
+                found_instances.append(instance_info)
+
+    found_instances.sort(key=lambda info: info["port"])
     return {"found": len(found_instances), "instances": found_instances}
 
 
+# ---------------------------------------------------------------------------
+# Health monitoring
+# ---------------------------------------------------------------------------
+
+def _apply_program_info(info: dict, result: dict) -> None:
+    """Copy /program fields into an instance info dict."""
+    program_id = result.get("programId", "")
+    if ":" in program_id:
+        project_name, file_path = program_id.split(":", 1)
+        info["project"] = project_name
+        if file_path.startswith("/"):
+            file_path = file_path[1:]
+        info["path"] = file_path
+    info["file"] = result.get("name", "")
+    info["language_id"] = result.get("languageId", "")
+    info["compiler_spec_id"] = result.get("compilerSpecId", "")
+    info["image_base"] = result.get("image_base", "")
+
+
+def _check_instance(port: int, url: str, uds: str | None = None) -> tuple[bool, dict | None]:
+    """Probe one instance without touching the registry.
+
+    Returns (reachable, program fields) -- the fields are None when /program
+    could not be read even though the plugin answered.
+    """
+    timeout = httpx.Timeout(5, connect=DISCOVERY_CONNECT_TIMEOUT)
+    try:
+        response = _probe_get(f"{url}/plugin-version", uds, timeout)
+        if not response.is_success:
+            return False, None
+    except httpx.HTTPError:
+        return False, None
+
+    try:
+        info_response = _probe_get(f"{url}/program", uds, timeout)
+        response_cache.observe_headers(port, info_response.headers)
+        if info_response.is_success:
+            info_data = info_response.json()
+            result = info_data.get("result") if isinstance(info_data, dict) else None
+            if isinstance(result, dict):
+                fields: dict[str, Any] = {}
+                _apply_program_info(fields, result)
+                return True, fields
+    except Exception as e:
+        print(f"Error reading info endpoint during health check on port {port}: {e}", file=sys.stderr)
+    return True, None
+
+
+def _record_health(port: int, healthy: bool, now: float) -> bool:
+    """Update a port's adaptive schedule; returns True when it should be dropped.
+
+    Caller must hold instances_lock.
+    """
+    health = _health.setdefault(port, {"interval": HEALTH_MIN_INTERVAL, "failures": 0})
+    if healthy:
+        health["failures"] = 0
+        health["interval"] = min(health["interval"] * 2, HEALTH_MAX_INTERVAL)
+        health["last_ok"] = now
+    else:
+        health["failures"] += 1
+        health["interval"] = HEALTH_MIN_INTERVAL
+    health["next_check"] = now + health["interval"]
+    return health["failures"] >= HEALTH_MAX_FAILURES
+
+
+def check_instances() -> list[int]:
+    """Health-check every instance that is due and apply the results.
+
+    The registry is snapshotted under the lock, instances are probed in
+    parallel without it, and the outcome is applied in one locked section.
+    Returns the ports that were dropped.
+    """
+    now = time.monotonic()
+    with instances_lock:
+        due = {
+            port: (info["url"], info.get("socket"))
+            for port, info in active_instances.items()
+            if _health.get(port, {}).get("next_check", 0) <= now
+        }
+    if not due:
+        return []
+
+    workers = max(1, min(DISCOVERY_WORKERS, len(due)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="GhidraMCP-Health") as pool:
+        results = dict(zip(due, pool.map(lambda item: _check_instance(item[0], *item[1]), due.items())))
+
+    now = time.monotonic()
+    removed: list[int] = []
+    with instances_lock:
+        instances = dict(active_instances)
+        for port, (healthy, fields) in results.items():
+            info = instances.get(port)
+            if info is None or (info["url"], info.get("socket")) != due[port]:
+                continue  # unregistered or re-registered while we were probing
+            if fields is not None:
+                instances[port] = {**info, **fields}
+            if _record_health(port, healthy and fields is not None, now) and not healthy:
+                del instances[port]
+                _health.pop(port, None)
+                removed.append(port)
+        _publish(instances)
+
+    for port in removed:
+        print(f"Removed unreachable instance on port {port}")
+        close_client(port)
+        response_cache.forget_port(port)
+        admission.forget(port)
+    return removed
+
+
+def _next_health_check() -> float:
+    """Monotonic time of the earliest scheduled health check."""
+    with instances_lock:
+        return min(
+            (_health.get(port, {}).get("next_check", 0) for port in active_instances),
+            default=float("inf"),
+        )
+
+
 def periodic_discovery() -> None:
-    """Background thread: discover new instances and prune dead ones every 30s."""
+    """Background thread: discover new instances every DISCOVERY_INTERVAL and health-check known ones.
+
+    Stable instances are re-checked at a doubling interval up to
+    HEALTH_MAX_INTERVAL; any error drops a port back to HEALTH_MIN_INTERVAL,
+    and it is removed after HEALTH_MAX_FAILURES consecutive failed probes.
+    """
+    next_discovery = 0.0
     while True:
         try:
-            _discover_instances(FULL_DISCOVERY_RANGE, timeout=5)
-
-            with instances_lock:
-                ports_to_remove: list[int] = []
-                for port, info in active_instances.items():
-                    url = info["url"]
-                    try:
-                        response = requests.get(f"{url}/plugin-version", timeout=5)
-                        if not response.ok:
-                            ports_to_remove.append(port)
-                            continue
-
-                        try:
-                            info_url = f"{url}/program"
-                            info_response = requests.get(info_url, timeout=5)
-                            if info_response.ok:
-                                try:
-                                    info_data = info_response.json()
-                                    if "result" in info_data:
-                                        result = info_data["result"]
-                                        if isinstance(result, dict):
-                                            program_id = result.get("programId", "")
-                                            if ":" in program_id:
-                                                project_name, file_path = program_id.split(":", 1)
-                                                info["project"] = project_name
-                                                if file_path.startswith("/"):
-                                                    file_path = file_path[1:]
-                                                info["path"] = file_path
-                                            info["file"] = result.get("name", "")
-                                            info["language_id"] = result.get("languageId", "")
-                                            info["compiler_spec_id"] = result.get(
-                                                "compilerSpecId", ""
-                                            )
-                                            info["image_base"] = result.get("image_base", "")
-                                except Exception as e:
-                                    print(
-                                        f"Error parsing info endpoint during discovery: {e}",
-                                        file=sys.stderr,
-                                    )
-                        except Exception:
-                            pass
-                    except requests.exceptions.RequestException:
-                        ports_to_remove.append(port)
-
-                for port in ports_to_remove:
-                    del active_instances[port]
-                    print(f"Removed unreachable instance on port {port}")
+            if time.monotonic() >= next_discovery:
+                _discover_instances(FULL_DISCOVERY_RANGE, timeout=5)
+                next_discovery = time.monotonic() + DISCOVERY_INTERVAL
+            check_instances()
         except Exception as e:
             print(f"Error in periodic discovery: {e}")
 
-        time.sleep(30)
+        wake_at = min(next_discovery, _next_health_check())
+        time.sleep(max(1.0, wake_at - time.monotonic()))
+
+
+def health_stats() -> dict[str, Any]:
+    """Per-instance health schedule plus time requests spent blocked on on-demand registration."""
+    now = time.monotonic()
+    with instances_lock:
+        instances = {
+            port: {
+                "failures": health.get("failures", 0),
+                "interval_seconds": health.get("interval", HEALTH_MIN_INTERVAL),
+                "next_check_in": round(max(0.0, health.get("next_check", now) - now), 1),
+                "last_ok_ago": round(now - health["last_ok"], 1) if "last_ok" in health else None,
+            }
+            for port, health in ((p, _health.get(p, {})) for p in active_instances)
+        }
+    return {"instances": instances, "registry_wait": registry_wait.stats()}
 
 
 def bootstrap_instances() -> None:
     """Initial registration and discovery at startup."""
-    register_instance(DEFAULT_GHIDRA_PORT, f"http://{GHIDRA_HOST}:{DEFAULT_GHIDRA_PORT}")
+    register_instance(DEFAULT_GHIDRA_PORT)
     _discover_instances(QUICK_DISCOVERY_RANGE)
 
 
-def get_instance_info(port: int | None = None) -> dict:
-    """Get detailed info about an instance (used by tools and resources)."""
-    from http_client import safe_get
-
-    port = get_instance_port(port)
-    response = safe_get(port, "program")
-
+def _build_instance_info(port: int, response: dict) -> dict:
+    """Shape a raw /program response into the instance info dict."""
     if not isinstance(response, dict) or not response.get("success", False):
         return {"error": f"Unable to access Ghidra instance on port {port}"}
 
@@ -279,13 +642,31 @@ def get_instance_info(port: int | None = None) -> dict:
         "analysis_complete": result.get("analysisComplete", False),
     }
 
-    with instances_lock:
-        if port in active_instances and "project" in active_instances[port]:
-            instance_info["project"] = active_instances[port]["project"]
+    registered = active_instances.get(port)
+    if registered is not None and "project" in registered:
+        instance_info["project"] = registered["project"]
+    if registered is not None and "socket" in registered:
+        instance_info["socket"] = registered["socket"]
 
     return instance_info
 
 
+def get_instance_info(port: int | None = None) -> dict:
+    """Get detailed info about an instance (used by tools and resources)."""
+    from http_client import safe_get
+
+    port = get_instance_port(port)
+    return _build_instance_info(port, safe_get(port, "program"))
+
+
+async def async_get_instance_info(port: int | None = None) -> dict:
+    """Async variant of get_instance_info."""
+    from http_client import async_safe_get
+
+    port = await async_get_instance_port(port)
+    return _build_instance_info(port, await async_safe_get(port, "program"))
+
+
 def error_response(code: str, message: str) -> dict:
     """Build a standard error dict (convenience, also importable from http_client)."""
     return {
@@ -0,0 +1,201 @@
+"""Shared fixtures: a fake plugin instance behind the bridge's real request path."""
+
+import gzip
+import json
+import socketserver
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import httpx
+import pytest
+
+# The bridge is a set of top-level modules run from its own directory
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import state  # noqa: E402
+import transport  # noqa: E402
+from cache import response_cache  # noqa: E402
+
+PORT = 18192
+
+COMPRESSION_MIN_BYTES = 1024
+LINK_CHUNK = 16 * 1024
+
+Handler = Callable[[httpx.Request], Awaitable[httpx.Response]]
+
+
+class FakePlugin:
+    """Answers plugin requests with ``handler``, counting requests per path."""
+
+    def __init__(self, handler: Handler):
+        self.handler = handler
+        self.hits: Counter[str] = Counter()
+        self.requests: list[httpx.Request] = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.hits[request.url.path] += 1
+        self.requests.append(request)
+        return await self.handler(request)
+
+
+@pytest.fixture
+def fake_plugin(monkeypatch) -> Callable[..., FakePlugin]:
+    """Register an instance (on PORT by default) whose pooled client is served by a FakePlugin."""
+    ports = []
+
+    def install(handler: Handler, port: int = PORT) -> FakePlugin:
+        plugin = FakePlugin(handler)
+        client = httpx.AsyncClient(transport=httpx.MockTransport(plugin))
+        url = f"http://ghidra.test:{port}"
+        monkeypatch.setitem(transport._clients, port, client)
+        monkeypatch.setitem(transport._client_routes, port, (url, None))
+        monkeypatch.setattr(state, "active_instances", {**state.active_instances, port: {"url": url}})
+        ports.append(port)
+        return plugin
+
+    yield install
+    for port in ports:
+        response_cache.forget_port(port)
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, as the plugin's server does
+    disable_nagle_algorithm = True  # headers and body go out in separate writes
+
+    def setup(self) -> None:
+        super().setup()
+        with self.server.plugin.lock:
+            self.server.plugin.connections += 1
+
+    def do_GET(self) -> None:
+        plugin = self.server.plugin
+        path = urlsplit(self.path).path
+        delay = plugin.delay(path)
+        if delay:
+            time.sleep(delay)
+        body = plugin.bodies.get(path, plugin.default_body)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        # Like HttpUtil.sendJsonResponse: gzip at level 1 from 1 KiB up, when the client accepts it
+        if len(body) >= COMPRESSION_MIN_BYTES and "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body, compresslevel=1)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        with plugin.lock:  # before the body, so a client that has the response sees it counted
+            plugin.hits[path] += 1
+            plugin.sent[path] = len(body)
+        if plugin.latency:
+            time.sleep(plugin.latency)
+        if plugin.bandwidth:
+            for start in range(0, len(body), LINK_CHUNK):
+                chunk = body[start:start + LINK_CHUNK]
+                time.sleep(len(chunk) / plugin.bandwidth)
+                self.wfile.write(chunk)
+        else:
+            self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+class _StandInUnixHandler(_StandInHandler):
+    disable_nagle_algorithm = False  # not a TCP socket
+
+
+class _StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 64  # a full pool connects at once; the default of 5 drops SYNs
+
+
+class _StandInUnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+    request_queue_size = 64
+
+
+class StandInPlugin:
+    """A real HTTP/1.1 server standing in for the plugin on a local TCP port, and optionally a Unix socket.
+
+    ``bodies`` maps request paths to JSON bodies; any other path gets an
+    empty success. ``delay`` gives the seconds a path takes to answer, to
+    model slow endpoints. ``bandwidth`` (bytes per second) and ``latency``
+    (seconds per response) model a slow link to a remote instance. Bodies
+    are gzipped like the plugin's when the client asks for it. Counts
+    requests per path and accepted connections, and records the bytes last
+    sent per path.
+    """
+
+    default_body = json.dumps({"success": True, "result": {}}).encode()
+
+    def __init__(
+        self,
+        bodies: dict[str, bytes] | None = None,
+        delay: Callable[[str], float] = lambda path: 0,
+        bandwidth: float | None = None,
+        latency: float = 0,
+    ):
+        self.delay = delay
+        self.bandwidth = bandwidth
+        self.latency = latency
+        self.bodies = {
+            "/plugin-version": json.dumps({
+                "success": True,
+                "result": {"plugin_version": "stand-in", "api_version": state.REQUIRED_API_VERSION},
+            }).encode(),
+            **(bodies or {}),
+        }
+        self.hits: Counter[str] = Counter()
+        self.sent: dict[str, int] = {}
+        self.connections = 0
+        self.lock = threading.Lock()
+        self._servers: list[socketserver.BaseServer] = []
+
+    def serve(self, port: int = 0) -> int:
+        """Start listening on a loopback port (an ephemeral one by default) and return it."""
+        server = _StandInServer(("127.0.0.1", port), _StandInHandler)
+        server.plugin = self
+        self._servers.append(server)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server.server_address[1]
+
+    def serve_unix(self, path: str) -> str:
+        """Also serve the API on a Unix domain socket at path, as the plugin does, and return it."""
+        server = _StandInUnixServer(path, _StandInUnixHandler)
+        server.plugin = self
+        self._servers.append(server)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return path
+
+    def close(self) -> None:
+        for server in self._servers:
+            server.shutdown()
+            server.server_close()
+
+
+@pytest.fixture
+def stand_in(monkeypatch) -> Callable[..., tuple[StandInPlugin, int]]:
+    """Start a StandInPlugin and register it, with a pooled client, on the port it listens on."""
+    started: list[tuple[StandInPlugin, int]] = []
+
+    def start(bodies: dict[str, bytes] | None = None, **options) -> tuple[StandInPlugin, int]:
+        plugin = StandInPlugin(bodies, **options)
+        port = plugin.serve()
+        url = f"http://127.0.0.1:{port}"
+        monkeypatch.setattr(state, "active_instances", {**state.active_instances, port: {"url": url}})
+        transport.open_client(port, url)
+        started.append((plugin, port))
+        return plugin, port
+
+    yield start
+    for plugin, port in started:
+        transport.close_client(port)
+        response_cache.forget_port(port)
+        plugin.close()
+
@@ -0,0 +1,372 @@
+"""Benchmarks for decoding and simplifying large plugin responses.
+
+Run with ``python -m pytest bridge/tests --benchmark-only``; save a baseline
+with ``--benchmark-autosave`` and fail on regressions against it with
+``--benchmark-compare --benchmark-compare-fail=mean:20%``. Peak allocations
+are measured with tracemalloc, recorded in each benchmark's extra_info and
+checked against a ceiling relative to the response body.
+"""
+
+import asyncio
+import base64
+import gzip
+import json
+import os
+import random
+import tracemalloc
+from collections.abc import AsyncIterator, Callable
+from contextlib import aclosing
+from typing import Any
+
+import httpx
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+import http_client  # noqa: E402
+from cache import response_cache  # noqa: E402
+from conftest import PORT  # noqa: E402
+from http_client import (  # noqa: E402
+    LEAN_PARAM,
+    _decode,
+    _extract_disassembly,
+    _parse_body,
+    async_get_listing,
+    async_get_streamed,
+    async_safe_get,
+    async_stream_items,
+    simplify_response,
+    to_columns,
+)
+
+FUNCTION_COUNT = 100_000
+INSTRUCTION_COUNT = 50_000
+
+MNEMONICS = ("MOV", "PUSH", "CALL", "LEA", "CMP", "JNZ", "ADD", "POP", "RET", "XOR")
+
+
+def _function_list_body() -> bytes:
+    """A functions listing page as the plugin sends it, links and all."""
+    items = []
+    for i in range(FUNCTION_COUNT):
+        address = f"{0x401000 + i * 0x40:08x}"
+        name = f"FUN_{address}"
+        items.append({
+            "name": name,
+            "address": address,
+            "_links": {
+                "self": {"href": f"/functions/{address}"},
+                "by_name": {"href": f"/functions/by-name/{name}"},
+                "decompile": {"href": f"/functions/{address}/decompile"},
+            },
+        })
+    return json.dumps({
+        "id": "mcp-bridge-bench",
+        "instance": "http://localhost:8192",
+        "success": True,
+        "result": items,
+        "size": FUNCTION_COUNT,
+        "offset": 0,
+        "limit": FUNCTION_COUNT,
+        "_links": {"self": {"href": f"/functions?offset=0&limit={FUNCTION_COUNT}"}, "program": {"href": "/program"}},
+    }).encode()
+
+
+def _disassembly_body() -> bytes:
+    """A disassembly response for one very long function."""
+    instructions = [
+        {
+            "address": f"{0x401000 + i * 4:08x}",
+            "bytes": f"{(i * 2654435761) & 0xFFFFFFFF:08X}",
+            "mnemonic": MNEMONICS[i % len(MNEMONICS)],
+            "operands": f"EAX,dword ptr [EBP + {-(i % 64) * 4:#x}]",
+        }
+        for i in range(INSTRUCTION_COUNT)
+    ]
+    return json.dumps({
+        "success": True,
+        "result": {
+            "function": {"name": "huge_function", "address": "00401000"},
+            "instructions": instructions,
+            "_links": {"self": {"href": "/functions/00401000/disassembly"}},
+        },
+        "_links": {"function": {"href": "/functions/00401000"}},
+    }).encode()
+
+
+@pytest.fixture(scope="module")
+def function_list_body() -> bytes:
+    return _function_list_body()
+
+
+@pytest.fixture(scope="module")
+def disassembly_body() -> bytes:
+    return _disassembly_body()
+
+
+def _peak_bytes(func: Callable[..., Any], *args: Any) -> int:
+    """Peak bytes allocated while func runs, its inputs excluded."""
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _record_peak(benchmark, body: bytes, peak: int, ceiling: float) -> None:
+    benchmark.extra_info["body_bytes"] = len(body)
+    benchmark.extra_info["peak_alloc_bytes"] = peak
+    assert peak <= ceiling * len(body), f"peak allocation {peak} exceeds {ceiling:g}x the body size"
+
+
+@pytest.mark.benchmark(group="functions-100k")
+def test_simplify_function_list(benchmark, function_list_body):
+    result = benchmark.pedantic(
+        simplify_response, setup=lambda: ((json.loads(function_list_body),), {}), rounds=5, iterations=1
+    )
+    assert result["result"][0]["decompile_url"].endswith("/decompile")
+    assert "api_links" in result
+
+    # In place: the new *_url members, never a copy of the items as well
+    _record_peak(benchmark, function_list_body, _peak_bytes(simplify_response, json.loads(function_list_body)), 1.5)
+
+
+@pytest.mark.benchmark(group="functions-100k")
+def test_decode_and_simplify_function_list(benchmark, function_list_body):
+    def decode_and_simplify() -> dict:
+        return simplify_response(_parse_body(200, function_list_body))
+
+    result = benchmark(decode_and_simplify)
+    assert len(result["result"]) == FUNCTION_COUNT
+    _record_peak(benchmark, function_list_body, _peak_bytes(decode_and_simplify), 8.0)
+
+
+@pytest.mark.benchmark(group="functions-100k")
+def test_lean_columns_function_list(benchmark, function_list_body):
+    result = benchmark.pedantic(
+        to_columns,
+        setup=lambda: ((simplify_response(json.loads(function_list_body)),), {}),
+        rounds=5,
+        iterations=1,
+    )
+    assert len(result["result"]) == FUNCTION_COUNT
+    _record_peak(benchmark, function_list_body, _peak_bytes(to_columns, json.loads(function_list_body)), 1.0)
+
+
+@pytest.mark.benchmark(group="disassembly-50k")
+def test_simplify_disassembly(benchmark, disassembly_body):
+    result = benchmark.pedantic(
+        simplify_response, setup=lambda: ((json.loads(disassembly_body),), {}), rounds=5, iterations=1
+    )
+    text = result["result"]["disassembly_text"]
+    assert text.count("\n") == INSTRUCTION_COUNT
+    # The listing is built once: text plus one line per instruction, not a copy per append
+    _record_peak(benchmark, disassembly_body, _peak_bytes(simplify_response, json.loads(disassembly_body)), 3.0)
+
+
+@pytest.mark.benchmark(group="disassembly-50k")
+def test_fetch_disassembly_text(benchmark, disassembly_body):
+    def decode_and_extract() -> str:
+        return _extract_disassembly(_parse_body(200, disassembly_body))
+
+    text = benchmark(decode_and_extract)
+    assert text.startswith("00401000: ")
+    _record_peak(benchmark, disassembly_body, _peak_bytes(decode_and_extract), 6.0)
+
+
+LISTING_LIMIT = 1000
+
+
+def _listing_item(endpoint: str, i: int, lean: bool) -> dict:
+    """One item of a functions or data page, shaped as the plugin builds it."""
+    address = f"{0x401000 + i * 0x10:08x}"
+    if endpoint == "functions":
+        item: dict[str, Any] = {"name": f"FUN_{address}", "address": address}
+        links = {"self": {"href": f"/functions/{address}"}, "program": {"href": "/program"}}
+    else:
+        item = {"address": address, "label": f"DAT_{address}", "value": f"{i:#x}", "dataType": "dword"}
+        links = {"self": {"href": f"/data/{address}"}}
+    if not lean:
+        item["_links"] = links
+    return item
+
+
+async def _listing_page(request: httpx.Request) -> httpx.Response:
+    endpoint = request.url.path.strip("/")
+    lean = request.url.params.get(LEAN_PARAM) == "1"
+    limit = int(request.url.params["limit"])
+    return httpx.Response(200, json={
+        "success": True,
+        "result": [_listing_item(endpoint, i, lean) for i in range(limit)],
+        "offset": 0,
+        "limit": limit,
+        "_links": {"self": {"href": f"/{endpoint}?offset=0&limit={limit}"}},
+    })
+
+
+@pytest.mark.benchmark(group="listing-lean")
+@pytest.mark.parametrize("lean", [False, True], ids=["full", "lean"])
+@pytest.mark.parametrize("endpoint", ["functions", "data"])
+def test_listing_payload(benchmark, fake_plugin, endpoint, lean):
+    """functions_list and data_list pages, full and lean, through the real request path."""
+    wire: list[int] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        response = await _listing_page(request)
+        wire.append(len(response.content))
+        return response
+
+    fake_plugin(handler)
+
+    def fetch() -> dict:
+        return asyncio.run(async_get_listing(PORT, endpoint, {"offset": 0, "limit": LISTING_LIMIT}, lean=lean))
+
+    # Every round goes to the plugin rather than the response cache
+    result = benchmark.pedantic(fetch, setup=lambda: response_cache.invalidate_port(PORT), rounds=10, iterations=1)
+    assert len(result["result"]) == LISTING_LIMIT
+    assert ("columns" in result) == lean
+
+    benchmark.extra_info["wire_bytes"] = wire[-1]
+    benchmark.extra_info["payload_bytes"] = len(json.dumps(result, separators=(",", ":")))
+
+
+# Size of the streamed listing body; set GHIDRA_BENCH_LARGE_MB=500 to reproduce the 500 MB case
+LARGE_MB = float(os.environ.get("GHIDRA_BENCH_LARGE_MB", "16"))
+STRING_VALUE = "A" * 480
+STREAM_CHUNK = 64 * 1024
+
+
+def _string_item(i: int) -> bytes:
+    address = f"{0x500000 + i * 0x200:08x}"
+    return json.dumps({
+        "address": address,
+        "value": STRING_VALUE,
+        "length": len(STRING_VALUE),
+        "_links": {"self": {"href": f"/data/{address}"}},
+    }).encode()
+
+
+STRING_COUNT = int(LARGE_MB * 1024 * 1024 / (len(_string_item(0)) + 1))
+
+
+async def _string_chunks() -> AsyncIterator[bytes]:
+    """A /strings page generated as it is sent, so the plugin never holds the body."""
+    yield b'{"success": true, "result": ['
+    chunk = bytearray()
+    for i in range(STRING_COUNT):
+        if i:
+            chunk += b","
+        chunk += _string_item(i)
+        if len(chunk) >= STREAM_CHUNK:
+            yield bytes(chunk)
+            chunk.clear()
+    yield bytes(chunk) + f'], "size": {STRING_COUNT}, "_links": {{"self": {{"href": "/strings"}}}}}}'.encode()
+
+
+async def _streamed_strings(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, headers={"Content-Type": "application/json"}, content=_string_chunks())
+
+
+async def _buffered(port: int) -> int:
+    return len(simplify_response(await async_safe_get(port, "strings"))["result"])
+
+
+async def _streamed_collected(port: int) -> int:
+    return len((await async_get_streamed(port, "strings"))["result"])
+
+
+async def _streamed_iterated(port: int) -> int:
+    count = 0
+    async with aclosing(async_stream_items(port, "strings")) as items:
+        async for _ in items:
+            count += 1
+    return count
+
+
+@pytest.mark.benchmark(group="streaming")
+@pytest.mark.parametrize(
+    "fetch, ceiling",
+    [(_buffered, 4.0), (_streamed_collected, 2.5), (_streamed_iterated, 0.25)],
+    ids=["buffered", "streamed-collected", "streamed-iterated"],
+)
+def test_large_listing_peak_memory(benchmark, fake_plugin, fetch, ceiling):
+    """A GHIDRA_BENCH_LARGE_MB /strings page fetched whole, streamed into a list, and streamed item by item."""
+    fake_plugin(_streamed_strings)
+
+    def run() -> int:
+        return asyncio.run(fetch(PORT))
+
+    count = benchmark.pedantic(run, setup=lambda: response_cache.invalidate_port(PORT), rounds=3, iterations=1)
+    assert count == STRING_COUNT
+
+    response_cache.invalidate_port(PORT)
+    peak = _peak_bytes(run)
+    body_bytes = int(LARGE_MB * 1024 * 1024)
+    benchmark.extra_info["body_bytes"] = body_bytes
+    benchmark.extra_info["peak_alloc_bytes"] = peak
+    assert peak <= ceiling * body_bytes, f"peak allocation {peak} exceeds {ceiling:g}x the body size"
+
+
+WIRE_ITEMS = 10_000
+
+
+def _functions_payload(lean: bool) -> dict:
+    items = [_listing_item("functions", i, lean) for i in range(WIRE_ITEMS)]
+    if lean:
+        return {"success": True, "columns": ["name", "address"], "result": [[i["name"], i["address"]] for i in items]}
+    return {"success": True, "result": items, "size": WIRE_ITEMS, "offset": 0, "limit": WIRE_ITEMS}
+
+
+def _callgraph_payload() -> dict:
+    nodes = [{"name": f"FUN_{0x401000 + i * 0x40:08x}", "address": f"{0x401000 + i * 0x40:08x}"} for i in range(3000)]
+    edges = [
+        {"from": nodes[i // 3]["address"], "to": nodes[(i * 7 + 1) % len(nodes)]["address"], "type": "CALL"}
+        for i in range(9000)
+    ]
+    return {"success": True, "result": {"root": nodes[0]["name"], "nodes": nodes, "edges": edges}}
+
+
+def _memory_payload(binary: bool) -> dict:
+    raw = random.Random(4096).randbytes(4096)  # code and data bytes barely compress
+    result: dict[str, Any] = {"address": "00401000", "length": len(raw)}
+    if binary:
+        result["rawBytes"] = raw  # MessagePack carries the bytes as a binary value, without hexBytes
+    else:
+        result["hexBytes"] = raw.hex(" ").upper()
+        result["rawBytes"] = base64.b64encode(raw).decode("ascii")
+    return {"success": True, "result": result}
+
+
+WIRE_PAYLOADS = {
+    "functions": lambda binary: _functions_payload(lean=False),
+    "columns": lambda binary: _functions_payload(lean=True),
+    "callgraph": lambda binary: _callgraph_payload(),
+    "memory": _memory_payload,
+}
+
+
+@pytest.mark.benchmark(group="wire-format")
+@pytest.mark.parametrize("decoder", ["json", "orjson", "msgpack"])
+@pytest.mark.parametrize("payload", list(WIRE_PAYLOADS))
+def test_decode_wire_format(benchmark, monkeypatch, payload, decoder):
+    """_decode on JSON (standard library or orjson) and MessagePack bodies of the same response."""
+    if decoder == "msgpack":
+        msgpack = pytest.importorskip("msgpack")
+        body = msgpack.packb(WIRE_PAYLOADS[payload](True))
+        other = json.dumps(WIRE_PAYLOADS[payload](False), separators=(",", ":")).encode()
+    else:
+        if decoder == "orjson":
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(http_client, "orjson", None)
+        body = json.dumps(WIRE_PAYLOADS[payload](False), separators=(",", ":")).encode()
+        other = None
+
+    result = benchmark(_decode, body)
+
+    assert result["success"]
+    benchmark.extra_info["body_bytes"] = len(body)
+    benchmark.extra_info["gzip_bytes"] = len(gzip.compress(body, compresslevel=1))
+    if other is not None:
+        assert len(body) < len(other)  # MessagePack is never the bigger one
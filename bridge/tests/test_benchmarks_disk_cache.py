@@ -0,0 +1,97 @@
+"""Benchmarks for the persistent disk cache across bridge restarts.
+
+Each round replays a corpus of decompiles and a call graph against a plugin
+that takes DECOMPILE_SECONDS per decompile, with the in-memory cache empty as
+after a restart. Run with ``python -m pytest bridge/tests --benchmark-only``.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+import http_client  # noqa: E402
+from cache import (  # noqa: E402
+    MODIFICATION_NUMBER_HEADER,
+    PROGRAM_ID_HEADER,
+    PROGRAM_IDENTITY_HEADER,
+    DiskCache,
+    response_cache,
+)
+from conftest import PORT  # noqa: E402
+from http_client import async_safe_get  # noqa: E402
+
+FUNCTIONS = 150
+DECOMPILE_SECONDS = 0.02
+ROUNDS = 3
+PROGRAM_STATE = {
+    PROGRAM_ID_HEADER: "1",
+    MODIFICATION_NUMBER_HEADER: "5",
+    PROGRAM_IDENTITY_HEADER: "proj%3A%2Ffirmware.bin%23f1%23aaaa",
+}
+CORPUS = [f"functions/{0x401000 + i * 0x40:08x}/decompile" for i in range(FUNCTIONS)] + ["analysis/callgraph"]
+
+
+def _decompiled(path: str) -> str:
+    name = path.split("/")[2]
+    body = "\n".join(f"  local_{i:x} = FUN_{name}(local_{i:x} + {i});" for i in range(20 + int(name, 16) % 60))
+    return f"int FUN_{name}(int param_1)\n{{\n{body}\n  return param_1;\n}}\n"
+
+
+async def _recorded(request: httpx.Request) -> httpx.Response:
+    path = request.url.path
+    if path.endswith("/decompile"):
+        await asyncio.sleep(DECOMPILE_SECONDS)
+        result = {"decompiled": _decompiled(path)}
+    elif path == "/analysis/callgraph":
+        await asyncio.sleep(DECOMPILE_SECONDS)
+        result = {"nodes": [{"name": e.split("/")[1]} for e in CORPUS[:-1]], "edges": []}
+    else:
+        result = {"name": "firmware.bin"}
+    return httpx.Response(200, json={"success": True, "result": result}, headers=PROGRAM_STATE)
+
+
+async def _replay() -> None:
+    await async_safe_get(PORT, "program")  # a restarted bridge observes the program state first
+    for endpoint in CORPUS:
+        response = await async_safe_get(PORT, endpoint)
+        assert response["success"]
+
+
+@pytest.mark.benchmark(group="disk-cache")
+@pytest.mark.parametrize("mode", ["no-disk-cache", "cold", "warm"])
+def test_replay_after_a_restart(benchmark, fake_plugin, tmp_path, monkeypatch, mode):
+    """Cold rounds start from an empty cache directory, warm rounds reopen one a previous run filled."""
+    plugin = fake_plugin(_recorded)
+    caches: list[DiskCache] = []
+    if mode == "warm":
+        monkeypatch.setattr(http_client, "disk_cache", DiskCache(str(tmp_path / "warm")))
+        asyncio.run(_replay())
+        http_client.disk_cache.flush()
+        plugin.hits.clear()
+
+    def restart() -> None:
+        directory = {"no-disk-cache": None, "warm": tmp_path / "warm"}.get(mode, tmp_path / f"cold-{len(caches)}")
+        caches.append(DiskCache(str(directory) if directory else ""))
+        monkeypatch.setattr(http_client, "disk_cache", caches[-1])
+        response_cache.clear()
+
+    def replay() -> None:
+        asyncio.run(_replay())
+        caches[-1].flush()  # a cold run is not done until its writes are
+
+    benchmark.pedantic(replay, setup=restart, rounds=ROUNDS, iterations=1)
+
+    decompiles = sum(n for path, n in plugin.hits.items() if path != "/program")
+    last = caches[-1]
+    benchmark.extra_info.update(decompiles=decompiles, disk_hits=last.hits, disk_writes=last.writes)
+    if mode == "warm":
+        assert decompiles == 0
+        assert last.hits == len(CORPUS)
+    else:
+        assert decompiles == ROUNDS * len(CORPUS)
+    if mode == "cold":
+        assert last.writes == len(CORPUS)
+        benchmark.extra_info["disk_bytes"] = last.stats()["bytes"]
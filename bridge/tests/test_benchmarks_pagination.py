@@ -0,0 +1,88 @@
+"""Benchmarks for walking a large listing page by page through async_iter_pages.
+
+The plugin is a Python model of the two ways its listing endpoints can page,
+not the Java endpoints themselves: offset paging converts every function of
+the program and slices the page out, keyset paging seeks to the cursor and
+converts only the page. Run with ``python -m pytest bridge/tests --benchmark-only``.
+"""
+
+import asyncio
+import bisect
+from contextlib import aclosing
+
+import httpx
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+import http_client  # noqa: E402
+from cache import response_cache  # noqa: E402
+from conftest import PORT  # noqa: E402
+from http_client import async_iter_pages, page_items  # noqa: E402
+
+FUNCTIONS = 200_000
+PAGE_SIZE = 100
+PAGES = 3
+ADDRESSES = [0x400000 + i * 0x20 for i in range(FUNCTIONS)]
+
+
+def _function(address: int) -> dict:
+    addr = f"{address:08x}"
+    return {"name": f"FUN_{addr}", "address": addr, "_links": {"self": {"href": f"/functions/{addr}"}}}
+
+
+def _page(items: list, next_params: str | None, **extra) -> httpx.Response:
+    links = {"next": {"href": f"/functions?{next_params}"}} if next_params else {}
+    return httpx.Response(200, json={"success": True, "result": items, "size": FUNCTIONS, **extra, "_links": links})
+
+
+async def _offset_paging(request: httpx.Request) -> httpx.Response:
+    """Converts every function, then slices the page out (cursor is not understood)."""
+    params = request.url.params
+    offset, limit = int(params.get("offset", 0)), int(params["limit"])
+    every = [_function(address) for address in ADDRESSES]
+    items = every[offset:offset + limit]
+    more = offset + limit < len(every)
+    return _page(items, f"offset={offset + limit}&limit={limit}" if more else None, offset=offset, limit=limit)
+
+
+async def _keyset_paging(request: httpx.Request) -> httpx.Response:
+    """Seeks to the cursor address and converts only the page plus one lookahead key."""
+    params = request.url.params
+    cursor, limit = params.get("cursor", ""), int(params["limit"])
+    start = bisect.bisect_left(ADDRESSES, int(cursor.partition(":")[2], 16)) if cursor else 0
+    items = [_function(address) for address in ADDRESSES[start:start + limit]]
+    if start + limit < len(ADDRESSES):
+        next_cursor = f"ram:{ADDRESSES[start + limit]:08x}"
+        return _page(items, f"cursor={next_cursor}&limit={limit}", next_cursor=next_cursor)
+    return _page(items, None)
+
+
+async def _walk(max_items: int) -> list:
+    items = []
+    async with aclosing(async_iter_pages(PORT, "functions", page_size=PAGE_SIZE, max_items=max_items)) as pages:
+        async for page in pages:
+            assert page["success"]
+            items.extend(page_items(page))
+    return items
+
+
+@pytest.mark.benchmark(group="pagination")
+@pytest.mark.parametrize("handler", [_offset_paging, _keyset_paging], ids=["offset", "keyset"])
+def test_walk_a_large_listing(benchmark, fake_plugin, monkeypatch, handler):
+    """The first PAGES pages of a FUNCTIONS-function listing, PAGE_SIZE items each."""
+    # Pin the page size so both modes walk the same pages; offset pages would otherwise shrink as they slow down
+    monkeypatch.setattr(http_client, "PAGE_MIN_SIZE", PAGE_SIZE)
+    monkeypatch.setattr(http_client, "PAGE_MAX_SIZE", PAGE_SIZE)
+    plugin = fake_plugin(handler)
+
+    items = benchmark.pedantic(
+        lambda: asyncio.run(_walk(PAGES * PAGE_SIZE)),
+        setup=lambda: response_cache.invalidate_port(PORT), rounds=3, iterations=1,
+    )
+
+    assert [item["address"] for item in items] == [f"{a:08x}" for a in ADDRESSES[:PAGES * PAGE_SIZE]]
+    assert plugin.hits["/functions"] == 3 * PAGES
+    per_page = benchmark.stats.stats.mean / PAGES
+    benchmark.extra_info["per_page_ms"] = round(per_page * 1000, 2)
+    benchmark.extra_info["full_walk_s"] = round(per_page * FUNCTIONS / PAGE_SIZE, 1)
@@ -0,0 +1,140 @@
+"""Benchmarks for instance discovery and registry lookups.
+
+Run with ``python -m pytest bridge/tests --benchmark-only``.
+"""
+
+import random
+import socket
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+import index  # noqa: E402
+import state  # noqa: E402
+import transport  # noqa: E402
+from cache import response_cache  # noqa: E402
+from conftest import StandInPlugin  # noqa: E402
+
+SCAN_PORTS = 20
+SILENT_PORTS = 4  # accept the connection and never answer
+READ_TIMEOUT = 0.5
+
+
+def _listen(port: int) -> socket.socket:
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", port))
+    sock.listen(8)
+    return sock
+
+
+def _free_range(size: int) -> range:
+    """A range of loopback ports nothing is listening on (checked, not reserved)."""
+    for _ in range(50):
+        base = random.randrange(40000, 60000 - size)
+        sockets = []
+        try:
+            for port in range(base, base + size):
+                sockets.append(_listen(port))
+            return range(base, base + size)
+        except OSError:
+            continue
+        finally:
+            for sock in sockets:
+                sock.close()
+    pytest.skip("no free range of loopback ports")
+
+
+@pytest.fixture
+def scan_range(monkeypatch):
+    """SCAN_PORTS ports: one plugin, SILENT_PORTS that never answer, the rest refusing connections."""
+    monkeypatch.setattr(index, "INDEX_ENABLED", False)
+    monkeypatch.setattr(state, "active_instances", dict(state.active_instances))
+    monkeypatch.setattr(state, "_health", {})
+    ports = _free_range(SCAN_PORTS)
+    plugin = StandInPlugin()
+    plugin.serve(ports[0])
+    silent = [_listen(port) for port in ports[1:1 + SILENT_PORTS]]
+    yield ports
+    for sock in silent:
+        sock.close()
+    transport.close_client(ports[0])
+    response_cache.forget_port(ports[0])
+    plugin.close()
+
+
+@pytest.mark.benchmark(group="discovery")
+@pytest.mark.parametrize("workers", [state.DISCOVERY_WORKERS, 1], ids=["parallel", "one-worker"])
+def test_discovery_scan(benchmark, scan_range, monkeypatch, workers):
+    """A port scan costs about one read timeout in parallel, one per silent port with a single worker."""
+    monkeypatch.setattr(state, "DISCOVERY_WORKERS", workers)
+    registered = dict(state.active_instances)
+
+    def forget_found() -> None:
+        state.active_instances = dict(registered)
+
+    result = benchmark.pedantic(
+        state._discover_instances, args=(scan_range, "127.0.0.1", READ_TIMEOUT),
+        setup=forget_found, rounds=3, iterations=1,
+    )
+
+    assert [instance["port"] for instance in result["instances"]] == [scan_range[0]]
+    benchmark.extra_info["ports"] = SCAN_PORTS
+    benchmark.extra_info["silent_ports"] = SILENT_PORTS
+    benchmark.extra_info["read_timeout"] = READ_TIMEOUT
+    if workers > SILENT_PORTS:
+        assert benchmark.stats.stats.max < 2 * READ_TIMEOUT
+    else:
+        assert benchmark.stats.stats.min >= SILENT_PORTS * READ_TIMEOUT
+
+
+LOOKUPS = 10_000
+
+
+def _per_call_ns(benchmark) -> float:
+    return round(benchmark.stats.stats.mean / LOOKUPS * 1e9, 1)
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """A registry holding one instance, with an empty negative cache."""
+    port = 8192
+    monkeypatch.setattr(state, "active_instances", {port: {"url": f"http://127.0.0.1:{port}"}})
+    monkeypatch.setattr(state, "_unreachable", {})
+    return port
+
+
+@pytest.mark.benchmark(group="registry")
+@pytest.mark.parametrize("lookup", [state.get_instance_url, state.get_instance_port], ids=lambda f: f.__name__)
+def test_registered_lookup(benchmark, registry, monkeypatch, lookup):
+    """Lookups of a registered port read the published mapping without a lock."""
+    monkeypatch.setattr(state, "_register_on_demand", lambda port: pytest.fail("took the slow path"))
+
+    def lookups() -> None:
+        for _ in range(LOOKUPS):
+            lookup(registry)
+
+    benchmark.pedantic(lookups, rounds=10, iterations=1)
+
+    benchmark.extra_info["per_call_ns"] = _per_call_ns(benchmark)
+
+
+@pytest.mark.benchmark(group="registry")
+def test_dead_port_lookup(benchmark, registry, monkeypatch):
+    """After one failed probe a dead port is answered from the negative cache."""
+    dead = _free_range(1)[0]
+    probes = []
+    register = state.register_instance
+    monkeypatch.setattr(state, "register_instance", lambda *args: probes.append(args) or register(*args))
+    monkeypatch.setattr(state, "GHIDRA_HOST", "127.0.0.1")
+    state.get_instance_url(dead)  # the one probe, refused
+
+    def lookups() -> None:
+        for _ in range(LOOKUPS):
+            state.get_instance_url(dead)
+
+    benchmark.pedantic(lookups, rounds=10, iterations=1)
+
+    benchmark.extra_info["per_call_ns"] = _per_call_ns(benchmark)
+    assert len(probes) == 1
+    assert dead not in state.active_instances
@@ -0,0 +1,207 @@
+"""Benchmarks for the transport between the bridge and a plugin on local sockets.
+
+The plugin is a StandInPlugin: a real HTTP/1.1 server on loopback, so
+connection setup, keep-alive and socket I/O are paid as against Ghidra.
+Run with ``python -m pytest bridge/tests --benchmark-only``.
+"""
+
+import asyncio
+import json
+import socket
+import time
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+import http_client  # noqa: E402
+import state  # noqa: E402
+import transport  # noqa: E402
+from cache import response_cache  # noqa: E402
+from http_client import async_safe_get, safe_get  # noqa: E402
+from transport import run_sync  # noqa: E402
+
+SEQUENTIAL_CALLS = 50
+ROUNDS = 5
+
+
+async def _sequential(port: int, calls: int) -> None:
+    for _ in range(calls):
+        response = await async_safe_get(port, "program")  # never cached
+        assert response["success"]
+
+
+@pytest.mark.benchmark(group="pooling")
+@pytest.mark.parametrize("mode", ["pooled", "no-keepalive", "client-per-call"])
+def test_sequential_calls(benchmark, stand_in, monkeypatch, mode):
+    """Per-call latency over the keep-alive pool, a pool with GHIDRA_POOL_KEEPALIVE=0, and a one-off client per call."""
+    plugin, port = stand_in()
+    if mode == "no-keepalive":
+        transport.close_client(port)
+        monkeypatch.setattr(transport, "POOL_KEEPALIVE", False)
+        transport.open_client(port, state.active_instances[port]["url"])
+    elif mode == "client-per-call":
+        monkeypatch.setattr(http_client, "get_client", lambda port: None)
+
+    benchmark.pedantic(lambda: run_sync(_sequential(port, SEQUENTIAL_CALLS)), rounds=ROUNDS, iterations=1)
+
+    calls = ROUNDS * SEQUENTIAL_CALLS
+    benchmark.extra_info["per_call_us"] = round(benchmark.stats.stats.mean / SEQUENTIAL_CALLS * 1e6, 1)
+    benchmark.extra_info["connections"] = plugin.connections
+    assert plugin.hits["/program"] == calls
+    if mode == "pooled":
+        assert plugin.connections == 1  # kept alive across every call
+    else:
+        assert plugin.connections == calls
+
+
+DECOMPILE_SECONDS = 0.5
+LOOKUP_SECONDS = 0.01
+LOOKUPS = 20
+DECOMPILE = "functions/00401000/decompile"
+
+
+def _endpoint_delay(path: str) -> float:
+    return DECOMPILE_SECONDS if path.endswith("/decompile") else LOOKUP_SECONDS
+
+
+def _lookups() -> list[str]:
+    return [f"functions/{0x402000 + i * 0x10:08x}" for i in range(LOOKUPS)]
+
+
+async def _timed(coro) -> float:
+    started = time.perf_counter()
+    response = await coro
+    assert response["success"]
+    return time.perf_counter() - started
+
+
+@pytest.mark.benchmark(group="concurrency")
+@pytest.mark.parametrize("mode", ["async", "blocking"])
+def test_lookups_during_a_decompile(benchmark, stand_in, mode):
+    """Cheap lookups issued while a slow decompile runs: async tools overlap them, blocking tools queue them."""
+    _, port = stand_in(delay=_endpoint_delay)
+    lookup_latencies: list[float] = []
+
+    async def overlapped() -> None:
+        decompile = asyncio.ensure_future(_timed(async_safe_get(port, DECOMPILE)))
+        lookup_latencies.extend(await asyncio.gather(*(_timed(async_safe_get(port, e)) for e in _lookups())))
+        await decompile
+
+    def one_at_a_time() -> None:
+        # Blocking tools ran one after another, each lookup waiting for the decompile ahead of it
+        started = time.perf_counter()
+        safe_get(port, DECOMPILE)
+        for endpoint in _lookups():
+            safe_get(port, endpoint)
+            lookup_latencies.append(time.perf_counter() - started)
+
+    run = (lambda: asyncio.run(overlapped())) if mode == "async" else one_at_a_time
+    benchmark.pedantic(run, setup=lambda: response_cache.invalidate_port(port), rounds=5, iterations=1)
+
+    benchmark.extra_info["max_lookup_latency_ms"] = round(max(lookup_latencies) * 1000, 1)
+    if mode == "async":
+        assert max(lookup_latencies) < DECOMPILE_SECONDS / 2
+        assert benchmark.stats.stats.max < DECOMPILE_SECONDS + LOOKUPS * LOOKUP_SECONDS
+    else:
+        assert min(lookup_latencies) >= DECOMPILE_SECONDS
+
+
+LINK_BANDWIDTH = 20e6 / 8  # 20 Mbit/s
+LINK_LATENCY = 0.005
+
+
+def _decompile_body() -> bytes:
+    lines = [f"  local_{i:x} = FUN_{0x401000 + i * 0x40:08x}(param_1, local_{i:x} + {i});" for i in range(1000)]
+    code = "int FUN_00401000(int param_1)\n{\n" + "\n".join(lines) + "\n  return param_1;\n}\n"
+    return json.dumps({"success": True, "result": {"name": "FUN_00401000", "decompiled": code}}).encode()
+
+
+def _disassembly_body() -> bytes:
+    mnemonics = ("MOV", "PUSH", "CALL", "LEA", "CMP", "JNZ", "ADD", "POP", "RET", "XOR")
+    instructions = [
+        {
+            "address": f"{0x401000 + i * 4:08x}",
+            "bytes": f"{(i * 2654435761) & 0xFFFFFFFF:08X}",
+            "mnemonic": mnemonics[i % len(mnemonics)],
+            "operands": f"EAX,dword ptr [EBP + {-(i % 64) * 4:#x}]",
+        }
+        for i in range(5000)
+    ]
+    return json.dumps({"success": True, "result": {"instructions": instructions}}).encode()
+
+
+def _functions_body() -> bytes:
+    items = []
+    for i in range(1000):
+        address = f"{0x401000 + i * 0x40:08x}"
+        items.append({
+            "name": f"FUN_{address}",
+            "address": address,
+            "_links": {
+                "self": {"href": f"/functions/{address}"},
+                "decompile": {"href": f"/functions/{address}/decompile"},
+            },
+        })
+    return json.dumps({"success": True, "result": items, "size": 1000, "offset": 0, "limit": 1000}).encode()
+
+
+LINK_BODIES = {
+    "functions/00401000/decompile": _decompile_body,
+    "functions/00401000/disassembly": _disassembly_body,
+    "functions": _functions_body,
+}
+
+
+LINKS = {"20mbit-5ms": {"bandwidth": LINK_BANDWIDTH, "latency": LINK_LATENCY}, "loopback": {}}
+
+
+@pytest.mark.benchmark(group="compression")
+@pytest.mark.parametrize("compression", ["0", "1"], ids=["identity", "gzip"])
+@pytest.mark.parametrize("endpoint", list(LINK_BODIES), ids=["decompile", "disassembly", "functions"])
+@pytest.mark.parametrize("link", list(LINKS))
+def test_compressed_responses(benchmark, stand_in, monkeypatch, link, endpoint, compression):
+    """One response over a 20 Mbit/s, 5 ms link and over plain loopback, with and without gzip at level 1."""
+    path = f"/{endpoint}"
+    body = LINK_BODIES[endpoint]()
+    plugin, port = stand_in({path: body}, **LINKS[link])
+    monkeypatch.setattr(transport, "COMPRESSION", compression)
+    transport.close_client(port)
+    transport.open_client(port, state.active_instances[port]["url"])
+
+    def fetch() -> None:
+        assert run_sync(async_safe_get(port, endpoint))["success"]
+
+    benchmark.pedantic(fetch, setup=lambda: response_cache.invalidate_port(port), rounds=7, iterations=1)
+
+    assert plugin.hits[path] == 7
+    benchmark.extra_info["body_bytes"] = len(body)
+    benchmark.extra_info["wire_bytes"] = plugin.sent[path]
+    assert (plugin.sent[path] < len(body) / 2) == (compression == "1")
+
+
+LATENCY_CALLS = 500
+
+
+@pytest.mark.benchmark(group="local-socket")
+@pytest.mark.parametrize("route", ["tcp", "unix"])
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="no Unix domain sockets")
+def test_per_call_latency(benchmark, stand_in, tmp_path, route):
+    """Sequential calls to the same instance over loopback TCP and over its Unix domain socket."""
+    plugin, port = stand_in()
+    if route == "unix":
+        path = plugin.serve_unix(str(tmp_path / f"{port}.sock"))
+        transport.open_client(port, state.active_instances[port]["url"], path)
+    latencies: list[float] = []
+
+    async def timed_calls() -> None:
+        for _ in range(LATENCY_CALLS):
+            latencies.append(await _timed(async_safe_get(port, "program")))
+
+    benchmark.pedantic(lambda: run_sync(timed_calls()), rounds=3, iterations=1)
+
+    latencies.sort()
+    benchmark.extra_info["p50_us"] = round(latencies[len(latencies) // 2] * 1e6)
+    benchmark.extra_info["p99_us"] = round(latencies[int(len(latencies) * 0.99)] * 1e6)
+    assert plugin.hits["/program"] == 3 * LATENCY_CALLS
+    assert plugin.connections == 1
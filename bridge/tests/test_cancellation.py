@@ -0,0 +1,131 @@
+"""A call the bridge stops waiting for is cancelled in the plugin too."""
+
+import asyncio
+import json
+from contextlib import aclosing
+
+import httpx
+
+from conftest import PORT
+from http_client import _send, _stream_json, async_safe_get, async_stream_items, async_stream_post
+from timeouts import Budget
+from transport import run_async
+
+URL = f"http://ghidra.test:{PORT}"
+CANCEL_PREFIX = "/requests/"
+
+
+async def _never(request: httpx.Request) -> httpx.Response:
+    """A long-running operation; the request-cancel endpoint answers at once."""
+    if request.url.path.startswith(CANCEL_PREFIX):
+        return httpx.Response(200, json={"success": True, "result": {"cancelled": True}})
+    await asyncio.sleep(30)
+    return httpx.Response(200, json={"success": True, "result": []})
+
+
+async def _stalled_ndjson(request: httpx.Request) -> httpx.Response:
+    """A batch that streams its first item and then stalls."""
+    if request.url.path.startswith(CANCEL_PREFIX):
+        return httpx.Response(200, json={"success": True})
+
+    async def lines():
+        yield json.dumps({"index": 0, "success": True, "result": {"name": "main"}}).encode() + b"\n"
+        await asyncio.sleep(30)
+
+    return httpx.Response(200, headers={"Content-Type": "application/x-ndjson"}, content=lines())
+
+
+async def _cancelled_ids(plugin, count: int = 1, timeout: float = 2.0) -> list[str]:
+    """Request IDs the plugin was asked to cancel, once ``count`` of them have arrived."""
+    loop = asyncio.get_running_loop()
+    until = loop.time() + timeout
+    while loop.time() < until:
+        paths = [path for path in plugin.hits if path.startswith(CANCEL_PREFIX)]
+        if len(paths) >= count:
+            return [path[len(CANCEL_PREFIX):-len("/cancel")] for path in paths]
+        await asyncio.sleep(0.01)
+    return []
+
+
+def _request_id(plugin, path: str) -> str:
+    return next(request.headers["X-Request-ID"] for request in plugin.requests if request.url.path == path)
+
+
+def test_cancelled_call_cancels_the_plugin_request(fake_plugin):
+    plugin = fake_plugin(_never)
+
+    async def run():
+        call = asyncio.ensure_future(async_safe_get(PORT, "functions/00401000/decompile"))
+        await asyncio.sleep(0.1)
+        call.cancel()
+        return await _cancelled_ids(plugin)
+
+    cancelled = asyncio.run(run())
+
+    assert cancelled == [_request_id(plugin, "/functions/00401000/decompile")]
+
+
+def test_timed_out_call_cancels_the_plugin_request(fake_plugin):
+    plugin = fake_plugin(_never)
+
+    async def run():
+        outcome = await run_async(_send(
+            "GET", PORT, f"{URL}/functions/00401000/decompile", None, None, None,
+            {"X-Request-ID": "timed-out"}, Budget(0.05, 0.2), "heavy",
+        ))
+        return outcome, await _cancelled_ids(plugin)
+
+    outcome, cancelled = asyncio.run(run())
+
+    assert outcome["error"]["code"] == "REQUEST_TIMEOUT"
+    assert cancelled == ["timed-out"]
+
+
+def test_closing_a_streamed_batch_cancels_the_plugin_request(fake_plugin):
+    plugin = fake_plugin(_stalled_ndjson)
+
+    async def run():
+        async with aclosing(async_stream_post(PORT, "functions/decompile-batch", {"functions": ["main"]})) as items:
+            first = await anext(items)
+        return first, await _cancelled_ids(plugin)
+
+    first, cancelled = asyncio.run(run())
+
+    assert first["index"] == 0
+    assert cancelled == [_request_id(plugin, "/functions/decompile-batch")]
+
+
+def test_cancelled_streamed_listing_cancels_the_plugin_request(fake_plugin):
+    plugin = fake_plugin(_never)
+
+    async def consume():
+        return [item async for item in async_stream_items(PORT, "functions", {"limit": 100000})]
+
+    async def run():
+        call = asyncio.ensure_future(consume())
+        await asyncio.sleep(0.1)
+        call.cancel()
+        return await _cancelled_ids(plugin)
+
+    cancelled = asyncio.run(run())
+
+    assert cancelled == [_request_id(plugin, "/functions")]
+
+
+def test_timed_out_streamed_listing_cancels_the_plugin_request(fake_plugin):
+    plugin = fake_plugin(_never)
+
+    async def emit(batch: list) -> None:
+        pass
+
+    async def run():
+        outcome = await run_async(_stream_json(
+            PORT, f"{URL}/functions", {"limit": 100000}, {"X-Request-ID": "slow-listing"},
+            ("result",), emit, Budget(0.05, 0.2), "standard",
+        ))
+        return outcome, await _cancelled_ids(plugin)
+
+    outcome, cancelled = asyncio.run(run())
+
+    assert outcome["error"]["code"] == "REQUEST_TIMEOUT"
+    assert cancelled == ["slow-listing"]
@@ -0,0 +1,77 @@
+"""Decompile line windows are cut from one cached decompilation only when the cache can hold it."""
+
+import asyncio
+
+import httpx
+import pytest
+from fastmcp import FastMCP
+
+from cache import MODIFICATION_NUMBER_HEADER, PROGRAM_ID_HEADER, response_cache
+from conftest import PORT
+from http_client import slice_decompiled
+from tools.function_tools import register_function_tools
+
+ENDPOINT = "/functions/by-name/main/decompile"
+CODE = "\n".join(f"  line_{i:04d}();" for i in range(1, 201))
+WINDOW_PARAMS = ("start_line", "end_line", "max_lines")
+PROGRAM_STATE = {PROGRAM_ID_HEADER: "1", MODIFICATION_NUMBER_HEADER: "5"}
+
+
+async def _decompiler(request: httpx.Request) -> httpx.Response:
+    """Decompiles main, applying the line filter when one is asked for, like the plugin."""
+    params = request.url.params
+    result = {"name": "main", "decompiled": CODE}
+    if any(name in params for name in WINDOW_PARAMS):
+        window = {name: int(params[name]) for name in WINDOW_PARAMS if name in params}
+        result["decompiled"], result["filter"] = slice_decompiled(CODE, **window)
+    return httpx.Response(200, json={"success": True, "result": result}, headers=PROGRAM_STATE)
+
+
+@pytest.fixture
+def decompile(fake_plugin):
+    server = FastMCP("test")
+    register_function_tools(server)
+    plugin = fake_plugin(_decompiler)
+
+    def call(**window) -> dict:
+        result = asyncio.run(server.call_tool("functions_decompile", {"name": "main", "port": PORT, **window}))
+        return result.structured_content
+
+    return plugin, call
+
+
+def _windowed_requests(plugin) -> list[bool]:
+    return [any(name in request.url.params for name in WINDOW_PARAMS) for request in plugin.requests]
+
+
+def test_windows_are_cut_from_one_cached_decompilation(decompile):
+    plugin, call = decompile
+
+    first = call(start_line=1, max_lines=50)
+    second = call(start_line=51, max_lines=50)
+
+    assert first["result"]["decompiled"].splitlines()[0].strip() == "line_0001();"
+    assert second["result"]["decompiled"].splitlines()[0].strip() == "line_0051();"
+    assert plugin.hits[ENDPOINT] == 1
+    assert _windowed_requests(plugin) == [False]
+
+
+def test_windows_go_to_the_plugin_when_the_cache_is_off(decompile, monkeypatch):
+    monkeypatch.setattr(response_cache, "max_bytes", 0)
+    plugin, call = decompile
+
+    window = call(start_line=51, max_lines=50)
+
+    assert window["result"]["decompiled"].splitlines()[0].strip() == "line_0051();"
+    assert window["result"]["filter"] == {"total_lines": 200, "start_line": 51, "max_lines": 50}
+    assert _windowed_requests(plugin) == [True]
+
+
+def test_windows_go_to_the_plugin_once_the_function_is_too_large_to_cache(decompile, monkeypatch):
+    monkeypatch.setattr(response_cache, "max_bytes", len(CODE) // 2)
+    plugin, call = decompile
+
+    call(start_line=1, max_lines=50)
+    call(start_line=51, max_lines=50)
+
+    assert _windowed_requests(plugin) == [False, True]
@@ -0,0 +1,85 @@
+"""The persistent response cache keys entries on program identity, not the per-session program ID."""
+
+import asyncio
+import threading
+
+import httpx
+import pytest
+
+import http_client
+from cache import MODIFICATION_NUMBER_HEADER, PROGRAM_ID_HEADER, PROGRAM_IDENTITY_HEADER, DiskCache
+from conftest import PORT
+from http_client import async_safe_get
+
+ENDPOINT = "functions/00401000/decompile"
+
+
+def _program(identity: str, code: str):
+    """A plugin whose program has the given identity, with session ID 1 at modification 5 like any fresh Ghidra."""
+    headers = {PROGRAM_ID_HEADER: "1", MODIFICATION_NUMBER_HEADER: "5", PROGRAM_IDENTITY_HEADER: identity}
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        result = {"name": "firmware"} if request.url.path == "/program" else {"decompiled": code}
+        return httpx.Response(200, json={"success": True, "result": result}, headers=headers)
+
+    return handler
+
+
+@pytest.fixture
+def disk_cache(tmp_path, monkeypatch):
+    cache = DiskCache(str(tmp_path))
+    monkeypatch.setattr(http_client, "disk_cache", cache)
+    return cache
+
+
+async def _decompile(port: int) -> str:
+    await async_safe_get(port, "program")  # observe the instance's program state
+    response = await async_safe_get(port, ENDPOINT)
+    return response["result"]["decompiled"]
+
+
+def test_programs_with_equal_session_ids_do_not_collide(fake_plugin, disk_cache):
+    first = fake_plugin(_program("proj%3A%2Fa.exe%23f1%23aaaa", "int a(void)"), PORT)
+    second = fake_plugin(_program("proj%3A%2Fb.exe%23f2%23bbbb", "int b(void)"), PORT + 1)
+
+    assert asyncio.run(_decompile(PORT)) == "int a(void)"
+    assert asyncio.run(_decompile(PORT + 1)) == "int b(void)"
+
+    assert first.hits["/functions/00401000/decompile"] == 1
+    assert second.hits["/functions/00401000/decompile"] == 1
+    disk_cache.flush()
+    assert disk_cache.stats()["entries"] == 2
+
+
+def test_same_program_is_served_from_disk_on_another_instance(fake_plugin, disk_cache):
+    identity = "proj%3A%2Fa.exe%23f1%23aaaa"
+    fake_plugin(_program(identity, "int a(void)"), PORT)
+    again = fake_plugin(_program(identity, "int a(void)"), PORT + 1)
+
+    asyncio.run(_decompile(PORT))
+
+    assert asyncio.run(_decompile(PORT + 1)) == "int a(void)"
+    assert again.hits["/functions/00401000/decompile"] == 0
+    assert disk_cache.hits == 1
+
+
+def test_disk_cache_io_runs_off_the_transport_loop(fake_plugin, disk_cache, monkeypatch):
+    identity = "proj%3A%2Fa.exe%23f1%23aaaa"
+    fake_plugin(_program(identity, "int a(void)"), PORT)
+    again = fake_plugin(_program(identity, "int a(void)"), PORT + 1)
+    threads = []
+
+    def recording(method):
+        def call(*args):
+            threads.append(threading.current_thread().name)
+            return method(*args)
+        return call
+
+    monkeypatch.setattr(disk_cache, "get", recording(disk_cache.get))
+    monkeypatch.setattr(disk_cache, "put", recording(disk_cache.put))
+
+    asyncio.run(_decompile(PORT))
+    assert asyncio.run(_decompile(PORT + 1)) == "int a(void)"
+
+    assert again.hits["/functions/00401000/decompile"] == 0
+    assert threads and all(name.startswith("GhidraMCP-DiskCache") for name in threads)
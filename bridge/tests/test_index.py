@@ -0,0 +1,105 @@
+"""Program index: rebuilds, program state and address validation."""
+
+import asyncio
+import sqlite3
+import threading
+from contextlib import closing
+
+import httpx
+import pytest
+
+from cache import MODIFICATION_NUMBER_HEADER, PROGRAM_ID_HEADER
+from conftest import PORT
+from index import SCHEMA, IndexManager, ProgramIndex
+
+PROGRAM_ID = "project:/firmware.bin"
+STATE = ("7", "42")
+
+
+def _write_index(path, xrefs=()):
+    with closing(sqlite3.connect(path)) as conn:
+        conn.executescript(SCHEMA)
+        conn.executemany("INSERT INTO xrefs VALUES (?, ?, ?, ?, ?, ?)", xrefs)
+        conn.commit()
+
+
+def test_xrefs_rejects_unparseable_address(tmp_path):
+    path = tmp_path / "index.sqlite"
+    _write_index(path, [("00401000", 0x401000, "00402000", 0x402000, "UNCONDITIONAL_CALL", 1)])
+    index = ProgramIndex(path)
+
+    assert index.xrefs(to_addr="0x402000")[1] == 1
+    with pytest.raises(ValueError, match="to_addr"):
+        index.xrefs(to_addr="main+4")
+
+
+def test_rebuild_keeps_live_file_and_reexports_after_running_export(tmp_path, monkeypatch):
+    manager = IndexManager(tmp_path)
+    path = manager.path_for(PROGRAM_ID)
+    _write_index(path)
+    exports = []
+    release_first = threading.Event()
+
+    async def identity(port):
+        return PROGRAM_ID, STATE
+
+    async def export(port, program_id, target, force=False):
+        exports.append(force)
+        assert target.exists(), "the live index must stay readable during an export"
+        if len(exports) == 1:
+            await asyncio.to_thread(release_first.wait)
+        return {}
+
+    monkeypatch.setattr(manager, "_identity", identity)
+    monkeypatch.setattr(manager, "_export", export)
+
+    # A background sync is already exporting when the rebuild is asked for
+    running, owner = manager._claim(path)
+    assert owner
+    manager._executor.submit(manager._run_export, running, 0, PROGRAM_ID, path)
+
+    async def rebuild():
+        task = asyncio.ensure_future(manager.get(0, rebuild=True))
+        await asyncio.sleep(0.1)
+        assert path.exists()
+        release_first.set()
+        return await task
+
+    index = asyncio.run(rebuild())
+
+    assert index.path == path
+    assert exports == [False, True]
+
+
+def test_without_program_state_get_fails_instead_of_exporting(tmp_path, monkeypatch):
+    manager = IndexManager(tmp_path)
+    exports = []
+
+    async def identity(port):
+        return PROGRAM_ID, None
+
+    async def export(port, program_id, target, force=False):
+        exports.append(force)
+        return {}
+
+    monkeypatch.setattr(manager, "_identity", identity)
+    monkeypatch.setattr(manager, "_export", export)
+
+    for _ in range(2):
+        with pytest.raises(RuntimeError, match="no program state"):
+            asyncio.run(manager.get(0))
+
+    assert exports == []
+
+
+def test_identity_falls_back_to_the_session_program_state(tmp_path, fake_plugin):
+    async def program(request: httpx.Request) -> httpx.Response:
+        headers = {PROGRAM_ID_HEADER: "7", MODIFICATION_NUMBER_HEADER: "42"}  # no program identity
+        return httpx.Response(200, json={"success": True, "result": {"programId": PROGRAM_ID}}, headers=headers)
+
+    fake_plugin(program)
+
+    program_id, state = asyncio.run(IndexManager(tmp_path)._identity(PORT))
+
+    assert program_id == PROGRAM_ID
+    assert state == (f"{PROGRAM_ID}#session-7", "42")
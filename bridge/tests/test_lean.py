@@ -0,0 +1,48 @@
+"""List tools return full items unless lean output is asked for."""
+
+import asyncio
+
+import httpx
+
+from conftest import PORT
+from http_client import LEAN_PARAM, async_get_listing, async_list_all
+
+
+async def _listing(request: httpx.Request) -> httpx.Response:
+    lean = request.url.params.get(LEAN_PARAM) == "1"
+    items = []
+    for i in range(3):
+        item = {"name": f"FUN_{i:08x}", "address": f"{i:08x}"}
+        if not lean:
+            item["_links"] = {"self": {"href": f"/functions/{i:08x}"}}
+        items.append(item)
+    return httpx.Response(200, json={"success": True, "result": items})
+
+
+def test_listings_are_full_by_default(fake_plugin):
+    plugin = fake_plugin(_listing)
+
+    response = asyncio.run(async_get_listing(PORT, "functions", {"limit": 3}))
+
+    assert LEAN_PARAM not in plugin.requests[0].url.params
+    assert "columns" not in response
+    assert response["result"][0] == {"name": "FUN_00000000", "address": "00000000", "self_url": "/functions/00000000"}
+
+
+def test_lean_listing_on_request(fake_plugin):
+    plugin = fake_plugin(_listing)
+
+    response = asyncio.run(async_get_listing(PORT, "functions", {"limit": 3}, lean=True))
+
+    assert plugin.requests[0].url.params[LEAN_PARAM] == "1"
+    assert response["columns"] == ["name", "address"]
+    assert response["result"][2] == ["FUN_00000002", "00000002"]
+
+
+def test_lean_list_all_on_request(fake_plugin):
+    fake_plugin(_listing)
+
+    response = asyncio.run(async_list_all(PORT, "functions", {}, max_results=3, lean=True))
+
+    assert response["columns"] == ["name", "address"]
+    assert response["size"] == 3
@@ -0,0 +1,70 @@
+"""Cached responses are revalidated against the program's modification number before they are served."""
+
+import asyncio
+
+import httpx
+import pytest
+
+import http_client
+from cache import MODIFICATION_NUMBER_HEADER, PROGRAM_ID_HEADER
+from conftest import PORT
+from http_client import async_safe_get
+
+ENDPOINT = "functions/00401000/decompile"
+
+
+class EditableProgram:
+    """A plugin whose program can be edited behind the bridge's back, as from the Ghidra GUI."""
+
+    def __init__(self) -> None:
+        self.modification_number = 5
+        self.code = "int main(void) { return 0; }"
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        headers = {PROGRAM_ID_HEADER: "1", MODIFICATION_NUMBER_HEADER: str(self.modification_number)}
+        result = {"name": "firmware"} if request.url.path == "/program" else {"decompiled": self.code}
+        return httpx.Response(200, json={"success": True, "result": result}, headers=headers)
+
+
+@pytest.fixture
+def program(fake_plugin):
+    program = EditableProgram()
+    return program, fake_plugin(program)
+
+
+def _decompile() -> str:
+    return asyncio.run(async_safe_get(PORT, ENDPOINT))["result"]["decompiled"]
+
+
+def test_edit_between_gets_is_a_miss(program, monkeypatch):
+    monkeypatch.setattr(http_client, "CACHE_REVALIDATE_AFTER", 0)
+    editable, plugin = program
+
+    assert _decompile() == "int main(void) { return 0; }"
+    editable.modification_number += 1
+    editable.code = "int main(void) { return 1; }"
+
+    assert _decompile() == "int main(void) { return 1; }"
+    assert plugin.hits["/" + ENDPOINT] == 2
+    assert plugin.hits["/program"] == 1
+
+
+def test_unchanged_program_is_a_hit_after_revalidating(program, monkeypatch):
+    monkeypatch.setattr(http_client, "CACHE_REVALIDATE_AFTER", 0)
+    _, plugin = program
+
+    _decompile()
+    _decompile()
+
+    assert plugin.hits["/" + ENDPOINT] == 1
+    assert plugin.hits["/program"] == 1
+
+
+def test_recently_confirmed_state_is_not_probed_again(program):
+    _, plugin = program
+
+    _decompile()
+    _decompile()
+
+    assert plugin.hits["/" + ENDPOINT] == 1
+    assert plugin.hits["/program"] == 0
@@ -0,0 +1,183 @@
+"""Saturation behaviour under a burst of heavy requests.
+
+The fake plugin serves heavy work on a couple of worker slots, the way the
+plugin's bounded executor does, and answers control requests (cancels,
+health and registration probes) at once, the way its control executor does.
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+import admission
+import timeouts
+import state
+from conftest import PORT
+from http_client import async_safe_get
+from timeouts import Budget
+from transport import run_sync
+
+WORKERS = 2
+WORK_SECONDS = 0.2
+BURST = 30
+BUDGET = Budget(0.1, 0.6)
+PROBES = ("plugin-version", "program", "info")
+LOOKUP_SECONDS = 0.01
+
+
+class SaturatedPlugin:
+    """Heavy requests share WORKERS slots; control requests never wait for one."""
+
+    def __init__(self) -> None:
+        self.slots = asyncio.Semaphore(WORKERS)
+        self.running = 0
+        self.max_running = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.startswith("/requests/") or path.strip("/") in PROBES:
+            return httpx.Response(200, json={"success": True, "result": {}})
+        if not path.endswith("/decompile"):
+            await asyncio.sleep(LOOKUP_SECONDS)  # point lookups and listing pages are cheap
+            return httpx.Response(200, json={"success": True, "result": []})
+        async with self.slots:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            try:
+                await asyncio.sleep(WORK_SECONDS)
+            finally:
+                self.running -= 1
+        return httpx.Response(200, json={"success": True, "result": {"ccode": "int main(void) {}"}})
+
+
+@pytest.fixture
+def saturated(fake_plugin, monkeypatch):
+    monkeypatch.setattr(admission, "MAX_CONCURRENT", WORKERS * 2)
+    monkeypatch.setattr(admission, "MAX_HEAVY", WORKERS)
+    monkeypatch.setitem(timeouts.TIMEOUT_CLASSES, "decompile", BUDGET)
+    handler = SaturatedPlugin()
+    return handler, fake_plugin(handler)
+
+
+async def _timed(coro) -> tuple[dict, float]:
+    started = time.monotonic()
+    result = await coro
+    return result, time.monotonic() - started
+
+
+def _decompile(i: int):
+    return async_safe_get(PORT, f"functions/{0x401000 + i * 0x10:08x}/decompile")
+
+
+def test_burst_of_decompiles_is_bounded_and_fails_fast(saturated):
+    handler, plugin = saturated
+
+    async def run():
+        return await asyncio.gather(*(_timed(_decompile(i)) for i in range(BURST)))
+
+    outcomes = asyncio.run(run())
+
+    codes = [response.get("error", {}).get("code") if not response.get("success") else "OK" for response, _ in outcomes]
+    # Admitted late, a call has only what is left of its budget and may still time out
+    assert {"OK", "INSTANCE_BUSY"} <= set(codes) <= {"OK", "INSTANCE_BUSY", "REQUEST_TIMEOUT"}
+    # No more heavy work reaches the plugin than the bridge's heavy lane allows
+    assert handler.max_running <= WORKERS
+    # Calls that queued past their budget are turned away without reaching the plugin, and none outlives it
+    assert max(elapsed for _, elapsed in outcomes) < BUDGET.total + 0.3
+    decompiles = sum(count for path, count in plugin.hits.items() if path.endswith("/decompile"))
+    assert decompiles == BURST - codes.count("INSTANCE_BUSY")
+
+
+def test_health_probes_stay_fast_under_saturation(saturated):
+    saturated_plugin, _ = saturated
+
+    async def run():
+        burst = asyncio.gather(*(_decompile(i) for i in range(BURST)))
+        await asyncio.sleep(0.05)
+        probes = []
+        for _ in range(5):
+            for endpoint in PROBES:
+                probes.append(await _timed(async_safe_get(PORT, endpoint)))
+            await asyncio.sleep(0.05)
+        await burst
+        return probes
+
+    probes = asyncio.run(run())
+
+    assert all(response["success"] for response, _ in probes)
+    assert max(elapsed for _, elapsed in probes) < WORK_SECONDS / 2
+
+
+def test_cancel_reaches_the_plugin_under_saturation(saturated):
+    _, plugin = saturated
+
+    async def run():
+        burst = asyncio.gather(*(_decompile(i) for i in range(1, BURST)))
+        await asyncio.sleep(0.05)
+        call = asyncio.ensure_future(_decompile(0))
+        await asyncio.sleep(0.05)
+        call.cancel()
+        cancelled_at = time.monotonic()
+        while not any(path.startswith("/requests/") for path in plugin.hits):
+            if time.monotonic() - cancelled_at > WORK_SECONDS:
+                break
+            await asyncio.sleep(0.005)
+        elapsed = time.monotonic() - cancelled_at
+        await burst
+        return elapsed
+
+    elapsed = asyncio.run(run())
+
+    assert elapsed < WORK_SECONDS
+
+
+def test_interactive_and_listing_calls_are_not_held_behind_heavy_ones(saturated):
+    """Mixed load: point lookups and listing pages stay fast while decompiles saturate the heavy lane."""
+
+    async def run():
+        burst = asyncio.gather(*(_decompile(i) for i in range(BURST)))
+        await asyncio.sleep(0.05)
+        lookups = [_timed(async_safe_get(PORT, f"functions/{0x401000 + i * 0x10:08x}")) for i in range(10)]
+        listings = [_timed(async_safe_get(PORT, "functions", {"offset": i * 10, "limit": 10})) for i in range(10)]
+        cheap = await asyncio.gather(*lookups, *listings)
+        await burst
+        return cheap[:10], cheap[10:]
+
+    lookups, listings = asyncio.run(run())
+
+    assert all(response["success"] for response, _ in lookups + listings)
+    assert max(elapsed for _, elapsed in lookups) < WORK_SECONDS / 2
+    # Heavy requests may take at most MAX_HEAVY of the MAX_CONCURRENT slots, so listings find one free
+    assert max(elapsed for _, elapsed in listings) < WORK_SECONDS / 2
+    lanes = admission.admission.stats(PORT)["instances"][PORT]
+    assert lanes["interactive"]["queued"] == 0
+    # Listings queue only among themselves, never for a heavy request to finish
+    assert lanes["standard"]["max_wait_ms"] < WORK_SECONDS * 1000 / 2
+    assert lanes["heavy"]["max_queue_depth"] > 0
+
+
+def _drain_transport_loop() -> None:
+    run_sync(asyncio.sleep(0))
+
+
+def test_unregistered_instance_is_dropped_from_admission(saturated):
+    asyncio.run(_decompile(0))
+    assert PORT in admission.admission.stats()["instances"]
+
+    state.unregister_instance(PORT)
+    _drain_transport_loop()
+
+    assert PORT not in admission.admission.stats()["instances"]
+
+
+def test_unreachable_instance_is_dropped_from_admission(saturated, monkeypatch):
+    asyncio.run(_decompile(0))
+    monkeypatch.setattr(state, "_check_instance", lambda port, url, uds=None: (False, None))
+    monkeypatch.setattr(state, "HEALTH_MAX_FAILURES", 1)
+
+    assert state.check_instances() == [PORT]
+    _drain_transport_loop()
+
+    assert PORT not in admission.admission.stats()["instances"]
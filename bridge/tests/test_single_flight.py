@@ -0,0 +1,42 @@
+"""Concurrent identical GETs share one upstream request."""
+
+import asyncio
+
+import httpx
+
+from conftest import PORT
+from http_client import async_safe_get, inflight_requests
+
+CALLERS = 20
+
+
+async def _slow_listing(request: httpx.Request) -> httpx.Response:
+    await asyncio.sleep(0.2)
+    return httpx.Response(200, json={"success": True, "result": [{"name": "main", "address": "00401000"}]})
+
+
+def test_concurrent_identical_gets_hit_the_plugin_once(fake_plugin):
+    plugin = fake_plugin(_slow_listing)
+    coalesced = inflight_requests.coalesced
+
+    async def call_all():
+        return await asyncio.gather(*(async_safe_get(PORT, "functions", {"limit": 10}) for _ in range(CALLERS)))
+
+    responses = asyncio.run(call_all())
+
+    assert plugin.hits["/functions"] == 1
+    assert inflight_requests.coalesced - coalesced == CALLERS - 1
+    assert all(response["success"] and response["result"][0]["name"] == "main" for response in responses)
+    # Every caller gets its own copy to simplify in place
+    assert len({id(response) for response in responses}) == CALLERS
+
+
+def test_different_params_are_not_coalesced(fake_plugin):
+    plugin = fake_plugin(_slow_listing)
+
+    async def call_all():
+        return await asyncio.gather(*(async_safe_get(PORT, "functions", {"limit": 10, "offset": i}) for i in range(3)))
+
+    asyncio.run(call_all())
+
+    assert plugin.hits["/functions"] == 3
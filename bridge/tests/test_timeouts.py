@@ -0,0 +1,70 @@
+"""The wait for an admission slot counts against a request's budget."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+import admission
+from conftest import PORT
+from http_client import _send
+from timeouts import DEADLINE_HEADER, Budget
+from transport import run_sync
+
+URL = f"http://ghidra.test:{PORT}"
+HOLD = 0.4
+
+
+@pytest.fixture
+def one_slot(monkeypatch):
+    monkeypatch.setattr(admission, "MAX_CONCURRENT", 1)
+
+
+async def _handler(request: httpx.Request) -> httpx.Response:
+    await asyncio.sleep(HOLD if request.url.path == "/hold" else float(request.url.params.get("sleep", "0")))
+    return httpx.Response(200, json={"success": True, "result": []})
+
+
+def _queued_behind_hold(budget: Budget, params: dict | None = None) -> tuple[object, float]:
+    """Send a standard request while another holds the only slot for HOLD seconds."""
+    async def run():
+        hold = asyncio.ensure_future(_send("GET", PORT, f"{URL}/hold", None, None, None, {}, Budget(1, 5), "standard"))
+        await asyncio.sleep(0.05)
+        started = time.monotonic()
+        outcome = await _send("GET", PORT, f"{URL}/functions", params, None, None, {}, budget, "standard")
+        elapsed = time.monotonic() - started
+        await hold
+        return outcome, elapsed
+
+    return run_sync(run())
+
+
+def test_deadline_header_is_what_is_left_after_admission(fake_plugin, one_slot):
+    plugin = fake_plugin(_handler)
+
+    outcome, _ = _queued_behind_hold(Budget(0.1, 1.0))
+
+    assert outcome[0] == 200
+    sent = next(request for request in plugin.requests if request.url.path == "/functions")
+    assert int(sent.headers[DEADLINE_HEADER]) <= (1.0 - (HOLD - 0.05)) * 1000 + 50
+
+
+def test_queueing_and_request_share_one_budget(fake_plugin, one_slot):
+    fake_plugin(_handler)
+
+    outcome, elapsed = _queued_behind_hold(Budget(0.1, 0.5), {"sleep": "2"})
+
+    assert outcome["error"]["code"] == "REQUEST_TIMEOUT"
+    # Budgets stacked, this would take the queue wait plus the whole budget (about 0.95s)
+    assert elapsed < 0.8
+
+
+def test_budget_spent_queueing_is_instance_busy(fake_plugin, one_slot):
+    plugin = fake_plugin(_handler)
+
+    outcome, elapsed = _queued_behind_hold(Budget(0.05, 0.1))
+
+    assert outcome["error"]["code"] == "INSTANCE_BUSY"
+    assert elapsed < HOLD
+    assert plugin.hits["/functions"] == 0
@@ -0,0 +1,35 @@
+"""Pooled clients follow the instance's transport."""
+
+import time
+
+import pytest
+
+import transport
+
+PORT = 18300
+
+
+@pytest.fixture
+def pooled_port():
+    transport.get_loop()
+    yield PORT
+    transport.close_client(PORT)
+
+
+def test_open_client_reuses_the_client_for_the_same_route(pooled_port):
+    client = transport.open_client(pooled_port, "http://localhost:8192")
+
+    assert transport.open_client(pooled_port, "http://localhost:8192") is client
+
+
+def test_open_client_replaces_the_client_when_the_transport_changes(pooled_port, tmp_path):
+    tcp = transport.open_client(pooled_port, "http://localhost:8192")
+
+    uds = transport.open_client(pooled_port, "http://localhost:8192", str(tmp_path / "8192.sock"))
+
+    assert uds is not tcp
+    assert transport.get_client(pooled_port) is uds
+    deadline = time.monotonic() + 2
+    while not tcp.is_closed and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert tcp.is_closed
@@ -0,0 +1,79 @@
+"""Per-endpoint timeout classes for plugin requests.
+
+Every request falls into a class by endpoint: interactive calls (UI
+selection, instance metadata) should fail fast, listings may take a while,
+decompiles longer and whole-program analysis longest. Each class has a
+connect budget and a read budget, and a buffered request must finish within
+their sum. The plugin is sent the read budget as a deadline so it can stop
+work nobody is waiting for any more.
+"""
+
+import os
+from typing import NamedTuple
+
+import httpx
+
+# Request header carrying the milliseconds the bridge will wait for the response
+DEADLINE_HEADER = "X-Ghidra-Deadline-Ms"
+
+
+class Budget(NamedTuple):
+    """Seconds to establish the connection and to wait for the response."""
+
+    connect: float
+    read: float
+
+    @property
+    def total(self) -> float:
+        return self.connect + self.read
+
+    def httpx_timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(self.read, connect=self.connect)
+
+    def within(self, seconds: float) -> "Budget":
+        """This budget cut down to fit in ``seconds``, taken off the read budget first."""
+        connect = max(0.0, min(self.connect, seconds))
+        return Budget(connect, max(0.0, min(self.read, seconds - connect)))
+
+
+def _budget(name: str, connect: float, read: float) -> Budget:
+    prefix = f"GHIDRA_{name.upper()}"
+    return Budget(
+        float(os.environ.get(f"{prefix}_CONNECT_TIMEOUT", connect)),
+        float(os.environ.get(f"{prefix}_READ_TIMEOUT", read)),
+    )
+
+
+TIMEOUT_CLASSES: dict[str, Budget] = {
+    "interactive": _budget("interactive", 1, 10),
+    "listing": _budget("listing", 2, 60),
+    "decompile": _budget("decompile", 2, 120),
+    "analysis": _budget("analysis", 2, 1800),
+}
+
+# UI selection and instance metadata: answered from memory, so a slow reply means a stuck plugin
+INTERACTIVE_ENDPOINTS = frozenset({"", "address", "function", "info", "instances", "plugin-version", "program", "projects"})
+
+# Endpoints that run the decompiler
+DECOMPILE_ENDPOINT_SUFFIXES = ("/decompile", "/decompile-batch", "/variables")
+
+
+def timeout_class(endpoint: str) -> str:
+    """The timeout class of a plugin endpoint."""
+    endpoint = endpoint.strip("/")
+    head = endpoint.split("/", 1)[0]
+    if head == "analysis":
+        return "analysis"
+    if endpoint.endswith(DECOMPILE_ENDPOINT_SUFFIXES):
+        return "decompile"
+    if head in INTERACTIVE_ENDPOINTS:
+        return "interactive"
+    return "listing"
+
+
+def budget_for(endpoint: str, timeout: float | None = None) -> Budget:
+    """Budget for a request to endpoint; ``timeout`` (from a tool parameter) replaces the read budget."""
+    budget = TIMEOUT_CLASSES[timeout_class(endpoint)]
+    if timeout is not None and timeout > 0:
+        return budget._replace(read=float(timeout))
+    return budget
@@ -7,6 +7,9 @@ from tools.xref_tools import register_xref_tools
 from tools.analysis_tools import register_analysis_tools
 from tools.ui_tools import register_ui_tools
 from tools.comment_tools import register_comment_tools
+from tools.cache_tools import register_cache_tools
+from tools.index_tools import register_index_tools
+from tools.job_tools import register_job_tools
 
 __all__ = [
     "register_instance_tools",
@@ -18,4 +21,7 @@ __all__ = [
     "register_analysis_tools",
     "register_ui_tools",
     "register_comment_tools",
+    "register_cache_tools",
+    "register_index_tools",
+    "register_job_tools",
 ]
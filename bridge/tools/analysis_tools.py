@@ -5,34 +5,39 @@ from typing import Any
 from fastmcp import FastMCP
 from pydantic import Field
 
-from http_client import error_response, safe_get, safe_post, simplify_response
-from state import get_instance_port
+from http_client import async_safe_get, async_safe_post, error_response, simplify_response
+from state import async_get_instance_port
 
 
 def register_analysis_tools(server: FastMCP) -> None:
 
     @server.tool
-    def analysis_run(
+    async def analysis_run(
         port: int | None = Field(default=None, description="Specific Ghidra instance port (optional)"),
         analysis_options: dict[str, Any] | None = Field(
             default=None,
-            description='Analysis options dict (e.g. {"functionRecovery": true, "dataRefs": false})',
+            description='Analyzer options to set first, by analyzer name (e.g. {"Stack": true, "Decompiler Parameter ID": false})',
         ),
     ) -> dict[str, Any]:
-        """Run analysis on the current program."""
-        port = get_instance_port(port)
-        response = safe_post(port, "analysis", analysis_options or {})
+        """Start auto-analysis of the current program as a background job.
+
+        Returns immediately with the job; follow it with jobs_status or jobs_wait,
+        and stop it with jobs_cancel.
+        """
+        port = await async_get_instance_port(port)
+        response = await async_safe_post(port, "analysis", analysis_options or {})
         return simplify_response(response)
 
     @server.tool
-    def analysis_get_callgraph(
+    async def analysis_get_callgraph(
         name: str | None = Field(default=None, description="Starting function name"),
         address: str | None = Field(default=None, description="Starting function address"),
         max_depth: int = Field(default=3, description="Maximum call depth to analyze"),
+        timeout: float | None = Field(default=None, description="Seconds to wait for the graph (default: GHIDRA_ANALYSIS_READ_TIMEOUT)"),
         port: int | None = Field(default=None, description="Specific Ghidra instance port (optional)"),
     ) -> dict[str, Any]:
         """Get function call graph visualization data."""
-        port = get_instance_port(port)
+        port = await async_get_instance_port(port)
 
         params: dict[str, Any] = {"max_depth": max_depth}
         if address:
@@ -40,22 +45,23 @@ def register_analysis_tools(server: FastMCP) -> None:
         elif name:
             params["name"] = name
 
-        response = safe_get(port, "analysis/callgraph", params)
+        response = await async_safe_get(port, "analysis/callgraph", params, timeout=timeout)
         return simplify_response(response)
 
     @server.tool
-    def analysis_get_dataflow(
+    async def analysis_get_dataflow(
         address: str = Field(description="Starting address in hex format"),
         direction: str = Field(default="forward", description='"forward" or "backward"'),
         max_steps: int = Field(default=50, description="Maximum analysis steps"),
+        timeout: float | None = Field(default=None, description="Seconds to wait for the analysis (default: GHIDRA_ANALYSIS_READ_TIMEOUT)"),
         port: int | None = Field(default=None, description="Specific Ghidra instance port (optional)"),
     ) -> dict[str, Any]:
         """Perform data flow analysis from an address."""
         if not address:
             return error_response("MISSING_PARAMETER", "Address parameter is required")
 
-        port = get_instance_port(port)
+        port = await async_get_instance_port(port)
 
         params = {"address": address, "direction": direction, "max_steps": max_steps}
-        response = safe_get(port, "analysis/dataflow", params)
+        response = await async_safe_get(port, "analysis/dataflow", params, timeout=timeout)
         return simplify_response(response)
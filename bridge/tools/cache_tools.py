@@ -0,0 +1,35 @@
+"""Response cache tools -- inspect and flush the bridge-side GET and on-disk caches, and report request coalescing."""
+
+from typing import Any
+
+from fastmcp import FastMCP
+from pydantic import Field
+
+from cache import disk_cache, response_cache
+from http_client import inflight_requests
+
+
+def register_cache_tools(server: FastMCP) -> None:
+
+    @server.tool
+    async def cache_stats() -> dict[str, Any]:
+        """Get response cache hit, miss and eviction counters, occupancy, and coalesced request counts."""
+        return {
+            "success": True,
+            "result": dict(response_cache.stats(), coalescing=inflight_requests.stats(), disk=disk_cache.stats()),
+        }
+
+    @server.tool
+    async def cache_clear(
+        port: int | None = Field(default=None, description="Only flush entries for this instance port (optional)"),
+    ) -> dict[str, Any]:
+        """Flush cached responses (in memory and on disk) for one instance, or for all instances."""
+        if port is None:
+            response_cache.clear()
+            disk_cache.clear()
+        else:
+            state = response_cache.persistent_state(port)
+            response_cache.invalidate_port(port)
+            if state is not None:
+                disk_cache.clear(state)
+        return {"success": True, "result": dict(response_cache.stats(), disk=disk_cache.stats())}
@@ -6,14 +6,14 @@ from typing import Any
 from fastmcp import FastMCP
 from pydantic import Field
 
-from http_client import error_response, safe_patch, safe_post, simplify_response
-from state import get_instance_port
+from http_client import async_safe_patch, async_safe_post, error_response, simplify_response
+from state import async_get_instance_port
 
 
 def register_comment_tools(server: FastMCP) -> None:
 
     @server.tool
-    def comments_set(
+    async def comments_set(
         address: str = Field(description="Memory address in hex format"),
         comment: str = Field(default="", description="Comment text (empty string removes comment)"),
         comment_type: str = Field(
@@ -26,13 +26,13 @@ def register_comment_tools(server: FastMCP) -> None:
         if not address:
             return error_response("MISSING_PARAMETER", "Address parameter is required")
 
-        port = get_instance_port(port)
+        port = await async_get_instance_port(port)
         payload = {"comment": comment}
-        response = safe_post(port, f"memory/{address}/comments/{comment_type}", payload)
+        response = await async_safe_post(port, f"memory/{address}/comments/{comment_type}", payload)
         return simplify_response(response)
 
     @server.tool
-    def functions_set_comment(
+    async def functions_set_comment(
         address: str = Field(description="Memory address in hex format (preferably function entry point)"),
         comment: str = Field(default="", description="Comment text (empty string removes comment)"),
         port: int | None = Field(default=None, description="Specific Ghidra instance port (optional)"),
@@ -41,10 +41,10 @@ def register_comment_tools(server: FastMCP) -> None:
         if not address:
             return error_response("MISSING_PARAMETER", "Address parameter is required")
 
-        port_to_use = get_instance_port(port)
+        port_to_use = await async_get_instance_port(port)
 
         try:
-            patch_response = safe_patch(port_to_use, f"functions/{address}", {"comment": comment})
+            patch_response = await async_safe_patch(port_to_use, f"functions/{address}", {"comment": comment})
             if patch_response.get("success", False):
                 return simplify_response(patch_response)
             else:
@@ -57,6 +57,6 @@ def register_comment_tools(server: FastMCP) -> None:
             print(f"Exception trying function comment PATCH: {e}. Falling back.", file=sys.stderr)
 
         print(f"Falling back to setting 'pre' comment for address {address}", file=sys.stderr)
-        return comments_set(
+        return await comments_set(
             address=address, comment=comment, comment_type="pre", port=port_to_use
         )
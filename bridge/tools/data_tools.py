@@ -1,30 +1,36 @@
-"""Data item tools -- list, create, rename, delete, set type, list strings."""
+"""Data item tools -- list, create, rename, delete, set type, list strings, list all strings."""
 
 from typing import Any
 
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 from pydantic import Field
 
-from http_client import error_response, safe_get, safe_post, simplify_response
-from state import get_instance_port
+from http_client import async_get_listing, async_list_all, async_safe_post, error_response, simplify_response
+from state import async_get_instance_port
 
 
 def register_data_tools(server: FastMCP) -> None:
 
     @server.tool
-    def data_list(
+    async def data_list(
         offset: int = Field(default=0, description="Pagination offset"),
+        cursor: str | None = Field(default=None, description='Opaque keyset cursor: "" for the first page, then the previous page\'s next_cursor (overrides offset)'),
         limit: int = Field(default=100, description="Maximum items to return"),
         addr: str | None = Field(default=None, description="Filter by address (hex)"),
         name: str | None = Field(default=None, description="Exact name match filter (case-sensitive)"),
         name_contains: str | None = Field(default=None, description="Substring name filter (case-insensitive)"),
         type: str | None = Field(default=None, description='Filter by data type (e.g. "string", "dword")'),
+        lean: bool | None = Field(default=None, description="Leave out per-item links and return rows under one columns header (default: GHIDRA_LEAN)"),
         port: int | None = Field(default=None, description="Specific Ghidra instance port (optional)"),
     ) -> dict[str, Any]:
         """List defined data items with filtering and pagination."""
-        port = get_instance_port(port)
+        port = await async_get_instance_port(port)
 
-        params: dict[str, Any] = {"offset": offset, "limit": limit}
+        params: dict[str, Any] = {"limit": limit}
+        if cursor is not None:
+            params["cursor"] = cursor
+        else:
+            params["offset"] = offset
         if addr:
             params["addr"] = addr
         if name:
@@ -34,10 +40,9 @@ def register_data_tools(server: FastMCP) -> None:
         if type:
             params["type"] = type
 
-        response = safe_get(port, "data", params)
-        simplified = simplify_response(response)
+        simplified = await async_get_listing(port, "data", params, lean=lean)
 
-        if isinstance(simplified, dict) and "error" not in simplified:
+        if isinstance(simplified, dict) and "error" not in simplified and cursor is None:
             simplified.setdefault("size", len(simplified.get("result", [])))
             simplified.setdefault("offset", offset)
             simplified.setdefault("limit", limit)
@@ -45,24 +50,53 @@ def register_data_tools(server: FastMCP) -> None:
         return simplified
 
     @server.tool
-    def data_list_strings(
+    async def data_list_strings(
         offset: int = Field(default=0, description="Pagination offset"),
+        cursor: str | None = Field(default=None, description='Opaque keyset cursor: "" for the first page, then the previous page\'s next_cursor (overrides offset)'),
         limit: int = Field(default=2000, description="Maximum strings to return"),
         filter: str | None = Field(default=None, description="Optional string content filter"),
+        lean: bool | None = Field(default=None, description="Leave out per-item links and return rows under one columns header (default: GHIDRA_LEAN)"),
         port: int | None = Field(default=None, description="Specific Ghidra instance port (optional)"),
     ) -> dict[str, Any]:
         """List all defined strings in the binary with their memory addresses."""
-        port = get_instance_port(port)
+        port = await async_get_instance_port(port)
 
-        params: dict[str, Any] = {"offset": offset, "limit": limit}
+        params: dict[str, Any] = {"limit": limit}
+        if cursor is not None:
+            params["cursor"] = cursor
+        else:
+            params["offset"] = offset
         if filter:
             params["filter"] = filter
 
-        response = safe_get(port, "strings", params)
-        return simplify_response(response)
+        return await async_get_listing(port, "strings", params, lean=lean)
+
+    @server.tool
+    async def data_list_strings_all(
+        ctx: Context,
+        filter: str | None = Field(default=None, description="Optional string content filter"),
+        max_results: int = Field(default=5000, description="Stop after this many strings"),
+        lean: bool | None = Field(default=None, description="Leave out per-item links and return rows under one columns header (default: GHIDRA_LEAN)"),
+        port: int | None = Field(default=None, description="Specific Ghidra instance port (optional)"),
+    ) -> dict[str, Any]:
+        """List every defined string matching the filter, paging automatically.
+
+        If max_results is reached, truncated is true and next_cursor can be passed
+        to data_list_strings to continue.
+        """
+        port = await async_get_instance_port(port)
+
+        params: dict[str, Any] = {}
+        if filter:
+            params["filter"] = filter
+
+        async def progress(count: int) -> None:
+            await ctx.report_progress(count, max_results)
+
+        return await async_list_all(port, "strings", params, max_results, page_size=500, on_page=progress, lean=lean)
 
     @server.tool
-    def data_create(
+    async def data_create(
         address: str = Field(description="Memory address in hex format"),
         data_type: str = Field(description='Data type (e.g. "string", "dword", "byte")'),
         size: int | None = Field(default=None, description="Optional size in bytes"),
@@ -72,17 +106,17 @@ def register_data_tools(server: FastMCP) -> None:
         if not address or not data_type:
             return error_response("MISSING_PARAMETER", "Address and data_type parameters are required")
 
-        port = get_instance_port(port)
+        port = await async_get_instance_port(port)
 
         payload: dict[str, Any] = {"address": address, "type": data_type}
         if size is not None:
             payload["size"] = size
 
-        response = safe_post(port, "data", payload)
+        response = await async_safe_post(port, "data", payload)
         return simplify_response(response)
 
     @server.tool
-    def data_rename(
+    async def data_rename(
         address: str = Field(description="Memory address in hex format"),
         name: str = Field(description="New name for the data item"),
         port: int | None = Field(default=None, description="Specific Ghidra instance port (optional)"),
@@ -91,14 +125,14 @@ def register_data_tools(server: FastMCP) -> None:
         if not address or not name:
             return error_response("MISSING_PARAMETER", "Address and name parameters are required")
 
-        port = get_instance_port(port)
+        port = await async_get_instance_port(port)
 
         payload = {"address": address, "newName": name}
-        response = safe_post(port, "data", payload)
+        response = await async_safe_post(port, "data", payload)
         return simplify_response(response)
 
     @server.tool
-    def data_delete(
+    async def data_delete(
         address: str = Field(description="Memory address in hex format"),
         port: int | None = Field(default=None, description="Specific Ghidra instance port (optional)"),
     ) -> dict[str, Any]:
@@ -106,14 +140,14 @@ def register_data_tools(server: FastMCP) -> None:
         if not address:
             return error_response("MISSING_PARAMETER", "Address parameter is required")
 
-        port = get_instance_port(port)
+        port = await async_get_instance_port(port)
 
         payload = {"address": address, "action": "delete"}
-        response = safe_post(port, "data/delete", payload)
+        response = await async_safe_post(port, "data/delete", payload)
         return simplify_response(response)
 
     @server.tool
-    def data_set_type(
+    async def data_set_type(
         address: str = Field(description="Memory address in hex format"),
         data_type: str = Field(description='Data type name (e.g. "uint32_t", "char[10]")'),
         port: int | None = Field(default=None, description="Specific Ghidra instance port (optional)"),
@@ -122,8 +156,8 @@ def register_data_tools(server: FastMCP) -> None:
         if not address or not data_type:
             return error_response("MISSING_PARAMETER", "Address and data_type parameters are required")
 
-        port = get_instance_port(port)
+        port = await async_get_instance_port(port)
 
         payload = {"address": address, "type": data_type}
-        response = safe_post(port, "data/type", payload)
+        response = await async_safe_post(port, "data/type", payload)
         return simplify_response(response)
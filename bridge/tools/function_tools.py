@@ -1,38 +1,54 @@
-"""Function tools -- list, get, decompile, disassemble, create, rename, set_signature, get_variables, set_comment."""
+"""Function tools -- list, list_all, get, decompile, decompile_batch, disassemble, create, rename, set_signature, get_variables, set_comment."""
 
 from typing import Any
 from urllib.parse import quote
 
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 from pydantic import Field
 
-from http_client import error_response, safe_get, safe_patch, safe_post, simplify_response
-from state import get_instance_port
+from cache import make_key, response_cache
+from http_client import (
+    async_get_listing,
+    async_safe_get,
+    async_safe_patch,
+    async_list_all,
+    async_safe_post,
+    async_stream_post,
+    error_response,
+    simplify_response,
+    slice_decompiled,
+)
+from state import async_get_instance_port
 
 
 def register_function_tools(server: FastMCP) -> None:
 
     @server.tool
-    def functions_list(
+    async def functions_list(
         offset: int = Field(default=0, description="Pagination offset"),
+        cursor: str | None = Field(default=None, description='Opaque keyset cursor: "" for the first page, then the previous page\'s next_cursor (overrides offset)'),
         limit: int = Field(default=100, description="Maximum items to return"),
         name_contains: str | None = Field(default=None, description="Substring name filter (case-insensitive)"),
         name_matches_regex: str | None = Field(default=None, description="Regex name filter"),
+        lean: bool | None = Field(default=None, description="Leave out per-item links and return rows under one columns header (default: GHIDRA_LEAN)"),
         port: int | None = Field(default=None, description="Specific Ghidra instance port (optional)"),
     ) -> dict[str, Any]:
         """List functions with filtering and pagination."""
-        port = get_instance_port(port)
+        port = await async_get_instance_port(port)
 
-        params: dict[str, Any] = {"offset": offset, "limit": limit}
+        params: dict[str, Any] = {"limit": limit}
+        if cursor is not None:
+            params["cursor"] = cursor
+        else:
+            params["offset"] = offset
         if name_contains:
             params["name_contains"] = name_contains
         if name_matches_regex:
             params["name_matches_regex"] = name_matches_regex
 
-        response = safe_get(port, "functions", params)
-        simplified = simplify_response(response)
+        simplified = await async_get_listing(port, "functions", params, lean=lean)
 
-        if isinstance(simplified, dict) and "error" not in simplified:
+        if isinstance(simplified, dict) and "error" not in simplified and cursor is None:
             simplified.setdefault("size", len(simplified.get("result", [])))
             simplified.setdefault("offset", offset)
             simplified.setdefault("limit", limit)
@@ -40,7 +56,34 @@ def register_function_tools(server: FastMCP) -> None:
         return simplified
 
     @server.tool
-    def functions_get(
+    async def functions_list_all(
+        ctx: Context,
+        name_contains: str | None = Field(default=None, description="Substring name filter (case-insensitive)"),
+        name_matches_regex: str | None = Field(default=None, description="Regex name filter"),
+        max_results: int = Field(default=1000, description="Stop after this many functions"),
+        lean: bool | None = Field(default=None, description="Leave out per-item links and return rows under one columns header (default: GHIDRA_LEAN)"),
+        port: int | None = Field(default=None, description="Specific Ghidra instance port (optional)"),
+    ) -> dict[str, Any]:
+        """List every function matching the filters, paging automatically.
+
+        Filters run in the plugin. If max_results is reached, truncated is true and
+        next_cursor can be passed to functions_list to continue.
+        """
+        port = await async_get_instance_port(port)
+
+        params: dict[str, Any] = {}
+        if name_contains:
+            params["name_contains"] = name_contains
+        if name_matches_regex:
+            params["name_matches_regex"] = name_matches_regex
+
+        async def progress(count: int) -> None:
+            await ctx.report_progress(count, max_results)
+
+        return await async_list_all(port, "functions", params, max_results, on_page=progress, lean=lean)
+
+    @server.tool
+    async def functions_get(
         name: str | None = Field(default=None, description="Function name"),
         address: str | None = Field(default=None, description="Function address in hex format"),
         port: int | None = Field(default=None, description="Specific Ghidra instance port (optional)"),
@@ -49,18 +92,18 @@ def register_function_tools(server: FastMCP) -> None:
         if not name and not address:
             return error_response("MISSING_PARAMETER", "Either name or address parameter is required")
 
-        port = get_instance_port(port)
+        port = await async_get_instance_port(port)
 
         if address:
             endpoint = f"functions/{address}"
         else:
             endpoint = f"functions/by-name/{quote(name)}"
 
-        response = safe_get(port, endpoint)
+        response = await async_safe_get(port, endpoint)
         return simplify_response(response)
 
     @server.tool
-    def functions_decompile(
+    async def functions_decompile(
         name: str | None = Field(default=None, description="Function name"),
         address: str | None = Field(default=None, description="Function address in hex format"),
         syntax_tree: bool = Field(default=False, description="Include syntax tree"),
@@ -68,6 +111,7 @@ def register_function_tools(server: FastMCP) -> None:
         start_line: int | None = Field(default=None, description="Start at this line number (1-indexed)"),
         end_line: int | None = Field(default=None, description="End at this line number (inclusive)"),
         max_lines: int | None = Field(default=None, description="Maximum lines to return (takes precedence over end_line)"),
+        timeout: int | None = Field(default=None, description="Seconds to allow for decompiling (default: the plugin's decompiler limit, within GHIDRA_DECOMPILE_READ_TIMEOUT)"),
         port: int | None = Field(default=None, description="Specific Ghidra instance port (optional)"),
     ) -> dict[str, Any]:
         """Get decompiled code for a function with optional line filtering for context management.
@@ -80,29 +124,101 @@ def register_function_tools(server: FastMCP) -> None:
         if not name and not address:
             return error_response("MISSING_PARAMETER", "Either name or address parameter is required")
 
-        port = get_instance_port(port)
+        port = await async_get_instance_port(port)
 
         params: dict[str, Any] = {
             "syntax_tree": str(syntax_tree).lower(),
             "style": style,
         }
-        if start_line is not None:
-            params["start_line"] = str(start_line)
-        if end_line is not None:
-            params["end_line"] = str(end_line)
-        if max_lines is not None:
-            params["max_lines"] = str(max_lines)
+        if timeout:
+            params["timeout"] = timeout
 
         if address:
             endpoint = f"functions/{address}/decompile"
         else:
             endpoint = f"functions/by-name/{quote(name)}/decompile"
 
-        response = safe_get(port, endpoint, params)
+        # Fetch the whole function and cut the window here when the response
+        # cache can hold it, so paging through a long function decompiles it
+        # once. Otherwise every window would transfer the whole function, so
+        # the plugin cuts it instead.
+        windowed = any(value is not None and value > 0 for value in (start_line, end_line, max_lines))
+        slice_locally = windowed and response_cache.can_hold(make_key(port, endpoint, params))
+        if windowed and not slice_locally:
+            if start_line is not None:
+                params["start_line"] = str(start_line)
+            if end_line is not None:
+                params["end_line"] = str(end_line)
+            if max_lines is not None:
+                params["max_lines"] = str(max_lines)
+
+        response = await async_safe_get(port, endpoint, params, timeout=timeout)
+
+        result = response.get("result") if response.get("success") else None
+        if slice_locally and isinstance(result, dict) and isinstance(result.get("decompiled"), str):
+            result["decompiled"], result["filter"] = slice_decompiled(
+                result["decompiled"], start_line, end_line, max_lines
+            )
         return simplify_response(response)
 
     @server.tool
-    def functions_disassemble(
+    async def functions_decompile_batch(
+        ctx: Context,
+        functions: list[str] = Field(description="Function names or hex addresses to decompile"),
+        timeout: int = Field(default=30, description="Per-function decompiler timeout in seconds"),
+        port: int | None = Field(default=None, description="Specific Ghidra instance port (optional)"),
+    ) -> dict[str, Any]:
+        """Decompile many functions in one call, in parallel on the plugin side.
+
+        Progress is reported as each function completes. A function that is not
+        found, fails or times out gets an error entry and does not fail the batch.
+        Results are returned in the order requested.
+
+        Example:
+            functions_decompile_batch(functions=["main", "0x401000", "parse_header"])
+        """
+        if not functions:
+            return error_response("MISSING_PARAMETER", "At least one function name or address is required")
+
+        port = await async_get_instance_port(port)
+        total = len(functions)
+        items: list[dict | None] = [None] * total
+        completed = 0
+
+        async for item in async_stream_post(
+            port, "functions/decompile-batch", {"functions": functions, "timeout": timeout}
+        ):
+            if "index" not in item:
+                if item.get("done"):
+                    continue
+                result = item.get("result") if item.get("success") else None
+                if isinstance(result, dict) and isinstance(result.get("items"), list):
+                    items = result["items"]  # plugin answered without streaming
+                    break
+                return simplify_response(item)
+
+            items[item["index"]] = item
+            completed += 1
+            status = "ok" if item.get("success") else item.get("error", {}).get("code", "error")
+            await ctx.report_progress(completed, total, f"{item.get('query')}: {status}")
+
+        for index, item in enumerate(items):
+            if item is None:
+                items[index] = {
+                    "index": index,
+                    "query": functions[index],
+                    "success": False,
+                    "error": {"code": "INCOMPLETE", "message": "Batch ended before this function was decompiled"},
+                }
+
+        succeeded = sum(1 for item in items if item.get("success"))
+        return {
+            "success": True,
+            "result": {"total": total, "succeeded": succeeded, "failed": total - succeeded, "items": items},
+        }
+
+    @server.tool
+    async def functions_disassemble(
         name: str | None = Field(default=None, description="Function name"),
         address: str | None = Field(default=None, description="Function address in hex format"),
         port: int | None = Field(default=None, description="Specific Ghidra instance port (optional)"),
@@ -111,18 +227,18 @@ def register_function_tools(server: FastMCP) -> None:
         if not name and not address:
             return error_response("MISSING_PARAMETER", "Either name or address parameter is required")
 
-        port = get_instance_port(port)
+        port = await async_get_instance_port(port)
 
         if address:
             endpoint = f"functions/{address}/disassembly"
         else:
             endpoint = f"functions/by-name/{quote(name)}/disassembly"
 
-        response = safe_get(port, endpoint)
+        response = await async_safe_get(port, endpoint)
         return simplify_response(response)
 
     @server.tool
-    def functions_create(
+    async def functions_create(
         address: str = Field(description="Memory address in hex format where function starts"),
         port: int | None = Field(default=None, description="Specific Ghidra instance port (optional)"),
     ) -> dict[str, Any]:
@@ -130,14 +246,14 @@ def register_function_tools(server: FastMCP) -> None:
         if not address:
             return error_response("MISSING_PARAMETER", "Address parameter is required")
 
-        port = get_instance_port(port)
+        port = await async_get_instance_port(port)
 
         payload = {"address": address}
-        response = safe_post(port, "functions", payload)
+        response = await async_safe_post(port, "functions", payload)
         return simplify_response(response)
 
     @server.tool
-    def functions_rename(
+    async def functions_rename(
         old_name: str | None = Field(default=None, description="Current function name"),
         address: str | None = Field(default=None, description="Function address in hex format"),
         new_name: str = Field(default="", description="New function name"),
@@ -150,7 +266,7 @@ def register_function_tools(server: FastMCP) -> None:
                 "Either old_name or address, and new_name parameters are required",
             )
 
-        port = get_instance_port(port)
+        port = await async_get_instance_port(port)
 
         payload = {"name": new_name}
         if address:
@@ -158,11 +274,11 @@ def register_function_tools(server: FastMCP) -> None:
         else:
             endpoint = f"functions/by-name/{quote(old_name)}"
 
-        response = safe_patch(port, endpoint, payload)
+        response = await async_safe_patch(port, endpoint, payload)
         return simplify_response(response)
 
     @server.tool
-    def functions_set_signature(
+    async def functions_set_signature(
         name: str | None = Field(default=None, description="Function name"),
         address: str | None = Field(default=None, description="Function address in hex format"),
         signature: str = Field(default="", description='New function signature (e.g. "int func(char *data, int size)")'),
@@ -175,7 +291,7 @@ def register_function_tools(server: FastMCP) -> None:
                 "Either name or address, and signature parameters are required",
             )
 
-        port = get_instance_port(port)
+        port = await async_get_instance_port(port)
 
         payload = {"signature": signature}
         if address:
@@ -183,11 +299,11 @@ def register_function_tools(server: FastMCP) -> None:
         else:
             endpoint = f"functions/by-name/{quote(name)}"
 
-        response = safe_patch(port, endpoint, payload)
+        response = await async_safe_patch(port, endpoint, payload)
         return simplify_response(response)
 
     @server.tool
-    def functions_get_variables(
+    async def functions_get_variables(
         name: str | None = Field(default=None, description="Function name"),
         address: str | None = Field(default=None, description="Function address in hex format"),
         port: int | None = Field(default=None, description="Specific Ghidra instance port (optional)"),
@@ -196,12 +312,12 @@ def register_function_tools(server: FastMCP) -> None:
         if not name and not address:
             return error_response("MISSING_PARAMETER", "Either name or address parameter is required")
 
-        port = get_instance_port(port)
+        port = await async_get_instance_port(port)
 
         if address:
             endpoint = f"functions/{address}/variables"
         else:
             endpoint = f"functions/by-name/{quote(name)}/variables"
 
-        response = safe_get(port, endpoint)
+        response = await async_safe_get(port, endpoint)
         return simplify_response(response)
@@ -0,0 +1,110 @@
+"""Program index tools -- search functions, symbols, strings, segments and xrefs from the local SQLite index."""
+
+import re
+import sqlite3
+from typing import Any, Literal
+
+from fastmcp import FastMCP
+from pydantic import Field
+
+from http_client import error_response
+from index import ProgramIndex, program_index, require_offset
+from state import async_get_instance_port
+
+
+async def _open_index(port: int, rebuild: bool = False) -> ProgramIndex | dict:
+    try:
+        return await program_index.get(port, rebuild=rebuild)
+    except Exception as e:
+        return error_response("INDEX_UNAVAILABLE", f"Program index could not be built: {e}", 503)
+
+
+def register_index_tools(server: FastMCP) -> None:
+
+    @server.tool
+    async def index_search(
+        kind: Literal["functions", "symbols", "strings", "segments"] = Field(
+            default="functions", description="What to search"
+        ),
+        name: str | None = Field(default=None, description="Exact name match (string value for strings)"),
+        name_contains: str | None = Field(default=None, description="Substring match (case-insensitive)"),
+        name_regex: str | None = Field(default=None, description="Regex that must match the whole name"),
+        start_addr: str | None = Field(default=None, description="Lowest address to include (hex)"),
+        end_addr: str | None = Field(default=None, description="Highest address to include (hex)"),
+        offset: int = Field(default=0, description="Pagination offset"),
+        limit: int = Field(default=100, description="Maximum items to return"),
+        port: int | None = Field(default=None, description="Specific Ghidra instance port (optional)"),
+    ) -> dict[str, Any]:
+        """Search the local program index by name, substring, regex or address range.
+
+        Much faster than functions_list filters on large binaries. The index is
+        re-exported from Ghidra first if the program changed since it was built.
+        """
+        port = await async_get_instance_port(port)
+        index = await _open_index(port)
+        if isinstance(index, dict):
+            return index
+
+        try:
+            items, total = index.search(
+                kind, name, name_contains, name_regex,
+                require_offset(start_addr, "start_addr") if start_addr else None,
+                require_offset(end_addr, "end_addr") if end_addr else None,
+                limit, offset,
+            )
+        except re.error as e:
+            return error_response("INVALID_PARAMETER", f"Invalid name_regex: {e}")
+        except ValueError as e:
+            return error_response("INVALID_PARAMETER", str(e))
+        except sqlite3.Error as e:
+            return error_response("INDEX_ERROR", f"Index query failed: {e}")
+
+        return {"success": True, "result": items, "size": total, "offset": offset, "limit": limit}
+
+    @server.tool
+    async def index_xrefs(
+        to_addr: str | None = Field(default=None, description="References to this address (hex)"),
+        from_addr: str | None = Field(default=None, description="References from this address (hex)"),
+        type: str | None = Field(default=None, description='Filter by reference type (e.g. "UNCONDITIONAL_CALL", "READ")'),
+        offset: int = Field(default=0, description="Pagination offset"),
+        limit: int = Field(default=100, description="Maximum items to return"),
+        port: int | None = Field(default=None, description="Specific Ghidra instance port (optional)"),
+    ) -> dict[str, Any]:
+        """Look up cross-references in the local program index."""
+        if not to_addr and not from_addr:
+            return error_response("MISSING_PARAMETER", "Either to_addr or from_addr parameter is required")
+
+        port = await async_get_instance_port(port)
+        index = await _open_index(port)
+        if isinstance(index, dict):
+            return index
+
+        try:
+            items, total = index.xrefs(to_addr, from_addr, type, limit, offset)
+        except ValueError as e:
+            return error_response("INVALID_PARAMETER", str(e))
+        except sqlite3.Error as e:
+            return error_response("INDEX_ERROR", f"Index query failed: {e}")
+
+        return {"success": True, "result": items, "size": total, "offset": offset, "limit": limit}
+
+    @server.tool
+    async def index_status(
+        rebuild: bool = Field(default=False, description="Re-export the index from Ghidra even if it is up to date"),
+        port: int | None = Field(default=None, description="Specific Ghidra instance port (optional)"),
+    ) -> dict[str, Any]:
+        """Show the program index's build info and row counts, syncing it first if stale."""
+        port = await async_get_instance_port(port)
+        index = await _open_index(port, rebuild=rebuild)
+        if isinstance(index, dict):
+            return index
+
+        return {
+            "success": True,
+            "result": {
+                "path": str(index.path),
+                "meta": index.meta(),
+                "counts": index.counts(),
+                "manager": program_index.stats(),
+            },
+        }
@@ -1,18 +1,22 @@
-"""Instance management tools -- list, discover, register, unregister, use, current."""
+"""Instance management tools -- list, discover, register, unregister, use, current, health, stats."""
 
+import asyncio
 from typing import Any
 
 from fastmcp import FastMCP
 from pydantic import Field
 
+from admission import admission
+from http_client import async_safe_get, simplify_response
 from state import (
     QUICK_DISCOVERY_RANGE,
-    active_instances,
-    get_instance_info,
-    get_instance_port,
-    instances_lock,
+    async_get_instance_info,
+    async_get_instance_port,
+    get_instances,
+    health_stats,
     register_instance,
     set_current_port,
+    unregister_instance,
     get_current_port,
     _discover_instances,
 )
@@ -21,29 +25,28 @@ from state import (
 def register_instance_tools(server: FastMCP) -> None:
 
     @server.tool
-    def instances_list() -> dict[str, Any]:
+    async def instances_list() -> dict[str, Any]:
         """List all active Ghidra instances.
 
         Automatically discovers new instances on the default host before listing.
         Use instances_discover(host) only if you need to scan a different host.
         """
-        _discover_instances(QUICK_DISCOVERY_RANGE, host=None, timeout=5)
-
-        with instances_lock:
-            return {
-                "instances": [
-                    {
-                        "port": port,
-                        "url": info["url"],
-                        "project": info.get("project", ""),
-                        "file": info.get("file", ""),
-                    }
-                    for port, info in active_instances.items()
-                ]
-            }
+        await asyncio.to_thread(_discover_instances, QUICK_DISCOVERY_RANGE, host=None, timeout=5)
+
+        return {
+            "instances": [
+                {
+                    "port": port,
+                    "url": info["url"],
+                    "project": info.get("project", ""),
+                    "file": info.get("file", ""),
+                }
+                for port, info in get_instances().items()
+            ]
+        }
 
     @server.tool
-    def instances_discover(
+    async def instances_discover(
         host: str | None = Field(
             default=None,
             description="Host to scan for Ghidra instances (default: configured ghidra_host)",
@@ -54,59 +57,85 @@ def register_instance_tools(server: FastMCP) -> None:
         Use this ONLY when you need to discover instances on a different host.
         For normal usage, just use instances_list() which auto-discovers on the default host.
         """
-        _discover_instances(QUICK_DISCOVERY_RANGE, host=host, timeout=5)
-
-        with instances_lock:
-            return {
-                "instances": [
-                    {
-                        "port": port,
-                        "url": info["url"],
-                        "project": info.get("project", ""),
-                        "file": info.get("file", ""),
-                    }
-                    for port, info in active_instances.items()
-                ]
-            }
+        await asyncio.to_thread(_discover_instances, QUICK_DISCOVERY_RANGE, host=host, timeout=5)
+
+        return {
+            "instances": [
+                {
+                    "port": port,
+                    "url": info["url"],
+                    "project": info.get("project", ""),
+                    "file": info.get("file", ""),
+                }
+                for port, info in get_instances().items()
+            ]
+        }
 
     @server.tool
-    def instances_register(
+    async def instances_register(
         port: int = Field(description="Port number of the Ghidra instance"),
         url: str | None = Field(default=None, description="Optional URL if different from default http://host:port"),
     ) -> str:
         """Register a new Ghidra instance."""
-        return register_instance(port, url)
+        return await asyncio.to_thread(register_instance, port, url)
 
     @server.tool
-    def instances_unregister(
+    async def instances_unregister(
         port: int = Field(description="Port number of the instance to unregister"),
     ) -> str:
         """Unregister a Ghidra instance."""
-        with instances_lock:
-            if port in active_instances:
-                del active_instances[port]
-                return f"Unregistered instance on port {port}"
-            return f"No instance found on port {port}"
+        if unregister_instance(port):
+            return f"Unregistered instance on port {port}"
+        return f"No instance found on port {port}"
 
     @server.tool
-    def instances_use(
+    async def instances_use(
         port: int = Field(description="Port number of the instance to use"),
     ) -> str:
         """Set the current working Ghidra instance."""
-        if port not in active_instances:
-            register_instance(port)
-            if port not in active_instances:
+        if port not in get_instances():
+            await asyncio.to_thread(register_instance, port)
+            if port not in get_instances():
                 return f"Error: No active Ghidra instance found on port {port}"
 
         set_current_port(port)
 
-        with instances_lock:
-            info = active_instances[port]
-            program = info.get("file", "unknown program")
-            project = info.get("project", "unknown project")
-            return f"Now using Ghidra instance on port {port} with {program} in project {project}"
+        info = get_instances()[port]
+        program = info.get("file", "unknown program")
+        project = info.get("project", "unknown project")
+        return f"Now using Ghidra instance on port {port} with {program} in project {project}"
 
     @server.tool
-    def instances_current() -> dict[str, Any]:
+    async def instances_current() -> dict[str, Any]:
         """Get information about the current working Ghidra instance."""
-        return get_instance_info(port=get_current_port())
+        return await async_get_instance_info(port=get_current_port())
+
+    @server.tool
+    async def instances_health() -> dict[str, Any]:
+        """Get each instance's health-check schedule and how long requests waited on the instance registry."""
+        return {"success": True, "result": health_stats()}
+
+    @server.tool
+    async def instances_stats(
+        port: int | None = Field(default=None, description="Specific Ghidra instance port (optional)"),
+    ) -> dict[str, Any]:
+        """Get performance counters: the plugin's request threads, decompiler session pool and
+        decompile result cache, and the bridge's admission queues for the instance."""
+        port = await async_get_instance_port(port)
+        response = await async_safe_get(port, "info")
+        if not response.get("success"):
+            return simplify_response(response)
+
+        info = response.get("result", {})
+        return {
+            "success": True,
+            "result": {
+                "port": port,
+                "http_executor": info.get("httpExecutor"),
+                "socket_executor": info.get("socketExecutor"),
+                "decompiler_pool": info.get("decompilerPool"),
+                "decompile_cache": info.get("decompileCache"),
+                "jobs": info.get("jobs"),
+                "admission": admission.stats(port),
+            },
+        }
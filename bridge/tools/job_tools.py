@@ -0,0 +1,92 @@
+"""Job tools -- status, progress, results and cancellation of long-running plugin jobs."""
+
+import asyncio
+import time
+from typing import Any
+from urllib.parse import quote
+
+from fastmcp import Context, FastMCP
+from pydantic import Field
+
+from http_client import async_safe_get, async_safe_post, error_response, simplify_response
+from state import async_get_instance_port
+
+# Seconds between status polls in jobs_wait
+POLL_INTERVAL = 2.0
+
+FINISHED_STATUSES = frozenset({"succeeded", "failed", "cancelled"})
+
+
+def register_job_tools(server: FastMCP) -> None:
+
+    @server.tool
+    async def jobs_list(
+        port: int | None = Field(default=None, description="Specific Ghidra instance port (optional)"),
+    ) -> dict[str, Any]:
+        """List running and recently finished jobs, oldest first."""
+        port = await async_get_instance_port(port)
+        response = await async_safe_get(port, "jobs")
+        return simplify_response(response)
+
+    @server.tool
+    async def jobs_status(
+        job_id: str = Field(description="Job ID returned by the tool that started the job"),
+        port: int | None = Field(default=None, description="Specific Ghidra instance port (optional)"),
+    ) -> dict[str, Any]:
+        """Get a job's status, percentage done and current step (e.g. the analyzer running)."""
+        port = await async_get_instance_port(port)
+        response = await async_safe_get(port, f"jobs/{quote(job_id, safe='')}")
+        return simplify_response(response)
+
+    @server.tool
+    async def jobs_result(
+        job_id: str = Field(description="Job ID returned by the tool that started the job"),
+        port: int | None = Field(default=None, description="Specific Ghidra instance port (optional)"),
+    ) -> dict[str, Any]:
+        """Get the result of a finished job."""
+        port = await async_get_instance_port(port)
+        response = await async_safe_get(port, f"jobs/{quote(job_id, safe='')}/result")
+        return simplify_response(response)
+
+    @server.tool
+    async def jobs_cancel(
+        job_id: str = Field(description="Job ID returned by the tool that started the job"),
+        port: int | None = Field(default=None, description="Specific Ghidra instance port (optional)"),
+    ) -> dict[str, Any]:
+        """Cancel a queued or running job. Work already done (e.g. analysis results) is kept."""
+        port = await async_get_instance_port(port)
+        response = await async_safe_post(port, f"jobs/{quote(job_id, safe='')}/cancel", {})
+        return simplify_response(response)
+
+    @server.tool
+    async def jobs_wait(
+        ctx: Context,
+        job_id: str = Field(description="Job ID returned by the tool that started the job"),
+        timeout: float = Field(default=300, description="Seconds to wait before returning the job's current status"),
+        port: int | None = Field(default=None, description="Specific Ghidra instance port (optional)"),
+    ) -> dict[str, Any]:
+        """Wait for a job to finish, reporting its progress, and return its result.
+
+        If the job is still running after ``timeout`` seconds its current status
+        is returned instead; the job keeps running.
+        """
+        port = await async_get_instance_port(port)
+        endpoint = f"jobs/{quote(job_id, safe='')}"
+        deadline = time.monotonic() + timeout
+        while True:
+            response = await async_safe_get(port, endpoint)
+            job = response.get("result") if response.get("success") else None
+            if not isinstance(job, dict):
+                return simplify_response(response)
+            if job.get("status") in FINISHED_STATUSES:
+                return simplify_response(await async_safe_get(port, f"{endpoint}/result"))
+
+            await ctx.report_progress(job.get("percent") or 0, 100, job.get("message") or job.get("status"))
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                response = error_response(
+                    "JOB_RUNNING", f"Job {job_id} is still {job.get('status')}; check again with jobs_status or jobs_wait"
+                )
+                response["result"] = job
+                return response
+            await asyncio.sleep(min(POLL_INTERVAL, remaining))
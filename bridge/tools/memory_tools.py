@@ -1,19 +1,20 @@
 """Memory read/write tools."""
 
+import base64
 import time
 from typing import Any
 
 from fastmcp import FastMCP
 from pydantic import Field
 
-from http_client import error_response, safe_get, safe_patch, simplify_response
-from state import get_instance_port
+from http_client import async_safe_get, async_safe_patch, error_response, simplify_response
+from state import async_get_instance_port
 
 
 def register_memory_tools(server: FastMCP) -> None:
 
     @server.tool
-    def memory_read(
+    async def memory_read(
         address: str = Field(description="Memory address in hex format"),
         length: int = Field(default=16, description="Number of bytes to read"),
         format: str = Field(default="hex", description='Output format - "hex", "base64", or "string"'),
@@ -23,10 +24,10 @@ def register_memory_tools(server: FastMCP) -> None:
         if not address:
             return error_response("MISSING_PARAMETER", "Address parameter is required")
 
-        port = get_instance_port(port)
+        port = await async_get_instance_port(port)
 
         params = {"address": address, "length": length, "format": format}
-        response = safe_get(port, "memory", params)
+        response = await async_safe_get(port, "memory", params)
         simplified = simplify_response(response)
 
         if "result" in simplified and isinstance(simplified["result"], dict):
@@ -38,6 +39,12 @@ def register_memory_tools(server: FastMCP) -> None:
                 "format": format,
                 "timestamp": simplified.get("timestamp", int(time.time() * 1000)),
             }
+            raw = result.get("rawBytes")
+            if isinstance(raw, bytes):
+                # MessagePack responses carry the bytes themselves
+                memory_info["hexBytes"] = raw.hex(" ").upper()
+                memory_info["rawBytes"] = base64.b64encode(raw).decode("ascii")
+                return memory_info
             if "hexBytes" in result:
                 memory_info["hexBytes"] = result["hexBytes"]
             if "rawBytes" in result:
@@ -47,7 +54,7 @@ def register_memory_tools(server: FastMCP) -> None:
         return simplified
 
     @server.tool
-    def memory_write(
+    async def memory_write(
         address: str = Field(description="Memory address in hex format"),
         bytes_data: str = Field(description="Data to write (format depends on 'format' parameter)"),
         format: str = Field(default="hex", description='Input format - "hex", "base64", or "string"'),
@@ -59,8 +66,8 @@ def register_memory_tools(server: FastMCP) -> None:
         if not bytes_data:
             return error_response("MISSING_PARAMETER", "Bytes parameter is required")
 
-        port = get_instance_port(port)
+        port = await async_get_instance_port(port)
 
         payload = {"bytes": bytes_data, "format": format}
-        response = safe_patch(port, f"programs/current/memory/{address}", payload)
+        response = await async_safe_patch(port, f"programs/current/memory/{address}", payload)
         return simplify_response(response)
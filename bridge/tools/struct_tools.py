@@ -5,27 +5,27 @@ from typing import Any
 from fastmcp import FastMCP
 from pydantic import Field
 
-from http_client import error_response, safe_get, safe_post, simplify_response
-from state import get_instance_port
+from http_client import async_safe_get, async_safe_post, error_response, simplify_response
+from state import async_get_instance_port
 
 
 def register_struct_tools(server: FastMCP) -> None:
 
     @server.tool
-    def structs_list(
+    async def structs_list(
         offset: int = Field(default=0, description="Pagination offset"),
         limit: int = Field(default=100, description="Maximum items to return"),
         category: str | None = Field(default=None, description='Filter by category path (e.g. "/winapi")'),
         port: int | None = Field(default=None, description="Specific Ghidra instance port (optional)"),
     ) -> dict[str, Any]:
         """List all struct data types in the program."""
-        port = get_instance_port(port)
+        port = await async_get_instance_port(port)
 
         params: dict[str, Any] = {"offset": offset, "limit": limit}
         if category:
             params["category"] = category
 
-        response = safe_get(port, "structs", params)
+        response = await async_safe_get(port, "structs", params)
         simplified = simplify_response(response)
 
         if isinstance(simplified, dict) and "error" not in simplified:
@@ -36,7 +36,7 @@ def register_struct_tools(server: FastMCP) -> None:
         return simplified
 
     @server.tool
-    def structs_get(
+    async def structs_get(
         name: str = Field(description="Struct name"),
         port: int | None = Field(default=None, description="Specific Ghidra instance port (optional)"),
     ) -> dict[str, Any]:
@@ -44,14 +44,14 @@ def register_struct_tools(server: FastMCP) -> None:
         if not name:
             return error_response("MISSING_PARAMETER", "Struct name parameter is required")
 
-        port = get_instance_port(port)
+        port = await async_get_instance_port(port)
 
         params = {"name": name}
-        response = safe_get(port, "structs", params)
+        response = await async_safe_get(port, "structs", params)
         return simplify_response(response)
 
     @server.tool
-    def structs_create(
+    async def structs_create(
         name: str = Field(description="Name for the new struct"),
         category: str | None = Field(default=None, description='Category path (e.g. "/custom")'),
         description: str | None = Field(default=None, description="Optional description"),
@@ -61,7 +61,7 @@ def register_struct_tools(server: FastMCP) -> None:
         if not name:
             return error_response("MISSING_PARAMETER", "Struct name parameter is required")
 
-        port = get_instance_port(port)
+        port = await async_get_instance_port(port)
 
         payload: dict[str, Any] = {"name": name}
         if category:
@@ -69,11 +69,11 @@ def register_struct_tools(server: FastMCP) -> None:
         if description:
             payload["description"] = description
 
-        response = safe_post(port, "structs/create", payload)
+        response = await async_safe_post(port, "structs/create", payload)
         return simplify_response(response)
 
     @server.tool
-    def structs_add_field(
+    async def structs_add_field(
         struct_name: str = Field(description="Name of the struct to modify"),
         field_name: str = Field(description="Name for the new field"),
         field_type: str = Field(description='Data type for the field (e.g. "int", "char", "pointer")'),
@@ -87,7 +87,7 @@ def register_struct_tools(server: FastMCP) -> None:
                 "MISSING_PARAMETER", "struct_name, field_name, and field_type parameters are required"
             )
 
-        port = get_instance_port(port)
+        port = await async_get_instance_port(port)
 
         payload: dict[str, Any] = {
             "struct": struct_name,
@@ -99,11 +99,11 @@ def register_struct_tools(server: FastMCP) -> None:
         if comment:
             payload["comment"] = comment
 
-        response = safe_post(port, "structs/addfield", payload)
+        response = await async_safe_post(port, "structs/addfield", payload)
         return simplify_response(response)
 
     @server.tool
-    def structs_update_field(
+    async def structs_update_field(
         struct_name: str = Field(description="Name of the struct to modify"),
         field_name: str | None = Field(default=None, description="Name of the field to update"),
         field_offset: int | None = Field(default=None, description="Offset of the field to update"),
@@ -122,7 +122,7 @@ def register_struct_tools(server: FastMCP) -> None:
                 "MISSING_PARAMETER", "At least one of new_name, new_type, or new_comment must be provided"
             )
 
-        port = get_instance_port(port)
+        port = await async_get_instance_port(port)
 
         payload: dict[str, Any] = {"struct": struct_name}
         if field_name:
@@ -136,11 +136,11 @@ def register_struct_tools(server: FastMCP) -> None:
         if new_comment is not None:
             payload["newComment"] = new_comment
 
-        response = safe_post(port, "structs/updatefield", payload)
+        response = await async_safe_post(port, "structs/updatefield", payload)
         return simplify_response(response)
 
     @server.tool
-    def structs_delete(
+    async def structs_delete(
         name: str = Field(description="Name of the struct to delete"),
         port: int | None = Field(default=None, description="Specific Ghidra instance port (optional)"),
     ) -> dict[str, Any]:
@@ -148,8 +148,8 @@ def register_struct_tools(server: FastMCP) -> None:
         if not name:
             return error_response("MISSING_PARAMETER", "Struct name parameter is required")
 
-        port = get_instance_port(port)
+        port = await async_get_instance_port(port)
 
         payload = {"name": name}
-        response = safe_post(port, "structs/delete", payload)
+        response = await async_safe_post(port, "structs/delete", payload)
         return simplify_response(response)
@@ -2,31 +2,37 @@
 
 from typing import Any
 
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 from pydantic import Field
 
-from http_client import error_response, safe_get, simplify_response
-from state import get_instance_port
+from http_client import async_get_listing, async_list_all, error_response
+from state import async_get_instance_port
 
 
 def register_xref_tools(server: FastMCP) -> None:
 
     @server.tool
-    def xrefs_list(
+    async def xrefs_list(
         to_addr: str | None = Field(default=None, description="Filter references to this address (hex)"),
         from_addr: str | None = Field(default=None, description="Filter references from this address (hex)"),
         type: str | None = Field(default=None, description='Filter by reference type (e.g. "CALL", "READ", "WRITE")'),
         offset: int = Field(default=0, description="Pagination offset"),
+        cursor: str | None = Field(default=None, description='Opaque keyset cursor: "" for the first page, then the previous page\'s next_cursor (overrides offset)'),
         limit: int = Field(default=100, description="Maximum items to return"),
+        lean: bool | None = Field(default=None, description="Leave out per-item links and return rows under one columns header (default: GHIDRA_LEAN)"),
         port: int | None = Field(default=None, description="Specific Ghidra instance port (optional)"),
     ) -> dict[str, Any]:
         """List cross-references with filtering and pagination."""
         if not to_addr and not from_addr:
             return error_response("MISSING_PARAMETER", "Either to_addr or from_addr parameter is required")
 
-        port = get_instance_port(port)
+        port = await async_get_instance_port(port)
 
-        params: dict[str, Any] = {"offset": offset, "limit": limit}
+        params: dict[str, Any] = {"limit": limit}
+        if cursor is not None:
+            params["cursor"] = cursor
+        else:
+            params["offset"] = offset
         if to_addr:
             params["to_addr"] = to_addr
         if from_addr:
@@ -34,12 +40,44 @@ def register_xref_tools(server: FastMCP) -> None:
         if type:
             params["type"] = type
 
-        response = safe_get(port, "xrefs", params)
-        simplified = simplify_response(response)
+        simplified = await async_get_listing(port, "xrefs", params, items_path=("result", "references"), lean=lean)
 
-        if isinstance(simplified, dict) and "error" not in simplified:
+        if isinstance(simplified, dict) and "error" not in simplified and cursor is None:
             simplified.setdefault("size", len(simplified.get("result", [])))
             simplified.setdefault("offset", offset)
             simplified.setdefault("limit", limit)
 
         return simplified
+
+    @server.tool
+    async def xrefs_list_all(
+        ctx: Context,
+        to_addr: str | None = Field(default=None, description="Filter references to this address (hex)"),
+        from_addr: str | None = Field(default=None, description="Filter references from this address (hex)"),
+        type: str | None = Field(default=None, description='Filter by reference type (e.g. "CALL", "READ", "WRITE")'),
+        max_results: int = Field(default=1000, description="Stop after this many references"),
+        lean: bool | None = Field(default=None, description="Leave out per-item links and return rows under one columns header (default: GHIDRA_LEAN)"),
+        port: int | None = Field(default=None, description="Specific Ghidra instance port (optional)"),
+    ) -> dict[str, Any]:
+        """List every matching cross-reference, paging automatically.
+
+        If max_results is reached, truncated is true and next_cursor can be passed
+        to xrefs_list to continue.
+        """
+        if not to_addr and not from_addr:
+            return error_response("MISSING_PARAMETER", "Either to_addr or from_addr parameter is required")
+
+        port = await async_get_instance_port(port)
+
+        params: dict[str, Any] = {}
+        if to_addr:
+            params["to_addr"] = to_addr
+        if from_addr:
+            params["from_addr"] = from_addr
+        if type:
+            params["type"] = type
+
+        async def progress(count: int) -> None:
+            await ctx.report_progress(count, max_results)
+
+        return await async_list_all(port, "xrefs", params, max_results, on_page=progress, lean=lean)
@@ -0,0 +1,155 @@
+"""Async HTTP transport -- background event loop and per-instance connection pools.
+
+All plugin traffic runs on one bridge-owned event loop so the pooled
+``httpx.AsyncClient`` for each instance is only ever used from the loop it
+belongs to. Async callers (FastMCP tools) await it without blocking their own
+loop; sync callers (scripts) block on the result.
+"""
+
+import asyncio
+import os
+import threading
+from collections.abc import Callable, Coroutine
+from typing import Any, TypeVar
+from urllib.parse import urlsplit
+
+import httpx
+
+T = TypeVar("T")
+
+# Per-instance HTTP connection pool settings
+POOL_MAXSIZE = int(os.environ.get("GHIDRA_POOL_MAXSIZE", "8"))
+POOL_KEEPALIVE = os.environ.get("GHIDRA_POOL_KEEPALIVE", "1").lower() not in ("0", "false", "no")
+POOL_IDLE_TIMEOUT = float(os.environ.get("GHIDRA_POOL_IDLE_TIMEOUT", "60"))
+
+# Ask the plugin for gzip-compressed responses ("auto": only from non-loopback
+# hosts, where bandwidth matters more than the CPU spent compressing)
+COMPRESSION = os.environ.get("GHIDRA_COMPRESSION", "auto").lower()
+LOOPBACK_HOSTS = {"localhost", "127.0.0.1", "::1"}
+
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_thread: threading.Thread | None = None
+_loop_lock = threading.Lock()
+
+_clients: dict[int, httpx.AsyncClient] = {}
+_client_routes: dict[int, tuple[str | None, str | None]] = {}  # (url, uds) each client was built for
+_clients_lock = threading.Lock()
+
+
+# ---------------------------------------------------------------------------
+# Event loop
+# ---------------------------------------------------------------------------
+
+def get_loop() -> asyncio.AbstractEventLoop:
+    """Get the transport event loop, starting its thread on first use."""
+    global _loop, _loop_thread
+    with _loop_lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, daemon=True, name="GhidraMCP-IO")
+            thread.start()
+            _loop, _loop_thread = loop, thread
+        return _loop
+
+
+def call_soon(callback: Callable[..., Any], *args: Any) -> None:
+    """Run a plain callback on the transport loop, or right away if the loop has not been started."""
+    if _loop is None or threading.current_thread() is _loop_thread:
+        callback(*args)
+    else:
+        _loop.call_soon_threadsafe(callback, *args)
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the transport loop and block until it finishes."""
+    if threading.current_thread() is _loop_thread:
+        coro.close()
+        raise RuntimeError("Blocking transport call made from the transport loop")
+    return asyncio.run_coroutine_threadsafe(coro, get_loop()).result()
+
+
+async def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine on the transport loop and await it from any other loop.
+
+    Cancelling the awaiting task cancels the coroutine on the transport loop.
+    """
+    loop = get_loop()
+    if asyncio.get_running_loop() is loop:
+        return await coro
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+
+
+# ---------------------------------------------------------------------------
+# Connection pools
+# ---------------------------------------------------------------------------
+
+def accept_encoding(url: str | None) -> str:
+    """Accept-Encoding to send to the instance at url, per GHIDRA_COMPRESSION."""
+    if COMPRESSION in ("0", "false", "no"):
+        return "identity"
+    if COMPRESSION == "auto":
+        host = urlsplit(url).hostname if url else None
+        if host is None or host in LOOPBACK_HOSTS or host.startswith("127."):
+            return "identity"
+    return "gzip"
+
+
+def _new_client(url: str | None, uds: str | None = None) -> httpx.AsyncClient:
+    """Build a keep-alive client with a bounded connection pool for one instance.
+
+    With ``uds`` set, requests go over that Unix domain socket; the URL still
+    supplies the Host header and path.
+    """
+    limits = httpx.Limits(
+        max_connections=POOL_MAXSIZE,
+        max_keepalive_connections=POOL_MAXSIZE if POOL_KEEPALIVE else 0,
+        keepalive_expiry=POOL_IDLE_TIMEOUT,
+    )
+    headers = {"Accept-Encoding": "identity" if uds else accept_encoding(url)}
+    if uds:
+        transport = httpx.AsyncHTTPTransport(uds=uds, limits=limits, verify=False)  # no TLS on a local socket
+        return httpx.AsyncClient(transport=transport, timeout=None, headers=headers)
+    return httpx.AsyncClient(limits=limits, timeout=None, headers=headers)
+
+
+def transient_client(url: str | None = None) -> httpx.AsyncClient:
+    """One-off client for an instance without a pool, with the same encoding preference."""
+    return httpx.AsyncClient(headers={"Accept-Encoding": accept_encoding(url)})
+
+
+def open_client(port: int, url: str | None = None, uds: str | None = None) -> httpx.AsyncClient:
+    """Create (or return the existing) pooled client for the instance at url, or on its socket.
+
+    An existing client built for another URL or socket is closed and replaced.
+    """
+    stale = None
+    with _clients_lock:
+        client = _clients.get(port)
+        if client is not None and _client_routes.get(port) != (url, uds):
+            stale, client = client, None
+        if client is None:
+            client = _new_client(url, uds)
+            _clients[port] = client
+            _client_routes[port] = (url, uds)
+    if stale is not None:
+        _close_in_background(stale)
+    return client
+
+
+def get_client(port: int) -> httpx.AsyncClient | None:
+    """Get the pooled client for a registered instance, or None if there is none."""
+    return _clients.get(port)
+
+
+def close_client(port: int) -> None:
+    """Tear down the pooled client for an instance."""
+    with _clients_lock:
+        client = _clients.pop(port, None)
+        _client_routes.pop(port, None)
+    if client is not None:
+        _close_in_background(client)
+
+
+def _close_in_background(client: httpx.AsyncClient) -> None:
+    if _loop is not None:
+        asyncio.run_coroutine_threadsafe(client.aclose(), _loop)
@@ -14,7 +14,6 @@ import java.util.HashMap;
 import java.util.List;
 import java.util.Map;
 import java.util.concurrent.ConcurrentHashMap;
-import java.util.concurrent.Executors;
 
 // For JSON response handling
 import com.google.gson.Gson;
@@ -50,6 +49,9 @@ public class GhidraMCPPlugin extends Plugin implements ApplicationLevelPlugin {
     private static final Object baseInstanceLock = new Object();
     
     private HttpServer server;
+    private InstrumentedExecutor httpExecutor;
+    private InstrumentedExecutor controlExecutor;
+    private UnixSocketServer socketServer;
     private int port;
     private boolean isBaseInstance = false;
 
@@ -90,30 +92,55 @@ public class GhidraMCPPlugin extends Plugin implements ApplicationLevelPlugin {
     private void startServer() throws IOException {
         server = HttpServer.create(new InetSocketAddress(port), 0);
         
-        // Use a cached thread pool for better performance with multiple concurrent requests
-        server.setExecutor(Executors.newCachedThreadPool());
+        // Bounded pool: a burst of heavy requests queues (or is turned away) instead of spawning threads
+        httpExecutor = new InstrumentedExecutor("GhidraMCP-HTTP-" + port,
+            InstrumentedExecutor.DEFAULT_THREADS, InstrumentedExecutor.DEFAULT_QUEUE_CAPACITY);
+        // The server itself runs on a small control pool; the router serves cancels, job status and
+        // health probes there and hands everything else to the bounded pool
+        controlExecutor = new InstrumentedExecutor("GhidraMCP-Control-" + port,
+            InstrumentedExecutor.DEFAULT_CONTROL_THREADS, InstrumentedExecutor.DEFAULT_QUEUE_CAPACITY);
+        server.setExecutor(controlExecutor);
+
+        // Endpoints are routed to the right pool, and those registered through the mirror
+        // are also served on the unix socket
+        HttpServer endpoints = new RequestRouter(server, httpExecutor, port);
+        if (UnixSocketServer.ENABLED) {
+            socketServer = new UnixSocketServer(port);
+            endpoints = socketServer.mirror(endpoints);
+        }
 
         // --- Register Endpoints ---
         Program currentProgram = getCurrentProgram(); // Get program once
         
         // Register Meta Endpoints (these don't require a program)
-        registerMetaEndpoints(server); 
+        registerMetaEndpoints(endpoints); 
         
         // Register endpoints that don't require a program
-        registerProjectEndpoints(server);
-        new InstanceEndpoints(currentProgram, port, activeInstances).registerEndpoints(server);
+        registerProjectEndpoints(endpoints);
+        new InstanceEndpoints(currentProgram, port, activeInstances).registerEndpoints(endpoints);
+        new JobEndpoints(currentProgram, port).registerEndpoints(endpoints);
         
         // Register Resource Endpoints that require a program
-        registerProgramDependentEndpoints(server);
+        registerProgramDependentEndpoints(endpoints);
         
         // Register Root Endpoint (should be last to include links to all other endpoints)
-        registerRootEndpoint(server);
+        registerRootEndpoint(endpoints);
 
         new Thread(() -> {
             server.start();
             Msg.info(this, "GhidraMCP HTTP server started on port " + port);
             System.out.println("[GhidraMCP] HTTP server started on port " + port);
         }, "GhidraMCP-HTTP-Server").start();
+
+        if (socketServer != null) {
+            try {
+                socketServer.start();
+                System.out.println("[GhidraMCP] Unix socket server started at " + socketServer.getPath());
+            } catch (IOException | UnsupportedOperationException e) {
+                Msg.warn(this, "Unix socket unavailable, serving on TCP port " + port + " only", e);
+                socketServer = null;
+            }
+        }
     }
     
     /**
@@ -184,6 +211,37 @@ public class GhidraMCPPlugin extends Plugin implements ApplicationLevelPlugin {
             }
         });
         
+        // Cancel the work behind an in-flight request: POST /requests/{X-Request-ID}/cancel
+        server.createContext("/requests/", exchange -> {
+            try {
+                String path = exchange.getRequestURI().getPath();
+                String requestId = path.substring("/requests/".length());
+                if (!requestId.endsWith("/cancel") || requestId.length() == "/cancel".length()) {
+                    HttpUtil.sendErrorResponse(exchange, 404, "Endpoint not found", "ENDPOINT_NOT_FOUND", port);
+                    return;
+                }
+                if (!"POST".equals(exchange.getRequestMethod())) {
+                    HttpUtil.sendErrorResponse(exchange, 405, "Method Not Allowed", "METHOD_NOT_ALLOWED", port);
+                    return;
+                }
+                requestId = requestId.substring(0, requestId.length() - "/cancel".length());
+
+                boolean running = RequestMonitor.cancel(requestId);
+                ResponseBuilder builder = new ResponseBuilder(exchange, port)
+                    .success(true)
+                    .result(Map.of("requestId", requestId, "running", running))
+                    .addLink("self", "/requests/" + requestId + "/cancel");
+                HttpUtil.sendJsonResponse(exchange, builder.build(), 200, port);
+            } catch (Exception e) {
+                Msg.error(this, "Error serving /requests/{id}/cancel", e);
+                try {
+                    HttpUtil.sendErrorResponse(exchange, 500, "Internal server error: " + e.getMessage(), "INTERNAL_ERROR", port);
+                } catch (IOException ioEx) {
+                    Msg.error(this, "Failed to send error for /requests/{id}/cancel", ioEx);
+                }
+            }
+        });
+
         // Info endpoint
         server.createContext("/info", exchange -> {
             try {
@@ -210,6 +268,17 @@ public class GhidraMCPPlugin extends Plugin implements ApplicationLevelPlugin {
                 infoData.put("serverPort", port);
                 infoData.put("serverStartTime", System.currentTimeMillis());
                 infoData.put("instanceCount", activeInstances.size());
+                infoData.put("decompilerPool", DecompilerPool.getInstance().getStats());
+                infoData.put("decompileCache", DecompileCache.getInstance().getStats());
+                infoData.put("cancellableRequests", RequestMonitor.activeCount());
+                infoData.put("jobs", JobManager.getInstance().getStats());
+                if (httpExecutor != null) {
+                    infoData.put("httpExecutor", httpExecutor.getStats());
+                    infoData.put("controlExecutor", controlExecutor.getStats());
+                }
+                if (socketServer != null) {
+                    infoData.put("socketExecutor", socketServer.getExecutorStats());
+                }
                 
                 ResponseBuilder builder = new ResponseBuilder(exchange, port)
                    .success(true)
@@ -363,6 +432,7 @@ public class GhidraMCPPlugin extends Plugin implements ApplicationLevelPlugin {
                     .addLink("plugin-version", "/plugin-version")
                     .addLink("projects", "/projects")
                     .addLink("instances", "/instances")
+                    .addLink("jobs", "/jobs")
                     .addLink("programs", "/programs");
                 
                 // Add links to program-dependent endpoints if a program is loaded
@@ -447,12 +517,22 @@ public class GhidraMCPPlugin extends Plugin implements ApplicationLevelPlugin {
      */
     @Override
     public void dispose() {
+        if (socketServer != null) {
+            socketServer.stop();
+        }
         if (server != null) {
             server.stop(0); // Stop immediately
+            httpExecutor.shutdownNow();
+            controlExecutor.shutdownNow();
             Msg.info(this, "GhidraMCP HTTP server stopped on port " + port);
             System.out.println("[GhidraMCP] HTTP server stopped on port " + port);
         }
         activeInstances.remove(port);
+        if (activeInstances.isEmpty()) {
+            DecompilerPool.getInstance().disposeAll();
+            DecompileCache.getInstance().invalidate();
+            JobManager.getInstance().cancelAll();
+        }
         super.dispose();
     }
 
@@ -5,4 +5,15 @@ public class ApiConstants {
     public static final int API_VERSION = 2010;
     public static final int DEFAULT_PORT = 8192;
     public static final int MAX_PORT_ATTEMPTS = 10;
+    public static final String PROGRAM_ID_HEADER = "X-Ghidra-Program-ID";
+    public static final String MODIFICATION_NUMBER_HEADER = "X-Ghidra-Modification-Number";
+    /** Response header: program identity that is stable across sessions (see GhidraUtil.getProgramIdentity) */
+    public static final String PROGRAM_IDENTITY_HEADER = "X-Ghidra-Program-Identity";
+    /** Request header ("1"/"true") or query parameter asking for responses without HATEOAS links */
+    public static final String LEAN_HEADER = "X-Ghidra-Lean";
+    public static final String LEAN_PARAM = "lean";
+    /** Binary response encoding offered to clients that list it in Accept */
+    public static final String MSGPACK_CONTENT_TYPE = "application/msgpack";
+    /** Request header: milliseconds the client will wait for this response before giving up */
+    public static final String DEADLINE_HEADER = "X-Ghidra-Deadline-Ms";
 }
@@ -3,6 +3,7 @@ package eu.starsong.ghidra.api;
 import com.google.gson.Gson;
 import com.google.gson.JsonObject;
 import com.sun.net.httpserver.HttpExchange;
+import eu.starsong.ghidra.util.HttpUtil;
 import java.util.Map;
 import java.util.UUID;
 
@@ -16,12 +17,14 @@ public class ResponseBuilder {
     private JsonObject response;
     private JsonObject links; // For HATEOAS links
     private final Gson gson = new Gson(); // Gson instance for serialization
+    private final boolean lean; // Client asked for no HATEOAS links
 
     public ResponseBuilder(HttpExchange exchange, int port) {
         this.exchange = exchange;
         this.port = port;
         this.response = new JsonObject();
         this.links = new JsonObject();
+        this.lean = isLean(exchange);
 
         // Add standard fields
         String requestId = exchange.getRequestHeaders().getFirst("X-Request-ID");
@@ -29,6 +32,27 @@ public class ResponseBuilder {
         response.addProperty("instance", "http://localhost:" + port); // URL of this instance
     }
 
+    /**
+     * Whether the request asked for a lean response, via the X-Ghidra-Lean header
+     * or the lean query parameter. Lean responses carry no per-item links and only
+     * the "next" pagination link at the top level.
+     */
+    public static boolean isLean(HttpExchange exchange) {
+        String value = exchange.getRequestHeaders().getFirst(ApiConstants.LEAN_HEADER);
+        if (value == null) {
+            String query = exchange.getRequestURI().getRawQuery();
+            if (query == null || !query.contains(ApiConstants.LEAN_PARAM)) {
+                return false;
+            }
+            value = HttpUtil.parseQueryParams(exchange).get(ApiConstants.LEAN_PARAM);
+        }
+        return value != null && (value.equals("1") || value.equalsIgnoreCase("true"));
+    }
+
+    public boolean isLean() {
+        return lean;
+    }
+
     public ResponseBuilder success(boolean success) {
         response.addProperty("success", success);
         return this;
@@ -64,6 +88,9 @@ public class ResponseBuilder {
     }
 
     public ResponseBuilder addLink(String rel, String href) {
+        if (lean && !"next".equals(rel)) {
+            return this;
+        }
         JsonObject link = new JsonObject();
         link.addProperty("href", href);
         links.add(rel, link);
@@ -72,6 +99,9 @@ public class ResponseBuilder {
     
     // Overload to add link with method
     public ResponseBuilder addLink(String rel, String href, String method) {
+        if (lean && !"next".equals(rel)) {
+            return this;
+        }
         JsonObject link = new JsonObject();
         link.addProperty("href", href);
         link.addProperty("method", method);
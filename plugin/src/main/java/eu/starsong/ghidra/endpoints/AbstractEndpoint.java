@@ -2,19 +2,25 @@ package eu.starsong.ghidra.endpoints;
 
 import com.google.gson.Gson;
 import com.google.gson.JsonObject;
+import com.sun.net.httpserver.Headers;
 import com.sun.net.httpserver.HttpExchange;
+import eu.starsong.ghidra.api.ApiConstants;
 import eu.starsong.ghidra.api.GhidraJsonEndpoint;
 import eu.starsong.ghidra.api.ResponseBuilder; // Import ResponseBuilder
 import eu.starsong.ghidra.util.GhidraUtil; // Import GhidraUtil
 import eu.starsong.ghidra.util.HttpUtil; // Import HttpUtil
 import ghidra.app.services.ProgramManager;
 import ghidra.framework.plugintool.PluginTool;
+import ghidra.program.model.address.Address;
 import ghidra.program.model.listing.Program;
 import ghidra.util.Msg;
 import java.io.IOException;
+import java.util.ArrayList;
 import java.util.HashMap;
+import java.util.Iterator;
 import java.util.List;
 import java.util.Map;
+import java.util.function.Predicate;
 
 public abstract class AbstractEndpoint implements GhidraJsonEndpoint {
     
@@ -86,6 +92,162 @@ public abstract class AbstractEndpoint implements GhidraJsonEndpoint {
         return applyPagination(items, offset, limit, builder, basePath, null);
     }
 
+    /** Query parameter carrying an opaque keyset pagination cursor */
+    protected static final String CURSOR_PARAM = "cursor";
+
+    /**
+     * Position in an address-ordered listing: the address of the first item of
+     * the page, plus how many items at that address earlier pages already returned
+     * (symbols and references can share an address).
+     *
+     * Encoded as {@code space:offset} or {@code space:offset~skip}.
+     */
+    protected static final class PageCursor {
+        /** Address to resume from, or null to start at the beginning */
+        public final Address address;
+        /** Items at {@code address} to skip before the page starts */
+        public final int skip;
+
+        public PageCursor(Address address, int skip) {
+            this.address = address;
+            this.skip = skip;
+        }
+
+        public String encode() {
+            String token = address.toString(true);
+            return skip > 0 ? token + "~" + skip : token;
+        }
+    }
+
+    /**
+     * Parse the {@code cursor} query parameter.
+     *
+     * @return null if no cursor was given (offset pagination), a cursor with a null
+     *         address for an empty cursor (first page), otherwise the decoded position
+     * @throws IllegalArgumentException if the cursor is malformed
+     */
+    protected PageCursor parseCursor(Program program, Map<String, String> params) {
+        String token = params.get(CURSOR_PARAM);
+        if (token == null) {
+            return null;
+        }
+        if (token.isEmpty()) {
+            return new PageCursor(null, 0);
+        }
+        String addressPart = token;
+        int skip = 0;
+        int sep = token.lastIndexOf('~');
+        if (sep >= 0) {
+            addressPart = token.substring(0, sep);
+            try {
+                skip = Integer.parseInt(token.substring(sep + 1));
+            } catch (NumberFormatException e) {
+                throw new IllegalArgumentException("Invalid cursor: " + token);
+            }
+        }
+        Address address = program.getAddressFactory().getAddress(addressPart);
+        if (address == null || skip < 0) {
+            throw new IllegalArgumentException("Invalid cursor: " + token);
+        }
+        return new PageCursor(address, skip);
+    }
+
+    /**
+     * Page through an address-ordered iterator, building response maps only for
+     * the items on the requested page.
+     *
+     * With a cursor the iterator must already start at {@code cursor.address};
+     * iteration stops one item past the page, whose position becomes
+     * {@code next_cursor}, so the cost of a page does not depend on how far into
+     * the listing it is. Without a cursor, {@code offset} items are skipped and
+     * the rest are counted (not converted) to report {@code size}.
+     *
+     * @param items items in ascending key order
+     * @param cursor the parsed cursor or null for offset pagination
+     * @param filter items to include, or null for all
+     * @param keyOf the address each item is ordered by
+     * @param toItem converts an item on the page to its response map
+     * @return the page of converted items
+     */
+    protected <T> List<Map<String, Object>> applyKeysetPagination(Iterator<T> items, PageCursor cursor,
+            int offset, int limit, Predicate<? super T> filter,
+            java.util.function.Function<? super T, Address> keyOf,
+            java.util.function.Function<? super T, Map<String, Object>> toItem,
+            ResponseBuilder builder, String basePath, String additionalQueryParams) {
+        List<Map<String, Object>> page = new ArrayList<>();
+        int skipAtCursor = cursor != null && cursor.address != null ? cursor.skip : 0;
+        int skipOffset = cursor == null ? Math.max(0, offset) : 0;
+        int matched = 0;
+        Address runKey = null;
+        int runLength = 0;
+        PageCursor next = null;
+
+        while (items.hasNext()) {
+            T item = items.next();
+            if (filter != null && !filter.test(item)) {
+                continue;
+            }
+            matched++;
+            if (next != null) {
+                continue; // offset mode: only counting towards size
+            }
+            Address key = keyOf.apply(item);
+            if (key.equals(runKey)) {
+                runLength++;
+            } else {
+                runKey = key;
+                runLength = 1;
+            }
+            if (skipAtCursor > 0 && key.equals(cursor.address)) {
+                skipAtCursor--;
+                continue;
+            }
+            skipAtCursor = 0;
+            if (skipOffset > 0) {
+                skipOffset--;
+                continue;
+            }
+            if (page.size() >= limit) {
+                next = new PageCursor(key, runLength - 1);
+                if (cursor != null) {
+                    break;
+                }
+                continue;
+            }
+            page.add(toItem.apply(item));
+        }
+
+        String queryParams = (additionalQueryParams != null && !additionalQueryParams.isEmpty())
+            ? additionalQueryParams + "&"
+            : "";
+
+        Map<String, Object> metadata = new HashMap<>();
+        metadata.put("limit", limit);
+        if (cursor != null) {
+            String self = cursor.address != null ? cursor.encode() : "";
+            metadata.put(CURSOR_PARAM, self);
+            builder.addLink("self", basePath + "?" + queryParams + CURSOR_PARAM + "=" + self + "&limit=" + limit);
+            if (next != null) {
+                metadata.put("next_cursor", next.encode());
+                builder.addLink("next", basePath + "?" + queryParams + CURSOR_PARAM + "=" + next.encode()
+                    + "&limit=" + limit);
+            }
+        } else {
+            metadata.put("size", matched);
+            metadata.put("offset", offset);
+            builder.addLink("self", basePath + "?" + queryParams + "offset=" + offset + "&limit=" + limit);
+            if (next != null) {
+                builder.addLink("next", basePath + "?" + queryParams + "offset=" + (offset + limit) + "&limit=" + limit);
+            }
+            if (offset > 0) {
+                int prevOffset = Math.max(0, offset - limit);
+                builder.addLink("prev", basePath + "?" + queryParams + "offset=" + prevOffset + "&limit=" + limit);
+            }
+        }
+        builder.metadata(metadata);
+        return page;
+    }
+
     protected final Gson gson = new Gson(); // Keep Gson if needed for specific object handling
     protected Program currentProgram;
     protected int port; // Add port field
@@ -131,8 +293,32 @@ public abstract class AbstractEndpoint implements GhidraJsonEndpoint {
     // --- Methods using HttpUtil ---
 
     protected void sendJsonResponse(HttpExchange exchange, JsonObject data, int statusCode) throws IOException {
+        addProgramStateHeaders(exchange);
         HttpUtil.sendJsonResponse(exchange, data, statusCode, this.port);
     }
+
+    // Byte payloads travel as binary in MessagePack and as base64 in JSON
+    protected void sendJsonResponse(HttpExchange exchange, JsonObject data, int statusCode,
+                                    Map<String, byte[]> resultBytes) throws IOException {
+        addProgramStateHeaders(exchange);
+        HttpUtil.sendJsonResponse(exchange, data, statusCode, this.port, resultBytes);
+    }
+    
+    /**
+     * Add headers identifying the current program and its modification number,
+     * so clients can tell when responses they have cached are stale. The
+     * program ID is only unique within this Ghidra session; the program
+     * identity also holds across sessions and instances.
+     */
+    protected void addProgramStateHeaders(HttpExchange exchange) {
+        Program program = getCurrentProgram();
+        if (program != null) {
+            Headers headers = exchange.getResponseHeaders();
+            headers.set(ApiConstants.PROGRAM_ID_HEADER, Long.toString(program.getUniqueProgramID()));
+            headers.set(ApiConstants.PROGRAM_IDENTITY_HEADER, GhidraUtil.getProgramIdentity(program));
+            headers.set(ApiConstants.MODIFICATION_NUMBER_HEADER, Long.toString(program.getModificationNumber()));
+        }
+    }
     
     // Overload for sending success responses easily using ResponseBuilder
     protected void sendSuccessResponse(HttpExchange exchange, Object resultData) throws IOException {
@@ -143,7 +329,7 @@ public abstract class AbstractEndpoint implements GhidraJsonEndpoint {
             .success(true)
             .result(resultData);
         // Add common links if desired here
-        HttpUtil.sendJsonResponse(exchange, builder.build(), 200, this.port);
+        sendJsonResponse(exchange, builder.build(), 200);
     }
     
     /**
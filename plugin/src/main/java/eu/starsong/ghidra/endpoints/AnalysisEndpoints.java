@@ -5,6 +5,10 @@ import com.google.gson.JsonObject;
 import com.sun.net.httpserver.HttpExchange;
 import com.sun.net.httpserver.HttpServer;
 import eu.starsong.ghidra.api.ResponseBuilder;
+import eu.starsong.ghidra.util.JobManager;
+import ghidra.app.plugin.core.analysis.AutoAnalysisManager;
+import ghidra.framework.options.OptionType;
+import ghidra.framework.options.Options;
 import ghidra.program.model.listing.Program;
 import ghidra.framework.plugintool.PluginTool;
 import ghidra.util.Msg;
@@ -89,18 +93,13 @@ public class AnalysisEndpoints extends AbstractEndpoint {
                 sendJsonResponse(exchange, builder.build(), 200);
                 
             } else if ("POST".equals(method)) {
-                // We can't directly start/stop analysis without direct AutoAnalysisManager access,
-                // so return a placeholder response
+                // Auto-analysis can take far longer than an HTTP request; run it as a job
                 Map<String, String> params = parseJsonPostParams(exchange);
-                String action = params.get("action");
-                
-                Map<String, Object> result = new HashMap<>();
-                result.put("success", true);
-                result.put("message", "Analysis action '" + action + "' requested, but not fully implemented yet.");
-                result.put("status", status);
-                
-                builder.result(result);
-                sendJsonResponse(exchange, builder.build(), 200);
+                JobManager.Job job = startAnalysisJob(program, params);
+                ResponseBuilder jobBuilder = JobEndpoints.jobResponse(exchange, port, job)
+                    .addLink("analysis", "/analysis");
+                exchange.getResponseHeaders().set("Location", "/jobs/" + job.getId());
+                sendJsonResponse(exchange, jobBuilder.build(), 202);
                 
             } else {
                 sendErrorResponse(exchange, 405, "Method Not Allowed");
@@ -110,4 +109,49 @@ public class AnalysisEndpoints extends AbstractEndpoint {
             sendErrorResponse(exchange, 500, "Internal server error: " + e.getMessage());
         }
     }
+
+    /**
+     * Queue a job that re-runs auto-analysis over the whole program.
+     *
+     * Each request parameter naming a boolean analyzer option (e.g. "Stack": "false")
+     * sets that option first; other parameters are reported back as ignored. The
+     * job's message follows the analyzer currently running.
+     */
+    private JobManager.Job startAnalysisJob(Program program, Map<String, String> params) {
+        return JobManager.getInstance().submit("analysis", "Auto-analysis of " + program.getName(), monitor -> {
+            List<String> applied = new ArrayList<>();
+            List<String> ignored = new ArrayList<>();
+            long started = System.currentTimeMillis();
+
+            // Whatever analysis completed is kept, even if the job is cancelled part way
+            int txId = program.startTransaction("MCP auto-analysis");
+            try {
+                Options analyzerOptions = program.getOptions(Program.ANALYSIS_PROPERTIES);
+                for (Map.Entry<String, String> option : params.entrySet()) {
+                    if (analyzerOptions.getType(option.getKey()) == OptionType.BOOLEAN_TYPE) {
+                        analyzerOptions.setBoolean(option.getKey(), Boolean.parseBoolean(option.getValue()));
+                        applied.add(option.getKey());
+                    } else {
+                        ignored.add(option.getKey());
+                    }
+                }
+
+                AutoAnalysisManager manager = AutoAnalysisManager.getAnalysisManager(program);
+                manager.initializeOptions();
+                manager.reAnalyzeAll(null);
+                manager.startAnalysis(monitor);
+            } finally {
+                program.endTransaction(txId, true);
+            }
+            monitor.checkCancelled();
+
+            Map<String, Object> result = new HashMap<>();
+            result.put("program", program.getName());
+            result.put("functionCount", program.getFunctionManager().getFunctionCount());
+            result.put("appliedOptions", applied);
+            result.put("ignoredOptions", ignored);
+            result.put("elapsedMs", System.currentTimeMillis() - started);
+            return result;
+        });
+    }
 }
\ No newline at end of file
@@ -13,7 +13,6 @@ package eu.starsong.ghidra.endpoints;
     import ghidra.program.model.listing.DataIterator;
     import ghidra.program.model.listing.Listing;
     import ghidra.program.model.listing.Program;
-    import ghidra.program.model.mem.MemoryBlock;
     import ghidra.program.model.symbol.SourceType;
     import ghidra.program.model.symbol.Symbol;
     import ghidra.program.model.symbol.SymbolTable;
@@ -213,42 +212,48 @@ package eu.starsong.ghidra.endpoints;
                     return;
                 }
                 
-                List<Map<String, Object>> dataItems = new ArrayList<>();
-                for (MemoryBlock block : program.getMemory().getBlocks()) {
-                    DataIterator it = program.getListing().getDefinedData(block.getStart(), true);
-                    while (it.hasNext()) {
-                        Data data = it.next();
-                        if (block.contains(data.getAddress())) {
-                            // Apply addr filter if present
-                            String addrFilter = qparams.get("addr");
-                            if (addrFilter != null && !data.getAddress().toString().equals(addrFilter)) {
-                                continue; // Skip this data item if address doesn't match filter
-                            }
-
-                            Map<String, Object> item = new HashMap<>();
-                            item.put("address", data.getAddress().toString());
-                            item.put("label", data.getLabel() != null ? data.getLabel() : "(unnamed)");
-                            item.put("value", data.getDefaultValueRepresentation());
-                            item.put("dataType", data.getDataType().getName());
-                            
-                            // Add HATEOAS links
-                            Map<String, Object> links = new HashMap<>();
-                            Map<String, String> selfLink = new HashMap<>();
-                            selfLink.put("href", "/data/" + data.getAddress().toString());
-                            links.put("self", selfLink);
-                            item.put("_links", links);
-                            
-                            dataItems.add(item);
-                        }
-                    }
+                PageCursor cursor;
+                try {
+                    cursor = parseCursor(program, qparams);
+                } catch (IllegalArgumentException e) {
+                    sendErrorResponse(exchange, 400, e.getMessage(), "INVALID_PARAMETER");
+                    return;
                 }
                 
+                // One pass over defined data in address order, resuming at the cursor if given
+                DataIterator it = (cursor != null && cursor.address != null)
+                    ? program.getListing().getDefinedData(cursor.address, true)
+                    : program.getListing().getDefinedData(true);
+                
+                // Apply addr filter if present
+                String addrFilter = qparams.get("addr");
+                
                 // Build response with HATEOAS links
                 eu.starsong.ghidra.api.ResponseBuilder builder = new eu.starsong.ghidra.api.ResponseBuilder(exchange, port)
                     .success(true);
                 
-                // Apply pagination and get paginated items
-                List<Map<String, Object>> paginated = applyPagination(dataItems, offset, limit, builder, "/data");
+                // Build only the data items on the requested page
+                List<Map<String, Object>> paginated = applyKeysetPagination(it, cursor, offset, limit,
+                    addrFilter != null ? data -> data.getAddress().toString().equals(addrFilter) : null,
+                    Data::getAddress, data -> {
+                        Map<String, Object> item = new HashMap<>();
+                        item.put("address", data.getAddress().toString());
+                        item.put("label", data.getLabel() != null ? data.getLabel() : "(unnamed)");
+                        item.put("value", data.getDefaultValueRepresentation());
+                        item.put("dataType", data.getDataType().getName());
+                        if (builder.isLean()) {
+                            return item;
+                        }
+                        
+                        // Add HATEOAS links
+                        Map<String, Object> links = new HashMap<>();
+                        Map<String, String> selfLink = new HashMap<>();
+                        selfLink.put("href", "/data/" + data.getAddress().toString());
+                        links.put("self", selfLink);
+                        item.put("_links", links);
+                        return item;
+                    },
+                    builder, "/data", addrFilter != null ? "addr=" + addrFilter : null);
                 
                 // Set the paginated result
                 builder.result(paginated);
@@ -1351,7 +1356,8 @@ package eu.starsong.ghidra.endpoints;
         
         /**
          * Handle request to list strings in the binary.
-         * Uses StringCacheManager for O(1) pagination on cached data.
+         * Uses StringCacheManager for O(1) pagination on cached data;
+         * cursor pages binary search the address-ordered cache instead.
          */
         public void handleListStrings(HttpExchange exchange) throws IOException {
             try {
@@ -1367,9 +1373,35 @@ package eu.starsong.ghidra.endpoints;
                     return;
                 }
 
+                PageCursor cursor;
+                try {
+                    cursor = parseCursor(program, qparams);
+                } catch (IllegalArgumentException e) {
+                    sendErrorResponse(exchange, 400, e.getMessage(), "INVALID_PARAMETER");
+                    return;
+                }
+
                 // Get or build cached string list (thread-safe, auto-invalidates on program change)
                 List<StringInfo> allStrings = stringCache.getOrBuild(program);
 
+                eu.starsong.ghidra.api.ResponseBuilder builder = new eu.starsong.ghidra.api.ResponseBuilder(exchange, port)
+                    .success(true);
+
+                if (cursor != null) {
+                    // Keyset page: binary search the address-ordered cache for the cursor
+                    int start = cursor.address != null ? firstStringAtOrAfter(allStrings, cursor.address) : 0;
+                    List<Map<String, Object>> strings = applyKeysetPagination(
+                        allStrings.listIterator(start), cursor, 0, limit,
+                        filterLower != null ? si -> si.getValueLower().contains(filterLower) : null,
+                        StringInfo::getAddressValue, si -> stringItem(si, builder.isLean()),
+                        builder, "/strings", filter != null ? "filter=" + filter : null);
+                    builder.result(strings);
+                    builder.addLink("program", "/program");
+                    builder.addLink("data", "/data");
+                    sendJsonResponse(exchange, builder.build(), 200);
+                    return;
+                }
+
                 // Apply filter if present
                 List<StringInfo> matched;
                 if (filterLower != null) {
@@ -1393,30 +1425,9 @@ package eu.starsong.ghidra.endpoints;
                 // Convert to response maps
                 List<Map<String, Object>> strings = new ArrayList<>(page.size());
                 for (StringInfo si : page) {
-                    Map<String, Object> item = new HashMap<>();
-                    item.put("address", si.getAddress());
-                    item.put("value", si.getValue());
-                    item.put("length", si.getLength());
-                    item.put("type", si.getTypeName());
-                    item.put("name", si.getSymbolName());
-
-                    Map<String, Object> links = new HashMap<>();
-                    Map<String, String> selfLink = new HashMap<>();
-                    selfLink.put("href", "/data/" + si.getAddress());
-                    links.put("self", selfLink);
-
-                    Map<String, String> memoryLink = new HashMap<>();
-                    memoryLink.put("href", "/memory?address=" + si.getAddress());
-                    links.put("memory", memoryLink);
-
-                    item.put("_links", links);
-                    strings.add(item);
+                    strings.add(stringItem(si, builder.isLean()));
                 }
 
-                // Build response with pagination metadata
-                eu.starsong.ghidra.api.ResponseBuilder builder = new eu.starsong.ghidra.api.ResponseBuilder(exchange, port)
-                    .success(true);
-
                 builder.result(strings);
 
                 // Pagination metadata
@@ -1445,6 +1456,47 @@ package eu.starsong.ghidra.endpoints;
             }
         }
 
+        private Map<String, Object> stringItem(StringInfo si, boolean lean) {
+            Map<String, Object> item = new HashMap<>();
+            item.put("address", si.getAddress());
+            item.put("value", si.getValue());
+            item.put("length", si.getLength());
+            item.put("type", si.getTypeName());
+            item.put("name", si.getSymbolName());
+            if (lean) {
+                return item;
+            }
+
+            Map<String, Object> links = new HashMap<>();
+            Map<String, String> selfLink = new HashMap<>();
+            selfLink.put("href", "/data/" + si.getAddress());
+            links.put("self", selfLink);
+
+            Map<String, String> memoryLink = new HashMap<>();
+            memoryLink.put("href", "/memory?address=" + si.getAddress());
+            links.put("memory", memoryLink);
+
+            item.put("_links", links);
+            return item;
+        }
+
+        /**
+         * Index of the first cached string at or after an address (the cache is in address order).
+         */
+        private static int firstStringAtOrAfter(List<StringInfo> strings, Address address) {
+            int low = 0;
+            int high = strings.size();
+            while (low < high) {
+                int mid = (low + high) >>> 1;
+                if (strings.get(mid).getAddressValue().compareTo(address) < 0) {
+                    low = mid + 1;
+                } else {
+                    high = mid;
+                }
+            }
+            return low;
+        }
+
         /**
          * Handle GET /strings/cache/status - returns cache debug info.
          */
@@ -1,13 +1,19 @@
 package eu.starsong.ghidra.endpoints;
 
+import com.google.gson.JsonArray;
+import com.google.gson.JsonElement;
 import com.google.gson.JsonObject;
+import com.google.gson.JsonParser;
 import com.sun.net.httpserver.HttpExchange;
 import com.sun.net.httpserver.HttpServer;
 import eu.starsong.ghidra.api.ResponseBuilder;
 import eu.starsong.ghidra.model.FunctionInfo;
+import eu.starsong.ghidra.util.DecompileCache;
+import eu.starsong.ghidra.util.DecompilerPool;
 import eu.starsong.ghidra.util.GhidraUtil;
+import eu.starsong.ghidra.util.HttpUtil;
+import eu.starsong.ghidra.util.RequestMonitor;
 import eu.starsong.ghidra.util.TransactionHelper;
-import ghidra.app.decompiler.DecompInterface;
 import ghidra.app.decompiler.DecompileResults;
 import ghidra.framework.plugintool.PluginTool;
 import ghidra.program.model.address.Address;
@@ -21,13 +27,25 @@ import ghidra.program.model.pcode.HighSymbol;
 import ghidra.program.model.symbol.SourceType;
 import ghidra.util.Msg;
 import ghidra.util.task.ConsoleTaskMonitor;
+import ghidra.util.task.TaskMonitor;
 
 import java.util.ArrayList;
+import java.util.Collections;
 import java.util.HashMap;
 import java.util.Iterator;
+import java.util.LinkedHashMap;
 import java.util.List;
 import java.util.Map;
+import java.util.concurrent.BlockingQueue;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Future;
+import java.util.concurrent.LinkedBlockingQueue;
+import java.util.concurrent.RejectedExecutionException;
+import java.util.concurrent.atomic.AtomicInteger;
+import java.util.function.Predicate;
+import java.util.regex.Pattern;
 import java.io.IOException;
+import java.io.OutputStream;
 import java.net.URLDecoder;
 import java.nio.charset.StandardCharsets;
 
@@ -37,6 +55,9 @@ import java.nio.charset.StandardCharsets;
  */
 public class FunctionEndpoints extends AbstractEndpoint {
 
+    /** Upper bound on the number of functions accepted by one batch decompile request */
+    private static final int MAX_BATCH_SIZE = 1000;
+
     private PluginTool tool;
 
     public FunctionEndpoints(Program program, int port) {
@@ -59,6 +80,7 @@ public class FunctionEndpoints extends AbstractEndpoint {
         
         // Specifically handle sub-resource endpoints first (these are the most specific)
         server.createContext("/functions/by-name/", this::handleFunctionByName);
+        server.createContext("/functions/decompile-batch", this::handleDecompileBatch);
         
         // Then handle address-based endpoints with clear pattern matching
         server.createContext("/functions/", this::handleFunctionByAddress);
@@ -218,10 +240,6 @@ public class FunctionEndpoints extends AbstractEndpoint {
                 Map<String, String> params = parseQueryParams(exchange);
                 int offset = parseIntOrDefault(params.get("offset"), 0);
                 int limit = parseIntOrDefault(params.get("limit"), 100);
-                String nameFilter = params.get("name");
-                String nameContainsFilter = params.get("name_contains");
-                String nameRegexFilter = params.get("name_matches_regex");
-                String addrFilter = params.get("addr");
                 
                 Program program = getCurrentProgram();
                 if (program == null) {
@@ -229,99 +247,53 @@ public class FunctionEndpoints extends AbstractEndpoint {
                     return;
                 }
                 
-                List<Map<String, Object>> functions = new ArrayList<>();
-                
-                // Get all functions
-                for (Function f : program.getFunctionManager().getFunctions(true)) {
-                    // Apply filters
-                    if (nameFilter != null && !f.getName().equals(nameFilter)) {
-                        continue;
-                    }
-                    
-                    if (nameContainsFilter != null && !f.getName().toLowerCase().contains(nameContainsFilter.toLowerCase())) {
-                        continue;
-                    }
-                    
-                    if (nameRegexFilter != null && !f.getName().matches(nameRegexFilter)) {
-                        continue;
-                    }
-                    
-                    if (addrFilter != null && !f.getEntryPoint().toString().equals(addrFilter)) {
-                        continue;
-                    }
-                    
-                    Map<String, Object> func = new HashMap<>();
-                    func.put("name", f.getName());
-                    func.put("address", f.getEntryPoint().toString());
-                    
-                    // Add HATEOAS links
-                    Map<String, Object> links = new HashMap<>();
-                    Map<String, String> selfLink = new HashMap<>();
-                    selfLink.put("href", "/programs/current/functions/" + f.getEntryPoint());
-                    links.put("self", selfLink);
-                    
-                    Map<String, String> byNameLink = new HashMap<>();
-                    byNameLink.put("href", "/programs/current/functions/by-name/" + f.getName());
-                    links.put("by_name", byNameLink);
-                    
-                    Map<String, String> decompileLink = new HashMap<>();
-                    decompileLink.put("href", "/programs/current/functions/" + f.getEntryPoint() + "/decompile");
-                    links.put("decompile", decompileLink);
-                    
-                    func.put("_links", links);
-                    
-                    functions.add(func);
+                PageCursor cursor;
+                Predicate<Function> filter;
+                try {
+                    cursor = parseCursor(program, params);
+                    filter = functionFilter(params);
+                } catch (IllegalArgumentException e) {
+                    sendErrorResponse(exchange, 400, e.getMessage(), "INVALID_PARAMETER");
+                    return;
                 }
                 
-                // Apply pagination
-                int endIndex = Math.min(functions.size(), offset + limit);
-                List<Map<String, Object>> paginatedFunctions = offset < functions.size() 
-                    ? functions.subList(offset, endIndex) 
-                    : new ArrayList<>();
-                
-                // Build response with pagination links
                 ResponseBuilder builder = new ResponseBuilder(exchange, port)
-                    .success(true)
-                    .result(paginatedFunctions);
-                
-                // Add pagination metadata
-                Map<String, Object> metadata = new HashMap<>();
-                metadata.put("size", functions.size());
-                metadata.put("offset", offset);
-                metadata.put("limit", limit);
-                builder.metadata(metadata);
-                
-                // Add query parameters for self link
-                StringBuilder queryParams = new StringBuilder();
-                if (nameFilter != null) {
-                    queryParams.append("name=").append(nameFilter).append("&");
-                }
-                if (nameContainsFilter != null) {
-                    queryParams.append("name_contains=").append(nameContainsFilter).append("&");
-                }
-                if (nameRegexFilter != null) {
-                    queryParams.append("name_matches_regex=").append(nameRegexFilter).append("&");
-                }
-                if (addrFilter != null) {
-                    queryParams.append("addr=").append(addrFilter).append("&");
-                }
+                    .success(true);
                 
-                String queryString = queryParams.toString();
+                // Build only the requested page, resuming from the cursor address if given
+                List<Map<String, Object>> paginatedFunctions = applyKeysetPagination(
+                    functionIterator(program, cursor), cursor, offset, limit,
+                    filter, Function::getEntryPoint, f -> {
+                        Map<String, Object> func = new HashMap<>();
+                        func.put("name", f.getName());
+                        func.put("address", f.getEntryPoint().toString());
+                        
+                        if (builder.isLean()) {
+                            return func;
+                        }
+                        
+                        // Add HATEOAS links
+                        Map<String, Object> links = new HashMap<>();
+                        Map<String, String> selfLink = new HashMap<>();
+                        selfLink.put("href", "/programs/current/functions/" + f.getEntryPoint());
+                        links.put("self", selfLink);
+                        
+                        Map<String, String> byNameLink = new HashMap<>();
+                        byNameLink.put("href", "/programs/current/functions/by-name/" + f.getName());
+                        links.put("by_name", byNameLink);
+                        
+                        Map<String, String> decompileLink = new HashMap<>();
+                        decompileLink.put("href", "/programs/current/functions/" + f.getEntryPoint() + "/decompile");
+                        links.put("decompile", decompileLink);
+                        
+                        func.put("_links", links);
+                        return func;
+                    },
+                    builder, "/programs/current/functions", functionFilterQuery(params));
                 
-                // Add HATEOAS links
-                builder.addLink("self", "/programs/current/functions?" + queryString + "offset=" + offset + "&limit=" + limit);
+                builder.result(paginatedFunctions);
                 builder.addLink("program", "/programs/current");
                 
-                // Add next/prev links if applicable
-                if (endIndex < functions.size()) {
-                    builder.addLink("next", "/programs/current/functions?" + queryString + "offset=" + endIndex + "&limit=" + limit);
-                }
-                
-                if (offset > 0) {
-                    int prevOffset = Math.max(0, offset - limit);
-                    builder.addLink("prev", "/programs/current/functions?" + queryString + "offset=" + prevOffset + "&limit=" + limit);
-                }
-                
                 // Add link to create a new function
                 builder.addLink("create", "/programs/current/functions", "POST");
                 
@@ -338,6 +310,63 @@ public class FunctionEndpoints extends AbstractEndpoint {
         }
     }
     
+    /**
+     * Functions in entry point order, starting at the cursor address if there is one.
+     */
+    private Iterator<Function> functionIterator(Program program, PageCursor cursor) {
+        if (cursor != null && cursor.address != null) {
+            return program.getFunctionManager().getFunctions(cursor.address, true);
+        }
+        return program.getFunctionManager().getFunctions(true);
+    }
+    
+    /**
+     * Predicate for the name, name_contains, name_matches_regex and addr list filters, or null if none are set.
+     *
+     * @throws IllegalArgumentException if name_matches_regex is not a valid pattern
+     */
+    private Predicate<Function> functionFilter(Map<String, String> params) {
+        String nameFilter = params.get("name");
+        String nameContainsFilter = params.get("name_contains");
+        String nameRegexFilter = params.get("name_matches_regex");
+        String addrFilter = params.get("addr");
+        if (nameFilter == null && nameContainsFilter == null && nameRegexFilter == null && addrFilter == null) {
+            return null;
+        }
+        String containsLower = nameContainsFilter != null ? nameContainsFilter.toLowerCase() : null;
+        Pattern regex = nameRegexFilter != null ? Pattern.compile(nameRegexFilter) : null;
+        return f -> {
+            String name = f.getName();
+            if (nameFilter != null && !name.equals(nameFilter)) {
+                return false;
+            }
+            if (containsLower != null && !name.toLowerCase().contains(containsLower)) {
+                return false;
+            }
+            if (regex != null && !regex.matcher(name).matches()) {
+                return false;
+            }
+            return addrFilter == null || f.getEntryPoint().toString().equals(addrFilter);
+        };
+    }
+    
+    /**
+     * Query string repeating the list filters in pagination links.
+     */
+    private String functionFilterQuery(Map<String, String> params) {
+        StringBuilder queryParams = new StringBuilder();
+        for (String key : new String[] {"name", "name_contains", "name_matches_regex", "addr"}) {
+            String value = params.get(key);
+            if (value != null) {
+                if (queryParams.length() > 0) {
+                    queryParams.append("&");
+                }
+                queryParams.append(key).append("=").append(value);
+            }
+        }
+        return queryParams.toString();
+    }
+    
     /**
      * Handle requests to function resources like /programs/current/functions/{address}/decompile
      */
@@ -614,81 +643,48 @@ public class FunctionEndpoints extends AbstractEndpoint {
                 Map<String, String> params = parseQueryParams(exchange);
                 int offset = parseIntOrDefault(params.get("offset"), 0);
                 int limit = parseIntOrDefault(params.get("limit"), 100);
-                String nameFilter = params.get("name");
-                String nameContainsFilter = params.get("name_contains");
-                String nameRegexFilter = params.get("name_matches_regex");
-                String addrFilter = params.get("addr");
                 
-                List<Map<String, Object>> functions = new ArrayList<>();
-                
-                // Get all functions
-                for (Function f : program.getFunctionManager().getFunctions(true)) {
-                    // Apply filters
-                    if (nameFilter != null && !f.getName().equals(nameFilter)) {
-                        continue;
-                    }
-                    
-                    if (nameContainsFilter != null && !f.getName().toLowerCase().contains(nameContainsFilter.toLowerCase())) {
-                        continue;
-                    }
-                    
-                    if (nameRegexFilter != null && !f.getName().matches(nameRegexFilter)) {
-                        continue;
-                    }
-                    
-                    if (addrFilter != null && !f.getEntryPoint().toString().equals(addrFilter)) {
-                        continue;
-                    }
-                    
-                    Map<String, Object> func = new HashMap<>();
-                    func.put("name", f.getName());
-                    func.put("address", f.getEntryPoint().toString());
-                    
-                    // Add HATEOAS links (fixed to use proper URL paths)
-                    Map<String, Object> links = new HashMap<>();
-                    Map<String, String> selfLink = new HashMap<>();
-                    selfLink.put("href", "/functions/" + f.getEntryPoint());
-                    links.put("self", selfLink);
-                    
-                    Map<String, String> programLink = new HashMap<>();
-                    programLink.put("href", "/program");
-                    links.put("program", programLink);
-                    
-                    func.put("_links", links);
-                    
-                    functions.add(func);
+                PageCursor cursor;
+                Predicate<Function> filter;
+                try {
+                    cursor = parseCursor(program, params);
+                    filter = functionFilter(params);
+                } catch (IllegalArgumentException e) {
+                    sendErrorResponse(exchange, 400, e.getMessage(), "INVALID_PARAMETER");
+                    return;
                 }
                 
-                // Apply pagination
-                int endIndex = Math.min(functions.size(), offset + limit);
-                List<Map<String, Object>> paginatedFunctions = offset < functions.size() 
-                    ? functions.subList(offset, endIndex) 
-                    : new ArrayList<>();
-                
-                // Build response with pagination links
                 ResponseBuilder builder = new ResponseBuilder(exchange, port)
-                    .success(true)
-                    .result(paginatedFunctions);
-                
-                // Add pagination metadata
-                Map<String, Object> metadata = new HashMap<>();
-                metadata.put("size", functions.size());
-                metadata.put("offset", offset);
-                metadata.put("limit", limit);
-                builder.metadata(metadata);
+                    .success(true);
                 
-                // Add HATEOAS links
-                builder.addLink("self", "/functions?offset=" + offset + "&limit=" + limit);
-                
-                // Add next/prev links if applicable
-                if (endIndex < functions.size()) {
-                    builder.addLink("next", "/functions?offset=" + endIndex + "&limit=" + limit);
-                }
+                // Build only the requested page, resuming from the cursor address if given
+                List<Map<String, Object>> paginatedFunctions = applyKeysetPagination(
+                    functionIterator(program, cursor), cursor, offset, limit,
+                    filter, Function::getEntryPoint, f -> {
+                        Map<String, Object> func = new HashMap<>();
+                        func.put("name", f.getName());
+                        func.put("address", f.getEntryPoint().toString());
+                        
+                        if (builder.isLean()) {
+                            return func;
+                        }
+                        
+                        // Add HATEOAS links (fixed to use proper URL paths)
+                        Map<String, Object> links = new HashMap<>();
+                        Map<String, String> selfLink = new HashMap<>();
+                        selfLink.put("href", "/functions/" + f.getEntryPoint());
+                        links.put("self", selfLink);
+                        
+                        Map<String, String> programLink = new HashMap<>();
+                        programLink.put("href", "/program");
+                        links.put("program", programLink);
+                        
+                        func.put("_links", links);
+                        return func;
+                    },
+                    builder, "/functions", functionFilterQuery(params));
                 
-                if (offset > 0) {
-                    int prevOffset = Math.max(0, offset - limit);
-                    builder.addLink("prev", "/functions?offset=" + prevOffset + "&limit=" + limit);
-                }
+                builder.result(paginatedFunctions);
                 
                 // Add link to create a new function
                 builder.addLink("create", "/functions", "POST");
@@ -1089,15 +1085,31 @@ public class FunctionEndpoints extends AbstractEndpoint {
             boolean syntaxTree = Boolean.parseBoolean(params.getOrDefault("syntax_tree", "false"));
             String style = params.getOrDefault("style", "normalize");
             String format = params.getOrDefault("format", "structured");
-            int timeout = parseIntOrDefault(params.get("timeout"), 30);
+            int timeout = HttpUtil.decompileTimeout(exchange,
+                parseIntOrDefault(params.get("timeout"), DecompilerPool.DEFAULT_TIMEOUT_SECONDS));
+            if (timeout <= 0) {
+                sendErrorResponse(exchange, 504, "Client deadline passed before decompiling", "DEADLINE_EXCEEDED");
+                return;
+            }
 
             // Line filtering parameters for context management
             int startLine = parseIntOrDefault(params.get("start_line"), -1);
             int endLine = parseIntOrDefault(params.get("end_line"), -1);
             int maxLines = parseIntOrDefault(params.get("max_lines"), -1);
 
-            // Decompile function
-            String decompilation = GhidraUtil.decompileFunction(function);
+            // Decompile function; the client can cancel it by request ID
+            String decompilation;
+            try (RequestMonitor monitor = RequestMonitor.open(exchange)) {
+                decompilation = GhidraUtil.decompileFunction(function, timeout,
+                    HttpUtil.remainingMillis(exchange), monitor);
+                if (monitor.isCancelled()) {
+                    sendErrorResponse(exchange, 499, "Request cancelled by client", "REQUEST_CANCELLED");
+                    return;
+                }
+            } catch (DecompilerPool.BusyException e) {
+                sendErrorResponse(exchange, 503, e.getMessage() + ", try again later", "DECOMPILER_BUSY");
+                return;
+            }
 
             // Apply line filtering if requested
             String filteredDecompilation = decompilation;
@@ -1176,6 +1188,252 @@ public class FunctionEndpoints extends AbstractEndpoint {
         }
     }
 
+    /**
+     * Handle POST /functions/decompile-batch.
+     *
+     * Body: {"functions": ["main", "0x401000", ...], "timeout": 30, "workers": 4}
+     *
+     * Functions are decompiled in parallel by workers on the pool's shared
+     * batch executor, each item with its own pooled decompiler session (none on a
+     * decompile cache hit). A failed or timed-out item is
+     * reported in place and does not fail the batch. When the client accepts
+     * application/x-ndjson, each item is written as one JSON line as soon as it
+     * completes, followed by a summary line; otherwise a single response with
+     * the items in request order is sent.
+     */
+    public void handleDecompileBatch(HttpExchange exchange) throws IOException {
+        try {
+            if (!"POST".equals(exchange.getRequestMethod())) {
+                sendErrorResponse(exchange, 405, "Method Not Allowed", "METHOD_NOT_ALLOWED");
+                return;
+            }
+
+            Program program = getCurrentProgram();
+            if (program == null) {
+                sendErrorResponse(exchange, 503, "No program is currently loaded", "NO_PROGRAM_LOADED");
+                return;
+            }
+
+            Map<String, String> params = parseJsonPostParams(exchange);
+            List<String> idents = new ArrayList<>();
+            try {
+                JsonArray functions = JsonParser.parseString(params.getOrDefault("functions", "[]")).getAsJsonArray();
+                for (JsonElement element : functions) {
+                    idents.add(element.getAsString());
+                }
+            } catch (Exception e) {
+                sendErrorResponse(exchange, 400, "'functions' must be a list of function names or addresses", "INVALID_PARAMETER");
+                return;
+            }
+            if (idents.isEmpty()) {
+                sendErrorResponse(exchange, 400, "'functions' must not be empty", "MISSING_PARAMETER");
+                return;
+            }
+            if (idents.size() > MAX_BATCH_SIZE) {
+                sendErrorResponse(exchange, 400, "At most " + MAX_BATCH_SIZE + " functions per batch", "INVALID_PARAMETER");
+                return;
+            }
+
+            int timeout = parseIntOrDefault(params.get("timeout"), DecompilerPool.DEFAULT_TIMEOUT_SECONDS);
+            int cpus = Runtime.getRuntime().availableProcessors();
+            int workers = parseIntOrDefault(params.get("workers"), cpus);
+            workers = Math.max(1, Math.min(Math.min(workers, cpus), idents.size()));
+
+            String accept = exchange.getRequestHeaders().getFirst("Accept");
+            boolean stream = accept != null && accept.contains("application/x-ndjson");
+
+            HttpUtil.remainingMillis(exchange); // fix the client's deadline before the workers read it
+            RequestMonitor monitor = RequestMonitor.open(exchange);
+            BlockingQueue<Map<String, Object>> completed = new LinkedBlockingQueue<>();
+            AtomicInteger next = new AtomicInteger();
+            Runnable worker = () -> {
+                int index;
+                while ((index = next.getAndIncrement()) < idents.size()) {
+                    String ident = idents.get(index);
+                    int itemTimeout = HttpUtil.decompileTimeout(exchange, timeout);
+                    if (monitor.isCancelled()) {
+                        completed.add(batchItemError(index, ident, "REQUEST_CANCELLED",
+                            "Batch cancelled before this function was decompiled"));
+                    } else if (itemTimeout <= 0) {
+                        completed.add(batchItemError(index, ident, "DEADLINE_EXCEEDED",
+                            "Client deadline passed before this function was decompiled"));
+                    } else {
+                        completed.add(decompileBatchItem(index, ident, itemTimeout,
+                            HttpUtil.remainingMillis(exchange), monitor));
+                    }
+                }
+            };
+
+            List<Future<?>> started = new ArrayList<>();
+            ExecutorService executor = DecompilerPool.getInstance().getBatchExecutor();
+            for (int w = 0; w < workers; w++) {
+                try {
+                    started.add(executor.submit(worker));
+                } catch (RejectedExecutionException e) {
+                    break; // the workers already queued get through the whole batch
+                }
+            }
+            if (started.isEmpty()) {
+                monitor.close();
+                sendErrorResponse(exchange, 503, "Too many batch decompiles in progress, try again later", "INSTANCE_BUSY");
+                return;
+            }
+
+            boolean delivered = false;
+            try {
+                if (stream) {
+                    streamBatchResults(exchange, completed, idents.size());
+                } else {
+                    sendBatchResults(exchange, completed, idents.size());
+                }
+                delivered = true;
+            } finally {
+                if (!delivered) {
+                    // The client went away: stop the workers still queued or running
+                    for (Future<?> future : started) {
+                        future.cancel(false);
+                    }
+                    monitor.cancel();
+                }
+                monitor.close();
+            }
+        } catch (Exception e) {
+            Msg.error(this, "Error handling /functions/decompile-batch endpoint", e);
+            sendErrorResponse(exchange, 500, "Internal Server Error: " + e.getMessage(), "INTERNAL_ERROR");
+        }
+    }
+
+    /**
+     * Decompile one batch item, checking out a pooled decompiler session only for as long as it takes
+     * and waiting at most {@code waitMillis} for one.
+     */
+    private Map<String, Object> decompileBatchItem(int index, String ident, int timeout, long waitMillis,
+            TaskMonitor monitor) {
+        Function function;
+        try {
+            function = findFunctionByAddress(ident);
+            if (function == null) {
+                function = findFunctionByName(ident);
+            }
+        } catch (Exception e) {
+            return batchItemError(index, ident, "DECOMPILE_ERROR", e.getMessage());
+        }
+        if (function == null) {
+            return batchItemError(index, ident, "FUNCTION_NOT_FOUND", "Function not found: " + ident);
+        }
+
+        try {
+            DecompileResults results = DecompileCache.getInstance().getOrDecompile(function, timeout, waitMillis,
+                monitor);
+            if (!results.decompileCompleted()) {
+                String code = monitor.isCancelled() ? "REQUEST_CANCELLED"
+                    : results.isTimedOut() ? "DECOMPILE_TIMEOUT" : "DECOMPILE_FAILED";
+                return batchItemError(index, ident, code, "Decompilation failed for " + function.getName()
+                    + ": " + results.getErrorMessage());
+            }
+
+            Map<String, Object> functionInfo = new HashMap<>();
+            functionInfo.put("address", function.getEntryPoint().toString());
+            functionInfo.put("name", function.getName());
+
+            Map<String, Object> result = new HashMap<>();
+            result.put("function", functionInfo);
+            result.put("decompiled", results.getDecompiledFunction().getC());
+
+            Map<String, Object> item = new LinkedHashMap<>();
+            item.put("index", index);
+            item.put("query", ident);
+            item.put("success", true);
+            item.put("result", result);
+            return item;
+        } catch (DecompilerPool.BusyException e) {
+            return batchItemError(index, ident, "DECOMPILER_BUSY", e.getMessage());
+        } catch (Exception e) {
+            Msg.error(this, "Error during batch decompilation of " + function.getName(), e);
+            return batchItemError(index, ident, "DECOMPILE_ERROR", e.getMessage());
+        }
+    }
+
+    private Map<String, Object> batchItemError(int index, String ident, String code, String message) {
+        Map<String, Object> error = new HashMap<>();
+        error.put("code", code);
+        error.put("message", message);
+
+        Map<String, Object> item = new LinkedHashMap<>();
+        item.put("index", index);
+        item.put("query", ident);
+        item.put("success", false);
+        item.put("error", error);
+        return item;
+    }
+
+    private Map<String, Object> batchSummary(int total, int succeeded) {
+        Map<String, Object> summary = new LinkedHashMap<>();
+        summary.put("total", total);
+        summary.put("succeeded", succeeded);
+        summary.put("failed", total - succeeded);
+        return summary;
+    }
+
+    /**
+     * Wait for every batch item and send them in request order as one response.
+     */
+    private void sendBatchResults(HttpExchange exchange, BlockingQueue<Map<String, Object>> completed, int total)
+            throws IOException, InterruptedException {
+        List<Map<String, Object>> items = new ArrayList<>(Collections.nCopies(total, null));
+        int succeeded = 0;
+        for (int i = 0; i < total; i++) {
+            Map<String, Object> item = completed.take();
+            items.set((Integer) item.get("index"), item);
+            if (Boolean.TRUE.equals(item.get("success"))) {
+                succeeded++;
+            }
+        }
+
+        Map<String, Object> result = batchSummary(total, succeeded);
+        result.put("items", items);
+
+        ResponseBuilder builder = new ResponseBuilder(exchange, port)
+            .success(true)
+            .result(result);
+        builder.addLink("self", "/functions/decompile-batch", "POST");
+        builder.addLink("functions", "/functions");
+        builder.addLink("program", "/program");
+        sendJsonResponse(exchange, builder.build(), 200);
+    }
+
+    /**
+     * Write batch items as newline-delimited JSON in completion order, then a summary line.
+     */
+    private void streamBatchResults(HttpExchange exchange, BlockingQueue<Map<String, Object>> completed, int total)
+            throws IOException, InterruptedException {
+        addProgramStateHeaders(exchange);
+        HttpUtil.addCorsHeaders(exchange);
+        exchange.getResponseHeaders().set("Content-Type", "application/x-ndjson; charset=utf-8");
+        boolean gzip = HttpUtil.acceptsGzip(exchange);
+        if (gzip) {
+            exchange.getResponseHeaders().set("Content-Encoding", "gzip");
+        }
+        exchange.sendResponseHeaders(200, 0);
+
+        int succeeded = 0;
+        try (OutputStream os = gzip
+                ? HttpUtil.gzipStream(exchange.getResponseBody(), true)
+                : exchange.getResponseBody()) {
+            for (int i = 0; i < total; i++) {
+                Map<String, Object> item = completed.take();
+                if (Boolean.TRUE.equals(item.get("success"))) {
+                    succeeded++;
+                }
+                os.write((gson.toJson(item) + "\n").getBytes(StandardCharsets.UTF_8));
+                os.flush();
+            }
+            Map<String, Object> summary = batchSummary(total, succeeded);
+            summary.put("done", true);
+            os.write((gson.toJson(summary) + "\n").getBytes(StandardCharsets.UTF_8));
+        }
+    }
+
     /**
      * Handle requests to disassemble a function
      */
@@ -1272,7 +1530,13 @@ public class FunctionEndpoints extends AbstractEndpoint {
      */
     public void handleFunctionVariables(HttpExchange exchange, Function function) throws IOException {
         if ("GET".equals(exchange.getRequestMethod())) {
-            List<Map<String, Object>> variables = GhidraUtil.getFunctionVariables(function);
+            List<Map<String, Object>> variables;
+            try {
+                variables = GhidraUtil.getFunctionVariables(function, HttpUtil.remainingMillis(exchange));
+            } catch (DecompilerPool.BusyException e) {
+                sendErrorResponse(exchange, 503, e.getMessage() + ", try again later", "DECOMPILER_BUSY");
+                return;
+            }
             
             Map<String, Object> functionInfo = new HashMap<>();
             functionInfo.put("address", function.getEntryPoint().toString());
@@ -1341,28 +1605,24 @@ public class FunctionEndpoints extends AbstractEndpoint {
             
             boolean success = TransactionHelper.executeInTransaction(program, "Update Variable", () -> {
                 try {
-                    // This requires a decompile operation to get the HighFunction
-                    DecompInterface decomp = new DecompInterface();
-                    try {
-                        decomp.openProgram(program);
-                        DecompileResults results = decomp.decompileFunction(function, 30, new ConsoleTaskMonitor());
-                        
-                        if (results.decompileCompleted()) {
-                            HighFunction highFunc = results.getHighFunction();
-                            if (highFunc != null) {
-                                // Find the variable in the high function
-                                for (Iterator<HighSymbol> symbolIter = highFunc.getLocalSymbolMap().getSymbols(); symbolIter.hasNext();) {
-                                    HighSymbol symbol = symbolIter.next();
-                                    if (symbol.getName().equals(variableName)) {
-                                        // Rename the variable using HighFunctionDBUtil
-                                        HighFunctionDBUtil.updateDBVariable(symbol, newName, null, SourceType.USER_DEFINED);
-                                        return true;
-                                    }
+                    // This requires a decompile operation to get the HighFunction. Use a fresh
+                    // result rather than the shared cache, since it is handed to a DB update.
+                    DecompileResults results = DecompilerPool.getInstance().decompile(function,
+                        DecompilerPool.DEFAULT_TIMEOUT_SECONDS, new ConsoleTaskMonitor());
+                    
+                    if (results.decompileCompleted()) {
+                        HighFunction highFunc = results.getHighFunction();
+                        if (highFunc != null) {
+                            // Find the variable in the high function
+                            for (Iterator<HighSymbol> symbolIter = highFunc.getLocalSymbolMap().getSymbols(); symbolIter.hasNext();) {
+                                HighSymbol symbol = symbolIter.next();
+                                if (symbol.getName().equals(variableName)) {
+                                    // Rename the variable using HighFunctionDBUtil
+                                    HighFunctionDBUtil.updateDBVariable(symbol, newName, null, SourceType.USER_DEFINED);
+                                    return true;
                                 }
                             }
                         }
-                    } finally {
-                        decomp.dispose();
                     }
                     return false;
                 } catch (Exception e) {
@@ -0,0 +1,118 @@
+package eu.starsong.ghidra.endpoints;
+
+import com.sun.net.httpserver.HttpExchange;
+import com.sun.net.httpserver.HttpServer;
+import eu.starsong.ghidra.api.ResponseBuilder;
+import eu.starsong.ghidra.util.JobManager;
+import ghidra.program.model.listing.Program;
+import ghidra.util.Msg;
+
+import java.io.IOException;
+import java.util.ArrayList;
+import java.util.List;
+import java.util.Map;
+
+/**
+ * Status, results and cancellation of background jobs.
+ *
+ * GET  /jobs                  all retained jobs, oldest first
+ * GET  /jobs/{id}             status and progress of one job
+ * GET  /jobs/{id}/result      result of a finished job
+ * POST /jobs/{id}/cancel      cancel a queued or running job
+ */
+public class JobEndpoints extends AbstractEndpoint {
+
+    public JobEndpoints(Program program, int port) {
+        super(program, port);
+    }
+
+    @Override
+    public void registerEndpoints(HttpServer server) {
+        server.createContext("/jobs", this::handleJobs);
+    }
+
+    @Override
+    protected boolean requiresProgram() {
+        return false;
+    }
+
+    /**
+     * Status of a job with its HATEOAS links, for this and other endpoints that start jobs.
+     */
+    public static ResponseBuilder jobResponse(HttpExchange exchange, int port, JobManager.Job job) {
+        String path = "/jobs/" + job.getId();
+        ResponseBuilder builder = new ResponseBuilder(exchange, port)
+            .success(true)
+            .result(job.toMap())
+            .addLink("self", path)
+            .addLink("jobs", "/jobs");
+        if (job.isFinished()) {
+            builder.addLink("result", path + "/result");
+        } else {
+            builder.addLink("cancel", path + "/cancel", "POST");
+        }
+        return builder;
+    }
+
+    private void handleJobs(HttpExchange exchange) throws IOException {
+        try {
+            String path = exchange.getRequestURI().getPath().replaceAll("/+$", "");
+            String method = exchange.getRequestMethod();
+
+            if (path.equals("/jobs")) {
+                if (!"GET".equals(method)) {
+                    sendErrorResponse(exchange, 405, "Method Not Allowed", "METHOD_NOT_ALLOWED");
+                    return;
+                }
+                List<Map<String, Object>> jobs = new ArrayList<>();
+                for (JobManager.Job job : JobManager.getInstance().list()) {
+                    jobs.add(job.toMap());
+                }
+                ResponseBuilder builder = new ResponseBuilder(exchange, port)
+                    .success(true)
+                    .result(jobs)
+                    .addLink("self", "/jobs");
+                sendJsonResponse(exchange, builder.build(), 200);
+                return;
+            }
+
+            String[] parts = path.substring("/jobs/".length()).split("/");
+            JobManager.Job job = JobManager.getInstance().get(parts[0]);
+            if (job == null) {
+                sendErrorResponse(exchange, 404, "Job not found (it may have aged out of the history): " + parts[0], "JOB_NOT_FOUND");
+                return;
+            }
+            String action = parts.length > 1 ? parts[1] : "";
+
+            if (action.isEmpty() && "GET".equals(method)) {
+                sendJsonResponse(exchange, jobResponse(exchange, port, job).build(), 200);
+            } else if (action.equals("result") && "GET".equals(method)) {
+                if (!job.isFinished()) {
+                    sendErrorResponse(exchange, 409, "Job " + job.getId() + " has not finished", "JOB_NOT_FINISHED");
+                    return;
+                }
+                Map<String, Object> status = job.toMap();
+                status.put("result", job.getResult());
+                ResponseBuilder builder = new ResponseBuilder(exchange, port)
+                    .success(true)
+                    .result(status)
+                    .addLink("self", "/jobs/" + job.getId() + "/result")
+                    .addLink("job", "/jobs/" + job.getId());
+                sendJsonResponse(exchange, builder.build(), 200);
+            } else if (action.equals("cancel") && "POST".equals(method)) {
+                if (!JobManager.getInstance().cancel(job)) {
+                    sendErrorResponse(exchange, 409, "Job " + job.getId() + " has already finished", "JOB_FINISHED");
+                    return;
+                }
+                sendJsonResponse(exchange, jobResponse(exchange, port, job).build(), 202);
+            } else if (action.isEmpty() || action.equals("result") || action.equals("cancel")) {
+                sendErrorResponse(exchange, 405, "Method Not Allowed", "METHOD_NOT_ALLOWED");
+            } else {
+                sendErrorResponse(exchange, 404, "Endpoint not found", "ENDPOINT_NOT_FOUND");
+            }
+        } catch (Exception e) {
+            Msg.error(this, "Error in /jobs endpoint", e);
+            sendErrorResponse(exchange, 500, "Internal server error: " + e.getMessage(), "INTERNAL_ERROR");
+        }
+    }
+}
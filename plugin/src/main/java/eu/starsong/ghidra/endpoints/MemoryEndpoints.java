@@ -5,6 +5,7 @@ import com.google.gson.JsonObject;
 import com.sun.net.httpserver.HttpExchange;
 import com.sun.net.httpserver.HttpServer;
 import eu.starsong.ghidra.api.ResponseBuilder;
+import eu.starsong.ghidra.util.HttpUtil;
 import eu.starsong.ghidra.util.TransactionHelper;
 import ghidra.program.model.address.Address;
 import ghidra.program.model.address.AddressFactory;
@@ -146,25 +147,26 @@ public class MemoryEndpoints extends AbstractEndpoint {
                     byte[] bytes = new byte[length];
                     int bytesRead = memory.getBytes(address, bytes, 0, length);
                     
-                    // Format as hex string
-                    StringBuilder hexString = new StringBuilder();
-                    for (int i = 0; i < bytesRead; i++) {
-                        String hex = Integer.toHexString(bytes[i] & 0xFF).toUpperCase();
-                        if (hex.length() == 1) {
-                            hexString.append('0');
-                        }
-                        hexString.append(hex);
-                        if (i < bytesRead - 1) {
-                            hexString.append(' ');
-                        }
-                    }
-                    
                     // Build result object
                     Map<String, Object> result = new HashMap<>();
                     result.put("address", address.toString());
                     result.put("bytesRead", bytesRead);
-                    result.put("hexBytes", hexString.toString());
-                    result.put("rawBytes", Base64.getEncoder().encodeToString(bytes));
+
+                    // MessagePack clients get the bytes as a binary value and format them themselves
+                    if (!HttpUtil.acceptsMsgPack(exchange)) {
+                        StringBuilder hexString = new StringBuilder();
+                        for (int i = 0; i < bytesRead; i++) {
+                            String hex = Integer.toHexString(bytes[i] & 0xFF).toUpperCase();
+                            if (hex.length() == 1) {
+                                hexString.append('0');
+                            }
+                            hexString.append(hex);
+                            if (i < bytesRead - 1) {
+                                hexString.append(' ');
+                            }
+                        }
+                        result.put("hexBytes", hexString.toString());
+                    }
                     
                     // Add next/prev links
                     builder.addLink("next", "/memory?address=" + address.add(length) + "&length=" + length);
@@ -174,7 +176,8 @@ public class MemoryEndpoints extends AbstractEndpoint {
                     
                     // Add result and send response
                     builder.result(result);
-                    sendJsonResponse(exchange, builder.build(), 200);
+                    sendJsonResponse(exchange, builder.build(), 200,
+                        Map.of("rawBytes", Arrays.copyOf(bytes, bytesRead)));
                     
                 } catch (MemoryAccessException e) {
                     sendErrorResponse(exchange, 404, "Cannot read memory at address: " + e.getMessage(), "MEMORY_ACCESS_ERROR");
@@ -6,6 +6,7 @@ import eu.starsong.ghidra.api.ResponseBuilder;
 import eu.starsong.ghidra.model.ProgramInfo;
 import eu.starsong.ghidra.util.GhidraUtil;
 import eu.starsong.ghidra.util.HttpUtil;
+import eu.starsong.ghidra.util.RequestMonitor;
 import eu.starsong.ghidra.util.TransactionHelper;
 import ghidra.app.services.ProgramManager;
 import ghidra.framework.model.DomainFile;
@@ -15,6 +16,8 @@ import ghidra.framework.plugintool.PluginTool;
 import ghidra.program.model.address.Address;
 import ghidra.program.model.listing.Program;
 import ghidra.util.Msg;
+import ghidra.util.exception.CancelledException;
+import ghidra.util.task.TaskMonitor;
 
 import java.io.IOException;
 import java.net.URLDecoder;
@@ -1531,8 +1534,14 @@ public class ProgramEndpoints extends AbstractEndpoint {
                 }
             }
             
-            // Build call graph (this is a simplified implementation)
-            Map<String, Object> graph = buildCallGraph(program, startFunction, maxDepth);
+            // Build call graph (this is a simplified implementation); the client can cancel it by request ID
+            Map<String, Object> graph;
+            try (RequestMonitor monitor = RequestMonitor.open(exchange)) {
+                graph = buildCallGraph(program, startFunction, maxDepth, monitor);
+            } catch (CancelledException e) {
+                sendErrorResponse(exchange, 499, "Request cancelled by client", "REQUEST_CANCELLED");
+                return;
+            }
             
             // Build response
             ResponseBuilder builder = new ResponseBuilder(exchange, port)
@@ -1572,7 +1581,8 @@ public class ProgramEndpoints extends AbstractEndpoint {
     /**
      * Build a call graph starting from a given function up to a maximum depth
      */
-    private Map<String, Object> buildCallGraph(Program program, ghidra.program.model.listing.Function startFunction, int maxDepth) {
+    private Map<String, Object> buildCallGraph(Program program, ghidra.program.model.listing.Function startFunction, int maxDepth,
+            TaskMonitor monitor) throws CancelledException {
         Map<String, Object> graph = new HashMap<>();
         graph.put("root", startFunction.getName());
         graph.put("root_address", startFunction.getEntryPoint().toString());
@@ -1588,7 +1598,7 @@ public class ProgramEndpoints extends AbstractEndpoint {
         java.util.Set<String> processedFunctions = new java.util.HashSet<>();
         
         // Build graph recursively
-        buildCallGraphRecursive(program, startFunction, nodes, edges, processedFunctions, 0, maxDepth);
+        buildCallGraphRecursive(program, startFunction, nodes, edges, processedFunctions, 0, maxDepth, monitor);
         
         graph.put("nodes", nodes);
         graph.put("edges", edges);
@@ -1606,8 +1616,11 @@ public class ProgramEndpoints extends AbstractEndpoint {
             List<Map<String, Object>> edges, 
             java.util.Set<String> processedFunctions, 
             int currentDepth, 
-            int maxDepth) {
+            int maxDepth,
+            TaskMonitor monitor) throws CancelledException {
         
+        monitor.checkCancelled();
+
         // Add this function as a node if it hasn't been processed yet
         String functionId = function.getEntryPoint().toString();
         if (!processedFunctions.contains(functionId)) {
@@ -1658,7 +1671,7 @@ public class ProgramEndpoints extends AbstractEndpoint {
                             edges.add(edge);
                             
                             // Recurse into called function
-                            buildCallGraphRecursive(program, calledFunction, nodes, edges, processedFunctions, currentDepth + 1, maxDepth);
+                            buildCallGraphRecursive(program, calledFunction, nodes, edges, processedFunctions, currentDepth + 1, maxDepth, monitor);
                         }
                     }
                 }
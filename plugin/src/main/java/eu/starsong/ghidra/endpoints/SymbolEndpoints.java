@@ -52,35 +52,53 @@ package eu.starsong.ghidra.endpoints;
                         return;
                     }
                     
-                    List<Map<String, Object>> symbols = new ArrayList<>();
+                    PageCursor cursor;
+                    try {
+                        cursor = parseCursor(program, qparams);
+                    } catch (IllegalArgumentException e) {
+                        sendErrorResponse(exchange, 400, e.getMessage(), "INVALID_PARAMETER");
+                        return;
+                    }
+                    
+                    // Keyset pages walk symbols in address order; offset pages keep the symbol table order
                     SymbolTable symbolTable = program.getSymbolTable();
-                    SymbolIterator symbolIterator = symbolTable.getAllSymbols(true);
-                    
-                    while (symbolIterator.hasNext()) {
-                        Symbol symbol = symbolIterator.next();
-                        Map<String, Object> symbolInfo = new HashMap<>();
-                        symbolInfo.put("name", symbol.getName());
-                        symbolInfo.put("address", symbol.getAddress().toString());
-                        symbolInfo.put("namespace", symbol.getParentNamespace().getName());
-                        symbolInfo.put("type", symbol.getSymbolType().toString());
-                        symbolInfo.put("isPrimary", symbol.isPrimary());
-                        
-                        // Add HATEOAS links
-                        Map<String, Object> links = new HashMap<>();
-                        Map<String, String> selfLink = new HashMap<>();
-                        selfLink.put("href", "/symbols/" + symbol.getAddress().toString());
-                        links.put("self", selfLink);
-                        symbolInfo.put("_links", links);
-                        
-                        symbols.add(symbolInfo);
+                    Iterator<Symbol> symbolIterator;
+                    if (cursor == null) {
+                        symbolIterator = symbolTable.getAllSymbols(true);
+                    } else if (cursor.address != null) {
+                        symbolIterator = symbolTable.getSymbolIterator(cursor.address, true);
+                    } else if (program.getMinAddress() != null) {
+                        symbolIterator = symbolTable.getSymbolIterator(program.getMinAddress(), true);
+                    } else {
+                        symbolIterator = Collections.emptyIterator();
                     }
                     
                     // Build response with HATEOAS links
                     eu.starsong.ghidra.api.ResponseBuilder builder = new eu.starsong.ghidra.api.ResponseBuilder(exchange, port)
                         .success(true);
                     
-                    // Apply pagination and get paginated items
-                    List<Map<String, Object>> paginatedSymbols = applyPagination(symbols, offset, limit, builder, "/symbols");
+                    // Build only the symbols on the requested page
+                    List<Map<String, Object>> paginatedSymbols = applyKeysetPagination(symbolIterator, cursor,
+                        offset, limit, null, Symbol::getAddress, symbol -> {
+                            Map<String, Object> symbolInfo = new HashMap<>();
+                            symbolInfo.put("name", symbol.getName());
+                            symbolInfo.put("address", symbol.getAddress().toString());
+                            symbolInfo.put("namespace", symbol.getParentNamespace().getName());
+                            symbolInfo.put("type", symbol.getSymbolType().toString());
+                            symbolInfo.put("isPrimary", symbol.isPrimary());
+                            if (builder.isLean()) {
+                                return symbolInfo;
+                            }
+                            
+                            // Add HATEOAS links
+                            Map<String, Object> links = new HashMap<>();
+                            Map<String, String> selfLink = new HashMap<>();
+                            selfLink.put("href", "/symbols/" + symbol.getAddress().toString());
+                            links.put("self", selfLink);
+                            symbolInfo.put("_links", links);
+                            return symbolInfo;
+                        },
+                        builder, "/symbols", null);
                     
                     // Set the paginated result
                     builder.result(paginatedSymbols);
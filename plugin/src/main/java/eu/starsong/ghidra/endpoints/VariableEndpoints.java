@@ -4,9 +4,11 @@ package eu.starsong.ghidra.endpoints;
     import com.google.gson.JsonObject;
     import com.sun.net.httpserver.HttpExchange;
     import com.sun.net.httpserver.HttpServer;
+    import eu.starsong.ghidra.util.DecompileCache;
+    import eu.starsong.ghidra.util.DecompilerPool;
+    import eu.starsong.ghidra.util.HttpUtil;
     import eu.starsong.ghidra.util.TransactionHelper;
     import eu.starsong.ghidra.util.TransactionHelper.TransactionException;
-    import ghidra.app.decompiler.DecompInterface;
     import ghidra.app.decompiler.DecompileResults;
     import ghidra.program.model.address.Address;
     import ghidra.program.model.data.DataType;
@@ -90,9 +92,11 @@ package eu.starsong.ghidra.endpoints;
                     // Use more efficient pagination by limiting data collection up-front
                     PaginatedResult paginatedResult;
                     if (search != null && !search.isEmpty()) {
-                        paginatedResult = searchVariablesPaginated(program, search, offset, limit, globalOnly);
+                        paginatedResult = searchVariablesPaginated(program, search, offset, limit, globalOnly,
+                            HttpUtil.remainingMillis(exchange));
                     } else {
-                        paginatedResult = listVariablesPaginated(program, offset, limit, globalOnly);
+                        paginatedResult = listVariablesPaginated(program, offset, limit, globalOnly,
+                            HttpUtil.remainingMillis(exchange));
                     }
                     
                     // Add pagination links
@@ -155,6 +159,8 @@ package eu.starsong.ghidra.endpoints;
                 } else {
                     sendErrorResponse(exchange, 405, "Method Not Allowed");
                 }
+            } catch (DecompilerPool.BusyException e) {
+                sendErrorResponse(exchange, 503, e.getMessage() + ", try again later", "DECOMPILER_BUSY");
             } catch (Exception e) {
                 Msg.error(this, "Error in /variables endpoint", e);
                 sendErrorResponse(exchange, 500, "Internal server error: " + e.getMessage());
@@ -192,14 +198,16 @@ package eu.starsong.ghidra.endpoints;
          * Legacy method kept for backward compatibility
          */
         private List<Map<String, String>> listVariables(Program program) {
-            PaginatedResult result = listVariablesPaginated(program, 0, Integer.MAX_VALUE, false);
+            PaginatedResult result = listVariablesPaginated(program, 0, Integer.MAX_VALUE, false, Long.MAX_VALUE);
             return result.getResults();
         }
         
         /**
-         * List variables with efficient pagination - only loads what's needed
+         * List variables with efficient pagination - only loads what's needed.
+         * Waits at most waitMillis for a decompiler session (DecompilerPool.BusyException).
          */
-        private PaginatedResult listVariablesPaginated(Program program, int offset, int limit, boolean globalOnly) {
+        private PaginatedResult listVariablesPaginated(Program program, int offset, int limit, boolean globalOnly,
+                long waitMillis) {
             if (program == null) {
                 return new PaginatedResult(new ArrayList<>(), false, 0);
             }
@@ -275,23 +283,84 @@ package eu.starsong.ghidra.endpoints;
                 int localLimit = limit;
                 
                 // Process functions to get the local variables
-                DecompInterface decomp = null;
-                try {
-                    decomp = new DecompInterface();
-                    if (decomp.openProgram(program)) {
-                        int localVarIndex = 0;
+                try (DecompilerPool.Lease decomp = DecompilerPool.getInstance().acquire(program, waitMillis)) {
+                    int localVarIndex = 0;
+                    int functionsProcessed = 0;
+                    int maxFunctionsToProcess = 20; // Limit how many functions we process per request
+                    
+                    for (Function function : program.getFunctionManager().getFunctions(true)) {
+                        try {
+                            DecompileResults results = DecompileCache.getInstance().getOrDecompile(decomp, function, 10, new ConsoleTaskMonitor());
+                            if (results != null && results.decompileCompleted()) {
+                                HighFunction highFunc = results.getHighFunction();
+                                if (highFunc != null) {
+                                    List<Map<String, String>> functionVars = new ArrayList<>();
+                                    Iterator<HighSymbol> symbolIter = highFunc.getLocalSymbolMap().getSymbols();
+                                    while (symbolIter.hasNext()) {
+                                        HighSymbol symbol = symbolIter.next();
+                                        if (!symbol.isParameter()) { // Only list locals
+                                            Map<String, String> varInfo = new HashMap<>();
+                                            varInfo.put("name", symbol.getName());
+                                            varInfo.put("type", "local");
+                                            varInfo.put("function", function.getName());
+                                            Address pcAddr = symbol.getPCAddress();
+                                            varInfo.put("address", pcAddr != null ? pcAddr.toString() : "N/A");
+                                            varInfo.put("dataType", symbol.getDataType() != null ? symbol.getDataType().getName() : "unknown");
+                                            functionVars.add(varInfo);
+                                        }
+                                    }
+                                    
+                                    // Sort function variables by name
+                                    functionVars.sort(Comparator.comparing(a -> a.get("name")));
+                                    
+                                    // Add only the needed variables for this page
+                                    for (Map<String, String> varInfo : functionVars) {
+                                        if (localVarIndex >= localOffset && localVarIndex < localOffset + localLimit) {
+                                            variables.add(varInfo);
+                                        }
+                                        localVarIndex++;
+                                        if (localVarIndex >= localOffset + localLimit) {
+                                            break;
+                                        }
+                                    }
+                                }
+                            }
+                        } catch (Exception e) {
+                            Msg.warn(this, "listVariablesPaginated: Error processing function " + function.getName(), e);
+                        }
+                        
+                        functionsProcessed++;
+                        if (functionsProcessed >= maxFunctionsToProcess || localVarIndex >= localOffset + localLimit) {
+                            // Stop processing if we've hit our limits
+                            break;
+                        }
+                    }
+                    
+                    // Determine if we have more variables
+                    hasMore = functionsProcessed < funcCount || localVarIndex >= localOffset + localLimit;
+                } catch (DecompilerPool.BusyException e) {
+                    throw e;
+                } catch (Exception e) {
+                    Msg.error(this, "listVariablesPaginated: Error during local variable processing", e);
+                }
+            } else {
+                // This means we already have some globals and may need a few locals to complete the page
+                int remainingSpace = limit - variables.size();
+                if (remainingSpace > 0) {
+                    // Process just enough functions to fill the page
+                    try (DecompilerPool.Lease decomp = DecompilerPool.getInstance().acquire(program, waitMillis)) {
                         int functionsProcessed = 0;
-                        int maxFunctionsToProcess = 20; // Limit how many functions we process per request
+                        int maxFunctionsToProcess = 5; // Limit how many functions we process
+                        int localVarsAdded = 0;
                         
                         for (Function function : program.getFunctionManager().getFunctions(true)) {
                             try {
-                                DecompileResults results = decomp.decompileFunction(function, 10, new ConsoleTaskMonitor());
+                                DecompileResults results = DecompileCache.getInstance().getOrDecompile(decomp, function, 10, new ConsoleTaskMonitor());
                                 if (results != null && results.decompileCompleted()) {
                                     HighFunction highFunc = results.getHighFunction();
                                     if (highFunc != null) {
-                                        List<Map<String, String>> functionVars = new ArrayList<>();
                                         Iterator<HighSymbol> symbolIter = highFunc.getLocalSymbolMap().getSymbols();
-                                        while (symbolIter.hasNext()) {
+                                        while (symbolIter.hasNext() && localVarsAdded < remainingSpace) {
                                             HighSymbol symbol = symbolIter.next();
                                             if (!symbol.isParameter()) { // Only list locals
                                                 Map<String, String> varInfo = new HashMap<>();
@@ -301,21 +370,8 @@ package eu.starsong.ghidra.endpoints;
                                                 Address pcAddr = symbol.getPCAddress();
                                                 varInfo.put("address", pcAddr != null ? pcAddr.toString() : "N/A");
                                                 varInfo.put("dataType", symbol.getDataType() != null ? symbol.getDataType().getName() : "unknown");
-                                                functionVars.add(varInfo);
-                                            }
-                                        }
-                                        
-                                        // Sort function variables by name
-                                        functionVars.sort(Comparator.comparing(a -> a.get("name")));
-                                        
-                                        // Add only the needed variables for this page
-                                        for (Map<String, String> varInfo : functionVars) {
-                                            if (localVarIndex >= localOffset && localVarIndex < localOffset + localLimit) {
                                                 variables.add(varInfo);
-                                            }
-                                            localVarIndex++;
-                                            if (localVarIndex >= localOffset + localLimit) {
-                                                break;
+                                                localVarsAdded++;
                                             }
                                         }
                                     }
@@ -325,78 +381,18 @@ package eu.starsong.ghidra.endpoints;
                             }
                             
                             functionsProcessed++;
-                            if (functionsProcessed >= maxFunctionsToProcess || localVarIndex >= localOffset + localLimit) {
+                            if (functionsProcessed >= maxFunctionsToProcess || localVarsAdded >= remainingSpace) {
                                 // Stop processing if we've hit our limits
                                 break;
                             }
                         }
                         
                         // Determine if we have more variables
-                        hasMore = functionsProcessed < funcCount || localVarIndex >= localOffset + localLimit;
-                    }
-                } catch (Exception e) {
-                    Msg.error(this, "listVariablesPaginated: Error during local variable processing", e);
-                } finally {
-                    if (decomp != null) {
-                        decomp.dispose();
-                    }
-                }
-            } else {
-                // This means we already have some globals and may need a few locals to complete the page
-                int remainingSpace = limit - variables.size();
-                if (remainingSpace > 0) {
-                    // Process just enough functions to fill the page
-                    DecompInterface decomp = null;
-                    try {
-                        decomp = new DecompInterface();
-                        if (decomp.openProgram(program)) {
-                            int functionsProcessed = 0;
-                            int maxFunctionsToProcess = 5; // Limit how many functions we process
-                            int localVarsAdded = 0;
-                            
-                            for (Function function : program.getFunctionManager().getFunctions(true)) {
-                                try {
-                                    DecompileResults results = decomp.decompileFunction(function, 10, new ConsoleTaskMonitor());
-                                    if (results != null && results.decompileCompleted()) {
-                                        HighFunction highFunc = results.getHighFunction();
-                                        if (highFunc != null) {
-                                            Iterator<HighSymbol> symbolIter = highFunc.getLocalSymbolMap().getSymbols();
-                                            while (symbolIter.hasNext() && localVarsAdded < remainingSpace) {
-                                                HighSymbol symbol = symbolIter.next();
-                                                if (!symbol.isParameter()) { // Only list locals
-                                                    Map<String, String> varInfo = new HashMap<>();
-                                                    varInfo.put("name", symbol.getName());
-                                                    varInfo.put("type", "local");
-                                                    varInfo.put("function", function.getName());
-                                                    Address pcAddr = symbol.getPCAddress();
-                                                    varInfo.put("address", pcAddr != null ? pcAddr.toString() : "N/A");
-                                                    varInfo.put("dataType", symbol.getDataType() != null ? symbol.getDataType().getName() : "unknown");
-                                                    variables.add(varInfo);
-                                                    localVarsAdded++;
-                                                }
-                                            }
-                                        }
-                                    }
-                                } catch (Exception e) {
-                                    Msg.warn(this, "listVariablesPaginated: Error processing function " + function.getName(), e);
-                                }
-                                
-                                functionsProcessed++;
-                                if (functionsProcessed >= maxFunctionsToProcess || localVarsAdded >= remainingSpace) {
-                                    // Stop processing if we've hit our limits
-                                    break;
-                                }
-                            }
-                            
-                            // Determine if we have more variables
-                            hasMore = functionsProcessed < funcCount || localVarsAdded >= remainingSpace;
-                        }
+                        hasMore = functionsProcessed < funcCount || localVarsAdded >= remainingSpace;
+                    } catch (DecompilerPool.BusyException e) {
+                        throw e;
                     } catch (Exception e) {
                         Msg.error(this, "listVariablesPaginated: Error during local variable processing", e);
-                    } finally {
-                        if (decomp != null) {
-                            decomp.dispose();
-                        }
                     }
                 }
             }
@@ -411,14 +407,16 @@ package eu.starsong.ghidra.endpoints;
          * Legacy method kept for backward compatibility
          */
         private List<Map<String, String>> searchVariables(Program program, String searchTerm) {
-            PaginatedResult result = searchVariablesPaginated(program, searchTerm, 0, Integer.MAX_VALUE, false);
+            PaginatedResult result = searchVariablesPaginated(program, searchTerm, 0, Integer.MAX_VALUE, false, Long.MAX_VALUE);
             return result.getResults();
         }
         
         /**
-         * Search variables with efficient pagination - only loads what's needed
+         * Search variables with efficient pagination - only loads what's needed.
+         * Waits at most waitMillis for a decompiler session (DecompilerPool.BusyException).
          */
-        private PaginatedResult searchVariablesPaginated(Program program, String searchTerm, int offset, int limit, boolean globalOnly) {
+        private PaginatedResult searchVariablesPaginated(Program program, String searchTerm, int offset, int limit,
+                boolean globalOnly, long waitMillis) {
             if (program == null || searchTerm == null || searchTerm.isEmpty()) {
                 return new PaginatedResult(new ArrayList<>(), false, 0);
             }
@@ -498,23 +496,84 @@ package eu.starsong.ghidra.endpoints;
                 int localLimit = limit;
                 
                 // Process functions to get the local variables
-                DecompInterface decomp = null;
-                try {
-                    decomp = new DecompInterface();
-                    if (decomp.openProgram(program)) {
-                        int localVarIndex = 0;
+                try (DecompilerPool.Lease decomp = DecompilerPool.getInstance().acquire(program, waitMillis)) {
+                    int localVarIndex = 0;
+                    int functionsProcessed = 0;
+                    int maxFunctionsToProcess = 30; // Limit how many functions we process for search
+                    
+                    for (Function function : program.getFunctionManager().getFunctions(true)) {
+                        try {
+                            DecompileResults results = DecompileCache.getInstance().getOrDecompile(decomp, function, 5, new ConsoleTaskMonitor());
+                            if (results != null && results.decompileCompleted()) {
+                                HighFunction highFunc = results.getHighFunction();
+                                if (highFunc != null) {
+                                    List<Map<String, String>> functionMatches = new ArrayList<>();
+                                    Iterator<HighSymbol> symbolIter = highFunc.getLocalSymbolMap().getSymbols();
+                                    while (symbolIter.hasNext()) {
+                                        HighSymbol symbol = symbolIter.next();
+                                        if (symbol.getName().toLowerCase().contains(lowerSearchTerm)) {
+                                            Map<String, String> varInfo = new HashMap<>();
+                                            varInfo.put("name", symbol.getName());
+                                            varInfo.put("function", function.getName());
+                                            varInfo.put("type", symbol.isParameter() ? "parameter" : "local");
+                                            Address pcAddr = symbol.getPCAddress();
+                                            varInfo.put("address", pcAddr != null ? pcAddr.toString() : "N/A");
+                                            varInfo.put("dataType", symbol.getDataType() != null ? symbol.getDataType().getName() : "unknown");
+                                            functionMatches.add(varInfo);
+                                        }
+                                    }
+                                    
+                                    // Sort function matches by name
+                                    functionMatches.sort(Comparator.comparing(a -> a.get("name")));
+                                    
+                                    // Add only the needed variables for this page
+                                    for (Map<String, String> varInfo : functionMatches) {
+                                        if (localVarIndex >= localOffset && localVarIndex < localOffset + localLimit) {
+                                            matchedVars.add(varInfo);
+                                        }
+                                        localVarIndex++;
+                                        if (localVarIndex >= localOffset + localLimit) {
+                                            break;
+                                        }
+                                    }
+                                }
+                            }
+                        } catch (Exception e) {
+                            Msg.warn(this, "searchVariablesPaginated: Error processing function " + function.getName(), e);
+                        }
+                        
+                        functionsProcessed++;
+                        if (functionsProcessed >= maxFunctionsToProcess || localVarIndex >= localOffset + localLimit) {
+                            // Stop processing if we've hit our limits
+                            break;
+                        }
+                    }
+                    
+                    // Determine if we have more variables
+                    hasMore = functionsProcessed < funcCount || localVarIndex >= localOffset + localLimit;
+                } catch (DecompilerPool.BusyException e) {
+                    throw e;
+                } catch (Exception e) {
+                    Msg.error(this, "searchVariablesPaginated: Error during local variable search", e);
+                }
+            } else {
+                // This means we already have some globals and may need a few locals to complete the page
+                int remainingSpace = limit - matchedVars.size();
+                if (remainingSpace > 0) {
+                    // Process functions until we've filled the page
+                    try (DecompilerPool.Lease decomp = DecompilerPool.getInstance().acquire(program, waitMillis)) {
                         int functionsProcessed = 0;
-                        int maxFunctionsToProcess = 30; // Limit how many functions we process for search
+                        int maxFunctionsToProcess = 5; // Limit how many functions we process
+                        int localVarsAdded = 0;
                         
                         for (Function function : program.getFunctionManager().getFunctions(true)) {
                             try {
-                                DecompileResults results = decomp.decompileFunction(function, 5, new ConsoleTaskMonitor());
+                                DecompileResults results = DecompileCache.getInstance().getOrDecompile(decomp, function, 5, new ConsoleTaskMonitor());
                                 if (results != null && results.decompileCompleted()) {
                                     HighFunction highFunc = results.getHighFunction();
                                     if (highFunc != null) {
-                                        List<Map<String, String>> functionMatches = new ArrayList<>();
                                         Iterator<HighSymbol> symbolIter = highFunc.getLocalSymbolMap().getSymbols();
-                                        while (symbolIter.hasNext()) {
+                                        while (symbolIter.hasNext() && localVarsAdded < remainingSpace) {
                                             HighSymbol symbol = symbolIter.next();
                                             if (symbol.getName().toLowerCase().contains(lowerSearchTerm)) {
                                                 Map<String, String> varInfo = new HashMap<>();
@@ -524,21 +583,8 @@ package eu.starsong.ghidra.endpoints;
                                                 Address pcAddr = symbol.getPCAddress();
                                                 varInfo.put("address", pcAddr != null ? pcAddr.toString() : "N/A");
                                                 varInfo.put("dataType", symbol.getDataType() != null ? symbol.getDataType().getName() : "unknown");
-                                                functionMatches.add(varInfo);
-                                            }
-                                        }
-                                        
-                                        // Sort function matches by name
-                                        functionMatches.sort(Comparator.comparing(a -> a.get("name")));
-                                        
-                                        // Add only the needed variables for this page
-                                        for (Map<String, String> varInfo : functionMatches) {
-                                            if (localVarIndex >= localOffset && localVarIndex < localOffset + localLimit) {
                                                 matchedVars.add(varInfo);
-                                            }
-                                            localVarIndex++;
-                                            if (localVarIndex >= localOffset + localLimit) {
-                                                break;
+                                                localVarsAdded++;
                                             }
                                         }
                                     }
@@ -548,78 +594,18 @@ package eu.starsong.ghidra.endpoints;
                             }
                             
                             functionsProcessed++;
-                            if (functionsProcessed >= maxFunctionsToProcess || localVarIndex >= localOffset + localLimit) {
+                            if (functionsProcessed >= maxFunctionsToProcess || localVarsAdded >= remainingSpace) {
                                 // Stop processing if we've hit our limits
                                 break;
                             }
                         }
                         
                         // Determine if we have more variables
-                        hasMore = functionsProcessed < funcCount || localVarIndex >= localOffset + localLimit;
-                    }
-                } catch (Exception e) {
-                    Msg.error(this, "searchVariablesPaginated: Error during local variable search", e);
-                } finally {
-                    if (decomp != null) {
-                        decomp.dispose();
-                    }
-                }
-            } else {
-                // This means we already have some globals and may need a few locals to complete the page
-                int remainingSpace = limit - matchedVars.size();
-                if (remainingSpace > 0) {
-                    // Process functions until we've filled the page
-                    DecompInterface decomp = null;
-                    try {
-                        decomp = new DecompInterface();
-                        if (decomp.openProgram(program)) {
-                            int functionsProcessed = 0;
-                            int maxFunctionsToProcess = 5; // Limit how many functions we process
-                            int localVarsAdded = 0;
-                            
-                            for (Function function : program.getFunctionManager().getFunctions(true)) {
-                                try {
-                                    DecompileResults results = decomp.decompileFunction(function, 5, new ConsoleTaskMonitor());
-                                    if (results != null && results.decompileCompleted()) {
-                                        HighFunction highFunc = results.getHighFunction();
-                                        if (highFunc != null) {
-                                            Iterator<HighSymbol> symbolIter = highFunc.getLocalSymbolMap().getSymbols();
-                                            while (symbolIter.hasNext() && localVarsAdded < remainingSpace) {
-                                                HighSymbol symbol = symbolIter.next();
-                                                if (symbol.getName().toLowerCase().contains(lowerSearchTerm)) {
-                                                    Map<String, String> varInfo = new HashMap<>();
-                                                    varInfo.put("name", symbol.getName());
-                                                    varInfo.put("function", function.getName());
-                                                    varInfo.put("type", symbol.isParameter() ? "parameter" : "local");
-                                                    Address pcAddr = symbol.getPCAddress();
-                                                    varInfo.put("address", pcAddr != null ? pcAddr.toString() : "N/A");
-                                                    varInfo.put("dataType", symbol.getDataType() != null ? symbol.getDataType().getName() : "unknown");
-                                                    matchedVars.add(varInfo);
-                                                    localVarsAdded++;
-                                                }
-                                            }
-                                        }
-                                    }
-                                } catch (Exception e) {
-                                    Msg.warn(this, "searchVariablesPaginated: Error processing function " + function.getName(), e);
-                                }
-                                
-                                functionsProcessed++;
-                                if (functionsProcessed >= maxFunctionsToProcess || localVarsAdded >= remainingSpace) {
-                                    // Stop processing if we've hit our limits
-                                    break;
-                                }
-                            }
-                            
-                            // Determine if we have more variables
-                            hasMore = functionsProcessed < funcCount || localVarsAdded >= remainingSpace;
-                        }
+                        hasMore = functionsProcessed < funcCount || localVarsAdded >= remainingSpace;
+                    } catch (DecompilerPool.BusyException e) {
+                        throw e;
                     } catch (Exception e) {
                         Msg.error(this, "searchVariablesPaginated: Error during local variable search", e);
-                    } finally {
-                        if (decomp != null) {
-                            decomp.dispose();
-                        }
                     }
                 }
             }
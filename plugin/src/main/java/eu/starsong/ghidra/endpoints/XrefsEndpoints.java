@@ -5,6 +5,7 @@ import com.sun.net.httpserver.HttpServer;
 import eu.starsong.ghidra.api.ResponseBuilder;
 import ghidra.program.model.address.Address;
 import ghidra.program.model.address.AddressFactory;
+import ghidra.program.model.address.AddressIterator;
 import ghidra.program.model.listing.Function;
 import ghidra.program.model.listing.Program;
 import ghidra.program.model.symbol.Reference;
@@ -86,10 +87,23 @@ public class XrefsEndpoints extends AbstractEndpoint {
                 // Add common links
                 builder.addLink("program", "/program");
                 
-                // At least one of to_addr or from_addr must be provided
+                PageCursor cursor;
+                try {
+                    cursor = parseCursor(program, qparams);
+                } catch (IllegalArgumentException e) {
+                    sendErrorResponse(exchange, 400, e.getMessage(), "INVALID_PARAMETER");
+                    return;
+                }
+                
+                // At least one of to_addr or from_addr must be provided, unless paging
+                // through every reference in the program with a cursor
                 if ((toAddrStr == null || toAddrStr.isEmpty()) && 
                     (fromAddrStr == null || fromAddrStr.isEmpty())) {
-                    sendErrorResponse(exchange, 400, "Either to_addr or from_addr parameter is required", "MISSING_PARAMETER");
+                    if (cursor == null) {
+                        sendErrorResponse(exchange, 400, "Either to_addr or from_addr parameter is required", "MISSING_PARAMETER");
+                        return;
+                    }
+                    sendAllReferences(exchange, program, cursor, limit, refTypeStr, builder);
                     return;
                 }
                 
@@ -118,7 +132,7 @@ public class XrefsEndpoints extends AbstractEndpoint {
                 
                 // Get reference manager
                 ReferenceManager refManager = program.getReferenceManager();
-                List<Map<String, Object>> referencesList = new ArrayList<>();
+                List<DirectedReference> references = new ArrayList<>();
                 
                 // Get references to this address
                 if (toAddr != null) {
@@ -127,9 +141,7 @@ public class XrefsEndpoints extends AbstractEndpoint {
                         if (refTypeStr != null && !ref.getReferenceType().getName().equalsIgnoreCase(refTypeStr)) {
                             continue; // Skip if type filter doesn't match
                         }
-                        
-                        Map<String, Object> refMap = createReferenceMap(program, ref, "to");
-                        referencesList.add(refMap);
+                        references.add(new DirectedReference(ref, "to"));
                     }
                 }
                 
@@ -140,30 +152,34 @@ public class XrefsEndpoints extends AbstractEndpoint {
                         if (refTypeStr != null && !ref.getReferenceType().getName().equalsIgnoreCase(refTypeStr)) {
                             continue; // Skip if type filter doesn't match
                         }
-                        
-                        Map<String, Object> refMap = createReferenceMap(program, ref, "from");
-                        referencesList.add(refMap);
+                        references.add(new DirectedReference(ref, "from"));
                     }
                 }
                 
-                // Sort by type and address
-                Collections.sort(referencesList, (a, b) -> {
-                    // First sort by direction
-                    int directionCompare = ((String)a.get("direction")).compareTo((String)b.get("direction"));
-                    if (directionCompare != 0) return directionCompare;
-                    
-                    // Then by reference type
-                    int typeCompare = ((String)a.get("refType")).compareTo((String)b.get("refType"));
-                    if (typeCompare != 0) return typeCompare;
-                    
-                    // Finally by from_address
-                    return ((String)a.get("from_addr")).compareTo((String)b.get("from_addr"));
-                });
+                int start = 0;
+                if (cursor == null) {
+                    // Sort by direction, type and address
+                    references.sort(Comparator
+                        .comparing((DirectedReference r) -> r.direction)
+                        .thenComparing(r -> r.ref.getReferenceType().getName())
+                        .thenComparing(r -> r.ref.getFromAddress().toString()));
+                } else {
+                    // Keyset pages are ordered by source address
+                    references.sort(Comparator
+                        .comparing((DirectedReference r) -> r.ref.getFromAddress())
+                        .thenComparing(r -> r.direction)
+                        .thenComparing(r -> r.ref.getReferenceType().getName())
+                        .thenComparing(r -> r.ref.getToAddress()));
+                    if (cursor.address != null) {
+                        start = firstReferenceFrom(references, cursor.address);
+                    }
+                }
                 
-                // Apply pagination
-                List<Map<String, Object>> paginatedRefs = 
-                    applyPagination(referencesList, offset, limit, builder, "/xrefs",
-                        buildQueryString(toAddrStr, fromAddrStr, refTypeStr));
+                // Describe only the references on the requested page
+                List<Map<String, Object>> paginatedRefs = applyKeysetPagination(
+                    references.listIterator(start), cursor, offset, limit, null,
+                    r -> r.ref.getFromAddress(), r -> createReferenceMap(program, r.ref, r.direction),
+                    builder, "/xrefs", buildQueryString(toAddrStr, fromAddrStr, refTypeStr));
                 
                 // Create result object
                 Map<String, Object> result = new HashMap<>();
@@ -198,6 +214,88 @@ public class XrefsEndpoints extends AbstractEndpoint {
         }
     }
     
+    /**
+     * Page through every memory reference in the program in source address order.
+     * Entries are compact (addresses, type and primary flag only) since this is
+     * meant for bulk export rather than browsing.
+     */
+    private void sendAllReferences(HttpExchange exchange, Program program, PageCursor cursor, int limit,
+            String refTypeStr, ResponseBuilder builder) throws IOException {
+        ReferenceManager refManager = program.getReferenceManager();
+        Address start = cursor.address != null ? cursor.address : program.getMinAddress();
+        Iterator<Reference> references = start == null
+            ? Collections.emptyIterator()
+            : new Iterator<Reference>() {
+                private final AddressIterator sources = refManager.getReferenceSourceIterator(start, true);
+                private Reference[] current = new Reference[0];
+                private int index;
+
+                @Override
+                public boolean hasNext() {
+                    while (index >= current.length && sources.hasNext()) {
+                        current = refManager.getReferencesFrom(sources.next());
+                        index = 0;
+                    }
+                    return index < current.length;
+                }
+
+                @Override
+                public Reference next() {
+                    if (!hasNext()) {
+                        throw new NoSuchElementException();
+                    }
+                    return current[index++];
+                }
+            };
+        
+        List<Map<String, Object>> page = applyKeysetPagination(references, cursor, 0, limit,
+            refTypeStr != null ? ref -> ref.getReferenceType().getName().equalsIgnoreCase(refTypeStr) : null,
+            Reference::getFromAddress, ref -> {
+                Map<String, Object> refMap = new HashMap<>();
+                refMap.put("from_addr", ref.getFromAddress().toString());
+                refMap.put("to_addr", ref.getToAddress().toString());
+                refMap.put("refType", ref.getReferenceType().getName());
+                refMap.put("isPrimary", ref.isPrimary());
+                return refMap;
+            },
+            builder, "/xrefs", buildQueryString(null, null, refTypeStr));
+        
+        Map<String, Object> result = new HashMap<>();
+        result.put("references", page);
+        builder.result(result);
+        sendJsonResponse(exchange, builder.build(), 200);
+    }
+    
+    /**
+     * A reference paired with the side of the query it matched ("to" or "from").
+     */
+    private static final class DirectedReference {
+        final Reference ref;
+        final String direction;
+
+        DirectedReference(Reference ref, String direction) {
+            this.ref = ref;
+            this.direction = direction;
+        }
+    }
+    
+    /**
+     * Index of the first reference whose source is at or after an address (list sorted by source).
+     */
+    private static int firstReferenceFrom(List<DirectedReference> references, Address address) {
+        int low = 0;
+        int high = references.size();
+        while (low < high) {
+            int mid = (low + high) >>> 1;
+            if (references.get(mid).ref.getFromAddress().compareTo(address) < 0) {
+                low = mid + 1;
+            } else {
+                high = mid;
+            }
+        }
+        return low;
+    }
+    
     private Map<String, Object> createReferenceMap(Program program, Reference ref, String direction) {
         Map<String, Object> refMap = new HashMap<>();
         
@@ -1,11 +1,14 @@
 package eu.starsong.ghidra.model;
 
+import ghidra.program.model.address.Address;
+
 /**
  * Immutable model class that pre-computes expensive values from Ghidra's Data objects
  * for string entries. Used by StringCacheManager to avoid repeated costly calls to
  * getDefaultValueRepresentation() and getPrimarySymbol() on every request.
  */
 public final class StringInfo {
+    private final Address addressValue;
     private final String address;
     private final String value;
     private final String valueLower;
@@ -13,8 +16,9 @@ public final class StringInfo {
     private final String typeName;
     private final String symbolName;
 
-    public StringInfo(String address, String value, int length, String typeName, String symbolName) {
-        this.address = address;
+    public StringInfo(Address address, String value, int length, String typeName, String symbolName) {
+        this.addressValue = address;
+        this.address = address.toString();
         this.value = value != null ? value : "";
         this.valueLower = this.value.toLowerCase();
         this.length = length;
@@ -26,6 +30,11 @@ public final class StringInfo {
         return address;
     }
 
+    /** The string's address, for ordering and cursor lookups */
+    public Address getAddressValue() {
+        return addressValue;
+    }
+
     public String getValue() {
         return value;
     }
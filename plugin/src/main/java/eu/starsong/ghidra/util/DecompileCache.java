@@ -0,0 +1,243 @@
+package eu.starsong.ghidra.util;
+
+import ghidra.app.decompiler.DecompileResults;
+import ghidra.app.decompiler.DecompiledFunction;
+import ghidra.program.model.address.Address;
+import ghidra.program.model.listing.Function;
+import ghidra.program.model.listing.Program;
+import ghidra.util.task.TaskMonitor;
+
+import java.util.HashMap;
+import java.util.Iterator;
+import java.util.LinkedHashMap;
+import java.util.Map;
+import java.util.Objects;
+
+/**
+ * Shared LRU cache of completed decompiler results.
+ *
+ * The decompile, variables and variable search endpoints all need the
+ * high-level function for the same handful of functions an agent is looking
+ * at. Entries are keyed by program, function entry point and the program's
+ * modification number, so any change to the program makes older entries
+ * unreachable; they are purged the next time that program is looked up.
+ *
+ * Bounded by entry count and by an estimate of retained memory (decompiled
+ * text plus a per-address allowance for the HighFunction graph).
+ */
+public class DecompileCache {
+
+    /** Maximum cached functions */
+    public static final int DEFAULT_MAX_ENTRIES = Integer.getInteger("ghidra.mcp.decompileCache.maxEntries", 512);
+
+    /** Approximate memory budget in megabytes */
+    public static final int DEFAULT_MAX_MB = Integer.getInteger("ghidra.mcp.decompileCache.maxMB", 256);
+
+    // Rough retained size of the HighFunction/p-code graph per address in the function body
+    private static final long BYTES_PER_BODY_ADDRESS = 512;
+
+    private static final DecompileCache INSTANCE = new DecompileCache(DEFAULT_MAX_ENTRIES, DEFAULT_MAX_MB * 1024L * 1024L);
+
+    public static DecompileCache getInstance() {
+        return INSTANCE;
+    }
+
+    private static final class Key {
+        final Program program;
+        final Address entryPoint;
+        final long modificationNumber;
+
+        Key(Program program, Address entryPoint, long modificationNumber) {
+            this.program = program;
+            this.entryPoint = entryPoint;
+            this.modificationNumber = modificationNumber;
+        }
+
+        @Override
+        public boolean equals(Object o) {
+            if (!(o instanceof Key)) {
+                return false;
+            }
+            Key other = (Key) o;
+            return program == other.program
+                && modificationNumber == other.modificationNumber
+                && entryPoint.equals(other.entryPoint);
+        }
+
+        @Override
+        public int hashCode() {
+            return Objects.hash(System.identityHashCode(program), entryPoint, modificationNumber);
+        }
+    }
+
+    private static final class Entry {
+        final DecompileResults results;
+        final long estimatedBytes;
+
+        Entry(DecompileResults results, long estimatedBytes) {
+            this.results = results;
+            this.estimatedBytes = estimatedBytes;
+        }
+    }
+
+    private final int maxEntries;
+    private final long maxBytes;
+    private final LinkedHashMap<Key, Entry> entries = new LinkedHashMap<>(16, 0.75f, true);
+    private final Map<Program, Long> lastModificationNumbers = new HashMap<>();
+    private long estimatedBytes;
+    private long hits;
+    private long misses;
+    private long evictions;
+
+    public DecompileCache(int maxEntries, long maxBytes) {
+        this.maxEntries = maxEntries;
+        this.maxBytes = maxBytes;
+    }
+
+    /**
+     * Return cached results for a function, decompiling with a pooled session on a miss.
+     */
+    public DecompileResults getOrDecompile(Function function, int timeoutSeconds, TaskMonitor monitor)
+            throws InterruptedException {
+        return getOrDecompile(function, timeoutSeconds, Long.MAX_VALUE, monitor);
+    }
+
+    /**
+     * As above, waiting at most {@code waitMillis} for a pooled session on a miss.
+     *
+     * @throws DecompilerPool.BusyException if no session frees up in time
+     */
+    public DecompileResults getOrDecompile(Function function, int timeoutSeconds, long waitMillis,
+            TaskMonitor monitor) throws InterruptedException {
+        DecompileResults cached = get(function);
+        if (cached != null) {
+            return cached;
+        }
+        DecompileResults results = DecompilerPool.getInstance().decompile(function, timeoutSeconds, waitMillis, monitor);
+        put(function, results);
+        return results;
+    }
+
+    /**
+     * Return cached results for a function, decompiling with an already checked-out session on a miss.
+     */
+    public DecompileResults getOrDecompile(DecompilerPool.Lease lease, Function function, int timeoutSeconds,
+            TaskMonitor monitor) {
+        DecompileResults cached = get(function);
+        if (cached != null) {
+            return cached;
+        }
+        DecompileResults results = lease.decompile(function, timeoutSeconds, monitor);
+        put(function, results);
+        return results;
+    }
+
+    /**
+     * Look up completed results for the function's current program state, or null.
+     */
+    public synchronized DecompileResults get(Function function) {
+        if (maxEntries <= 0) {
+            return null;
+        }
+        Key key = keyFor(function);
+        purgeIfModified(key.program, key.modificationNumber);
+        Entry entry = entries.get(key);
+        if (entry == null) {
+            misses++;
+            return null;
+        }
+        hits++;
+        return entry.results;
+    }
+
+    /**
+     * Store results if decompilation completed.
+     */
+    public synchronized void put(Function function, DecompileResults results) {
+        if (maxEntries <= 0 || results == null || !results.decompileCompleted()) {
+            return;
+        }
+        Key key = keyFor(function);
+        if (key.modificationNumber != lastModificationNumbers.getOrDefault(key.program, key.modificationNumber)) {
+            return; // program changed while this function was decompiling
+        }
+        long size = estimateSize(function, results);
+        if (size > maxBytes) {
+            return;
+        }
+
+        Entry previous = entries.remove(key);
+        if (previous != null) {
+            estimatedBytes -= previous.estimatedBytes;
+        }
+        entries.put(key, new Entry(results, size));
+        estimatedBytes += size;
+
+        Iterator<Map.Entry<Key, Entry>> it = entries.entrySet().iterator();
+        while ((entries.size() > maxEntries || estimatedBytes > maxBytes) && it.hasNext()) {
+            estimatedBytes -= it.next().getValue().estimatedBytes;
+            it.remove();
+            evictions++;
+        }
+    }
+
+    /**
+     * Drop every cached entry.
+     */
+    public synchronized void invalidate() {
+        entries.clear();
+        lastModificationNumbers.clear();
+        estimatedBytes = 0;
+    }
+
+    /**
+     * Cache counters for the /info endpoint.
+     */
+    public synchronized Map<String, Object> getStats() {
+        long lookups = hits + misses;
+        Map<String, Object> stats = new HashMap<>();
+        stats.put("entries", entries.size());
+        stats.put("maxEntries", maxEntries);
+        stats.put("estimatedBytes", estimatedBytes);
+        stats.put("maxBytes", maxBytes);
+        stats.put("hits", hits);
+        stats.put("misses", misses);
+        stats.put("hitRatio", lookups > 0 ? Math.round(hits * 10000.0 / lookups) / 10000.0 : 0.0);
+        stats.put("evictions", evictions);
+        return stats;
+    }
+
+    private Key keyFor(Function function) {
+        Program program = function.getProgram();
+        return new Key(program, function.getEntryPoint(), program.getModificationNumber());
+    }
+
+    /**
+     * Drop a program's entries once its modification number moves (or it was closed).
+     */
+    private void purgeIfModified(Program program, long modificationNumber) {
+        Long last = lastModificationNumbers.put(program, modificationNumber);
+        if (last == null || last == modificationNumber) {
+            return;
+        }
+        Iterator<Map.Entry<Key, Entry>> it = entries.entrySet().iterator();
+        while (it.hasNext()) {
+            Map.Entry<Key, Entry> e = it.next();
+            Program p = e.getKey().program;
+            if ((p == program && e.getKey().modificationNumber != modificationNumber) || p.isClosed()) {
+                estimatedBytes -= e.getValue().estimatedBytes;
+                it.remove();
+            }
+        }
+        lastModificationNumbers.keySet().removeIf(Program::isClosed);
+    }
+
+    private static long estimateSize(Function function, DecompileResults results) {
+        long size = function.getBody().getNumAddresses() * BYTES_PER_BODY_ADDRESS;
+        DecompiledFunction decompiled = results.getDecompiledFunction();
+        if (decompiled != null && decompiled.getC() != null) {
+            size += decompiled.getC().length() * 2L;
+        }
+        return size;
+    }
+}
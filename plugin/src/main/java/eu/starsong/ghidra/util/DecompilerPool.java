@@ -0,0 +1,342 @@
+package eu.starsong.ghidra.util;
+
+import ghidra.app.decompiler.DecompInterface;
+import ghidra.app.decompiler.DecompileOptions;
+import ghidra.app.decompiler.DecompileResults;
+import ghidra.program.model.listing.Function;
+import ghidra.program.model.listing.Program;
+import ghidra.util.Msg;
+import ghidra.util.task.TaskMonitor;
+
+import java.util.ArrayList;
+import java.util.HashMap;
+import java.util.List;
+import java.util.Map;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.ConcurrentLinkedDeque;
+import java.util.concurrent.Semaphore;
+import java.util.concurrent.TimeUnit;
+import java.util.concurrent.atomic.AtomicLong;
+
+/**
+ * Bounded pool of warm decompiler sessions, one pool per open program.
+ *
+ * Opening a DecompInterface starts a decompiler process and loads the program
+ * into it, which costs far more than decompiling a typical function. Sessions
+ * are checked out per request and returned afterwards instead of being
+ * disposed. At most {@code maxSessions} sessions exist per program (CPU count
+ * by default); further callers wait for one to be returned, request handlers
+ * no longer than their client's deadline.
+ *
+ * A session is reset to default options on return, flushed when the program's
+ * modification number has moved since its last use, and recycled after
+ * {@code maxUses} decompiles or after a timeout, cancellation or crash.
+ * Sessions for closed programs are disposed on the next checkout.
+ */
+public class DecompilerPool {
+
+    /** Sessions per program; defaults to the number of CPUs */
+    public static final int DEFAULT_MAX_SESSIONS = Integer.getInteger("ghidra.mcp.decompiler.pool",
+        Math.max(1, Runtime.getRuntime().availableProcessors()));
+
+    /** Decompiles served by one session before it is recycled */
+    public static final int DEFAULT_MAX_USES = Integer.getInteger("ghidra.mcp.decompiler.maxUses", 500);
+
+    /** Decompiler time limit per function when the request doesn't set one */
+    public static final int DEFAULT_TIMEOUT_SECONDS = Integer.getInteger("ghidra.mcp.decompiler.timeout", 30);
+
+    /** Threads decompiling batch items, shared by every batch request */
+    public static final int DEFAULT_BATCH_THREADS = Integer.getInteger("ghidra.mcp.decompiler.batchThreads",
+        DEFAULT_MAX_SESSIONS);
+
+    /** Batch workers waiting for a thread before further batches are turned away */
+    public static final int DEFAULT_BATCH_QUEUE = Integer.getInteger("ghidra.mcp.decompiler.batchQueue", 64);
+
+    private static final DecompilerPool INSTANCE = new DecompilerPool(DEFAULT_MAX_SESSIONS, DEFAULT_MAX_USES);
+
+    public static DecompilerPool getInstance() {
+        return INSTANCE;
+    }
+
+    private static final class Session {
+        final DecompInterface decompiler;
+        long modificationNumber;
+        int uses;
+
+        Session(DecompInterface decompiler, long modificationNumber) {
+            this.decompiler = decompiler;
+            this.modificationNumber = modificationNumber;
+        }
+    }
+
+    private static final class ProgramSessions {
+        final Semaphore permits;
+        final ConcurrentLinkedDeque<Session> idle = new ConcurrentLinkedDeque<>();
+
+        ProgramSessions(int maxSessions) {
+            this.permits = new Semaphore(maxSessions, true);
+        }
+    }
+
+    private final int maxSessions;
+    private final int maxUses;
+    private final Map<Program, ProgramSessions> pools = new ConcurrentHashMap<>();
+    private final InstrumentedExecutor batchExecutor =
+        new InstrumentedExecutor("GhidraMCP-Batch", DEFAULT_BATCH_THREADS, DEFAULT_BATCH_QUEUE);
+
+    private final AtomicLong checkouts = new AtomicLong();
+    private final AtomicLong waitNanos = new AtomicLong();
+    private final AtomicLong maxWaitNanos = new AtomicLong();
+    private final AtomicLong busy = new AtomicLong();
+    private final AtomicLong decompiles = new AtomicLong();
+    private final AtomicLong failedDecompiles = new AtomicLong();
+    private final AtomicLong decompileNanos = new AtomicLong();
+    private final AtomicLong maxDecompileNanos = new AtomicLong();
+    private final AtomicLong sessionsCreated = new AtomicLong();
+    private final AtomicLong sessionsRecycled = new AtomicLong();
+
+    public DecompilerPool(int maxSessions, int maxUses) {
+        this.maxSessions = Math.max(1, maxSessions);
+        this.maxUses = Math.max(1, maxUses);
+    }
+
+    /**
+     * A checked-out session. Close it (try-with-resources) to return it to the pool.
+     */
+    public final class Lease implements AutoCloseable {
+        private final Program program;
+        private final ProgramSessions sessions;
+        private final Session session;
+        private boolean broken;
+        private boolean closed;
+
+        private Lease(Program program, ProgramSessions sessions, Session session) {
+            this.program = program;
+            this.sessions = sessions;
+            this.session = session;
+        }
+
+        /** The underlying decompiler; prefer {@link #decompile} so timing is recorded. */
+        public DecompInterface decompiler() {
+            return session.decompiler;
+        }
+
+        /**
+         * Decompile a function with this session, recording its duration.
+         */
+        public DecompileResults decompile(Function function, int timeoutSeconds, TaskMonitor monitor) {
+            long start = System.nanoTime();
+            DecompileResults results = null;
+            try {
+                results = session.decompiler.decompileFunction(function, timeoutSeconds, monitor);
+                return results;
+            } finally {
+                long elapsed = System.nanoTime() - start;
+                session.uses++;
+                decompiles.incrementAndGet();
+                decompileNanos.addAndGet(elapsed);
+                maxDecompileNanos.accumulateAndGet(elapsed, Math::max);
+                if (results == null || !results.decompileCompleted()) {
+                    failedDecompiles.incrementAndGet();
+                    // A timed-out or cancelled decompile kills the decompiler process
+                    if (results == null || results.isTimedOut() || results.isCancelled() || results.failedToStart()) {
+                        broken = true;
+                    }
+                }
+            }
+        }
+
+        /** Mark the session unusable so it is disposed instead of reused. */
+        public void invalidate() {
+            broken = true;
+        }
+
+        @Override
+        public void close() {
+            if (closed) {
+                return;
+            }
+            closed = true;
+            try {
+                if (broken || session.uses >= maxUses || program.isClosed()) {
+                    sessionsRecycled.incrementAndGet();
+                    session.decompiler.dispose();
+                } else {
+                    resetOptions(session.decompiler);
+                    sessions.idle.push(session);
+                }
+            } catch (Exception e) {
+                Msg.warn(DecompilerPool.class, "Discarding decompiler session after reset failed: " + e.getMessage());
+                session.decompiler.dispose();
+            } finally {
+                sessions.permits.release();
+            }
+        }
+    }
+
+    /**
+     * No session was returned to the pool within the caller's wait limit.
+     * Request handlers answer it with 503 DECOMPILER_BUSY.
+     */
+    public static final class BusyException extends RuntimeException {
+        public BusyException(long waitedMillis) {
+            super("No decompiler session became free within " + waitedMillis + " ms");
+        }
+    }
+
+    /**
+     * Check out a session for a program, blocking until one is available.
+     */
+    public Lease acquire(Program program) throws InterruptedException {
+        return acquire(program, Long.MAX_VALUE);
+    }
+
+    /**
+     * Check out a session for a program, waiting at most {@code waitMillis}
+     * for one ({@code Long.MAX_VALUE}: as long as it takes). Request handlers
+     * pass {@link HttpUtil#remainingMillis}, so a request never waits past its
+     * client's deadline.
+     *
+     * @throws BusyException if no session frees up in time
+     */
+    public Lease acquire(Program program, long waitMillis) throws InterruptedException {
+        pruneClosedPrograms();
+        ProgramSessions sessions = pools.computeIfAbsent(program, p -> new ProgramSessions(maxSessions));
+
+        long start = System.nanoTime();
+        if (waitMillis == Long.MAX_VALUE) {
+            sessions.permits.acquire();
+        } else if (!sessions.permits.tryAcquire(waitMillis, TimeUnit.MILLISECONDS)) {
+            busy.incrementAndGet();
+            throw new BusyException(waitMillis);
+        }
+        long waited = System.nanoTime() - start;
+        checkouts.incrementAndGet();
+        waitNanos.addAndGet(waited);
+        maxWaitNanos.accumulateAndGet(waited, Math::max);
+
+        try {
+            long modificationNumber = program.getModificationNumber();
+            Session session = sessions.idle.poll();
+            if (session == null) {
+                session = new Session(GhidraUtil.openDecompiler(program), modificationNumber);
+                sessionsCreated.incrementAndGet();
+            } else if (session.modificationNumber != modificationNumber) {
+                session.decompiler.flushCache();
+                session.modificationNumber = modificationNumber;
+            }
+            return new Lease(program, sessions, session);
+        } catch (RuntimeException e) {
+            sessions.permits.release();
+            throw e;
+        }
+    }
+
+    /**
+     * Check out a session, decompile one function and return the session.
+     */
+    public DecompileResults decompile(Function function, int timeoutSeconds, TaskMonitor monitor)
+            throws InterruptedException {
+        return decompile(function, timeoutSeconds, Long.MAX_VALUE, monitor);
+    }
+
+    /**
+     * Decompile one function, waiting at most {@code waitMillis} for a session.
+     *
+     * @throws BusyException if no session frees up in time
+     */
+    public DecompileResults decompile(Function function, int timeoutSeconds, long waitMillis, TaskMonitor monitor)
+            throws InterruptedException {
+        try (Lease lease = acquire(function.getProgram(), waitMillis)) {
+            return lease.decompile(function, timeoutSeconds, monitor);
+        }
+    }
+
+    /**
+     * The executor batch decompiles run their workers on. Shared by all
+     * batches, so concurrent batches queue for its threads instead of each
+     * starting their own.
+     */
+    public InstrumentedExecutor getBatchExecutor() {
+        return batchExecutor;
+    }
+
+    /**
+     * Dispose every idle session for every program.
+     */
+    public void disposeAll() {
+        for (ProgramSessions sessions : pools.values()) {
+            disposeIdle(sessions);
+        }
+        pools.clear();
+    }
+
+    /**
+     * Pool counters for the /info endpoint.
+     */
+    public Map<String, Object> getStats() {
+        long checkoutCount = checkouts.get();
+        long decompileCount = decompiles.get();
+
+        int idle = 0;
+        int inUse = 0;
+        for (ProgramSessions sessions : pools.values()) {
+            idle += sessions.idle.size();
+            inUse += maxSessions - sessions.permits.availablePermits();
+        }
+
+        Map<String, Object> stats = new HashMap<>();
+        stats.put("maxSessionsPerProgram", maxSessions);
+        stats.put("maxUsesPerSession", maxUses);
+        stats.put("programs", pools.size());
+        stats.put("idleSessions", idle);
+        stats.put("inUseSessions", inUse);
+        stats.put("sessionsCreated", sessionsCreated.get());
+        stats.put("sessionsRecycled", sessionsRecycled.get());
+        stats.put("checkouts", checkoutCount);
+        stats.put("avgWaitMs", checkoutCount > 0 ? nanosToMs(waitNanos.get() / checkoutCount) : 0.0);
+        stats.put("maxWaitMs", nanosToMs(maxWaitNanos.get()));
+        stats.put("busy", busy.get());
+        stats.put("decompiles", decompileCount);
+        stats.put("failedDecompiles", failedDecompiles.get());
+        stats.put("avgDecompileMs", decompileCount > 0 ? nanosToMs(decompileNanos.get() / decompileCount) : 0.0);
+        stats.put("maxDecompileMs", nanosToMs(maxDecompileNanos.get()));
+        stats.put("batchExecutor", batchExecutor.getStats());
+        return stats;
+    }
+
+    private void pruneClosedPrograms() {
+        List<Program> closed = new ArrayList<>();
+        for (Program program : pools.keySet()) {
+            if (program.isClosed()) {
+                closed.add(program);
+            }
+        }
+        for (Program program : closed) {
+            ProgramSessions sessions = pools.remove(program);
+            if (sessions != null) {
+                disposeIdle(sessions);
+            }
+        }
+    }
+
+    private void disposeIdle(ProgramSessions sessions) {
+        Session session;
+        while ((session = sessions.idle.poll()) != null) {
+            sessionsRecycled.incrementAndGet();
+            session.decompiler.dispose();
+        }
+    }
+
+    private static void resetOptions(DecompInterface decompiler) {
+        decompiler.toggleCCode(true);
+        decompiler.toggleSyntaxTree(true);
+        decompiler.toggleParamMeasures(false);
+        decompiler.setSimplificationStyle("decompile");
+        decompiler.setOptions(new DecompileOptions());
+    }
+
+    private static double nanosToMs(long nanos) {
+        return Math.round(nanos / 10_000.0) / 100.0;
+    }
+}
@@ -5,6 +5,8 @@ import ghidra.app.decompiler.DecompileOptions;
 import ghidra.app.decompiler.DecompileResults;
 import ghidra.app.services.GoToService;
 import ghidra.app.services.ProgramManager;
+import ghidra.framework.model.DomainFile;
+import ghidra.framework.model.ProjectLocator;
 import ghidra.framework.plugintool.PluginTool;
 import ghidra.program.model.address.Address;
 import ghidra.program.model.address.AddressFactory;
@@ -27,6 +29,8 @@ import ghidra.util.Msg;
 import ghidra.util.exception.CancelledException;
 import ghidra.util.task.TaskMonitor;
 
+import java.net.URLEncoder;
+import java.nio.charset.StandardCharsets;
 import java.util.ArrayList;
 import java.util.HashMap;
 import java.util.List;
@@ -47,6 +51,34 @@ public class GhidraUtil {
         }
     }
     
+    /**
+     * Identity of a program that stays the same across Ghidra sessions and
+     * differs between programs: its {@code project:pathname}, the domain
+     * file ID and the SHA-256 (else MD5) of the imported executable, URL-encoded
+     * so it can travel in a header. Unlike {@link Program#getUniqueProgramID()},
+     * which counts up from zero in each JVM, it can key data kept across restarts.
+     */
+    public static String getProgramIdentity(Program program) {
+        DomainFile file = program.getDomainFile();
+        ProjectLocator locator = file.getProjectLocator();
+        StringBuilder identity = new StringBuilder()
+            .append(locator != null ? locator.getName() : "unknown")
+            .append(':')
+            .append(file.getPathname());
+        String fileId = file.getFileID();
+        if (fileId != null) {
+            identity.append('#').append(fileId);
+        }
+        String hash = program.getExecutableSHA256();
+        if (hash == null || hash.isEmpty()) {
+            hash = program.getExecutableMD5();
+        }
+        if (hash != null && !hash.isEmpty()) {
+            identity.append('#').append(hash);
+        }
+        return URLEncoder.encode(identity.toString(), StandardCharsets.UTF_8);
+    }
+
     /**
      * Finds a data type by name within the program's data type managers.
      * @param program The current program.
@@ -330,36 +362,82 @@ public class GhidraUtil {
     }
     
     
+    /**
+     * Create a decompiler session with default options, opened on the given program.
+     * The caller owns the session and must dispose it.
+     * @param program The program to open.
+     * @return The opened decompiler session.
+     */
+    public static DecompInterface openDecompiler(Program program) {
+        DecompInterface decompiler = new DecompInterface();
+        decompiler.setOptions(new DecompileOptions());
+        if (!decompiler.openProgram(program)) {
+            Msg.warn(GhidraUtil.class, "Decompiler failed to open program: " + decompiler.getLastMessage());
+        }
+        return decompiler;
+    }
+    
     /**
      * Helper method to decompile a function.
      * @param function The function to decompile.
      * @return The decompiled code as a string, or null if decompilation failed.
      */
     public static String decompileFunction(Function function) {
+        return decompileFunction(function, DecompilerPool.DEFAULT_TIMEOUT_SECONDS);
+    }
+
+    /**
+     * Helper method to decompile a function within a time limit.
+     * @param function The function to decompile.
+     * @param timeoutSeconds Decompiler time limit.
+     * @return The decompiled code as a string, or null if decompilation failed.
+     */
+    public static String decompileFunction(Function function, int timeoutSeconds) {
+        return decompileFunction(function, timeoutSeconds, TaskMonitor.DUMMY);
+    }
+
+    /**
+     * Helper method to decompile a function within a time limit, stopping early if the monitor is cancelled.
+     * @param function The function to decompile.
+     * @param timeoutSeconds Decompiler time limit.
+     * @param monitor Monitor that can cancel the decompilation.
+     * @return The decompiled code as a string, or null if decompilation failed or was cancelled.
+     */
+    public static String decompileFunction(Function function, int timeoutSeconds, TaskMonitor monitor) {
+        return decompileFunction(function, timeoutSeconds, Long.MAX_VALUE, monitor);
+    }
+
+    /**
+     * Helper method to decompile a function, waiting at most {@code waitMillis} for a pooled decompiler session.
+     * @param function The function to decompile.
+     * @param timeoutSeconds Decompiler time limit.
+     * @param waitMillis Longest wait for a free decompiler session.
+     * @param monitor Monitor that can cancel the decompilation.
+     * @return The decompiled code as a string, or null if decompilation failed or was cancelled.
+     * @throws DecompilerPool.BusyException if no session frees up in time.
+     */
+    public static String decompileFunction(Function function, int timeoutSeconds, long waitMillis, TaskMonitor monitor) {
         if (function == null) {
             return null;
         }
         
-        Program program = function.getProgram();
-        DecompInterface decompiler = new DecompInterface();
-        DecompileOptions options = new DecompileOptions();
-        
-        decompiler.setOptions(options);
-        decompiler.openProgram(program);
-        
         try {
-            DecompileResults results = decompiler.decompileFunction(function, 30, TaskMonitor.DUMMY);
+            DecompileResults results = DecompileCache.getInstance().getOrDecompile(function, timeoutSeconds,
+                waitMillis, monitor);
             if (results.decompileCompleted()) {
                 return results.getDecompiledFunction().getC();
             } else {
                 Msg.warn(GhidraUtil.class, "Decompilation failed for function: " + function.getName());
                 return "// Decompilation failed for " + function.getName();
             }
+        } catch (InterruptedException e) {
+            Thread.currentThread().interrupt();
+            return "// Decompilation interrupted for " + function.getName();
+        } catch (DecompilerPool.BusyException e) {
+            throw e;
         } catch (Exception e) {
             Msg.error(GhidraUtil.class, "Error during decompilation of function: " + function.getName(), e);
             return "// Error during decompilation: " + e.getMessage();
-        } finally {
-            decompiler.dispose();
         }
     }
     
@@ -369,6 +447,17 @@ public class GhidraUtil {
      * @return A list of maps containing information about each variable.
      */
     public static List<Map<String, Object>> getFunctionVariables(Function function) {
+        return getFunctionVariables(function, Long.MAX_VALUE);
+    }
+
+    /**
+     * Gets information about variables in a function, waiting at most {@code waitMillis} for a decompiler session.
+     * @param function The function to get variables from.
+     * @param waitMillis Longest wait for a free decompiler session.
+     * @return A list of maps containing information about each variable.
+     * @throws DecompilerPool.BusyException if no session frees up in time.
+     */
+    public static List<Map<String, Object>> getFunctionVariables(Function function, long waitMillis) {
         List<Map<String, Object>> variables = new ArrayList<>();
         
         if (function == null) {
@@ -402,10 +491,9 @@ public class GhidraUtil {
         }
         
         // Add decompiler-generated variables
-        DecompInterface decompiler = new DecompInterface();
         try {
-            decompiler.openProgram(function.getProgram());
-            DecompileResults results = decompiler.decompileFunction(function, 30, TaskMonitor.DUMMY);
+            DecompileResults results = DecompileCache.getInstance().getOrDecompile(function,
+                DecompilerPool.DEFAULT_TIMEOUT_SECONDS, waitMillis, TaskMonitor.DUMMY);
             
             if (results.decompileCompleted()) {
                 HighFunction highFunc = results.getHighFunction();
@@ -446,12 +534,15 @@ public class GhidraUtil {
                 }
             }
         } 
+        catch (InterruptedException e) {
+            Thread.currentThread().interrupt();
+        }
+        catch (DecompilerPool.BusyException e) {
+            throw e;
+        }
         catch (Exception e) {
             Msg.error(GhidraUtil.class, "Error analyzing decompiler variables", e);
         }
-        finally {
-            decompiler.dispose();
-        }
         
         return variables;
     }
@@ -5,19 +5,32 @@ import com.google.gson.JsonElement;
 import com.google.gson.JsonObject;
 import com.sun.net.httpserver.HttpExchange;
 import com.sun.net.httpserver.Headers;
+import eu.starsong.ghidra.api.ApiConstants;
 import eu.starsong.ghidra.api.ResponseBuilder; // Use the ResponseBuilder
 import ghidra.util.Msg;
 
+import java.io.ByteArrayOutputStream;
 import java.io.IOException;
 import java.io.OutputStream;
 import java.nio.charset.StandardCharsets;
+import java.util.Base64;
+import java.util.Collections;
 import java.util.HashMap;
+import java.util.Locale;
 import java.util.Map;
+import java.util.zip.GZIPOutputStream;
 
 public class HttpUtil {
 
     private static final Gson gson = new Gson();
 
+    /** Responses smaller than this are sent uncompressed */
+    public static final int COMPRESSION_MIN_BYTES = Integer.getInteger("ghidra.mcp.compression.minBytes", 1024);
+    /** Deflate level for gzip responses: 1 is fastest, 9 smallest, 0 turns compression off */
+    public static final int COMPRESSION_LEVEL = Integer.getInteger("ghidra.mcp.compression.level", 1);
+    /** Answer in MessagePack when the client's Accept header prefers it */
+    public static final boolean MSGPACK_ENABLED = Boolean.parseBoolean(System.getProperty("ghidra.mcp.msgpack", "true"));
+
     /**
      * Sends a JSON response with the given status code.
      * Uses the ResponseBuilder internally.
@@ -47,17 +60,42 @@ public class HttpUtil {
     }
     
     public static void sendJsonResponse(HttpExchange exchange, JsonObject jsonObj, int statusCode, int port) throws IOException {
+        sendJsonResponse(exchange, jsonObj, statusCode, port, Collections.emptyMap());
+    }
+
+    /**
+     * Sends a response in JSON, or in MessagePack if the client asked for it.
+     * {@code resultBytes} are added to the result object: as binary values in
+     * MessagePack, base64-encoded in JSON.
+     */
+    public static void sendJsonResponse(HttpExchange exchange, JsonObject jsonObj, int statusCode, int port,
+                                        Map<String, byte[]> resultBytes) throws IOException {
          try {
             // Handle OPTIONS requests for CORS preflight
             if (handleOptionsRequest(exchange)) {
                 return;
             }
             
-            String json = gson.toJson(jsonObj);
-            byte[] bytes = json.getBytes(StandardCharsets.UTF_8);
+            byte[] bytes;
+            if (acceptsMsgPack(exchange)) {
+                bytes = MessagePack.encode(jsonObj, resultBytes);
+                exchange.getResponseHeaders().set("Content-Type", ApiConstants.MSGPACK_CONTENT_TYPE);
+            } else {
+                if (!resultBytes.isEmpty() && jsonObj.has("result") && jsonObj.get("result").isJsonObject()) {
+                    JsonObject result = jsonObj.getAsJsonObject("result");
+                    for (Map.Entry<String, byte[]> entry : resultBytes.entrySet()) {
+                        result.addProperty(entry.getKey(), Base64.getEncoder().encodeToString(entry.getValue()));
+                    }
+                }
+                bytes = gson.toJson(jsonObj).getBytes(StandardCharsets.UTF_8);
+                exchange.getResponseHeaders().set("Content-Type", "application/json; charset=utf-8");
+            }
             
-            exchange.getResponseHeaders().set("Content-Type", "application/json; charset=utf-8");
             addCorsHeaders(exchange);
+            if (statusCode != 204 && bytes.length >= COMPRESSION_MIN_BYTES && acceptsGzip(exchange)) {
+                bytes = gzip(bytes);
+                exchange.getResponseHeaders().set("Content-Encoding", "gzip");
+            }
             
             long responseLength = (statusCode == 204) ? -1 : bytes.length; 
             exchange.sendResponseHeaders(statusCode, responseLength); 
@@ -86,6 +124,156 @@ public class HttpUtil {
         }
     }
     
+    /**
+     * Whether the client's Accept-Encoding allows a gzip response (and compression is enabled).
+     * Also marks the response as varying by Accept-Encoding.
+     */
+    public static boolean acceptsGzip(HttpExchange exchange) {
+        if (COMPRESSION_LEVEL <= 0) {
+            return false;
+        }
+        addVary(exchange, "Accept-Encoding");
+        String header = exchange.getRequestHeaders().getFirst("Accept-Encoding");
+        if (header == null) {
+            return false;
+        }
+        for (String part : header.split(",")) {
+            String[] pieces = part.split(";");
+            String coding = pieces[0].trim().toLowerCase(Locale.ROOT);
+            if (!coding.equals("gzip") && !coding.equals("x-gzip") && !coding.equals("*")) {
+                continue;
+            }
+            boolean refused = false;
+            for (int i = 1; i < pieces.length; i++) {
+                String param = pieces[i].trim();
+                if (param.startsWith("q=")) {
+                    try {
+                        refused = Double.parseDouble(param.substring(2)) <= 0;
+                    } catch (NumberFormatException e) {
+                        refused = true;
+                    }
+                }
+            }
+            if (!refused) {
+                return true;
+            }
+        }
+        return false;
+    }
+
+    /**
+     * Milliseconds left before the client gives up on this request, per its
+     * deadline header, or Long.MAX_VALUE when it sent none. The deadline is
+     * fixed relative to the first call for the exchange.
+     */
+    public static long remainingMillis(HttpExchange exchange) {
+        Object deadline = exchange.getAttribute(ApiConstants.DEADLINE_HEADER);
+        if (deadline == null) {
+            String header = exchange.getRequestHeaders().getFirst(ApiConstants.DEADLINE_HEADER);
+            long budget;
+            try {
+                budget = header != null ? Long.parseLong(header.trim()) : -1;
+            } catch (NumberFormatException e) {
+                budget = -1;
+            }
+            deadline = budget >= 0 ? System.nanoTime() + budget * 1_000_000L : Long.MAX_VALUE;
+            exchange.setAttribute(ApiConstants.DEADLINE_HEADER, deadline);
+        }
+        long deadlineNanos = (Long) deadline;
+        if (deadlineNanos == Long.MAX_VALUE) {
+            return Long.MAX_VALUE;
+        }
+        return Math.max(0, (deadlineNanos - System.nanoTime()) / 1_000_000L);
+    }
+
+    /**
+     * Decompiler time limit for this request: {@code requestedSeconds}, cut
+     * down to what is left of the client's deadline. 0 once the deadline has passed.
+     */
+    public static int decompileTimeout(HttpExchange exchange, int requestedSeconds) {
+        long remaining = remainingMillis(exchange);
+        if (remaining == Long.MAX_VALUE) {
+            return requestedSeconds;
+        }
+        if (remaining == 0) {
+            return 0;
+        }
+        return (int) Math.min(requestedSeconds, (remaining + 999) / 1000);
+    }
+
+    /**
+     * Whether the client's Accept header prefers MessagePack to JSON (and MessagePack is enabled).
+     * Also marks the response as varying by Accept.
+     */
+    public static boolean acceptsMsgPack(HttpExchange exchange) {
+        if (!MSGPACK_ENABLED) {
+            return false;
+        }
+        addVary(exchange, "Accept");
+        String header = exchange.getRequestHeaders().getFirst("Accept");
+        if (header == null) {
+            return false;
+        }
+        double msgpack = 0;
+        double json = 0;
+        for (String part : header.split(",")) {
+            String[] pieces = part.split(";");
+            String type = pieces[0].trim().toLowerCase(Locale.ROOT);
+            double q = 1;
+            for (int i = 1; i < pieces.length; i++) {
+                String param = pieces[i].trim();
+                if (param.startsWith("q=")) {
+                    try {
+                        q = Double.parseDouble(param.substring(2));
+                    } catch (NumberFormatException e) {
+                        q = 0;
+                    }
+                }
+            }
+            if (type.equals(ApiConstants.MSGPACK_CONTENT_TYPE) || type.equals("application/x-msgpack")) {
+                msgpack = Math.max(msgpack, q);
+            } else if (type.equals("application/json") || type.equals("application/*") || type.equals("*/*")) {
+                json = Math.max(json, q);
+            }
+        }
+        return msgpack > 0 && msgpack >= json;
+    }
+
+    private static void addVary(HttpExchange exchange, String header) {
+        Headers headers = exchange.getResponseHeaders();
+        String vary = headers.getFirst("Vary");
+        if (vary == null) {
+            headers.set("Vary", header);
+            return;
+        }
+        for (String existing : vary.split(",")) {
+            if (existing.trim().equalsIgnoreCase(header)) {
+                return;
+            }
+        }
+        headers.set("Vary", vary + ", " + header);
+    }
+
+    /**
+     * Wrap a response body stream in a gzip stream at the configured level.
+     * With syncFlush, each flush() pushes everything written so far to the client.
+     */
+    public static GZIPOutputStream gzipStream(OutputStream out, boolean syncFlush) throws IOException {
+        return new GZIPOutputStream(out, 64 * 1024, syncFlush) {
+            {
+                def.setLevel(COMPRESSION_LEVEL);
+            }
+        };
+    }
+
+    private static byte[] gzip(byte[] bytes) throws IOException {
+        ByteArrayOutputStream out = new ByteArrayOutputStream(bytes.length / 4 + 64);
+        try (GZIPOutputStream gz = gzipStream(out, false)) {
+            gz.write(bytes);
+        }
+        return out.toByteArray();
+    }
+
     /**
      * Sends a standardized error response using ResponseBuilder.
      */
@@ -0,0 +1,123 @@
+package eu.starsong.ghidra.util;
+
+import java.util.HashMap;
+import java.util.Map;
+import java.util.concurrent.BlockingQueue;
+import java.util.concurrent.LinkedBlockingQueue;
+import java.util.concurrent.RejectedExecutionException;
+import java.util.concurrent.SynchronousQueue;
+import java.util.concurrent.ThreadFactory;
+import java.util.concurrent.ThreadPoolExecutor;
+import java.util.concurrent.TimeUnit;
+import java.util.concurrent.atomic.AtomicInteger;
+import java.util.concurrent.atomic.AtomicLong;
+
+/**
+ * Bounded thread pool for serving requests, with queue and wait-time counters.
+ *
+ * At most {@code threads} tasks run at once and at most {@code queueCapacity}
+ * wait; anything beyond that is rejected (for the HTTP server, the connection
+ * is closed) rather than spawning more threads and decompiler processes.
+ * Idle threads exit after a minute.
+ */
+public class InstrumentedExecutor extends ThreadPoolExecutor {
+
+    /** Requests served at the same time */
+    public static final int DEFAULT_THREADS = Integer.getInteger("ghidra.mcp.http.threads",
+        Math.max(8, 2 * Runtime.getRuntime().availableProcessors()));
+
+    /** Threads serving control requests (cancels, job status, health probes) and handing off the rest */
+    public static final int DEFAULT_CONTROL_THREADS = Integer.getInteger("ghidra.mcp.http.controlThreads", 4);
+
+    /** Requests waiting for a thread before new ones are rejected */
+    public static final int DEFAULT_QUEUE_CAPACITY = Integer.getInteger("ghidra.mcp.http.queue", 256);
+
+    private final int queueCapacity;
+    private final AtomicLong submitted = new AtomicLong();
+    private final AtomicLong rejected = new AtomicLong();
+    private final AtomicLong waitNanos = new AtomicLong();
+    private final AtomicLong maxWaitNanos = new AtomicLong();
+    private final AtomicInteger maxQueueDepth = new AtomicInteger();
+
+    /** A task stamped with the time it was handed to the executor */
+    private static final class Timed implements Runnable {
+        final Runnable task;
+        final long enqueuedAt = System.nanoTime();
+
+        Timed(Runnable task) {
+            this.task = task;
+        }
+
+        @Override
+        public void run() {
+            task.run();
+        }
+    }
+
+    public InstrumentedExecutor(String name, int threads, int queueCapacity) {
+        super(Math.max(1, threads), Math.max(1, threads), 60, TimeUnit.SECONDS, newQueue(queueCapacity),
+            namedThreads(name));
+        this.queueCapacity = Math.max(0, queueCapacity);
+        allowCoreThreadTimeOut(true);
+    }
+
+    private static BlockingQueue<Runnable> newQueue(int capacity) {
+        return capacity > 0 ? new LinkedBlockingQueue<>(capacity) : new SynchronousQueue<>();
+    }
+
+    private static ThreadFactory namedThreads(String name) {
+        AtomicInteger count = new AtomicInteger();
+        return r -> {
+            Thread t = new Thread(r, name + "-" + count.incrementAndGet());
+            t.setDaemon(true);
+            return t;
+        };
+    }
+
+    @Override
+    public void execute(Runnable command) {
+        try {
+            super.execute(new Timed(command));
+            submitted.incrementAndGet();
+            maxQueueDepth.accumulateAndGet(getQueue().size(), Math::max);
+        } catch (RejectedExecutionException e) {
+            rejected.incrementAndGet();
+            throw e;
+        }
+    }
+
+    @Override
+    protected void beforeExecute(Thread t, Runnable r) {
+        if (r instanceof Timed) {
+            long wait = System.nanoTime() - ((Timed) r).enqueuedAt;
+            waitNanos.addAndGet(wait);
+            maxWaitNanos.accumulateAndGet(wait, Math::max);
+        }
+        super.beforeExecute(t, r);
+    }
+
+    /**
+     * Executor counters for the /info endpoint.
+     */
+    public Map<String, Object> getStats() {
+        long started = getCompletedTaskCount() + getActiveCount();
+        Map<String, Object> stats = new HashMap<>();
+        stats.put("maxThreads", getMaximumPoolSize());
+        stats.put("threads", getPoolSize());
+        stats.put("activeThreads", getActiveCount());
+        stats.put("largestPoolSize", getLargestPoolSize());
+        stats.put("queueDepth", getQueue().size());
+        stats.put("maxQueueDepth", maxQueueDepth.get());
+        stats.put("queueCapacity", queueCapacity);
+        stats.put("submitted", submitted.get());
+        stats.put("completed", getCompletedTaskCount());
+        stats.put("rejected", rejected.get());
+        stats.put("avgWaitMs", started > 0 ? nanosToMs(waitNanos.get() / started) : 0.0);
+        stats.put("maxWaitMs", nanosToMs(maxWaitNanos.get()));
+        return stats;
+    }
+
+    private static double nanosToMs(long nanos) {
+        return Math.round(nanos / 10_000.0) / 100.0;
+    }
+}
@@ -0,0 +1,297 @@
+package eu.starsong.ghidra.util;
+
+import ghidra.util.Msg;
+import ghidra.util.exception.CancelledException;
+import ghidra.util.task.TaskMonitor;
+import ghidra.util.task.TaskMonitorAdapter;
+
+import java.util.ArrayList;
+import java.util.HashMap;
+import java.util.Iterator;
+import java.util.LinkedHashMap;
+import java.util.List;
+import java.util.Map;
+import java.util.UUID;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.Future;
+import java.util.concurrent.atomic.AtomicInteger;
+
+/**
+ * Background jobs for operations that outlive an HTTP request, such as auto-analysis.
+ *
+ * A job is submitted with a type and a task, gets an ID straight away and runs
+ * on a small fixed pool of worker threads. Its monitor records the progress and
+ * current message the task reports, and cancelling the job cancels the monitor.
+ * Finished jobs keep their result until more than {@code maxHistory} finished
+ * jobs exist; the oldest are then dropped. Queued and running jobs are never dropped.
+ */
+public class JobManager {
+
+    /** Worker threads running jobs */
+    public static final int DEFAULT_WORKERS = Integer.getInteger("ghidra.mcp.jobs.workers", 2);
+
+    /** Finished jobs whose status and result are kept */
+    public static final int DEFAULT_MAX_HISTORY = Integer.getInteger("ghidra.mcp.jobs.history", 50);
+
+    private static final JobManager INSTANCE = new JobManager(DEFAULT_WORKERS, DEFAULT_MAX_HISTORY);
+
+    public static JobManager getInstance() {
+        return INSTANCE;
+    }
+
+    public enum Status { QUEUED, RUNNING, SUCCEEDED, FAILED, CANCELLED }
+
+    /**
+     * The work of a job; reports progress to, and stops when cancelled by, its monitor.
+     */
+    @FunctionalInterface
+    public interface JobTask {
+        Object run(TaskMonitor monitor) throws Exception;
+    }
+
+    /**
+     * Task monitor that remembers the progress and message reported to it.
+     */
+    private static final class JobMonitor extends TaskMonitorAdapter {
+        private volatile String message;
+        private volatile long progress;
+        private volatile long maximum;
+
+        JobMonitor() {
+            super(true);
+        }
+
+        @Override
+        public void setMessage(String message) {
+            this.message = message;
+        }
+
+        @Override
+        public String getMessage() {
+            return message;
+        }
+
+        @Override
+        public void initialize(long max) {
+            maximum = max;
+            progress = 0;
+        }
+
+        @Override
+        public void setMaximum(long max) {
+            maximum = max;
+        }
+
+        @Override
+        public long getMaximum() {
+            return maximum;
+        }
+
+        @Override
+        public void setProgress(long value) {
+            progress = value;
+        }
+
+        @Override
+        public void incrementProgress(long increment) {
+            progress += increment;
+        }
+
+        @Override
+        public long getProgress() {
+            return progress;
+        }
+    }
+
+    public static final class Job {
+        private final String id;
+        private final String type;
+        private final String description;
+        private final JobMonitor monitor = new JobMonitor();
+        private final long submittedAt = System.currentTimeMillis();
+        private volatile long startedAt;
+        private volatile long finishedAt;
+        private volatile Status status = Status.QUEUED;
+        private volatile Object result;
+        private volatile String error;
+        private volatile Future<?> future;
+
+        private Job(String id, String type, String description) {
+            this.id = id;
+            this.type = type;
+            this.description = description;
+        }
+
+        public String getId() {
+            return id;
+        }
+
+        public Status getStatus() {
+            return status;
+        }
+
+        public Object getResult() {
+            return result;
+        }
+
+        public boolean isFinished() {
+            return status != Status.QUEUED && status != Status.RUNNING;
+        }
+
+        /**
+         * Status, progress and timing, without the result.
+         */
+        public Map<String, Object> toMap() {
+            Map<String, Object> map = new LinkedHashMap<>();
+            map.put("id", id);
+            map.put("type", type);
+            map.put("description", description);
+            map.put("status", status.name().toLowerCase());
+            long maximum = monitor.getMaximum();
+            if (status == Status.SUCCEEDED) {
+                map.put("percent", 100.0);
+            } else if (maximum > 0) {
+                map.put("percent", Math.min(100.0, Math.round(monitor.getProgress() * 1000.0 / maximum) / 10.0));
+            }
+            if (monitor.getMessage() != null) {
+                map.put("message", monitor.getMessage());
+            }
+            if (error != null) {
+                map.put("error", error);
+            }
+            map.put("submittedAt", submittedAt);
+            if (startedAt > 0) {
+                map.put("startedAt", startedAt);
+            }
+            if (finishedAt > 0) {
+                map.put("finishedAt", finishedAt);
+                map.put("durationMs", finishedAt - startedAt);
+            }
+            map.put("hasResult", result != null);
+            return map;
+        }
+    }
+
+    private final int maxHistory;
+    private final ExecutorService executor;
+    // Insertion-ordered, so finished jobs are dropped oldest first
+    private final LinkedHashMap<String, Job> jobs = new LinkedHashMap<>();
+
+    public JobManager(int workers, int maxHistory) {
+        this.maxHistory = Math.max(0, maxHistory);
+        AtomicInteger threads = new AtomicInteger();
+        this.executor = Executors.newFixedThreadPool(Math.max(1, workers), runnable -> {
+            Thread thread = new Thread(runnable, "GhidraMCP-Job-" + threads.incrementAndGet());
+            thread.setDaemon(true);
+            return thread;
+        });
+    }
+
+    /**
+     * Queue a job and return it immediately.
+     */
+    public Job submit(String type, String description, JobTask task) {
+        Job job = new Job(UUID.randomUUID().toString(), type, description);
+        synchronized (this) {
+            jobs.put(job.id, job);
+        }
+        job.future = executor.submit(() -> run(job, task));
+        return job;
+    }
+
+    public synchronized Job get(String id) {
+        return jobs.get(id);
+    }
+
+    /**
+     * All known jobs, oldest first.
+     */
+    public synchronized List<Job> list() {
+        return new ArrayList<>(jobs.values());
+    }
+
+    /**
+     * Cancel a queued or running job. Returns false if it had already finished.
+     */
+    public boolean cancel(Job job) {
+        if (job.isFinished()) {
+            return false;
+        }
+        job.monitor.cancel();
+        Future<?> future = job.future;
+        if (future != null && future.cancel(false)) {
+            finish(job, Status.CANCELLED, null, null); // never started
+        }
+        return true;
+    }
+
+    /**
+     * Job counters for the /info endpoint.
+     */
+    public synchronized Map<String, Object> getStats() {
+        Map<String, Integer> byStatus = new HashMap<>();
+        for (Job job : jobs.values()) {
+            byStatus.merge(job.status.name().toLowerCase(), 1, Integer::sum);
+        }
+        Map<String, Object> stats = new HashMap<>();
+        stats.put("jobs", jobs.size());
+        stats.put("maxHistory", maxHistory);
+        stats.put("byStatus", byStatus);
+        return stats;
+    }
+
+    /**
+     * Cancel every unfinished job. The (daemon) workers stay available for new jobs.
+     */
+    public void cancelAll() {
+        for (Job job : list()) {
+            cancel(job);
+        }
+    }
+
+    private void run(Job job, JobTask task) {
+        if (job.monitor.isCancelled()) {
+            finish(job, Status.CANCELLED, null, null);
+            return;
+        }
+        job.startedAt = System.currentTimeMillis();
+        job.status = Status.RUNNING;
+        try {
+            Object result = task.run(job.monitor);
+            finish(job, job.monitor.isCancelled() ? Status.CANCELLED : Status.SUCCEEDED, result, null);
+        } catch (CancelledException e) {
+            finish(job, Status.CANCELLED, null, null);
+        } catch (Exception e) {
+            Msg.error(this, "Job " + job.id + " (" + job.type + ") failed", e);
+            finish(job, Status.FAILED, null, e.getMessage() != null ? e.getMessage() : e.toString());
+        }
+    }
+
+    private synchronized void finish(Job job, Status status, Object result, String error) {
+        if (job.isFinished()) {
+            return;
+        }
+        job.result = result;
+        job.error = error;
+        job.finishedAt = System.currentTimeMillis();
+        if (job.startedAt == 0) {
+            job.startedAt = job.finishedAt;
+        }
+        job.status = status;
+
+        int finished = 0;
+        for (Job j : jobs.values()) {
+            if (j.isFinished()) {
+                finished++;
+            }
+        }
+        Iterator<Job> it = jobs.values().iterator();
+        while (finished > maxHistory && it.hasNext()) {
+            if (it.next().isFinished()) {
+                it.remove();
+                finished--;
+            }
+        }
+    }
+}
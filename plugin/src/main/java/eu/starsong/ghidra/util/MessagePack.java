@@ -0,0 +1,299 @@
+package eu.starsong.ghidra.util;
+
+import com.google.gson.JsonArray;
+import com.google.gson.JsonElement;
+import com.google.gson.JsonObject;
+import com.google.gson.JsonPrimitive;
+
+import java.math.BigDecimal;
+import java.math.BigInteger;
+import java.nio.charset.StandardCharsets;
+import java.util.Arrays;
+import java.util.Collections;
+import java.util.Map;
+
+/**
+ * MessagePack encoder for response trees built with Gson.
+ *
+ * Produces the same structure a JSON client would see (maps, arrays,
+ * strings, integers, doubles, booleans, nil), but without quoting, escaping
+ * or number formatting, and with byte payloads carried as native binary
+ * instead of hex or base64 text. Integers are written in the smallest
+ * encoding that holds them; numbers with a fraction or exponent as float 64.
+ */
+public final class MessagePack {
+
+    private static final BigInteger UINT64_MAX = BigInteger.ONE.shiftLeft(64).subtract(BigInteger.ONE);
+
+    private byte[] buf;
+    private int size;
+
+    private MessagePack(int capacity) {
+        this.buf = new byte[Math.max(capacity, 64)];
+    }
+
+    /** Encode a JSON tree. */
+    public static byte[] encode(JsonElement element) {
+        return encode(element, Collections.emptyMap());
+    }
+
+    /**
+     * Encode a response, adding {@code resultBytes} to its {@code result}
+     * object as binary values.
+     */
+    public static byte[] encode(JsonElement response, Map<String, byte[]> resultBytes) {
+        int extra = 0;
+        for (byte[] bytes : resultBytes.values()) {
+            extra += bytes.length + 8;
+        }
+        MessagePack packer = new MessagePack(4096 + extra);
+        if (!resultBytes.isEmpty() && response.isJsonObject()) {
+            packer.writeResponse(response.getAsJsonObject(), resultBytes);
+        } else {
+            packer.write(response);
+        }
+        return Arrays.copyOf(packer.buf, packer.size);
+    }
+
+    private void writeResponse(JsonObject response, Map<String, byte[]> resultBytes) {
+        JsonElement result = response.get("result");
+        if (result == null || !result.isJsonObject()) {
+            write(response);
+            return;
+        }
+        writeMapHeader(response.size());
+        for (Map.Entry<String, JsonElement> entry : response.entrySet()) {
+            writeString(entry.getKey());
+            if (!entry.getKey().equals("result")) {
+                write(entry.getValue());
+                continue;
+            }
+            JsonObject resultObject = entry.getValue().getAsJsonObject();
+            int fields = resultObject.size();
+            for (String name : resultBytes.keySet()) {
+                if (!resultObject.has(name)) {
+                    fields++;
+                }
+            }
+            writeMapHeader(fields);
+            for (Map.Entry<String, JsonElement> field : resultObject.entrySet()) {
+                if (!resultBytes.containsKey(field.getKey())) {
+                    writeString(field.getKey());
+                    write(field.getValue());
+                }
+            }
+            for (Map.Entry<String, byte[]> field : resultBytes.entrySet()) {
+                writeString(field.getKey());
+                writeBinary(field.getValue());
+            }
+        }
+    }
+
+    private void write(JsonElement element) {
+        if (element == null || element.isJsonNull()) {
+            put(0xc0);
+        } else if (element.isJsonObject()) {
+            JsonObject object = element.getAsJsonObject();
+            writeMapHeader(object.size());
+            for (Map.Entry<String, JsonElement> entry : object.entrySet()) {
+                writeString(entry.getKey());
+                write(entry.getValue());
+            }
+        } else if (element.isJsonArray()) {
+            JsonArray array = element.getAsJsonArray();
+            writeArrayHeader(array.size());
+            for (JsonElement item : array) {
+                write(item);
+            }
+        } else {
+            writePrimitive(element.getAsJsonPrimitive());
+        }
+    }
+
+    private void writePrimitive(JsonPrimitive primitive) {
+        if (primitive.isBoolean()) {
+            put(primitive.getAsBoolean() ? 0xc3 : 0xc2);
+        } else if (primitive.isString()) {
+            writeString(primitive.getAsString());
+        } else {
+            writeNumber(primitive.getAsNumber());
+        }
+    }
+
+    private void writeNumber(Number number) {
+        if (number instanceof Integer || number instanceof Long || number instanceof Short || number instanceof Byte) {
+            writeLong(number.longValue());
+            return;
+        }
+        if (number instanceof Double || number instanceof Float) {
+            writeDouble(number.doubleValue());
+            return;
+        }
+        // Gson's LazilyParsedNumber, BigInteger, BigDecimal, ...: go by the literal
+        String text = number.toString();
+        if (text.indexOf('.') >= 0 || text.indexOf('e') >= 0 || text.indexOf('E') >= 0) {
+            writeDouble(new BigDecimal(text).doubleValue());
+            return;
+        }
+        BigInteger value = new BigInteger(text);
+        if (value.bitLength() < 64) {
+            writeLong(value.longValue());
+        } else if (value.signum() > 0 && value.compareTo(UINT64_MAX) <= 0) {
+            put(0xcf);
+            putLong(value.longValue());
+        } else {
+            writeDouble(value.doubleValue());
+        }
+    }
+
+    private void writeLong(long v) {
+        if (v >= 0) {
+            if (v < 128) {
+                put((int) v);
+            } else if (v < 0x100) {
+                put(0xcc);
+                put((int) v);
+            } else if (v < 0x10000) {
+                put(0xcd);
+                putShort((int) v);
+            } else if (v < 0x100000000L) {
+                put(0xce);
+                putInt((int) v);
+            } else {
+                put(0xcf);
+                putLong(v);
+            }
+        } else if (v >= -32) {
+            put((int) v & 0xff);
+        } else if (v >= Byte.MIN_VALUE) {
+            put(0xd0);
+            put((int) v & 0xff);
+        } else if (v >= Short.MIN_VALUE) {
+            put(0xd1);
+            putShort((int) v);
+        } else if (v >= Integer.MIN_VALUE) {
+            put(0xd2);
+            putInt((int) v);
+        } else {
+            put(0xd3);
+            putLong(v);
+        }
+    }
+
+    private void writeDouble(double v) {
+        put(0xcb);
+        putLong(Double.doubleToLongBits(v));
+    }
+
+    private void writeString(String s) {
+        int length = s.length();
+        // ASCII needs no encoder pass; most keys and addresses are ASCII
+        boolean ascii = true;
+        for (int i = 0; i < length; i++) {
+            if (s.charAt(i) >= 0x80) {
+                ascii = false;
+                break;
+            }
+        }
+        if (ascii) {
+            writeStringHeader(length);
+            ensure(length);
+            for (int i = 0; i < length; i++) {
+                buf[size++] = (byte) s.charAt(i);
+            }
+            return;
+        }
+        byte[] utf8 = s.getBytes(StandardCharsets.UTF_8);
+        writeStringHeader(utf8.length);
+        putBytes(utf8);
+    }
+
+    private void writeStringHeader(int length) {
+        if (length < 32) {
+            put(0xa0 | length);
+        } else if (length < 0x100) {
+            put(0xd9);
+            put(length);
+        } else if (length < 0x10000) {
+            put(0xda);
+            putShort(length);
+        } else {
+            put(0xdb);
+            putInt(length);
+        }
+    }
+
+    private void writeBinary(byte[] bytes) {
+        if (bytes.length < 0x100) {
+            put(0xc4);
+            put(bytes.length);
+        } else if (bytes.length < 0x10000) {
+            put(0xc5);
+            putShort(bytes.length);
+        } else {
+            put(0xc6);
+            putInt(bytes.length);
+        }
+        putBytes(bytes);
+    }
+
+    private void writeMapHeader(int entries) {
+        if (entries < 16) {
+            put(0x80 | entries);
+        } else if (entries < 0x10000) {
+            put(0xde);
+            putShort(entries);
+        } else {
+            put(0xdf);
+            putInt(entries);
+        }
+    }
+
+    private void writeArrayHeader(int items) {
+        if (items < 16) {
+            put(0x90 | items);
+        } else if (items < 0x10000) {
+            put(0xdc);
+            putShort(items);
+        } else {
+            put(0xdd);
+            putInt(items);
+        }
+    }
+
+    private void ensure(int extra) {
+        if (size + extra > buf.length) {
+            buf = Arrays.copyOf(buf, Math.max(buf.length * 2, size + extra));
+        }
+    }
+
+    private void put(int b) {
+        ensure(1);
+        buf[size++] = (byte) b;
+    }
+
+    private void putShort(int v) {
+        ensure(2);
+        buf[size++] = (byte) (v >>> 8);
+        buf[size++] = (byte) v;
+    }
+
+    private void putInt(int v) {
+        ensure(4);
+        buf[size++] = (byte) (v >>> 24);
+        buf[size++] = (byte) (v >>> 16);
+        buf[size++] = (byte) (v >>> 8);
+        buf[size++] = (byte) v;
+    }
+
+    private void putLong(long v) {
+        putInt((int) (v >>> 32));
+        putInt((int) v);
+    }
+
+    private void putBytes(byte[] bytes) {
+        ensure(bytes.length);
+        System.arraycopy(bytes, 0, buf, size, bytes.length);
+        size += bytes.length;
+    }
+}
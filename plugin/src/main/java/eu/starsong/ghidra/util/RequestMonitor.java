@@ -0,0 +1,89 @@
+package eu.starsong.ghidra.util;
+
+import com.sun.net.httpserver.HttpExchange;
+import ghidra.util.task.TaskMonitorAdapter;
+
+import java.util.LinkedHashMap;
+import java.util.Map;
+import java.util.concurrent.ConcurrentHashMap;
+
+/**
+ * Cancellable task monitor for the work behind one HTTP request.
+ *
+ * Monitors are registered under the request's X-Request-ID while the work
+ * runs, so a client that gives up can cancel it through
+ * {@code POST /requests/{id}/cancel}; the decompiler stops its process as soon
+ * as its monitor is cancelled. A cancel that arrives before the work starts is
+ * remembered for a while and applied when the monitor is opened.
+ */
+public class RequestMonitor extends TaskMonitorAdapter implements AutoCloseable {
+
+    public static final String REQUEST_ID_HEADER = "X-Request-ID";
+
+    // Cancels for requests that had not opened a monitor yet
+    private static final int MAX_EARLY_CANCELS = 256;
+
+    private static final Map<String, RequestMonitor> active = new ConcurrentHashMap<>();
+    private static final Map<String, Boolean> earlyCancels = new LinkedHashMap<String, Boolean>() {
+        @Override
+        protected boolean removeEldestEntry(Map.Entry<String, Boolean> eldest) {
+            return size() > MAX_EARLY_CANCELS;
+        }
+    };
+
+    private final String requestId;
+
+    private RequestMonitor(String requestId) {
+        super(true);
+        this.requestId = requestId;
+    }
+
+    /**
+     * Open a monitor for the request, cancellable by its X-Request-ID if it sent one.
+     */
+    public static RequestMonitor open(HttpExchange exchange) {
+        String requestId = exchange.getRequestHeaders().getFirst(REQUEST_ID_HEADER);
+        RequestMonitor monitor = new RequestMonitor(requestId);
+        if (requestId != null) {
+            active.put(requestId, monitor);
+            boolean cancelledEarly;
+            synchronized (earlyCancels) {
+                cancelledEarly = earlyCancels.remove(requestId) != null;
+            }
+            if (cancelledEarly) {
+                monitor.cancel();
+            }
+        }
+        return monitor;
+    }
+
+    /**
+     * Cancel the work of a request. Returns whether it was running; a cancel for
+     * a request that has not started yet is held until it does.
+     */
+    public static boolean cancel(String requestId) {
+        RequestMonitor monitor = active.get(requestId);
+        if (monitor != null) {
+            monitor.cancel();
+            return true;
+        }
+        synchronized (earlyCancels) {
+            earlyCancels.put(requestId, Boolean.TRUE);
+        }
+        return false;
+    }
+
+    /**
+     * Number of requests currently running with a cancellable monitor.
+     */
+    public static int activeCount() {
+        return active.size();
+    }
+
+    @Override
+    public void close() {
+        if (requestId != null) {
+            active.remove(requestId, this);
+        }
+    }
+}
@@ -0,0 +1,139 @@
+package eu.starsong.ghidra.util;
+
+import com.sun.net.httpserver.HttpContext;
+import com.sun.net.httpserver.HttpExchange;
+import com.sun.net.httpserver.HttpHandler;
+import com.sun.net.httpserver.HttpServer;
+import ghidra.util.Msg;
+
+import java.io.IOException;
+import java.net.InetSocketAddress;
+import java.util.List;
+import java.util.Set;
+import java.util.concurrent.Executor;
+import java.util.concurrent.RejectedExecutionException;
+
+/**
+ * Keeps control requests out of the queue for heavy work.
+ *
+ * The HTTP server runs on a small control executor. Requests to endpoints
+ * answered from memory (request cancellation, job status, instance metadata,
+ * the health and registration probes) are handled right there; everything
+ * else is handed to the bounded work executor. A cancel or a health check
+ * therefore never waits behind, or is turned away with, a burst of
+ * decompiles. When the work executor is full the request gets
+ * {@code 503 INSTANCE_BUSY} instead of a dropped connection.
+ *
+ * Like {@link UnixSocketServer#mirror}, this wraps the server and routes
+ * each handler as its context is created.
+ */
+public class RequestRouter extends HttpServer {
+
+    /** Endpoints served on the control executor, whatever the load */
+    private static final Set<String> CONTROL_PATHS = Set.of(
+        "/", "/info", "/plugin-version", "/program", "/instances", "/projects", "/address", "/function");
+
+    /** Path prefixes served on the control executor */
+    private static final List<String> CONTROL_PREFIXES = List.of("/requests/", "/jobs");
+
+    private final HttpServer delegate;
+    private final Executor work;
+    private final int port;
+
+    public RequestRouter(HttpServer delegate, Executor work, int port) {
+        this.delegate = delegate;
+        this.work = work;
+        this.port = port;
+    }
+
+    /**
+     * Whether a request path is served on the control executor.
+     */
+    public static boolean isControl(String path) {
+        String trimmed = path.length() > 1 ? path.replaceAll("/+$", "") : path;
+        if (CONTROL_PATHS.contains(trimmed)) {
+            return true;
+        }
+        for (String prefix : CONTROL_PREFIXES) {
+            if (trimmed.startsWith(prefix)) {
+                return true;
+            }
+        }
+        return false;
+    }
+
+    private HttpHandler route(HttpHandler handler) {
+        return exchange -> {
+            if (isControl(exchange.getRequestURI().getPath())) {
+                handler.handle(exchange);
+                return;
+            }
+            HttpUtil.remainingMillis(exchange); // the client's deadline runs from now, not from when a worker is free
+            try {
+                work.execute(() -> handleQueued(handler, exchange));
+            } catch (RejectedExecutionException e) {
+                HttpUtil.sendErrorResponse(exchange, 503, "Too many requests in progress, try again later",
+                    "INSTANCE_BUSY", port);
+            }
+        };
+    }
+
+    private void handleQueued(HttpHandler handler, HttpExchange exchange) {
+        try {
+            handler.handle(exchange);
+        } catch (Exception e) {
+            Msg.error(this, "Unhandled error serving " + exchange.getRequestURI().getPath(), e);
+            exchange.close();
+        }
+    }
+
+    @Override
+    public HttpContext createContext(String path, HttpHandler handler) {
+        return delegate.createContext(path, route(handler));
+    }
+
+    @Override
+    public HttpContext createContext(String path) {
+        return delegate.createContext(path);
+    }
+
+    @Override
+    public void removeContext(String path) {
+        delegate.removeContext(path);
+    }
+
+    @Override
+    public void removeContext(HttpContext context) {
+        delegate.removeContext(context);
+    }
+
+    @Override
+    public void bind(InetSocketAddress addr, int backlog) throws IOException {
+        delegate.bind(addr, backlog);
+    }
+
+    @Override
+    public void start() {
+        delegate.start();
+    }
+
+    @Override
+    public void setExecutor(Executor executor) {
+        delegate.setExecutor(executor);
+    }
+
+    @Override
+    public Executor getExecutor() {
+        return delegate.getExecutor();
+    }
+
+    @Override
+    public void stop(int delay) {
+        delegate.stop(delay);
+    }
+
+    @Override
+    public InetSocketAddress getAddress() {
+        return delegate.getAddress();
+    }
+}
@@ -1,6 +1,7 @@
 package eu.starsong.ghidra.util;
 
 import eu.starsong.ghidra.model.StringInfo;
+import ghidra.program.model.address.Address;
 import ghidra.program.model.data.AbstractStringDataType;
 import ghidra.program.model.listing.Data;
 import ghidra.program.model.listing.Program;
@@ -102,7 +103,7 @@ public class StringCacheManager {
 
         for (Data data : DefinedDataIterator.byDataType(program,
                 dt -> dt instanceof AbstractStringDataType)) {
-            String address = data.getAddress().toString();
+            Address address = data.getAddress();
             String value = data.getDefaultValueRepresentation();
             int length = data.getLength();
             String typeName = data.getDataType().getName();
@@ -0,0 +1,771 @@
+package eu.starsong.ghidra.util;
+
+import com.sun.net.httpserver.Headers;
+import com.sun.net.httpserver.HttpContext;
+import com.sun.net.httpserver.HttpExchange;
+import com.sun.net.httpserver.HttpHandler;
+import com.sun.net.httpserver.HttpPrincipal;
+import com.sun.net.httpserver.HttpServer;
+import ghidra.util.Msg;
+
+import java.io.BufferedInputStream;
+import java.io.BufferedOutputStream;
+import java.io.ByteArrayOutputStream;
+import java.io.IOException;
+import java.io.InputStream;
+import java.io.OutputStream;
+import java.net.InetSocketAddress;
+import java.net.StandardProtocolFamily;
+import java.net.URI;
+import java.net.URISyntaxException;
+import java.net.UnixDomainSocketAddress;
+import java.nio.channels.Channels;
+import java.nio.channels.ServerSocketChannel;
+import java.nio.channels.SocketChannel;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.FileAlreadyExistsException;
+import java.nio.file.Files;
+import java.nio.file.LinkOption;
+import java.nio.file.Path;
+import java.nio.file.Paths;
+import java.nio.file.attribute.PosixFilePermission;
+import java.nio.file.attribute.PosixFilePermissions;
+import java.nio.file.attribute.UserPrincipal;
+import java.util.HashMap;
+import java.util.List;
+import java.util.Map;
+import java.util.Set;
+import java.util.concurrent.CopyOnWriteArrayList;
+import java.util.concurrent.Executor;
+import java.util.concurrent.RejectedExecutionException;
+
+/**
+ * Serves the plugin's HTTP API on a Unix domain socket next to the TCP port.
+ *
+ * A bridge on the same host connects to {@code <socketDir>/<port>.sock}
+ * instead of going through TCP loopback, and finds running instances by
+ * listing the directory rather than probing a port range. Endpoints are not
+ * registered twice: {@link #mirror(HttpServer)} wraps the TCP server and
+ * records every context created on it, and requests on the socket are
+ * dispatched to the same handlers through a minimal HTTP/1.1 exchange.
+ *
+ * Only what the bridge sends is supported: keep-alive requests with an
+ * optional Content-Length body. Responses may be fixed-length or chunked.
+ */
+public class UnixSocketServer {
+
+    /** Whether to serve on a Unix domain socket at all */
+    public static final boolean ENABLED = Boolean.parseBoolean(System.getProperty("ghidra.mcp.unixSocket", "true"));
+
+    /** Directory holding one {@code <port>.sock} per running instance */
+    public static final String SOCKET_DIR = System.getProperty("ghidra.mcp.socketDir", defaultSocketDir());
+
+    private static final int MAX_HEADER_BYTES = 64 * 1024;
+
+    private static final Set<PosixFilePermission> PRIVATE_DIR = PosixFilePermissions.fromString("rwx------");
+
+    private final int port;
+    private final Path path;
+    private final List<Map.Entry<String, HttpHandler>> contexts = new CopyOnWriteArrayList<>();
+    private final InstrumentedExecutor executor;
+    private volatile ServerSocketChannel channel;
+
+    public UnixSocketServer(int port) {
+        this.port = port;
+        this.path = Paths.get(SOCKET_DIR, port + ".sock");
+        // One thread per keep-alive connection; connections beyond the limit are closed, not queued
+        this.executor = new InstrumentedExecutor("GhidraMCP-UDS-" + port, InstrumentedExecutor.DEFAULT_THREADS, 0);
+    }
+
+    /** Default socket directory: $XDG_RUNTIME_DIR/ghidra-mcp, else a per-user directory under the temp dir. */
+    private static String defaultSocketDir() {
+        String runtimeDir = System.getenv("XDG_RUNTIME_DIR");
+        if (runtimeDir != null && !runtimeDir.isEmpty()) {
+            return Paths.get(runtimeDir, "ghidra-mcp").toString();
+        }
+        String tmpDir = System.getenv("TMPDIR");
+        if (tmpDir == null || tmpDir.isEmpty()) {
+            tmpDir = System.getProperty("java.io.tmpdir");
+        }
+        return Paths.get(tmpDir, "ghidra-mcp-" + System.getProperty("user.name")).toString();
+    }
+
+    public Path getPath() {
+        return path;
+    }
+
+    /** Connection thread counters for the /info endpoint. */
+    public Map<String, Object> getExecutorStats() {
+        return executor.getStats();
+    }
+
+    /**
+     * Wrap an HttpServer so every context created on it is also served on this socket.
+     */
+    public HttpServer mirror(HttpServer server) {
+        return new ContextMirror(server);
+    }
+
+    /**
+     * Bind the socket and start accepting connections.
+     * A stale socket file left by a crashed instance on the same port is replaced.
+     * Refuses to start if the socket directory is not private to the current user.
+     */
+    public void start() throws IOException {
+        checkSocketDir(path.getParent());
+        Files.deleteIfExists(path);
+
+        ServerSocketChannel ssc = ServerSocketChannel.open(StandardProtocolFamily.UNIX);
+        ssc.bind(UnixDomainSocketAddress.of(path));
+        channel = ssc;
+
+        Thread acceptor = new Thread(this::acceptLoop, "GhidraMCP-UDS-Server-" + port);
+        acceptor.setDaemon(true);
+        acceptor.start();
+        Msg.info(this, "GhidraMCP API also served on unix socket " + path);
+    }
+
+    /**
+     * Create the socket directory with mode 0700, or make sure an existing one
+     * is a real directory owned by the current user with mode 0700. Anyone else
+     * able to write to it could swap a socket for their own and see every request.
+     */
+    private static void checkSocketDir(Path dir) throws IOException {
+        if (!Files.exists(dir, LinkOption.NOFOLLOW_LINKS)) {
+            try {
+                Files.createDirectories(dir, PosixFilePermissions.asFileAttribute(PRIVATE_DIR));
+            } catch (UnsupportedOperationException e) {
+                // Not a POSIX file system; rely on the defaults
+                Files.createDirectories(dir);
+            } catch (FileAlreadyExistsException e) {
+                // Created by another instance in the meantime; checked below
+            }
+        }
+        if (!Files.isDirectory(dir, LinkOption.NOFOLLOW_LINKS)) {
+            throw new IOException("Socket directory " + dir + " is not a directory");
+        }
+
+        UserPrincipal owner = Files.getOwner(dir, LinkOption.NOFOLLOW_LINKS);
+        UserPrincipal user = dir.getFileSystem().getUserPrincipalLookupService()
+            .lookupPrincipalByName(System.getProperty("user.name"));
+        if (!owner.equals(user)) {
+            throw new IOException("Socket directory " + dir + " is owned by " + owner.getName()
+                + ", not " + user.getName());
+        }
+
+        Set<PosixFilePermission> permissions;
+        try {
+            permissions = Files.getPosixFilePermissions(dir, LinkOption.NOFOLLOW_LINKS);
+        } catch (UnsupportedOperationException e) {
+            return; // Not a POSIX file system; ownership is all there is to check
+        }
+        if (!permissions.equals(PRIVATE_DIR)) {
+            throw new IOException("Socket directory " + dir + " has mode "
+                + PosixFilePermissions.toString(permissions) + ", expected rwx------");
+        }
+    }
+
+    /** Close the socket, drop its file and stop serving connections. */
+    public void stop() {
+        ServerSocketChannel ssc = channel;
+        channel = null;
+        if (ssc != null) {
+            try {
+                ssc.close();
+            } catch (IOException e) {
+                Msg.debug(this, "Error closing unix socket " + path, e);
+            }
+        }
+        try {
+            Files.deleteIfExists(path);
+        } catch (IOException e) {
+            Msg.debug(this, "Could not remove unix socket " + path, e);
+        }
+        executor.shutdownNow();
+    }
+
+    private void acceptLoop() {
+        while (true) {
+            ServerSocketChannel ssc = channel;
+            if (ssc == null) {
+                return;
+            }
+            try {
+                SocketChannel client = ssc.accept();
+                try {
+                    executor.execute(() -> serve(client));
+                } catch (RejectedExecutionException e) {
+                    Msg.warn(this, "Too many connections on unix socket " + path + ", closing one");
+                    client.close();
+                }
+            } catch (IOException e) {
+                if (channel != null) {
+                    Msg.error(this, "Error accepting on unix socket " + path, e);
+                }
+                return;
+            }
+        }
+    }
+
+    private HttpHandler findHandler(String requestPath) {
+        HttpHandler best = null;
+        int bestLength = -1;
+        for (Map.Entry<String, HttpHandler> context : contexts) {
+            String prefix = context.getKey();
+            if (prefix.length() > bestLength && requestPath.startsWith(prefix)) {
+                best = context.getValue();
+                bestLength = prefix.length();
+            }
+        }
+        return best;
+    }
+
+    /** Serve requests on one connection until the client closes it or asks to. */
+    private void serve(SocketChannel client) {
+        try (SocketChannel connection = client) {
+            InputStream in = new BufferedInputStream(Channels.newInputStream(connection));
+            OutputStream out = new BufferedOutputStream(Channels.newOutputStream(connection));
+            while (true) {
+                String requestLine = readLine(in);
+                if (requestLine == null) {
+                    return;
+                }
+                if (requestLine.isEmpty()) {
+                    continue;
+                }
+                String[] parts = requestLine.split(" ");
+                if (parts.length != 3) {
+                    writeStatus(out, 400, "Bad Request");
+                    return;
+                }
+                Headers headers = readHeaders(in);
+                if (headers == null) {
+                    writeStatus(out, 431, "Request Header Fields Too Large");
+                    return;
+                }
+                if (headers.containsKey("Transfer-Encoding")) {
+                    writeStatus(out, 411, "Length Required");
+                    return;
+                }
+
+                long contentLength = 0;
+                String length = headers.getFirst("Content-Length");
+                if (length != null) {
+                    try {
+                        contentLength = Long.parseLong(length.trim());
+                    } catch (NumberFormatException e) {
+                        writeStatus(out, 400, "Bad Request");
+                        return;
+                    }
+                }
+
+                boolean keepAlive = "HTTP/1.1".equals(parts[2])
+                    && !"close".equalsIgnoreCase(headers.getFirst("Connection"));
+
+                Exchange exchange;
+                try {
+                    exchange = new Exchange(parts[0], new URI(parts[1]), parts[2], headers,
+                        new BoundedInputStream(in, contentLength), out, keepAlive);
+                } catch (URISyntaxException e) {
+                    writeStatus(out, 400, "Bad Request");
+                    return;
+                }
+
+                HttpHandler handler = findHandler(exchange.getRequestURI().getPath());
+                try {
+                    if (handler == null) {
+                        exchange.sendResponseHeaders(404, -1);
+                    } else {
+                        handler.handle(exchange);
+                    }
+                } catch (Exception e) {
+                    Msg.error(this, "Unhandled error serving " + parts[1] + " on unix socket", e);
+                    if (!exchange.headersSent) {
+                        exchange.getResponseHeaders().clear();
+                        exchange.sendResponseHeaders(500, -1);
+                    } else {
+                        return; // response is incomplete; the client sees the connection drop
+                    }
+                }
+                if (!exchange.headersSent) {
+                    exchange.sendResponseHeaders(500, -1);
+                }
+                exchange.close();
+                if (!exchange.keepAlive) {
+                    return;
+                }
+            }
+        } catch (IOException e) {
+            // Client went away
+        }
+    }
+
+    private static void writeStatus(OutputStream out, int code, String reason) throws IOException {
+        out.write(("HTTP/1.1 " + code + " " + reason + "\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+            .getBytes(StandardCharsets.ISO_8859_1));
+        out.flush();
+    }
+
+    /** Read one CRLF-terminated line, or null at end of stream. */
+    private static String readLine(InputStream in) throws IOException {
+        ByteArrayOutputStream line = new ByteArrayOutputStream(128);
+        int b;
+        while ((b = in.read()) != -1) {
+            if (b == '\n') {
+                int size = line.size();
+                byte[] bytes = line.toByteArray();
+                if (size > 0 && bytes[size - 1] == '\r') {
+                    size--;
+                }
+                return new String(bytes, 0, size, StandardCharsets.ISO_8859_1);
+            }
+            if (line.size() >= MAX_HEADER_BYTES) {
+                throw new IOException("Header line too long");
+            }
+            line.write(b);
+        }
+        return line.size() == 0 ? null : line.toString(StandardCharsets.ISO_8859_1);
+    }
+
+    private static Headers readHeaders(InputStream in) throws IOException {
+        Headers headers = new Headers();
+        int total = 0;
+        String line;
+        while ((line = readLine(in)) != null && !line.isEmpty()) {
+            total += line.length();
+            if (total > MAX_HEADER_BYTES) {
+                return null;
+            }
+            int colon = line.indexOf(':');
+            if (colon > 0) {
+                headers.add(line.substring(0, colon).trim(), line.substring(colon + 1).trim());
+            }
+        }
+        return headers;
+    }
+
+    // ---------------------------------------------------------------------
+    // Streams
+    // ---------------------------------------------------------------------
+
+    /** Request body: exactly Content-Length bytes of the connection, never closing it. */
+    private static final class BoundedInputStream extends InputStream {
+        private final InputStream in;
+        private long remaining;
+
+        BoundedInputStream(InputStream in, long length) {
+            this.in = in;
+            this.remaining = length;
+        }
+
+        @Override
+        public int read() throws IOException {
+            if (remaining <= 0) {
+                return -1;
+            }
+            int b = in.read();
+            if (b != -1) {
+                remaining--;
+            }
+            return b;
+        }
+
+        @Override
+        public int read(byte[] buf, int off, int len) throws IOException {
+            if (remaining <= 0) {
+                return -1;
+            }
+            int n = in.read(buf, off, (int) Math.min(len, remaining));
+            if (n > 0) {
+                remaining -= n;
+            }
+            return n;
+        }
+
+        /** Skip whatever the handler did not read so the next request starts in the right place. */
+        @Override
+        public void close() throws IOException {
+            while (remaining > 0) {
+                long skipped = in.skip(remaining);
+                if (skipped <= 0) {
+                    if (in.read() == -1) {
+                        throw new IOException("Connection closed inside request body");
+                    }
+                    skipped = 1;
+                }
+                remaining -= skipped;
+            }
+        }
+    }
+
+    /** Fixed-length response body; close() flushes but leaves the connection open. */
+    private static final class FixedOutputStream extends OutputStream {
+        private final OutputStream out;
+        private long remaining;
+        private boolean closed;
+
+        FixedOutputStream(OutputStream out, long length) {
+            this.out = out;
+            this.remaining = length;
+        }
+
+        @Override
+        public void write(int b) throws IOException {
+            write(new byte[] { (byte) b }, 0, 1);
+        }
+
+        @Override
+        public void write(byte[] buf, int off, int len) throws IOException {
+            if (closed) {
+                throw new IOException("Response body already closed");
+            }
+            if (len > remaining) {
+                throw new IOException("Response body longer than its Content-Length");
+            }
+            out.write(buf, off, len);
+            remaining -= len;
+        }
+
+        @Override
+        public void flush() throws IOException {
+            out.flush();
+        }
+
+        @Override
+        public void close() throws IOException {
+            if (closed) {
+                return;
+            }
+            closed = true;
+            out.flush();
+            if (remaining > 0) {
+                throw new IOException("Response body shorter than its Content-Length");
+            }
+        }
+    }
+
+    /** Chunked response body; flush() sends what is buffered as a chunk, close() ends the body. */
+    private static final class ChunkedOutputStream extends OutputStream {
+        private final OutputStream out;
+        private final byte[] buffer = new byte[16 * 1024];
+        private int count;
+        private boolean closed;
+
+        ChunkedOutputStream(OutputStream out) {
+            this.out = out;
+        }
+
+        @Override
+        public void write(int b) throws IOException {
+            if (count == buffer.length) {
+                writeChunk();
+            }
+            buffer[count++] = (byte) b;
+        }
+
+        @Override
+        public void write(byte[] buf, int off, int len) throws IOException {
+            if (closed) {
+                throw new IOException("Response body already closed");
+            }
+            while (len > 0) {
+                if (count == buffer.length) {
+                    writeChunk();
+                }
+                int n = Math.min(len, buffer.length - count);
+                System.arraycopy(buf, off, buffer, count, n);
+                count += n;
+                off += n;
+                len -= n;
+            }
+        }
+
+        private void writeChunk() throws IOException {
+            if (count == 0) {
+                return;
+            }
+            out.write((Integer.toHexString(count) + "\r\n").getBytes(StandardCharsets.ISO_8859_1));
+            out.write(buffer, 0, count);
+            out.write('\r');
+            out.write('\n');
+            count = 0;
+        }
+
+        @Override
+        public void flush() throws IOException {
+            if (!closed) {
+                writeChunk();
+            }
+            out.flush();
+        }
+
+        @Override
+        public void close() throws IOException {
+            if (closed) {
+                return;
+            }
+            writeChunk();
+            out.write("0\r\n\r\n".getBytes(StandardCharsets.ISO_8859_1));
+            out.flush();
+            closed = true;
+        }
+    }
+
+    // ---------------------------------------------------------------------
+    // Exchange
+    // ---------------------------------------------------------------------
+
+    /** The parts of HttpExchange the endpoint handlers use, over one socket connection. */
+    private final class Exchange extends HttpExchange {
+        private final String method;
+        private final URI uri;
+        private final String protocol;
+        private final Headers requestHeaders;
+        private final Headers responseHeaders = new Headers();
+        private final Map<String, Object> attributes = new HashMap<>();
+        private final OutputStream connection;
+        private InputStream requestBody;
+        private OutputStream responseBody;
+        private int responseCode = -1;
+        boolean headersSent;
+        boolean keepAlive;
+
+        Exchange(String method, URI uri, String protocol, Headers requestHeaders,
+                 InputStream requestBody, OutputStream connection, boolean keepAlive) {
+            this.method = method;
+            this.uri = uri;
+            this.protocol = protocol;
+            this.requestHeaders = requestHeaders;
+            this.requestBody = requestBody;
+            this.connection = connection;
+            this.keepAlive = keepAlive;
+        }
+
+        @Override
+        public Headers getRequestHeaders() {
+            return requestHeaders;
+        }
+
+        @Override
+        public Headers getResponseHeaders() {
+            return responseHeaders;
+        }
+
+        @Override
+        public URI getRequestURI() {
+            return uri;
+        }
+
+        @Override
+        public String getRequestMethod() {
+            return method;
+        }
+
+        @Override
+        public HttpContext getHttpContext() {
+            return null;
+        }
+
+        @Override
+        public void close() {
+            try {
+                requestBody.close();
+                if (responseBody != null) {
+                    responseBody.close();
+                }
+                connection.flush();
+            } catch (IOException e) {
+                keepAlive = false;
+            }
+        }
+
+        @Override
+        public InputStream getRequestBody() {
+            return requestBody;
+        }
+
+        @Override
+        public OutputStream getResponseBody() {
+            if (responseBody == null) {
+                // Placeholder until sendResponseHeaders picks the framing of the body
+                responseBody = OutputStream.nullOutputStream();
+            }
+            return responseBody;
+        }
+
+        @Override
+        public void sendResponseHeaders(int rCode, long responseLength) throws IOException {
+            if (headersSent) {
+                throw new IOException("Response headers already sent");
+            }
+            headersSent = true;
+            responseCode = rCode;
+
+            boolean noBody = rCode == 204 || rCode == 304 || "HEAD".equals(method);
+            if (noBody || responseLength < 0) {
+                responseHeaders.set("Content-Length", "0");
+                responseHeaders.remove("Transfer-Encoding");
+            } else if (responseLength == 0) {
+                responseHeaders.set("Transfer-Encoding", "chunked");
+                responseHeaders.remove("Content-Length");
+            } else {
+                responseHeaders.set("Content-Length", Long.toString(responseLength));
+                responseHeaders.remove("Transfer-Encoding");
+            }
+            if (!keepAlive) {
+                responseHeaders.set("Connection", "close");
+            }
+
+            StringBuilder head = new StringBuilder(256);
+            head.append("HTTP/1.1 ").append(rCode).append(' ').append(reason(rCode)).append("\r\n");
+            for (Map.Entry<String, List<String>> header : responseHeaders.entrySet()) {
+                for (String value : header.getValue()) {
+                    head.append(header.getKey()).append(": ").append(value).append("\r\n");
+                }
+            }
+            head.append("\r\n");
+            connection.write(head.toString().getBytes(StandardCharsets.ISO_8859_1));
+
+            if (noBody || responseLength < 0) {
+                responseBody = new FixedOutputStream(connection, 0);
+            } else if (responseLength == 0) {
+                responseBody = new ChunkedOutputStream(connection);
+            } else {
+                responseBody = new FixedOutputStream(connection, responseLength);
+            }
+        }
+
+        @Override
+        public InetSocketAddress getRemoteAddress() {
+            return InetSocketAddress.createUnresolved("localhost", 0);
+        }
+
+        @Override
+        public int getResponseCode() {
+            return responseCode;
+        }
+
+        @Override
+        public InetSocketAddress getLocalAddress() {
+            return InetSocketAddress.createUnresolved("localhost", port);
+        }
+
+        @Override
+        public String getProtocol() {
+            return protocol;
+        }
+
+        @Override
+        public Object getAttribute(String name) {
+            return attributes.get(name);
+        }
+
+        @Override
+        public void setAttribute(String name, Object value) {
+            if (value == null) {
+                attributes.remove(name);
+            } else {
+                attributes.put(name, value);
+            }
+        }
+
+        @Override
+        public void setStreams(InputStream i, OutputStream o) {
+            if (i != null) {
+                requestBody = i;
+            }
+            if (o != null) {
+                responseBody = o;
+            }
+        }
+
+        @Override
+        public HttpPrincipal getPrincipal() {
+            return null;
+        }
+    }
+
+    private static String reason(int code) {
+        switch (code) {
+            case 200: return "OK";
+            case 201: return "Created";
+            case 202: return "Accepted";
+            case 204: return "No Content";
+            case 304: return "Not Modified";
+            case 400: return "Bad Request";
+            case 404: return "Not Found";
+            case 405: return "Method Not Allowed";
+            case 409: return "Conflict";
+            case 500: return "Internal Server Error";
+            case 503: return "Service Unavailable";
+            default: return "Status";
+        }
+    }
+
+    // ---------------------------------------------------------------------
+    // Context mirror
+    // ---------------------------------------------------------------------
+
+    /** Delegates to the TCP server and records each handler for the socket. */
+    private final class ContextMirror extends HttpServer {
+        private final HttpServer delegate;
+
+        ContextMirror(HttpServer delegate) {
+            this.delegate = delegate;
+        }
+
+        @Override
+        public HttpContext createContext(String path, HttpHandler handler) {
+            HttpContext context = delegate.createContext(path, handler);
+            contexts.add(Map.entry(path, handler));
+            return context;
+        }
+
+        @Override
+        public HttpContext createContext(String path) {
+            return delegate.createContext(path);
+        }
+
+        @Override
+        public void removeContext(String path) {
+            delegate.removeContext(path);
+            contexts.removeIf(context -> context.getKey().equals(path));
+        }
+
+        @Override
+        public void removeContext(HttpContext context) {
+            delegate.removeContext(context);
+            contexts.removeIf(entry -> entry.getKey().equals(context.getPath()));
+        }
+
+        @Override
+        public void bind(InetSocketAddress addr, int backlog) throws IOException {
+            delegate.bind(addr, backlog);
+        }
+
+        @Override
+        public void start() {
+            delegate.start();
+        }
+
+        @Override
+        public void setExecutor(Executor executor) {
+            delegate.setExecutor(executor);
+        }
+
+        @Override
+        public Executor getExecutor() {
+            return delegate.getExecutor();
+        }
+
+        @Override
+        public void stop(int delay) {
+            delegate.stop(delay);
+        }
+
+        @Override
+        public InetSocketAddress getAddress() {
+            return delegate.getAddress();
+        }
+    }
+}